@@ -0,0 +1,153 @@
+"""Shared AppTest instrumentation for the benchmark scripts.
+
+``Recorder`` hooks ``LocalScriptRunner`` to capture every forward message and
+the time spent inside script runs, times figure serialization (Matplotlib
+``savefig`` and ``plotly.io.to_json``), can replay a click as a
+fragment-scoped rerun, and turns the simulated ``time.sleep`` delays in the
+script thread into no-ops so the numbers reflect real work.
+"""
+import contextlib
+import dataclasses
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from streamlit.runtime.scriptrunner import RerunData, ScriptRunnerEvent
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import local_script_runner
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_real_sleep = time.sleep
+
+
+def _script_sleep(seconds):
+    # The simulated protocol steps sleep for seconds; skip that in the script thread only.
+    if threading.current_thread().name != "ScriptRunner.scriptThread":
+        _real_sleep(seconds)
+
+
+_SCRIPT_STOPPED = {
+    ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+    ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR,
+    ScriptRunnerEvent.SCRIPT_STOPPED_FOR_RERUN,
+    ScriptRunnerEvent.FRAGMENT_STOPPED_WITH_SUCCESS,
+}
+
+
+# Element types that carry a rendered figure (st.pyplot and st.image both send imgs)
+FIGURE_ELEMENTS = ('plotly_chart', 'imgs', 'vega_lite_chart')
+
+
+@dataclasses.dataclass
+class RunStats:
+    seconds: float
+    script_runs: int
+    forward_msgs: int
+    forward_bytes: int
+    figures: int = 0
+    matplotlib_seconds: float = 0.0
+    plotly_seconds: float = 0.0
+
+
+@contextlib.contextmanager
+def _patched(owner, name: str, recorder: 'Recorder', library: str):
+    """Add the time spent in owner.name to recorder.serialize_seconds[library]."""
+    func = getattr(owner, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder.serialize_seconds[library] += time.perf_counter() - start
+
+    setattr(owner, name, wrapper)
+    try:
+        yield
+    finally:
+        setattr(owner, name, func)
+
+
+class Recorder:
+    """Captures the forward messages of each AppTest run and injects fragment ids."""
+
+    def __init__(self, time_serialization: bool = False):
+        # Off by default: it imports Matplotlib and plotly.io up front, which
+        # would hide the import cost of the pages that need them
+        self.time_serialization = time_serialization
+        self.runners: List[local_script_runner.LocalScriptRunner] = []
+        self.script_seconds = 0.0
+        self.fragment_id: Optional[str] = None
+        self.serialize_seconds = {'matplotlib': 0.0, 'plotly': 0.0}
+
+    @contextlib.contextmanager
+    def installed(self):
+        orig_run = local_script_runner.LocalScriptRunner.run
+        orig_rerun_data = local_script_runner.RerunData
+        recorder = self
+
+        def run(runner, *args, **kwargs):
+            started = []
+
+            def on_event(sender, event, **_):
+                if event == ScriptRunnerEvent.SCRIPT_STARTED:
+                    started.append(time.perf_counter())
+                elif event in _SCRIPT_STOPPED and started:
+                    recorder.script_seconds += time.perf_counter() - started.pop()
+
+            recorder.runners.append(runner)
+            recorder.script_seconds = 0.0
+            recorder.serialize_seconds = {'matplotlib': 0.0, 'plotly': 0.0}
+            runner.on_event.connect(on_event, weak=False)
+            return orig_run(runner, *args, **kwargs)
+
+        def rerun_data(**kwargs):
+            if recorder.fragment_id:
+                kwargs['fragment_id'] = recorder.fragment_id
+            return RerunData(**kwargs)
+
+        with contextlib.ExitStack() as stack:
+            if self.time_serialization:
+                import matplotlib.figure
+                import plotly.io
+                stack.enter_context(_patched(matplotlib.figure.Figure, 'savefig', self, 'matplotlib'))
+                stack.enter_context(_patched(plotly.io, 'to_json', self, 'plotly'))
+            local_script_runner.LocalScriptRunner.run = run
+            local_script_runner.RerunData = rerun_data
+            time.sleep = _script_sleep
+            try:
+                yield self
+            finally:
+                local_script_runner.LocalScriptRunner.run = orig_run
+                local_script_runner.RerunData = orig_rerun_data
+                time.sleep = _real_sleep
+
+    def last_forward_msgs(self):
+        runner = self.runners[-1]
+        return [data['forward_msg'] for event, data in zip(runner.events, runner.event_data)
+                if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG]
+
+    def last_script_runs(self) -> int:
+        return sum(1 for event in self.runners[-1].events if event == ScriptRunnerEvent.SCRIPT_STARTED)
+
+    def button_fragment_id(self, label: str) -> Optional[str]:
+        for msg in self.last_forward_msgs():
+            if not msg.HasField('delta') or not msg.delta.HasField('new_element'):
+                continue
+            element = msg.delta.new_element
+            if element.WhichOneof('type') == 'button' and element.button.label == label:
+                return msg.delta.fragment_id or None
+        return None
+
+
+def timed_run(at: AppTest, recorder: Recorder) -> RunStats:
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    msgs = recorder.last_forward_msgs()
+    figures = sum(1 for m in msgs if m.HasField('delta') and m.delta.HasField('new_element')
+                  and m.delta.new_element.WhichOneof('type') in FIGURE_ELEMENTS)
+    return RunStats(recorder.script_seconds, recorder.last_script_runs(), len(msgs), sum(m.ByteSize() for m in msgs),
+                    figures, recorder.serialize_seconds['matplotlib'], recorder.serialize_seconds['plotly'])
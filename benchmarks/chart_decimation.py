@@ -0,0 +1,49 @@
+"""Bytes and time to send one long line trace, with and without decimation.
+
+For traces of increasing length, compares serializing the full figure with
+``decimate_figure`` followed by serializing the decimated one (what
+``rendering.plotly_chart`` does before handing the figure to Streamlit).
+
+Run from the repository root::
+
+    python benchmarks/chart_decimation.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.rendering import decimate_figure  # noqa: E402
+
+POINTS = (10_000, 100_000, 1_000_000, 5_000_000)
+
+
+def main() -> int:
+    rng = np.random.default_rng(0)
+    print(f"{'points':>9} {'full kB':>10} {'full ms':>8} {'sent kB':>8} {'decimated ms':>12} {'trace':>10}")
+    for n in POINTS:
+        x = np.linspace(0, 15, n)
+        y = np.sin(x) + 3 * np.exp(-0.5 * ((x - 5) / 0.05) ** 2) + 0.02 * rng.normal(size=n)
+        fig = go.Figure(go.Scatter(x=x, y=y, mode='lines'))
+
+        start = time.perf_counter()
+        full = len(plotly.io.to_json(fig, validate=False))
+        full_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sent, _ = decimate_figure(fig)
+        size = len(plotly.io.to_json(sent, validate=False))
+        decimated_s = time.perf_counter() - start
+        print(f"{n:>9} {full / 1024:>10.0f} {full_s * 1000:>8.0f} {size / 1024:>8.0f} "
+              f"{decimated_s * 1000:>12.0f} {sent.data[0].type:>10}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
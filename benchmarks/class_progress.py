@@ -0,0 +1,165 @@
+"""Correctness and time of the instructor dashboard's progress aggregation for a large class.
+
+Simulates ``--sessions`` students working through the protocols for an
+hour: every 20 s or so a student advances a step, records a measurement or
+changes page, and publishes only what changed.  The dashboard refreshes
+every ``REFRESH_S`` of simulated time; at ``--checks`` of the refreshes its
+summary (step counts, stuck steps, pages, distributions) is checked
+against one recomputed from scratch from every session's full state, and
+the cost of a refresh is compared with that full scan.  Then sessions
+publishing with ``publish_progress`` fall silent past ``SESSION_TTL_S`` and
+come back, and must be counted with their page and mode again.
+
+Run from the repository root::
+
+    python benchmarks/class_progress.py
+    python benchmarks/class_progress.py --sessions 5000
+"""
+import argparse
+import collections
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.progress import (ACTIVE_S, HISTOGRAMS, PROTOCOL_LENGTHS, SESSION_TTL_S,  # noqa: E402
+                                          STUCK_S, ProgressBus, ProgressRegistry, ProgressUpdate, progress_bus,
+                                          publish_progress)
+from experiment_platform.pages.instructor import REFRESH_S  # noqa: E402
+from experiment_platform.session_log import MEASUREMENTS, PROTOCOL_STEPS  # noqa: E402
+
+# A dashboard refresh for 500+ sessions, well under a fragment rerun
+TARGET_MS = 20.0
+PAGES = ["Background Introduction", "Basic Laboratory Procedures", "Engineered Bacteria Construction",
+         "CRISPR-Cas9 Gene Integration", "Results Analysis"]
+
+
+def reference_summary(sessions, advanced, seen, now):
+    """Step counts, stuck steps, page counts and histogram bins from every session's full state."""
+    live = {s for s, t in seen.items() if t > now - SESSION_TTL_S}
+    steps, stuck, pages = [], [], collections.Counter()
+    for key, protocol in PROTOCOL_STEPS.items():
+        counts = collections.Counter(sessions[s].get(key, 0) for s in live)
+        steps += [(protocol, step, counts.get(step, 0)) for step in range(PROTOCOL_LENGTHS[key] + 1)]
+        waiting = collections.Counter(sessions[s][key] for s in live
+                                      if 0 < sessions[s].get(key, 0) < PROTOCOL_LENGTHS[key]
+                                      and advanced[s][key] <= now - STUCK_S)
+        stuck += [(protocol, step, count) for step, count in sorted(waiting.items())]
+    for s in live:
+        pages[sessions[s]['page']] += 1
+    bins = {}
+    for key, (low, high, count) in HISTOGRAMS.items():
+        values = [sessions[s][key] for s in live if key in sessions[s]]
+        bins[key] = np.bincount(np.clip(((np.array(values, dtype=float) - low) / (high - low) * count)
+                                        .astype(int), 0, count - 1), minlength=count)
+    active = sum(seen[s] > now - ACTIVE_S for s in live)
+    return len(live), active, steps, stuck, dict(pages), bins
+
+
+def returning_sessions(count: int) -> bool:
+    """Whether sessions that expire and come back are counted with their page, mode and step again."""
+    registry = ProgressRegistry(progress_bus)
+    states = [{'simulator': SimpleNamespace(experiment_data={'current_step': 2}), 'app_mode': "Basic"}
+              for _ in range(count)]
+    for state in states:
+        publish_progress(PAGES[1], state)
+    expired = registry.summary(time.time() + SESSION_TTL_S + 1).sessions
+    for state in states:
+        # Back on the same page, with one step more: only the step changed since the session last published
+        state['simulator'].experiment_data['current_step'] = 3
+        publish_progress(state=state)
+    summary = registry.summary()
+    step = summary.steps[(summary.steps['protocol'] == PROTOCOL_STEPS['current_step']) & (summary.steps['step'] == 3)]
+    print(f"{count} sessions silent past the TTL: {expired} left after it, {summary.sessions} counted on their "
+          f"return, pages {summary.pages.to_dict()}, modes {summary.modes.to_dict()}")
+    return (not expired and summary.sessions == count and summary.pages.to_dict() == {PAGES[1]: count}
+            and summary.modes.to_dict() == {"Basic": count} and int(step['sessions'].iloc[0]) == count)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=600)
+    parser.add_argument('--minutes', type=int, default=60)
+    parser.add_argument('--checks', type=int, default=12, help="summaries checked against the full scan")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    bus = ProgressBus()
+    registry = ProgressRegistry(bus)
+    sessions = {f"s{i}": {'page': PAGES[0]} for i in range(args.sessions)}
+    advanced = {s: collections.defaultdict(float) for s in sessions}
+    seen = {}
+    start = 0.0
+    for s in sessions:
+        bus.publish(ProgressUpdate(s, start, (('page', PAGES[0]), ('mode', 'Professional'))))
+        seen[s] = start
+    # Students act every 20 s on average; some stop for good
+    events = int(args.sessions * args.minutes * 3)
+    times = np.sort(rng.uniform(0, args.minutes * 60, events))
+    gone = set(rng.choice(list(sessions), args.sessions // 10, replace=False))
+    refreshes = int(args.minutes * 60 / REFRESH_S)
+    checks = set(np.linspace(1, refreshes - 1, args.checks).astype(int))
+    names = list(sessions)
+    agree, seconds, scan_seconds, published, refresh = 0, [], [], 0, 1
+    for now in times:
+        while now >= refresh * REFRESH_S:
+            began = time.perf_counter()
+            summary = registry.summary(refresh * REFRESH_S)
+            seconds.append(time.perf_counter() - began)
+            if refresh in checks:
+                began = time.perf_counter()
+                live, active, steps, stuck, pages, bins = reference_summary(sessions, advanced, seen,
+                                                                            refresh * REFRESH_S)
+                scan_seconds.append(time.perf_counter() - began)
+                agree += (summary.sessions == live and summary.active == active
+                          and list(summary.steps.itertuples(index=False, name=None)) == steps
+                          and list(summary.stuck[['protocol', 'step', 'sessions']].itertuples(index=False, name=None))
+                          == stuck
+                          and summary.pages.to_dict() == pages
+                          and all((summary.distributions[MEASUREMENTS[key][0]].to_numpy() == bins[key]).all()
+                                  for key in HISTOGRAMS))
+            refresh += 1
+        session = names[rng.integers(len(names))]
+        if session in gone and now > args.minutes * 30:
+            continue
+        state, changes = sessions[session], []
+        roll = rng.random()
+        if roll < 0.6:
+            key = list(PROTOCOL_LENGTHS)[rng.integers(len(PROTOCOL_LENGTHS))]
+            # Some steps are hard: students stall on them
+            step = state.get(key, 0)
+            if step < PROTOCOL_LENGTHS[key] and not (step == 3 and rng.random() < 0.8):
+                state[key] = step + 1
+                advanced[session][key] = now
+                changes.append((key, step + 1))
+        elif roll < 0.9:
+            key = list(HISTOGRAMS)[rng.integers(len(HISTOGRAMS))]
+            low, high, _ = HISTOGRAMS[key]
+            state[key] = float(rng.normal((low + high) / 2, (high - low) / 5))
+            changes.append((key, state[key]))
+        else:
+            state['page'] = PAGES[rng.integers(len(PAGES))]
+            changes.append(('page', state['page']))
+        seen[session] = now
+        bus.publish(ProgressUpdate(session, now, tuple(changes)))
+        published += 1
+    final = registry.summary(times[-1])
+    print(f"{args.sessions} sessions, {published:,} updates over {args.minutes} min; "
+          f"{agree}/{len(checks)} summaries match the full scan")
+    print(f"refresh every {REFRESH_S:g} s: {np.median(seconds) * 1000:.1f} ms median, "
+          f"{np.max(seconds) * 1000:.1f} ms max; full scan {np.median(scan_seconds) * 1000:.1f} ms median")
+    print(f"at the end: {final.sessions} sessions, {final.active} active, "
+          f"{int(final.stuck['sessions'].sum())} stuck")
+    print(pd.DataFrame(final.stuck).head(8).to_string(index=False))
+    returned = returning_sessions(args.sessions // 10)
+    return 0 if agree == len(checks) and np.median(seconds) * 1000 < TARGET_MS and returned else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
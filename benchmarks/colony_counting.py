@@ -0,0 +1,104 @@
+"""Accuracy and time of colony counting on synthetic plate photos.
+
+Counts plates of known colony numbers (a share of them touching a
+neighbour) and reports the counting error; counts blank plates under steep
+lighting gradients, which must come to no colonies, and a plate with a large
+smear, which is counted by its area in bounded memory; then writes ``--plates`` JPEG
+photos at camera resolution to a temporary folder and counts the folder with
+``count_folder``, serially and, with more than one CPU, in the process pool,
+which must not be slower, with the per-image time.
+
+Run from the repository root::
+
+    python benchmarks/colony_counting.py
+    python benchmarks/colony_counting.py --plates 300 --size 3000
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.colonies import FALLBACK_SLACK, count_folder, count_plate, synthetic_plate  # noqa: E402
+from experiment_platform.parallel import worth_parallel  # noqa: E402
+
+COLONY_NUMBERS = (0, 10, 50, 150, 300)
+# Largest acceptable counting error, as a fraction of the true count
+TOLERANCE = 0.05
+# Gray levels of lighting across the blank plates
+GRADIENTS = (60, 140)
+# Radius of the smear, as a fraction of the photo's side, and the most memory counting it may take
+SMEAR_RADIUS = 0.2
+TARGET_MB = 64
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--plates', type=int, default=100, help="photos in the folder batch")
+    parser.add_argument('--size', type=int, default=2000, help="side of each photo in pixels")
+    args = parser.parse_args(argv)
+
+    print(f"{'colonies':>9} {'counted':>8} {'split':>6} {'ms':>6}")
+    worst = 0.0
+    for seed, colonies in enumerate(COLONY_NUMBERS):
+        count = count_plate(synthetic_plate(colonies, seed=seed))
+        worst = max(worst, abs(count.colonies - colonies) / max(colonies, 1))
+        print(f"{colonies:>9} {count.colonies:>8} {count.split:>6} {count.seconds * 1000:>6.0f}")
+    print(f"worst error: {worst:.1%}")
+
+    size = 800
+    ramp = np.linspace(-0.5, 0.5, size, dtype=np.float32)
+    false = 0
+    for gradient in GRADIENTS:
+        counted = count_plate(np.clip(synthetic_plate(0, size) + gradient * ramp, 0, 255)).colonies
+        false = max(false, counted)
+        print(f"blank plate, {gradient} gray levels of lighting across: {counted} colonies")
+
+    smeared = synthetic_plate(50, size, seed=1).astype(np.float32)
+    yy, xx = np.mgrid[:size, :size]
+    smear = np.hypot(yy - size / 2, xx - size / 2) <= SMEAR_RADIUS * size
+    smeared[smear] = np.maximum(smeared[smear], 180)
+    tracemalloc.start()
+    count = count_plate(smeared)
+    peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    # The smear counted as colonies of its area, and the colonies clear of it
+    colonies = count_plate(np.where(smear, synthetic_plate(0, size, seed=1), smeared)).colonies
+    expected = colonies + int(smear.sum() / (FALLBACK_SLACK * count.single_area))
+    smear_error = abs(count.colonies - expected) / expected
+    print(f"smeared plate: {count.colonies} colonies, {expected} by area ({smear_error:.1%} off), "
+          f"{count.seconds * 1000:.0f} ms, {peak_mb:.0f} MB at most")
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        truth = rng.integers(20, 250, args.plates)
+        for plate, colonies in enumerate(truth):
+            Image.fromarray(synthetic_plate(int(colonies), args.size, seed=plate)).save(
+                Path(directory) / f"plate{plate:04d}.jpg", quality=90)
+        elapsed = {}
+        for parallel in (False, True) if worth_parallel(2) else (False,):
+            start = time.perf_counter()
+            counts = count_folder(directory, parallel=parallel)
+            elapsed[parallel] = time.perf_counter() - start
+            error = np.abs(counts['colonies'].to_numpy() - truth) / truth
+            print(f"folder ({'pool' if parallel else 'serial'}): {len(counts)} plates in {elapsed[parallel]:.1f} s, "
+                  f"{counts['seconds'].median() * 1000:.0f} ms median per image (max "
+                  f"{counts['seconds'].max() * 1000:.0f}), mean error {error.mean():.1%}")
+        if True not in elapsed:
+            print("folder (pool): skipped, one CPU")
+    pool_slower = elapsed.get(True, 0.0) > elapsed[False]
+    if pool_slower:
+        print(f"FAIL: the pool took {elapsed[True]:.1f} s, serial {elapsed[False]:.1f} s", file=sys.stderr)
+    return 0 if (worst <= TOLERANCE and not false and smear_error <= TOLERANCE and peak_mb <= TARGET_MB
+                 and not pool_slower) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
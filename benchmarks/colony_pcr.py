@@ -0,0 +1,139 @@
+"""Correctness and time of the in-silico PCR: binding sites, amplicons and primer pairs against a genome.
+
+Plants copies of random primers, with up to four mismatches and across the
+origin, in random circular and linear templates, and checks the binding
+sites and amplicons found through the index against a plain scan of every
+position of both strands and every pair of sites.  Then indexes the
+stand-in genome and its integrant and evaluates ``--pairs`` random primer
+pairs and the page's locus primers against them.
+
+Run from the repository root::
+
+    python benchmarks/colony_pcr.py
+    python benchmarks/colony_pcr.py --pairs 1000 --kb 500
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.assembly import random_bases, reverse_complement  # noqa: E402
+from experiment_platform.pcr import (MAX_MISMATCHES, SEED, Template, TemplateIndex,  # noqa: E402
+                                     integration_example)
+
+# A primer pair against two 4.6 Mb genomes, well under a page rerun
+TARGET_MS = 50.0
+
+
+def mutate(primer: str, count: int, rng) -> str:
+    """``count`` substitutions away from the primer's 3' seed."""
+    bases = list(primer)
+    for position in rng.choice(len(primer) - SEED, count, replace=False):
+        bases[position] = rng.choice([b for b in 'ACGT' if b != bases[position]])
+    return ''.join(bases)
+
+
+def reference_sites(templates, primers) -> set:
+    """(primer, template, start, strand, mismatches) of every position of both strands, one at a time."""
+    found = set()
+    for name, primer in primers.items():
+        length = len(primer)
+        flipped = reverse_complement(primer)
+        for template in templates:
+            text = template.sequence + (template.sequence[:length - 1] if template.circular else '')
+            for start in range(len(template.sequence)):
+                window = text[start:start + length]
+                if len(window) < length:
+                    break
+                for strand, probe in ((1, primer), (-1, flipped)):
+                    seed = probe[-SEED:] == window[-SEED:] if strand > 0 else probe[:SEED] == window[:SEED]
+                    mismatches = sum(a != b for a, b in zip(probe, window))
+                    if seed and mismatches <= MAX_MISMATCHES:
+                        found.add((name, template.name, start, strand, mismatches))
+    return found
+
+
+def reference_amplicons(templates, sites, max_product: int) -> set:
+    """(template, forward, reverse, start, size) of every top-strand site paired with every bottom-strand one."""
+    found = set()
+    for template in templates:
+        length = len(template.sequence)
+        here = sites[sites['template'] == template.name]
+        for top in here[here['strand'] > 0].itertuples():
+            for bottom in here[here['strand'] < 0].itertuples():
+                for shift in ((0, length) if template.circular else (0,)):
+                    if bottom.start + shift > top.start and 0 < bottom.end + shift - top.start <= max_product:
+                        found.add((template.name, top.primer, bottom.primer, top.start,
+                                   bottom.end + shift - top.start))
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--templates', type=int, default=6)
+    parser.add_argument('--kb', type=int, default=30, help="longest checked template, kilobases")
+    parser.add_argument('--pairs', type=int, default=200, help="random primer pairs against the genome")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    agree = 0
+    for index in range(args.templates):
+        length = int(rng.integers(5000, args.kb * 1000 + 1))
+        bases = list(random_bases(length, f"template{index}"))
+        primers = {f"P{p}": random_bases(int(rng.integers(18, 31)), f"primer{index}.{p}") for p in range(3)}
+        for name, primer in primers.items():
+            for _ in range(6):
+                copy = mutate(primer, int(rng.integers(0, 5)), rng)
+                copy = copy if rng.random() < 0.5 else reverse_complement(copy)
+                # Some copies run across the end of the template
+                at = int(rng.integers(length - len(copy) // 2, length)) if rng.random() < 0.2 else int(
+                    rng.integers(0, length - len(copy)))
+                for offset, base in enumerate(copy):
+                    bases[(at + offset) % length] = base
+        bases[int(rng.integers(0, length))] = 'N'
+        sequence = ''.join(bases)
+        templates = [Template('circular', sequence, True), Template('linear', sequence[::-1], False)]
+        engine = TemplateIndex(templates)
+        sites = [engine.binding_sites(primer, name) for name, primer in primers.items()]
+        found = {(s.primer, s.template, s.start, s.strand, s.mismatches) for table in sites
+                 for s in table.itertuples()}
+        expected = reference_sites(templates, primers)
+        amplicons = engine.amplicons(primers, max_product=length // 2)
+        products = set(zip(amplicons['template'], amplicons['forward'], amplicons['reverse'], amplicons['start'],
+                           amplicons['size']))
+        expected_products = reference_amplicons(
+            templates, pd.DataFrame(list(expected), columns=['primer', 'template', 'start', 'strand', 'mismatches'])
+            .assign(end=lambda d: d['start'] + d['primer'].map(lambda p: len(primers[p]))), length // 2)
+        agree += found == expected and products == expected_products
+    print(f"{agree}/{args.templates} templates match the position-by-position scan (sites and amplicons)")
+
+    start = time.perf_counter()
+    index, locus = integration_example()
+    print(f"stand-in genome and integrant ({index.lengths.sum() / 1e6:.1f} Mb) indexed in "
+          f"{time.perf_counter() - start:.2f} s")
+    genome = index.templates[0].sequence
+    seconds, products = [], 0
+    for pair in range(args.pairs):
+        at = int(rng.integers(0, len(genome) - 5000))
+        size = int(rng.integers(300, 4000))
+        primers = {'F': mutate(genome[at:at + 20], pair % 3, rng),
+                   'R': reverse_complement(genome[at + size - 22:at + size])}
+        began = time.perf_counter()
+        products += len(index.amplicons(primers))
+        seconds.append(time.perf_counter() - began)
+    amplicons = index.amplicons(locus)
+    print(f"{args.pairs} primer pairs: {np.median(seconds) * 1000:.1f} ms median, "
+          f"{np.max(seconds) * 1000:.1f} ms max, {products} products")
+    print("locus primers: " + ', '.join(f"{a.template} {a.size} bp" for a in amplicons.itertuples()))
+    ok = agree == args.templates and products == 2 * args.pairs
+    return 0 if ok and np.median(seconds) * 1000 < TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
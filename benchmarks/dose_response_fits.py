@@ -0,0 +1,91 @@
+"""Time of 4PL dose-response fitting with bootstrap confidence intervals.
+
+Builds plate-reader tables of increasing size (compounds × cell lines, ten
+doses in triplicate, known IC50 and Hill slope per curve) and times
+``fit_curves`` serially and, with more than one CPU, in the process pool
+(started before timing, as it is in a running server).  Also reports how
+often the 95% IC50 interval contains the true IC50.  Fails if the largest
+table takes longer than ``TARGET_S`` serially or the intervals of all
+tables together cover the true IC50 less often than ``MIN_COVERAGE``.
+
+Run from the repository root::
+
+    python benchmarks/dose_response_fits.py
+    python benchmarks/dose_response_fits.py --resamples 500
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.dose_response import BOOTSTRAP_RESAMPLES, fit_curves  # noqa: E402
+from experiment_platform.parallel import process_pool, worth_parallel  # noqa: E402
+
+CURVES = (100, 1_000, 3_000)
+DOSES = np.array([0, 0.01, 0.03, 0.1, 0.3, 1, 3, 10, 30, 100])
+CELL_LINES = 10
+# Serial seconds for the largest table with BOOTSTRAP_RESAMPLES resamples (scaled to --resamples)
+TARGET_S = 5.0
+# Nominal 95%, less about three standard errors of a coverage measured on 4100 curves
+MIN_COVERAGE = 0.935
+
+
+def plate_table(curves: int, rng) -> tuple:
+    ic50 = 10 ** rng.uniform(-1.5, 1.5, curves)
+    hill = rng.uniform(0.5, 2, curves)
+    dose = np.tile(np.repeat(DOSES, 3), curves)
+    curve = np.repeat(np.arange(curves), 3 * len(DOSES))
+    viability = 10 + 90 / (1 + (dose / ic50[curve]) ** hill[curve]) + rng.normal(0, 4, len(dose))
+    # Zero-padded names, so fit_curves (which sorts curves by name) keeps the curves in this order
+    return pd.DataFrame({
+        'treatment': pd.Categorical([f"compound {i:05d}" for i in curve // CELL_LINES]),
+        'cell_line': pd.Categorical([f"line {i:02d}" for i in curve % CELL_LINES]),
+        'concentration': dose.astype(np.float32),
+        'viability': viability.astype(np.float32),
+    }), ic50
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--resamples', type=int, default=BOOTSTRAP_RESAMPLES)
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(0)
+    pool = worth_parallel(2)
+    if pool:
+        process_pool().submit(int).result()
+
+    print(f"{'curves':>7} {'serial s':>9} {'pool s':>7} {'CI coverage':>12}")
+    covered = []
+    for curves in CURVES:
+        table, ic50 = plate_table(curves, rng)
+        timings = []
+        for parallel in (False, True) if pool else (False,):
+            start = time.perf_counter()
+            fits = fit_curves(table, by=('treatment', 'cell_line'), resamples=args.resamples, parallel=parallel)
+            timings.append(time.perf_counter() - start)
+        hits = (fits.curves['ic50_lower'] <= ic50) & (ic50 <= fits.curves['ic50_upper'])
+        covered.append(hits.to_numpy())
+        pool_s = f"{timings[1]:>7.2f}" if pool else f"{'-':>7}"
+        print(f"{curves:>7} {timings[0]:>9.2f} {pool_s} {hits.mean():>12.1%}")
+
+    failures = []
+    target = TARGET_S * args.resamples / BOOTSTRAP_RESAMPLES
+    if timings[0] > target:
+        failures.append(f"{CURVES[-1]} curves took {timings[0]:.2f} s serially, target {target:.2f} s")
+    coverage = np.concatenate(covered).mean()
+    if coverage < MIN_COVERAGE:
+        failures.append(f"95% IC50 intervals covered the true IC50 in {coverage:.1%} of curves, "
+                        f"at least {MIN_COVERAGE:.1%} expected")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
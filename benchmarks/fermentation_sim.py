@@ -0,0 +1,104 @@
+"""Time of the fermentation model: vectorized simulation and parameter estimation.
+
+Times ``simulate`` over growing numbers of parameter sets (the what-if
+explorer re-simulates the fit's population on every widget change), then
+fits time courses made from known parameters with ``estimate``, twice:
+
+* noiseless measurements, where the fitted 72 h titre must be within
+  ``TITRE_TOLERANCE`` of the true one;
+* the example's noisy measurements (5% on OD600, 0.3 mg/L on ATRA), where
+  the fit must explain the data about as well as the true parameters do:
+  its objective at most ``OBJECTIVE_SLACK`` times theirs.  The titre is only
+  reported here: that noise alone can move it 30% (course 1 of the default
+  run: 1.56 mg/L fitted, 2.23 true, from a fit with half the true
+  parameters' objective), and more on courses producing under 1 mg/L.
+
+Fails as well when re-simulating for the what-if explorer takes longer than
+``TARGET_MS``.
+
+Run from the repository root::
+
+    python benchmarks/fermentation_sim.py
+    python benchmarks/fermentation_sim.py --courses 10
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.fermentation import (DEFAULT_PARAMS, Conditions, example_time_course,  # noqa: E402
+                                              estimate, simulate)
+
+PARAMETER_SETS = (1, 100, 1_000, 10_000)
+# What-if re-simulation budget for an interactive widget
+TARGET_MS = 50.0
+# Relative error of the 72 h titre fitted to noiseless measurements
+TITRE_TOLERANCE = 0.05
+# Objective of the fit to noisy measurements, relative to the true parameters'
+OBJECTIVE_SLACK = 1.03
+
+
+def objective(params, data, conditions: Conditions) -> float:
+    """What ``estimate`` minimizes: mean squared error of each series over its spread, summed."""
+    run = simulate(params, conditions.inducer_time, conditions.temperature, conditions.medium)
+    error = 0.0
+    for name in ('od600', 'atra'):
+        values = data[name].to_numpy()
+        predicted = np.interp(data['time'], run.time, getattr(run, name)[0])
+        error += np.mean(((predicted - values) / max(np.std(values), 1e-6)) ** 2)
+    return float(error)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--courses', type=int, default=5, help="synthetic time courses to fit")
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(0)
+
+    print(f"{'sets':>7} {'simulate ms':>12}")
+    what_if_ms = 0.0
+    for sets in PARAMETER_SETS:
+        params = DEFAULT_PARAMS * rng.lognormal(0, 0.2, (sets, len(DEFAULT_PARAMS)))
+        start = time.perf_counter()
+        simulate(params, 12.0, 30.0, 'TB')
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if sets <= 100:
+            what_if_ms = max(what_if_ms, elapsed_ms)
+        print(f"{sets:>7} {elapsed_ms:>12.1f}")
+
+    print(f"\n{'course':>7} {'fit s':>6} {'simulations':>12} {'true mg/L':>10} {'noiseless fit':>14} "
+          f"{'noisy fit':>10} {'fit / true objective':>21} {'':>6}")
+    failures = 0
+    for course in range(args.courses):
+        conditions = Conditions(inducer_time=float(rng.uniform(4, 24)), temperature=float(rng.uniform(25, 35)))
+        data = example_time_course(conditions, seed=course)
+        run = simulate(DEFAULT_PARAMS, conditions.inducer_time, conditions.temperature)
+        truth = run.atra[0, -1]
+        noiseless = pd.DataFrame({'time': data['time'], 'od600': np.interp(data['time'], run.time, run.od600[0]),
+                                  'atra': np.interp(data['time'], run.time, run.atra[0])})
+        titres = []
+        for measured in (noiseless, data):
+            fit = estimate(measured['time'], measured['od600'], measured['atra'], conditions, seed=course)
+            titres.append(simulate(fit.params, conditions.inducer_time, conditions.temperature).atra[0, -1])
+        ratio = objective(fit.params, data, conditions) / objective(DEFAULT_PARAMS, data, conditions)
+        ok = abs(titres[0] - truth) <= TITRE_TOLERANCE * truth and ratio <= OBJECTIVE_SLACK
+        failures += not ok
+        print(f"{course:>7} {fit.seconds:>6.2f} {fit.simulations:>12,} {truth:>10.2f} {titres[0]:>14.2f} "
+              f"{titres[1]:>10.2f} {ratio:>21.3f} {'ok' if ok else 'FAIL':>6}")
+    if failures:
+        print(f"FAIL: {failures} of {args.courses} courses with a noiseless titre more than {TITRE_TOLERANCE:.0%} "
+              f"off or a noisy fit more than {OBJECTIVE_SLACK - 1:.0%} worse than the true parameters'",
+              file=sys.stderr)
+    if what_if_ms >= TARGET_MS:
+        print(f"FAIL: what-if re-simulation took {what_if_ms:.1f} ms", file=sys.stderr)
+    return 0 if what_if_ms < TARGET_MS and not failures else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Accuracy and time of gel densitometry on simulated gel photos.
+
+Simulates ``--gels`` JPEG photos of gels with random lane counts, fragment
+sizes and amounts (a third of them dark bands on a light background),
+analyses each with ``analyze_gel`` and reports how many gels had every
+fragment found, the worst sizing error against the ladder, and how closely
+band volumes follow the amount of DNA loaded.  The same photos are then
+analysed as one batch with ``analyze_gels``.
+
+Run from the repository root::
+
+    python benchmarks/gel_densitometry.py
+    python benchmarks/gel_densitometry.py --gels 200
+"""
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.gel import analyze_gel, analyze_gels, synthetic_gel  # noqa: E402
+
+FRAGMENT_SIZES = (300, 800, 1200, 1500, 2223, 3552, 5000)
+# A gel analysed on upload should not hold the page up longer than this
+TARGET_MS = 100.0
+MAX_SIZE_ERROR = 0.05
+# Share of gels that must have every fragment found and sized
+MIN_COMPLETE = 0.95
+
+
+def simulated_gels(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    for gel in range(count):
+        lanes = [[(int(size), float(rng.uniform(20, 120)))
+                  for size in rng.choice(FRAGMENT_SIZES, rng.integers(0, 3), replace=False)]
+                 for _ in range(rng.integers(3, 14))]
+        image = synthetic_gel(lanes, height=int(rng.integers(400, 1000)), lane_width=int(rng.integers(30, 80)),
+                              seed=gel)
+        if gel % 3 == 0:
+            image = 255 - image
+        buffer = io.BytesIO()
+        Image.fromarray(image).save(buffer, 'JPEG', quality=85)
+        yield f"gel{gel:03d}.jpg", buffer.getvalue(), lanes
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--gels', type=int, default=60)
+    args = parser.parse_args(argv)
+    gels = list(simulated_gels(args.gels))
+
+    complete, worst, seconds, amounts, volumes = 0, 0.0, [], [], []
+    for name, photo, lanes in gels:
+        analysis = analyze_gel(photo)
+        seconds.append(analysis.seconds)
+        # Lane 0 is the ladder
+        loaded = sorted((size, lane + 1, ng) for lane, fragments in enumerate(lanes) for size, ng in fragments)
+        found = analysis.bands[analysis.bands['lane'] != analysis.ladder_lane].sort_values(['size_bp', 'lane'])
+        if len(found) != len(loaded):
+            continue
+        errors = np.abs(found['size_bp'].to_numpy() / [size for size, _, _ in loaded] - 1)
+        worst = max(worst, errors.max(initial=0))
+        complete += bool((errors <= MAX_SIZE_ERROR).all())
+        # Volumes relative to the ladder's bands, all loaded at the same amount
+        ladder = analysis.bands.loc[analysis.bands['lane'] == analysis.ladder_lane, 'volume'].median()
+        amounts.extend(ng for _, _, ng in loaded)
+        volumes.extend(found['volume'] / ladder)
+    linearity = np.corrcoef(amounts, volumes)[0, 1] if len(amounts) > 1 else float('nan')
+    print(f"{complete}/{len(gels)} gels with every fragment found and sized within {MAX_SIZE_ERROR:.0%}; "
+          f"worst sizing error {worst:.1%}; volume vs ng loaded r = {linearity:.3f}")
+    print(f"per gel: {np.median(seconds) * 1000:.0f} ms median, {np.max(seconds) * 1000:.0f} ms max")
+
+    jobs = [(name, photo) for name, photo, _ in gels]
+    start = time.perf_counter()
+    bands = analyze_gels(jobs)
+    print(f"batch: {len(jobs)} gels, {len(bands)} bands in {time.perf_counter() - start:.2f} s")
+    return 0 if np.median(seconds) * 1000 < TARGET_MS and complete >= MIN_COMPLETE * len(gels) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Correctness and time of the Gibson assembly simulator on random designs.
+
+Builds ``--designs`` random constructs (a backbone and 2 to 10 inserts, up
+to ``--kb`` kilobases in all), amplifies the inserts with homology tails,
+shuffles and randomly reverse-complements them, and checks that
+``assemble`` recovers each design's sequence, order and orientation.  Each
+design is then assembled again with one insert missing, which must fail.
+
+Run from the repository root::
+
+    python benchmarks/gibson_assembly.py
+    python benchmarks/gibson_assembly.py --designs 200 --kb 40
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.assembly import (AssemblyError, Fragment, assemble, gibson_fragments,  # noqa: E402
+                                          random_bases, reverse_complement)
+
+# A 20 kb construct should assemble in well under a page rerun
+TARGET_MS = 50.0
+
+
+def random_design(index: int, kb: int, rng):
+    inserts = int(rng.integers(2, 11))
+    total = int(rng.integers(5000, kb * 1000))
+    sizes = rng.multinomial(total - 2000, np.full(inserts + 1, 1 / (inserts + 1))) + 200
+    backbone = Fragment('backbone', random_bases(int(sizes[0]) + 1600, f"backbone{index}"))
+    units = [Fragment(f"insert{i}", random_bases(int(size), f"design{index} insert{i}"))
+             for i, size in enumerate(sizes[1:])]
+    overlap = int(rng.integers(18, 41))
+    products = gibson_fragments(backbone, units, overlap)
+    expected = backbone.sequence + ''.join(unit.sequence for unit in units)
+    handed = []
+    for product in rng.permutation(len(products)):
+        fragment = products[product]
+        if rng.random() < 0.5:
+            fragment = Fragment(fragment.name, reverse_complement(fragment.sequence))
+        handed.append(fragment)
+    return backbone, handed, [unit.name for unit in units], expected
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--designs', type=int, default=100)
+    parser.add_argument('--kb', type=int, default=20, help="largest construct, kilobases")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    correct, rejected, seconds, largest = 0, 0, [], 0
+    for index in range(args.designs):
+        backbone, inserts, names, expected = random_design(index, args.kb, rng)
+        start = time.perf_counter()
+        assembly = assemble(backbone, inserts)
+        seconds.append(time.perf_counter() - start)
+        largest = max(largest, assembly.plasmid.length)
+        correct += (assembly.plasmid.sequence == expected and [name for name, _ in assembly.order[1:]] == names)
+        try:
+            assemble(backbone, inserts[:-1])
+        except AssemblyError:
+            rejected += 1
+    print(f"{correct}/{args.designs} designs assembled to the expected sequence and order; "
+          f"{rejected}/{args.designs} rejected with an insert missing")
+    print(f"assembly: {np.median(seconds) * 1000:.1f} ms median, {np.max(seconds) * 1000:.1f} ms max "
+          f"(largest construct {largest:,} bp)")
+    ok = correct == rejected == args.designs
+    return 0 if ok and np.max(seconds) * 1000 < TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Where rerun time goes, from the opt-in hot-path timers, and what the timers themselves cost.
+
+Runs every page of ``page_costs`` with ``AppTest`` (simulated sleeps
+skipped) and ``TIMING_ENV`` set, so the app installs the timers before any
+page is loaded, rerunning each page ``--reruns`` times.  Prints every timed
+function's calls, total and mean time and p50/p95/p99 from its histogram,
+most time first.  Checks that
+
+* the ``matplotlib.savefig`` and ``plotly.to_json`` histograms agree with the
+  independent timers of ``_apptest.Recorder`` over the same runs;
+* every page's ``show_*`` function was timed;
+* a timer costs under ``TARGET_US`` a call.
+
+The cost of all the timers is estimated as calls times that per-call cost,
+against the script time.  ``--out`` writes the histograms there in the
+OpenMetrics text format, as ``TIMING_FILE_ENV`` would.
+
+Run from the repository root::
+
+    python benchmarks/hot_paths.py
+    python benchmarks/hot_paths.py --reruns 10 --out hot_paths.prom
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from _apptest import REPO_ROOT, Recorder, timed_run
+from page_costs import scenarios
+
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.pages import PAGES  # noqa: E402
+from experiment_platform.timing import TIMING_ENV, quantile, timed, timing_stats, write_metrics  # noqa: E402
+
+# A timer around a call: two clock reads, a bisect and a lock
+TARGET_US = 2.0
+# Serialization totals from the histograms and from the Recorder agree this closely
+AGREEMENT = 0.1
+CALLS = 200_000
+
+
+def timer_cost_us() -> float:
+    """Microseconds a timer adds to a call of a function doing nothing."""
+    def bare():
+        return None
+
+    wrapped = timed('hot_paths.overhead', bare)
+    best = []
+    for func in (bare, wrapped):
+        runs = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                func()
+            runs.append(time.perf_counter() - start)
+        best.append(min(runs))
+    return (best[1] - best[0]) / CALLS * 1e6
+
+
+def totals() -> dict:
+    return {stat.function: stat.total for stat in timing_stats()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', type=Path, default=REPO_ROOT / 'app.py')
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--out', type=Path, help="write the histograms here (OpenMetrics text)")
+    args = parser.parse_args(argv)
+
+    app_path = args.app.resolve()
+    os.chdir(app_path.parent)
+    os.environ[TIMING_ENV] = '1'
+    recorder = Recorder(time_serialization=True)
+    script_s = recorded = timed_s = 0.0
+    with recorder.installed():
+        for name, module, experiment in scenarios():
+            at = AppTest.from_file(str(app_path), default_timeout=120)
+            at.run()
+            at.sidebar.selectbox[0].set_value(module)
+            at.run()
+            if experiment:
+                at.selectbox[0].set_value(experiment)
+                at.run()
+            for _ in range(args.reruns):
+                before = totals()
+                stats = timed_run(at, recorder)
+                after = totals()
+                script_s += stats.seconds
+                recorded += stats.matplotlib_seconds + stats.plotly_seconds
+                timed_s += sum(after.get(key, 0.0) - before.get(key, 0.0)
+                               for key in ('matplotlib.savefig', 'plotly.to_json'))
+
+    if args.out:
+        write_metrics(str(args.out))
+        print(f"histograms written to {args.out}")
+    stats = [stat for stat in timing_stats() if sum(stat.counts)]
+    calls = sum(sum(stat.counts) for stat in stats)
+    print(f"{'function':52} {'calls':>7} {'total ms':>9} {'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7}")
+    for stat in stats:
+        count = sum(stat.counts)
+        print(f"{stat.function:52} {count:>7} {stat.total * 1000:>9.1f} {stat.total / count * 1000:>8.2f} "
+              + ' '.join(f"{quantile(list(stat.counts), q) * 1000:>7.2f}" for q in (0.5, 0.95, 0.99)))
+    agree = abs(timed_s - recorded) <= AGREEMENT * recorded + 0.005
+    print(f"serialization: {timed_s * 1000:.1f} ms in the histograms, {recorded * 1000:.1f} ms by the Recorder")
+    timed_pages = {stat.function for stat in stats}
+    missing = [f"{module}.{function}" for module, function in PAGES[:5]
+               if f"{module}.{function}" not in timed_pages]
+    if missing:
+        print(f"FAIL: not timed: {', '.join(missing)}", file=sys.stderr)
+    untimed = [stat.function for stat in timing_stats() if not sum(stat.counts)]
+    if untimed:
+        print(f"wrapped but never called: {', '.join(untimed)}")
+    cost_us = timer_cost_us()
+    print(f"timer cost {cost_us:.2f} µs a call; {calls:,} calls, about {calls * cost_us / 1e3:.1f} ms of "
+          f"{script_s * 1000:,.0f} ms script time ({calls * cost_us / 1e4 / script_s:.2f}%)")
+    return 0 if agree and not missing and cost_us < TARGET_US else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Accuracy and time of the HPLC chromatogram pipeline.
+
+Finds the peaks of synthetic traces with a drifting baseline sampled at
+``ACCURACY_POINTS`` rates and checks the retention times and areas of both
+peaks against the true ones, then times ``find_peaks`` on single detector
+traces of increasing length and ``process_injections`` on a batch of
+injections.
+
+Run from the repository root::
+
+    python benchmarks/hplc_pipeline.py
+    python benchmarks/hplc_pipeline.py --injections 24 --points 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.hplc import find_peaks, process_injections  # noqa: E402
+
+ACCURACY_POINTS = (1000, 4500, 9000, 100_000)
+TRACE_POINTS = (100_000, 1_000_000, 5_000_000)
+# (retention time, height, width) of ATRA and the impurity, in minutes
+PEAKS = ((5.0, 3.0, 0.05), (8.0, 1.5, 0.08))
+AREA_TOLERANCE = 0.05  # fraction of the true area
+RETENTION_TOLERANCE_MIN = 0.01
+# The longest trace, well under a second
+TARGET_MS = 1000.0
+
+
+def synthetic_trace(points: int, rng) -> tuple:
+    """15-minute run with a drifting baseline, ATRA at 5 min and an impurity at 8 min."""
+    t = np.linspace(0, 15, points)
+    signal = 0.5 + 0.05 * t + 0.02 * rng.normal(size=points)
+    for retention, height, width in PEAKS:
+        signal += height * np.exp(-0.5 * ((t - retention) / width) ** 2)
+    return t.astype(np.float32), signal.astype(np.float32)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--injections', type=int, default=12)
+    parser.add_argument('--points', type=int, default=500_000, help='points per injection in the batch')
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(0)
+
+    failures = []
+    print(f"{'trace points':>12} {'peak (min)':>10} {'retention':>9} {'area':>7} {'true':>7} {'error':>7}")
+    for points in ACCURACY_POINTS:
+        peaks = find_peaks(*synthetic_trace(points, rng))
+        for retention, height, width in PEAKS:
+            true = height * width * np.sqrt(2 * np.pi)
+            found = peaks[(peaks['retention_time'] - retention).abs() <= RETENTION_TOLERANCE_MIN]
+            if len(found) != 1:
+                failures.append(f"{points} points: {len(found)} peaks at {retention:g} min")
+                continue
+            error = found['area'].iloc[0] / true - 1
+            print(f"{points:>12} {retention:>10g} {found['retention_time'].iloc[0]:>9.3f} "
+                  f"{found['area'].iloc[0]:>7.3f} {true:>7.3f} {error:>7.1%}")
+            if abs(error) > AREA_TOLERANCE:
+                failures.append(f"{points} points: area at {retention:g} min {error:+.1%} off")
+
+    print(f"\n{'trace points':>12} {'find_peaks ms':>14}")
+    for points in TRACE_POINTS:
+        t, signal = synthetic_trace(points, rng)
+        start = time.perf_counter()
+        find_peaks(t, signal)
+        ms = (time.perf_counter() - start) * 1000
+        print(f"{points:>12} {ms:>14.0f}")
+    if ms > TARGET_MS:
+        failures.append(f"{TRACE_POINTS[-1]} points took {ms:.0f} ms")
+
+    frames = []
+    for i in range(args.injections):
+        t, signal = synthetic_trace(args.points, rng)
+        frames.append(pd.DataFrame({'injection': f"injection {i + 1}", 'time': t, 'signal': signal}))
+    traces = pd.concat(frames, ignore_index=True)
+    traces['injection'] = traces['injection'].astype('category')
+    start = time.perf_counter()
+    process_injections(traces)
+    print(f"\nbatch of {args.injections} injections x {args.points} points: "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
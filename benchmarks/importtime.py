@@ -0,0 +1,97 @@
+"""Cold-start cost of the landing page.
+
+Two measurements, each in a fresh interpreter:
+
+* ``python -X importtime app.py`` renders the landing page (Professional
+  version, Background Introduction) in Streamlit's bare mode.  The import
+  log is summarised per heavy library, so a library the landing page does
+  not need showing up here is a regression.
+* Time to first render: one ``AppTest`` run of the landing page, timed after
+  Streamlit itself has been imported (that cost is the same for every app).
+
+``--check`` exits non-zero when a heavy library is imported by the landing
+page or the first render misses ``FIRST_RENDER_TARGET_S``.
+
+Run from the repository root::
+
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py --check
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Libraries only some pages need; none of them may load for the landing page
+HEAVY_MODULES = ('matplotlib', 'seaborn', 'pandas', 'plotly.express', 'PIL')
+# Reported for context; the landing page needs them
+BASE_MODULES = ('streamlit', 'numpy', 'plotly.graph_objects')
+
+FIRST_RENDER_TARGET_S = 1.0
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+_FIRST_RENDER_SNIPPET = '''
+import sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+print(elapsed)
+'''
+
+
+def landing_page_imports(app_path: Path) -> dict:
+    """Map module name -> cumulative import time in microseconds for a bare-mode landing render."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', str(app_path)],
+                          cwd=app_path.parent, capture_output=True, text=True)
+    imports = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.search(line)
+        if match:
+            imports.setdefault(match.group(4), int(match.group(2)))
+    return imports
+
+
+def first_render_seconds(app_path: Path) -> float:
+    proc = subprocess.run([sys.executable, '-c', _FIRST_RENDER_SNIPPET, str(app_path)],
+                          cwd=app_path.parent, capture_output=True, text=True, check=True)
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', type=Path, default=REPO_ROOT / 'app.py')
+    parser.add_argument('--check', action='store_true', help='fail when the cold-start targets are missed')
+    args = parser.parse_args(argv)
+
+    app_path = args.app.resolve()
+    os.chdir(app_path.parent)
+    imports = landing_page_imports(app_path)
+    render_s = first_render_seconds(app_path)
+
+    print(f"{'module':22} {'cumulative ms':>14}")
+    for name in BASE_MODULES + HEAVY_MODULES:
+        value = f"{imports[name] / 1000:.1f}" if name in imports else 'not imported'
+        print(f"{name:22} {value:>14}")
+    print(f"first render of landing page: {render_s * 1000:.0f} ms (target {FIRST_RENDER_TARGET_S * 1000:.0f} ms)")
+
+    failures = [f"{name} imported by the landing page" for name in HEAVY_MODULES if name in imports]
+    if render_s > FIRST_RENDER_TARGET_S:
+        failures.append(f"first render took {render_s:.2f}s")
+    if args.check and failures:
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""Load test: how many concurrent student sessions one server process can take.
+
+Starts the app with ``streamlit run`` on a local port and drives simulated
+sessions over the same WebSocket protocol a browser uses: each session
+loads the app and walks ``STUDENT_PATH`` (module navigation, protocol step
+buttons, sliders, fragment reruns included) over and over, with random
+think time between actions.  The number of sessions is stepped up through
+``--sessions``; for every level it records the rerun latency (action sent
+to script finished) percentiles, leaving out the ``ANIMATED`` buttons
+whose runs sleep through an animation, reruns per second, errors, and, sampled
+from ``/proc`` of the server process, the CPU it used, its busy and total
+threads and its RSS.  Throughput that stops growing with more sessions, or
+a p90 latency over ``--slo``, marks where the server saturates.
+
+Sessions are asyncio tasks, split over ``--clients`` processes so the
+clients keep up at high counts; on a machine with few cores the clients
+compete with the server for CPU, so pin them elsewhere (``taskset``) for
+clean numbers.  Linux only (``/proc``).
+
+Run from the repository root::
+
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --sessions 1,5,10,25,50 --duration 60 --clients 2 --report load.json
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# (action, widget label, value): a student's way through the app, repeated for the whole level
+STUDENT_PATH = [
+    ('select', "Select Module", "Basic Laboratory Procedures"),
+    ('click', "Start Preparation", None),
+    ('click', "Next Step", None),
+    ('click', "Next Step", None),
+    ('select', "Select Experiment", "PCR Amplification"),
+    ('slide', "Number of cycles", 35),
+    ('click', "Initiate PCR amplification", None),
+    ('select', "Select Experiment", "Agarose Gel Electrophoresis"),
+    ('slide', "Electrophoresis voltage(V)", 120),
+    ('click', "Start electrophoresis", None),
+    ('select', "Select Module", "Engineered Bacteria Construction"),
+    ('select', "Select Module", "CRISPR-Cas9 Gene Integration"),
+    ('click', "Execute Next PCR", None),
+    ('select', "Select Module", "Results Analysis"),
+    ('click', "Reset All Experiments", None),
+    ('select', "Select Module", "Background Introduction"),
+]
+WIDGETS = ('button', 'selectbox', 'slider', 'radio', 'text_input', 'number_input')
+# Buttons whose runs play an animation, sleeping between frames by design: their latency is reported apart
+ANIMATED = ("Initiate PCR amplification", "Start electrophoresis")
+SAMPLE_S = 0.25
+RERUN_TIMEOUT_S = 120.0  # the protocol animations sleep for up to half a minute
+SATURATION_GAIN = 1.1  # throughput must grow by this much from one level to the next, or it has saturated
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK')
+FINISHED = ForwardMsg.ScriptFinishedStatus
+
+
+class Session:
+    """One simulated browser tab: a WebSocket to the server and the widgets its last runs drew."""
+
+    def __init__(self, url: str, rng: random.Random, think_s: float):
+        self.url = url
+        self.rng = rng
+        self.think_s = think_s
+        self.widgets: Dict[str, tuple] = {}  # label: (type, id, fragment id)
+        self.states: Dict[str, object] = {}  # widget id: WidgetState the browser keeps sending
+        self.records: List[tuple] = []  # (action, label, seconds, bytes, errors)
+
+    async def run(self, path, until: float, once: bool = False):
+        async with websockets.connect(self.url, subprotocols=['streamlit'], max_size=None,
+                                      origin=self.url.replace('ws://', 'http://').split('/_stcore')[0]) as self.ws:
+            try:
+                await self.walk(path, until, once)
+            except asyncio.TimeoutError:
+                self.records.append(('timeout', '', RERUN_TIMEOUT_S, 0, 1))
+
+    async def walk(self, path, until: float, once: bool):
+        self.records.append(('load', '', *await self.rerun()))
+        while True:
+            for action, label, value in path:
+                await asyncio.sleep(self.rng.expovariate(1 / self.think_s))
+                if time.time() >= until:
+                    return
+                if label not in self.widgets:
+                    self.records.append(('skipped', label, 0.0, 0, 0))
+                    continue
+                _, widget_id, fragment = self.widgets[label]
+                trigger = None
+                if action == 'click':
+                    trigger = widget_id
+                elif action == 'select':
+                    self.states[widget_id] = ('string_value', value)
+                else:
+                    self.states[widget_id] = ('double_array_value', [float(value)])
+                self.records.append((action, label, *await self.rerun(fragment, trigger)))
+            if once:
+                return
+
+    async def rerun(self, fragment: Optional[str] = None, trigger: Optional[str] = None):
+        """Seconds until the run (and any rerun it asked for) finished, bytes received and exceptions shown."""
+        message = BackMsg()
+        client = message.rerun_script
+        client.SetInParent()
+        if fragment:
+            client.fragment_id = fragment
+        for widget_id, (field, value) in self.states.items():
+            state = client.widget_states.widgets.add()
+            state.id = widget_id
+            if field == 'string_value':
+                state.string_value = value
+            else:
+                state.double_array_value.data.extend(value)
+        if trigger:
+            state = client.widget_states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+        if not fragment:
+            self.widgets = {}
+        start = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        received = errors = 0
+        while True:
+            data = await asyncio.wait_for(self.ws.recv(), RERUN_TIMEOUT_S)
+            received += len(data)
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof('type')
+            if kind == 'delta' and forward.delta.WhichOneof('type') == 'new_element':
+                element = forward.delta.new_element
+                element_type = element.WhichOneof('type')
+                if element_type == 'exception':
+                    errors += 1
+                elif element_type in WIDGETS:
+                    widget = getattr(element, element_type)
+                    self.widgets.setdefault(widget.label, (element_type, widget.id, forward.delta.fragment_id))
+            elif kind == 'script_finished' and forward.script_finished != FINISHED.FINISHED_EARLY_FOR_RERUN:
+                return time.perf_counter() - start, received, errors
+
+
+def _drive(url: str, sessions: int, seed: int, think_s: float, duration_s: float, once: bool = False) -> List[tuple]:
+    """Run ``sessions`` sessions in this process for ``duration_s`` (or one walk of the path); their records."""
+    async def main():
+        until = time.time() + duration_s
+        tasks = [Session(url, random.Random(seed * 100_003 + index), think_s) for index in range(sessions)]
+
+        async def start(session):
+            # Sessions arrive over one think time, not all at once
+            await asyncio.sleep(session.rng.uniform(0, think_s))
+            await session.run(STUDENT_PATH, until, once)
+
+        await asyncio.gather(*(start(s) for s in tasks))
+        return [record for s in tasks for record in s.records]
+    return asyncio.run(main())
+
+
+class ServerMonitor(threading.Thread):
+    """Samples the server process from /proc: CPU seconds, threads with CPU time since the last sample, RSS."""
+
+    def __init__(self, pid: int):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.samples: List[tuple] = []  # (time, cpu seconds, busy threads, threads, RSS bytes)
+        self._done = threading.Event()
+
+    @staticmethod
+    def _ticks(stat_path: str) -> int:
+        """User plus system clock ticks from a /proc stat file."""
+        with open(stat_path) as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        return int(fields[11]) + int(fields[12])
+
+    def _threads(self) -> Dict[str, int]:
+        ticks = {}
+        for task in os.listdir(f"/proc/{self.pid}/task"):
+            try:
+                ticks[task] = self._ticks(f"/proc/{self.pid}/task/{task}/stat")
+            except (FileNotFoundError, ProcessLookupError):
+                pass
+        return ticks
+
+    def run(self):
+        last = self._threads()
+        while not self._done.wait(SAMPLE_S):
+            try:
+                ticks = self._threads()
+                # The process total keeps the time of script threads that have since exited
+                cpu = self._ticks(f"/proc/{self.pid}/stat") / CLOCK_TICKS
+                with open(f"/proc/{self.pid}/status") as f:
+                    rss = next(int(line.split()[1]) * 1024 for line in f if line.startswith('VmRSS'))
+            except (FileNotFoundError, ProcessLookupError):
+                return
+            busy = sum(1 for task, t in ticks.items() if t > last.get(task, 0))
+            self.samples.append((time.time(), cpu, busy, len(ticks), rss))
+            last = ticks
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+    def between(self, start: float, end: float) -> dict:
+        window = [s for s in self.samples if start <= s[0] <= end]
+        if len(window) < 2:
+            return {'cpu_cores': 0.0, 'busy_threads': 0.0, 'threads': 0, 'rss_mb': 0.0, 'rss_growth_mb': 0.0}
+        return {'cpu_cores': (window[-1][1] - window[0][1]) / (window[-1][0] - window[0][0]),
+                'busy_threads': float(np.mean([s[2] for s in window])),
+                'threads': max(s[3] for s in window),
+                'rss_mb': window[-1][4] / 2 ** 20,
+                'rss_growth_mb': (window[-1][4] - window[0][4]) / 2 ** 20}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(app: Path, port: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', str(app), '--server.headless', 'true', '--server.port', str(port),
+         '--server.address', '127.0.0.1', '--browser.gatherUsageStats', 'false',
+         '--server.enableXsrfProtection', 'false', '--server.fileWatcherType', 'none'],
+        cwd=app.parent, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("the server did not start")
+
+
+def run_level(url: str, sessions: int, clients: int, think_s: float, duration_s: float, seed: int,
+              pool: concurrent.futures.Executor, once: bool = False) -> List[tuple]:
+    shares = [sessions // clients + (i < sessions % clients) for i in range(clients)]
+    futures = [pool.submit(_drive, url, share, seed * 1000 + i, think_s, duration_s, once)
+               for i, share in enumerate(shares) if share]
+    return [record for future in futures for record in future.result()]
+
+
+def summarize(sessions: int, records: List[tuple], seconds: float, server: dict) -> dict:
+    reruns = [r for r in records if r[0] not in ('load', 'skipped', 'timeout')]
+    interactive = [r[2] for r in reruns if r[1] not in ANIMATED]
+    latency = np.array(interactive) * 1000 if interactive else np.zeros(1)
+    animated = [r[2] * 1000 for r in reruns if r[1] in ANIMATED]
+    by_label: Dict[str, List[float]] = {}
+    for action, label, elapsed, _, _ in reruns:
+        by_label.setdefault(f"{action} {label}", []).append(elapsed * 1000)
+    return {
+        'sessions': sessions,
+        'reruns': len(reruns),
+        'reruns_per_s': len(reruns) / seconds,
+        'p50_ms': float(np.percentile(latency, 50)),
+        'p90_ms': float(np.percentile(latency, 90)),
+        'p99_ms': float(np.percentile(latency, 99)),
+        'max_ms': float(latency.max()),
+        'animated_p50_ms': float(np.median(animated or [0])),
+        'load_ms': float(np.median([r[2] for r in records if r[0] == 'load'] or [0]) * 1000),
+        'errors': sum(r[4] for r in records),
+        'timeouts': sum(r[0] == 'timeout' for r in records),
+        'skipped': sum(r[0] == 'skipped' for r in records),
+        'received_mb': sum(r[3] for r in records) / 2 ** 20,
+        'slowest': sorted(((label, float(np.percentile(ms, 90))) for label, ms in by_label.items()),
+                          key=lambda item: -item[1])[:5],
+        **server,
+    }
+
+
+def saturation(levels: List[dict], slo_ms: float) -> str:
+    notes = []
+    for previous, level in zip(levels, levels[1:]):
+        if level['reruns_per_s'] < previous['reruns_per_s'] * SATURATION_GAIN:
+            notes.append(f"throughput saturates at about {previous['sessions']} sessions "
+                         f"({previous['reruns_per_s']:.1f} reruns/s, {previous['cpu_cores']:.2f} cores)")
+            break
+    over = [level for level in levels if level['p90_ms'] > slo_ms]
+    if over:
+        notes.append(f"p90 latency passes {slo_ms:g} ms at {over[0]['sessions']} sessions")
+    return '; '.join(notes) or f"no saturation up to {levels[-1]['sessions']} sessions"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', type=Path, default=REPO_ROOT / 'app.py')
+    parser.add_argument('--sessions', default='1,2,4,8,16', help="comma-separated session counts, one level each")
+    parser.add_argument('--duration', type=float, default=60.0, help="seconds per level")
+    parser.add_argument('--think', type=float, default=2.0, help="mean think time between actions, seconds")
+    parser.add_argument('--clients', type=int, default=1, help="client processes")
+    parser.add_argument('--slo', type=float, default=1000.0, help="p90 rerun latency bound, ms")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--report', type=Path, help="write the levels as JSON here")
+    args = parser.parse_args(argv)
+
+    port = free_port()
+    server = start_server(args.app.resolve(), port)
+    monitor = ServerMonitor(server.pid)
+    monitor.start()
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    levels = []
+    try:
+        with concurrent.futures.ProcessPoolExecutor(args.clients,
+                                                    mp_context=multiprocessing.get_context('spawn')) as pool:
+            # Warm-up: one session through the whole path, so imports and caches are not charged to level 1
+            run_level(url, 1, 1, 0.05, RERUN_TIMEOUT_S * len(STUDENT_PATH), args.seed, pool, once=True)
+            print(f"{'sessions':>8} {'reruns/s':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'load ms':>8} "
+                  f"{'errors':>6} {'cores':>6} {'busy':>5} {'threads':>7} {'RSS MB':>7} {'+MB':>6}")
+            for count in (int(n) for n in args.sessions.split(',')):
+                start = time.time()
+                records = run_level(url, count, min(args.clients, count), args.think, args.duration, args.seed,
+                                    pool)
+                end = time.time()
+                level = summarize(count, records, end - start, monitor.between(start, end))
+                levels.append(level)
+                print(f"{count:>8} {level['reruns_per_s']:>8.1f} {level['p50_ms']:>8.0f} {level['p90_ms']:>8.0f} "
+                      f"{level['p99_ms']:>8.0f} {level['load_ms']:>8.0f} {level['errors']:>6} "
+                      f"{level['cpu_cores']:>6.2f} {level['busy_threads']:>5.1f} {level['threads']:>7} "
+                      f"{level['rss_mb']:>7.0f} {level['rss_growth_mb']:>6.1f}")
+    finally:
+        monitor.stop()
+        server.terminate()
+        server.wait(timeout=30)
+    print(saturation(levels, args.slo))
+    print(f"animations ({', '.join(ANIMATED)}) at the highest level: "
+          f"{levels[-1]['animated_p50_ms']:.0f} ms median, not counted in the percentiles")
+    print("slowest actions at the highest level (p90 ms): "
+          + ', '.join(f"{label} {ms:.0f}" for label, ms in levels[-1]['slowest']))
+    if args.report:
+        args.report.write_text(json.dumps({'think_s': args.think, 'duration_s': args.duration,
+                                           'clients': args.clients, 'levels': levels}, indent=2))
+    return 0 if not any(level['errors'] for level in levels) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Memory the server's sessions leave behind, read from the memory sampler's metrics endpoint.
+
+Starts the app with ``MEMORY_ENV`` set (see ``load_test``), walks
+``--sessions`` simulated students part-way through ``STUDENT_PATH`` so they
+stop on different pages, and reads ``/_stcore/metrics`` until every session
+and every cache has been sized.  Reports the process RSS, the session state by page and its
+largest sessions, the caches with their hit rates, and the pyplot figures
+still open, which should be none: a page that saves a figure and leaves it
+open leaks it into pyplot's registry on every run.  Fails on open figures
+or a sample slower than ``TARGET_MS``.
+
+Run from the repository root::
+
+    python benchmarks/memory_profile.py
+    python benchmarks/memory_profile.py --sessions 12
+"""
+import argparse
+import asyncio
+import collections
+import os
+import random
+import re
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.memory import MEMORY_ENV, SAMPLE_S  # noqa: E402
+from load_test import STUDENT_PATH, Session, free_port, start_server  # noqa: E402
+
+# One sample (process, a few sessions and a cache sized), well under a second of a core every SAMPLE_S
+TARGET_MS = 50.0
+METRIC = re.compile(r'^(\w+)(?:\{(.*)\})? (\S+)$')
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def read_metrics(url: str) -> dict:
+    """family: [(labels, value)] of the experiment_* metrics."""
+    with urllib.request.urlopen(url, timeout=30) as response:
+        text = response.read().decode()
+    metrics = collections.defaultdict(list)
+    for line in text.splitlines():
+        match = METRIC.match(line)
+        if match and match.group(1).startswith('experiment_'):
+            metrics[match.group(1)].append((dict(LABEL.findall(match.group(2) or '')), float(match.group(3))))
+    return metrics
+
+
+async def walk(url: str, sessions: int, seed: int):
+    """Each session walks a different prefix of the path, so they end on different pages."""
+    rng = random.Random(seed)
+    walks = [Session(url, random.Random(seed * 1000 + index), 0.05) for index in range(sessions)]
+    await asyncio.gather(*(session.run(STUDENT_PATH[:rng.randint(1, len(STUDENT_PATH))], time.time() + 600, True)
+                           for session in walks))
+    return sum(record[4] for session in walks for record in session.records)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', type=Path, default=REPO_ROOT / 'app.py')
+    parser.add_argument('--sessions', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.environ[MEMORY_ENV] = '1'
+    port = free_port()
+    server = start_server(args.app.resolve(), port)
+    try:
+        started = time.time()
+        errors = asyncio.run(walk(f"ws://127.0.0.1:{port}/_stcore/stream", args.sessions, args.seed))
+        print(f"{args.sessions} sessions walked in {time.time() - started:.0f} s, {errors} errors shown")
+        # Sessions are sized a few per sample and caches one per sample; disconnected sessions are kept for a
+        # reconnect only a while, so each is taken as last read while it was there
+        deadline = time.time() + SAMPLE_S * (args.sessions + 30)
+        by_session = {}
+        while True:
+            metrics = read_metrics(f"http://127.0.0.1:{port}/_stcore/metrics")
+            by_session.update({labels['session']: (labels, value)
+                               for labels, value in metrics['experiment_session_state_bytes']})
+            sized = list(by_session.values())
+            missed = {labels['cache'] for labels, value in metrics['experiment_cache_requests_total']
+                      if labels['result'] == 'miss' and value}
+            unsized = missed - {labels['cache'] for labels, value in metrics['experiment_cache_bytes'] if value}
+            if (len(sized) >= args.sessions and not unsized) or time.time() > deadline:
+                break
+            time.sleep(SAMPLE_S)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    rss = metrics['experiment_process_rss_bytes'][0][1] / 2 ** 20
+    sample_ms = metrics['experiment_memory_sample_microseconds'][0][1] / 1000
+    print(f"process RSS {rss:,.0f} MB; last sample took {sample_ms:.1f} ms; {len(sized)}/{args.sessions} "
+          f"sessions sized")
+    pages = collections.defaultdict(list)
+    for labels, value in sized:
+        pages[labels['page']].append(value / 1024)
+    print("session state by page (kB): " + '; '.join(
+        f"{page or '(none)'}: {len(sizes)} sessions, mean {sum(sizes) / len(sizes):,.1f}, max {max(sizes):,.1f}"
+        for page, sizes in sorted(pages.items(), key=lambda item: -max(item[1]))))
+    requests = collections.defaultdict(dict)
+    for labels, value in metrics['experiment_cache_requests_total']:
+        requests[labels['cache']][labels['result']] = int(value)
+    sizes = {labels['cache']: value / 2 ** 20 for labels, value in metrics['experiment_cache_bytes']}
+    for cache, counts in sorted(requests.items(), key=lambda item: -sizes.get(item[0], 0)):
+        total = counts.get('hit', 0) + counts.get('miss', 0)
+        print(f"  {cache:<45} {sizes.get(cache, 0):>8.2f} MB  {counts.get('hit', 0):>4} hits "
+              f"{counts.get('miss', 0):>4} misses" + (f"  {counts.get('hit', 0) / total:.0%}" if total else ''))
+    figures = {labels['figure']: int(value) for labels, value in metrics['experiment_open_figures']}
+    print("open pyplot figures: " + (', '.join(f"{label} x{count}" for label, count in figures.items()) or "none"))
+    ok = not figures and len(sized) >= args.sessions and not errors
+    return 0 if ok and sample_ms < TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""Per-page rerun cost, checked against a stored baseline.
+
+Drives every sidebar module, and every experiment of Basic Laboratory
+Procedures, with ``AppTest`` (simulated sleeps skipped).  Each page is
+rendered once to warm up, then rerun ``--reruns`` times; the median rerun is
+recorded:
+
+* ``script_ms``: time inside the script run
+* ``figures``: charts and images sent (plotly, st.pyplot/st.image, vega)
+* ``matplotlib_ms`` / ``plotly_ms``: time in ``Figure.savefig`` and
+  ``plotly.io.to_json``
+* ``forward_bytes``: bytes of forward messages sent to the browser
+
+Script times depend on the machine, so before each page the script also
+times ``calibrate``, a fixed mix of Python, NumPy and Matplotlib work, and
+takes the median over the pages as the run's calibration time: spread over
+the whole run, it follows a shared machine whose speed drifts, and one slow
+sample does not move it.  The baseline keeps its calibration time, and its
+script times are scaled by this run's calibration time over the baseline's
+before they are compared.
+
+``--update`` writes the results to ``baselines/page_costs.json``.  Without it
+the results are compared with that file, and the script exits non-zero when a
+page's script time or bytes grow by more than ``--threshold`` (script time
+also has to grow by at least ``MIN_REGRESSION_MS``, which keeps timer noise on
+cheap pages from failing the check).
+
+Run from the repository root::
+
+    python benchmarks/page_costs.py
+    python benchmarks/page_costs.py --update
+"""
+import argparse
+import dataclasses
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from _apptest import REPO_ROOT, Recorder, RunStats, timed_run
+
+BASELINE_PATH = Path(__file__).resolve().parent / 'baselines' / 'page_costs.json'
+
+DEFAULT_THRESHOLD = 0.25
+MIN_REGRESSION_MS = 20.0
+CALIBRATION_RUNS = 5
+
+MODULES = ("Background Introduction", "Basic Laboratory Procedures", "Engineered Bacteria Construction",
+           "CRISPR-Cas9 Gene Integration", "Results Analysis")
+BASIC_EXPERIMENTS = ("LB Medium Preparation", "Plasmid Extraction", "PCR Amplification",
+                     "Agarose Gel Electrophoresis", "Gel Extraction", "Heat Shock Transformation",
+                     "Electrocompetent Cell Preparation")
+
+
+@dataclasses.dataclass
+class PageCost:
+    script_ms: float
+    figures: int
+    matplotlib_ms: float
+    plotly_ms: float
+    forward_bytes: int
+
+
+def scenarios() -> List[Tuple[str, str, Optional[str]]]:
+    """(name, sidebar module, basic experiment) for every page the suite covers."""
+    pages = [(module, module, None) for module in MODULES]
+    pages += [(f"{MODULES[1]} / {experiment}", MODULES[1], experiment) for experiment in BASIC_EXPERIMENTS]
+    return pages
+
+
+def calibrate() -> float:
+    """Milliseconds of a fixed workload on this machine, the median of ``CALIBRATION_RUNS`` like the pages' times."""
+    from matplotlib.figure import Figure
+
+    def workload():
+        rng = random.Random(0)
+        rows = sorted(({'well': f"{chr(65 + i % 8)}{i % 12 + 1}", 'od': rng.random()} for i in range(20_000)),
+                      key=lambda row: row['od'])
+        values = np.random.default_rng(0).normal(size=(400, 400))
+        np.linalg.svd(values @ values.T, compute_uv=False)
+        fig = Figure(figsize=(6, 4), dpi=100)
+        ax = fig.add_subplot()
+        ax.plot([row['od'] for row in rows[::20]])
+        ax.hist(values.ravel(), bins=50)
+        fig.savefig(io.BytesIO(), format='png')
+
+    workload()  # imports and font lookups
+    times = []
+    for _ in range(CALIBRATION_RUNS):
+        start = time.perf_counter()
+        workload()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def summarize(stats: List[RunStats]) -> PageCost:
+    return PageCost(
+        script_ms=round(statistics.median(s.seconds for s in stats) * 1000, 1),
+        figures=int(statistics.median(s.figures for s in stats)),
+        matplotlib_ms=round(statistics.median(s.matplotlib_seconds for s in stats) * 1000, 1),
+        plotly_ms=round(statistics.median(s.plotly_seconds for s in stats) * 1000, 1),
+        forward_bytes=int(statistics.median(s.forward_bytes for s in stats)),
+    )
+
+
+def measure(app_path: Path, reruns: int) -> Tuple[Dict[str, PageCost], float]:
+    """Every page's cost, and the run's calibration time in ms."""
+    results, calibrations = {}, []
+    recorder = Recorder(time_serialization=True)
+    with recorder.installed():
+        for name, module, experiment in scenarios():
+            at = AppTest.from_file(str(app_path), default_timeout=120)
+            at.run()
+            at.sidebar.selectbox[0].set_value(module)
+            at.run()
+            if experiment:
+                at.selectbox[0].set_value(experiment)
+                at.run()
+            calibrations.append(calibrate())
+            results[name] = summarize([timed_run(at, recorder) for _ in range(reruns)])
+    return results, round(statistics.median(calibrations), 1)
+
+
+def regressions(results: Dict[str, PageCost], baseline: Dict[str, dict], threshold: float,
+                scale: float = 1.0) -> List[str]:
+    """Pages slower or heavier than the baseline, whose script times are first multiplied by scale."""
+    failures = []
+    for name, cost in results.items():
+        if name not in baseline:
+            continue
+        base = PageCost(**baseline[name])
+        base_ms = base.script_ms * scale
+        if cost.script_ms > base_ms * (1 + threshold) and cost.script_ms - base_ms >= MIN_REGRESSION_MS:
+            failures.append(f"{name}: script time {base_ms:.1f} (scaled) -> {cost.script_ms:.1f} ms")
+        if cost.forward_bytes > base.forward_bytes * (1 + threshold):
+            failures.append(f"{name}: forward bytes {base.forward_bytes} -> {cost.forward_bytes}")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', type=Path, default=REPO_ROOT / 'app.py')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed relative growth before a page counts as regressed')
+    parser.add_argument('--update', action='store_true', help='write the results as the new baseline')
+    args = parser.parse_args(argv)
+
+    app_path = args.app.resolve()
+    os.chdir(app_path.parent)
+    results, calibration_ms = measure(app_path, args.reruns)
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    baseline = stored.get('pages', {})
+    # A baseline written before calibration is compared unscaled
+    scale = calibration_ms / stored['calibration_ms'] if 'calibration_ms' in stored else 1.0
+
+    print(f"calibration {calibration_ms:.1f} ms"
+          + (f", the baseline's {stored['calibration_ms']:.1f} ms: its script times scaled by {scale:.2f}"
+             if 'calibration_ms' in stored else ''))
+    print(f"{'page':64} {'script ms':>9} {'base ms':>8} {'figs':>4} {'mpl ms':>7} {'plotly ms':>9} {'bytes':>8}")
+    for name, cost in results.items():
+        base_ms = f"{baseline[name]['script_ms'] * scale:.1f}" if name in baseline else '-'
+        print(f"{name:64} {cost.script_ms:>9.1f} {base_ms:>8} {cost.figures:>4} {cost.matplotlib_ms:>7.1f} "
+              f"{cost.plotly_ms:>9.1f} {cost.forward_bytes:>8}")
+
+    if args.update:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        payload = {'calibration_ms': calibration_ms,
+                   'pages': {name: dataclasses.asdict(cost) for name, cost in results.items()}}
+        args.baseline.write_text(json.dumps(payload, indent=2) + '\n')
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    failures = regressions(results, baseline, args.threshold, scale)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
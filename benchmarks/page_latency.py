@@ -0,0 +1,69 @@
+"""Time to show each sidebar page, cold and warm.
+
+Each page is measured in a fresh interpreter: the landing page is rendered
+first (as a browser session would), then the page is selected in the sidebar
+(first visit, which pays for any imports the page needs), then the landing
+page and the page again (revisit).  The app script itself is re-executed on
+every rerun, so whatever it defines at module level is paid on every one of
+these reruns.
+
+Run from the repository root::
+
+    python benchmarks/page_latency.py
+    python benchmarks/page_latency.py --app /path/to/older/app.py
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+PAGES = ("Background Introduction", "Basic Laboratory Procedures", "Engineered Bacteria Construction",
+         "CRISPR-Cas9 Gene Integration", "Results Analysis")
+
+_PAGE_SNIPPET = '''
+import json, sys, time
+sys.path.insert(0, sys.argv[3])
+from _apptest import Recorder, timed_run
+from streamlit.testing.v1 import AppTest
+recorder = Recorder()
+with recorder.installed():
+    at = AppTest.from_file(sys.argv[1], default_timeout=120)
+    landing = timed_run(at, recorder)
+    at.sidebar.selectbox[0].set_value(sys.argv[2])
+    first = timed_run(at, recorder)
+    at.sidebar.selectbox[0].set_value(at.sidebar.selectbox[0].options[0])
+    at.run()
+    at.sidebar.selectbox[0].set_value(sys.argv[2])
+    again = timed_run(at, recorder)
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+print(json.dumps([landing.seconds, first.seconds, again.seconds]))
+'''
+
+
+def measure_page(app_path: Path, page: str) -> list:
+    proc = subprocess.run([sys.executable, '-c', _PAGE_SNIPPET, str(app_path), page, str(Path(__file__).parent)],
+                          cwd=app_path.parent, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', type=Path, default=REPO_ROOT / 'app.py')
+    args = parser.parse_args(argv)
+
+    app_path = args.app.resolve()
+    os.chdir(app_path.parent)
+    print(f"{'page':36} {'landing ms':>10} {'first visit ms':>14} {'revisit ms':>10}")
+    for page in PAGES:
+        landing, first, again = measure_page(app_path, page)
+        print(f"{page:36} {landing * 1000:>10.0f} {first * 1000:>14.0f} {again * 1000:>10.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Time of the ATRA pathway ODE model and its Sobol sensitivity analysis.
+
+Integrates growing batches of random enzyme-level combinations with
+``simulate_pathway``, serially and in the process pool (started before
+timing, as it is in a running server), checks a sample of the titres
+against a fine fixed-step RK4 reference, and times ``sobol_indices``.  Fails
+when an index's first-order interval lies wholly above its total one: S1
+cannot exceed ST, so the sample is too small for the intervals shown.
+
+Run from the repository root::
+
+    python benchmarks/pathway_flux.py
+    python benchmarks/pathway_flux.py --samples 8192
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.parallel import process_pool  # noqa: E402
+from experiment_platform.pathway import (_VMAX, ATRA_MG_PER_UMOL, DURATION_H, ENZYME_NAMES, SPECIES,  # noqa: E402
+                                         _derivatives, atra_titre, sobol_indices)
+
+COMBINATIONS = (1_000, 10_000, 50_000)
+REFERENCE_ROWS = 50
+REFERENCE_STEPS = 20_000
+
+
+def rk4_titre(levels: np.ndarray) -> np.ndarray:
+    """ATRA (µM) at DURATION_H by classic RK4 with a small fixed step."""
+    vmax = _VMAX * levels
+    y = np.zeros((len(levels), len(SPECIES)))
+    h = DURATION_H / REFERENCE_STEPS
+    for _ in range(REFERENCE_STEPS):
+        k1 = _derivatives(y, vmax)
+        k2 = _derivatives(y + h / 2 * k1, vmax)
+        k3 = _derivatives(y + h / 2 * k2, vmax)
+        k4 = _derivatives(y + h * k3, vmax)
+        y = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    return y[:, SPECIES.index('ATRA')]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--samples', type=int, default=2048, help="Sobol base samples")
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(0)
+    process_pool().submit(int).result()
+
+    print(f"{'combinations':>13} {'serial s':>9} {'pool s':>7}")
+    for combinations in COMBINATIONS:
+        levels = np.exp(rng.uniform(-1, 1, (combinations, len(ENZYME_NAMES))) * np.log(4))
+        timings = []
+        for parallel in (False, True):
+            start = time.perf_counter()
+            titres = atra_titre(levels, parallel=parallel)
+            timings.append(time.perf_counter() - start)
+        print(f"{combinations:>13,} {timings[0]:>9.2f} {timings[1]:>7.2f}")
+
+    reference = rk4_titre(levels[:REFERENCE_ROWS])
+    error = np.max(np.abs(titres[:REFERENCE_ROWS] / (reference * ATRA_MG_PER_UMOL) - 1))
+    print(f"\nmax relative error vs RK4 reference: {error:.2e}")
+
+    start = time.perf_counter()
+    sensitivity = sobol_indices(args.samples)
+    print(f"Sobol indices: {sensitivity.simulations:,} simulations in {time.perf_counter() - start:.2f} s")
+    inconsistent = []
+    for index, name in enumerate(ENZYME_NAMES):
+        first, total = sensitivity.first_order_interval[:, index], sensitivity.total_interval[:, index]
+        print(f"  {name:<6} S1 {sensitivity.first_order[index]:6.3f} [{first[0]:6.3f}, {first[1]:6.3f}]  "
+              f"ST {sensitivity.total[index]:6.3f} [{total[0]:6.3f}, {total[1]:6.3f}]")
+        # S1 <= ST always holds; intervals that cannot both contain a consistent pair mean too few samples
+        if first[0] > total[1]:
+            inconsistent.append(name)
+    if inconsistent:
+        print(f"FAIL: S1 above ST beyond their intervals for {', '.join(inconsistent)}", file=sys.stderr)
+    return 0 if error < 1e-3 and not inconsistent else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
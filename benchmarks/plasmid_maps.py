@@ -0,0 +1,120 @@
+"""Reading, laying out and drawing plasmid maps of large multi-record GenBank files.
+
+Writes a GenBank file of ``--records`` random constructs of up to ``--kb``
+kilobases, each with tens to hundreds of features, some across the origin.
+The file is read with and without the sequences (time and peak traced
+memory), then every record is laid out and rendered to SVG.  The run checks
+that no two arcs on a track overlap and that no two labels on a side are
+closer than a line.
+
+Run from the repository root::
+
+    python benchmarks/plasmid_maps.py
+    python benchmarks/plasmid_maps.py --records 100 --kb 500
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.plasmid import (FONT_SIZE, LABEL_SPACING, layout_map, read_records,  # noqa: E402
+                                         render_svg, span)
+
+KINDS = ('CDS', 'gene', 'promoter', 'terminator', 'rep_origin', 'misc_feature', 'primer_bind')
+# A map drawn on first view should not hold the page up longer than this
+TARGET_MS = 50.0
+
+
+def genbank_record(name: str, length: int, features: int, rng) -> str:
+    lines = [f"LOCUS       {name:<16} {length} bp    DNA     circular SYN 01-JAN-2024",
+             f"DEFINITION  Synthetic construct {name}.",
+             "FEATURES             Location/Qualifiers",
+             f"     source          1..{length}"]
+    for index in range(features):
+        start = int(rng.integers(1, length))
+        end = start + int(rng.integers(20, max(length // 8, 40)))
+        if end > length:
+            location = f"join({start}..{length},1..{end - length})"
+        else:
+            location = f"{start}..{end}"
+        if rng.random() < 0.5:
+            location = f"complement({location})"
+        lines.append(f"     {KINDS[index % len(KINDS)]:<16}{location}")
+        lines.append(f'                     /label="{name}_f{index}"')
+    lines.append("ORIGIN")
+    bases = ''.join(rng.choice(list('acgt'), length))
+    for offset in range(0, length, 60):
+        blocks = ' '.join(bases[i:i + 10] for i in range(offset, min(offset + 60, length), 10))
+        lines.append(f"{offset + 1:>9} {blocks}")
+    lines.append("//")
+    return '\n'.join(lines) + '\n'
+
+
+def read_all(path: Path, sequence: bool):
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = list(read_records(path, sequence=sequence))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return records, elapsed, peak
+
+
+def overlaps(plasmid, layout) -> int:
+    """Arcs overlapping on a track, and labels on a side closer than a line."""
+    found = 0
+    length = plasmid.length
+    for track in np.unique(layout.tracks):
+        arcs = sorted((f.start, f.start + span(f, length)) for f, t in zip(plasmid.features, layout.tracks)
+                      if t == track)
+        # Unrolled once round the circle, so an arc across the origin meets the first arcs again
+        unrolled = arcs + [(a + length, b + length) for a, b in arcs]
+        found += sum(b > c for (_, b), (c, _) in zip(unrolled, unrolled[1:]))
+    line = FONT_SIZE * LABEL_SPACING
+    for side in (True, False):
+        ys = np.sort(layout.label_xy[layout.right == side, 1])
+        found += int((np.diff(ys) < line - 1e-6).sum())
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=40)
+    parser.add_argument('--kb', type=int, default=200, help="largest construct, kilobases")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'constructs.gb'
+        with open(path, 'w') as handle:
+            for record in range(args.records):
+                length = int(rng.integers(3000, args.kb * 1000))
+                handle.write(genbank_record(f"pSYN{record:03d}", length, int(rng.integers(10, 300)), rng))
+        size = path.stat().st_size
+        for sequence in (True, False):
+            records, elapsed, peak = read_all(path, sequence)
+            print(f"read {'with' if sequence else 'without'} sequences: {len(records)} records, "
+                  f"{size / 2 ** 20:.1f} MB in {elapsed:.2f} s, peak {peak / 2 ** 20:.1f} MB traced")
+
+    seconds, bad = [], 0
+    for plasmid in records:
+        start = time.perf_counter()
+        layout = layout_map(plasmid)
+        render_svg(plasmid, layout)
+        seconds.append(time.perf_counter() - start)
+        bad += overlaps(plasmid, layout)
+    features = sum(len(plasmid.features) for plasmid in records)
+    print(f"layout and SVG: {features} features, {np.median(seconds) * 1000:.1f} ms median per map "
+          f"(max {np.max(seconds) * 1000:.1f}); overlaps: {bad}")
+    return 0 if bad == 0 and np.median(seconds) * 1000 < TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Correctness and time of primer design on random multi-kilobase templates.
+
+Designs primers for ``--templates`` random templates of up to ``--kb``
+kilobases, each with a 0.5 to 2 kb target, with homology tails on half of
+them.  The Tm, hairpin and dimer scores of the pairs returned are checked
+against plain per-primer computations: the nearest-neighbor sum base by
+base, and every antiparallel alignment of the two strands walked one
+stacked pair at a time.
+
+Run from the repository root::
+
+    python benchmarks/primer_design.py
+    python benchmarks/primer_design.py --templates 50 --kb 50
+"""
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.assembly import random_bases, reverse_complement  # noqa: E402
+from experiment_platform.primers import (DNTP_MM, DUPLEX_INITIATION, GAS_CONSTANT, HAIRPIN_LOOP,  # noqa: E402
+                                         INITIATION, MAGNESIUM_MM, MIN_LOOP, NEAREST_NEIGHBOR, PRIMER_NM, SODIUM_MM,
+                                         design_primers)
+
+# Multi-kilobase templates should be designed well under a second
+TARGET_MS = 500.0
+PAIRS = {'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A'}
+
+
+def stack(pair: str):
+    return NEAREST_NEIGHBOR.get(pair) or NEAREST_NEIGHBOR[reverse_complement(pair)]
+
+
+def reference_tm(sequence: str) -> float:
+    enthalpy = sum(stack(sequence[i:i + 2])[0] for i in range(len(sequence) - 1))
+    entropy = sum(stack(sequence[i:i + 2])[1] for i in range(len(sequence) - 1))
+    for base in (sequence[0], sequence[-1]):
+        dh, ds = INITIATION['GC' if base in 'GC' else 'AT']
+        enthalpy, entropy = enthalpy + dh, entropy + ds
+    sodium = (SODIUM_MM + 120 * math.sqrt(MAGNESIUM_MM - DNTP_MM)) / 1000
+    entropy += 0.368 * (len(sequence) - 1) * math.log(sodium)
+    return 1000 * enthalpy / (entropy + GAS_CONSTANT * math.log(PRIMER_NM * 1e-9 / 4)) - 273.15
+
+
+def reference_stem(first: str, second: str, hairpin: bool = False) -> float:
+    """Most stable run of stacked antiparallel pairs, one alignment at a time."""
+    best = 0.0
+    for total in range(len(first) + len(second) - 1):
+        run = 0.0
+        # Pairs (a, b) with a + b = total, walked with a rising and b falling
+        for a in range(max(0, total - len(second) + 1), min(len(first), total + 1) - 1):
+            b = total - a
+            pairs = (PAIRS.get(first[a]) == second[b] and PAIRS.get(first[a + 1]) == second[b - 1])
+            if hairpin:
+                pairs = pairs and (b - 1) - (a + 1) - 1 >= MIN_LOOP
+            if pairs:
+                dh, ds = stack(first[a:a + 2])
+                run += -(dh - 310.15 * ds / 1000)
+                best = max(best, run)
+            else:
+                run = 0.0
+    penalty = HAIRPIN_LOOP if hairpin else DUPLEX_INITIATION
+    return min(penalty - best, 0.0) if best > 0 else 0.0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--templates', type=int, default=20)
+    parser.add_argument('--kb', type=int, default=10, help="longest template, kilobases")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    seconds, checked, wrong, designed = [], 0, 0, 0
+    for index in range(args.templates):
+        length = int(rng.integers(3000, args.kb * 1000 + 1))
+        template = random_bases(length, f"template{index}")
+        size = int(rng.integers(500, 2001))
+        start = int(rng.integers(300, length - size - 300))
+        tails = ('', '')
+        if index % 2:
+            tails = (random_bases(20, f"left{index}").lower(), random_bases(20, f"right{index}").lower())
+        began = time.perf_counter()
+        pairs = design_primers(template, (start, start + size), tails)
+        seconds.append(time.perf_counter() - began)
+        designed += not pairs.empty
+        for pair in pairs.itertuples():
+            forward, reverse = pair.forward.upper(), pair.reverse.upper()
+            annealing = (forward[len(tails[0]):], reverse[len(tails[1]):])
+            checked += 1
+            wrong += not (abs(reference_tm(annealing[0]) - pair.forward_tm) < 0.06
+                          and abs(reference_tm(annealing[1]) - pair.reverse_tm) < 0.06
+                          and abs(reference_stem(forward, reverse) - pair.cross_dimer) < 0.006
+                          and abs(min(reference_stem(forward, forward), reference_stem(reverse, reverse))
+                                  - pair.self_dimer) < 0.006
+                          and abs(min(reference_stem(forward, forward, True), reference_stem(reverse, reverse, True))
+                                  - pair.hairpin) < 0.006)
+    print(f"{designed}/{args.templates} templates designed; {checked - wrong}/{checked} pairs match the "
+          f"per-primer Tm, hairpin and dimer computations")
+    print(f"design: {np.median(seconds) * 1000:.0f} ms median, {np.max(seconds) * 1000:.0f} ms max "
+          f"(templates up to {args.kb} kb)")
+    ok = designed == args.templates and wrong == 0
+    return 0 if ok and np.max(seconds) * 1000 < TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Time of the ΔΔCt engine on large Ct tables.
+
+Builds synthetic exports of increasing size (more plates, four technical
+replicates, the seven pathway genes plus two reference genes, 1% of wells
+shifted by 3 cycles as outliers) with the compact dtypes the dataset loader
+produces, and times ``relative_expression`` on each.
+
+Run from the repository root::
+
+    python benchmarks/qpcr_engine.py
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.qpcr import example_ct_table, relative_expression  # noqa: E402
+
+PLATES = (10, 100, 500)
+TARGET_S = 1.0
+
+
+def ct_table(plates: int):
+    table = example_ct_table(plates=plates, replicates=4, seed=1)
+    table.loc[::100, 'ct'] += 3
+    for name in ('plate', 'sample', 'gene'):
+        table[name] = table[name].astype('category')
+    table['ct'] = table['ct'].astype(np.float32)
+    return table
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'wells':>8} {'median ms':>10}")
+    slowest = 0.0
+    for plates in PLATES:
+        table = ct_table(plates)
+        times = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            relative_expression(table, ['16S rRNA', 'gapA'], 'Wild-type')
+            times.append(time.perf_counter() - start)
+        median = statistics.median(times)
+        slowest = max(slowest, median)
+        print(f"{len(table):>8} {median * 1000:>10.1f}")
+    return 0 if slowest < TARGET_S else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
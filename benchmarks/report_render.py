@@ -0,0 +1,82 @@
+"""Time of session report export: snapshot, HTML and PDF rendering, and a class batch.
+
+Visits every sidebar module with ``AppTest`` so the session has shown each
+page's figures and metrics, then times taking a snapshot of it, rendering it
+in-process, submitting a render to the process pool (the time the page's
+script is held up), and rendering ``--students`` saved snapshots offline with
+``render_directory``, serially and in the pool.
+
+Run from the repository root::
+
+    python benchmarks/report_render.py
+    python benchmarks/report_render.py --students 60
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from _apptest import REPO_ROOT
+
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.parallel import process_pool  # noqa: E402
+from experiment_platform.report import SNAPSHOT_SUFFIX, render, render_directory, render_timed  # noqa: E402
+from experiment_platform.session_log import SNAPSHOT_KEYS, figure_store, session_snapshot  # noqa: E402
+
+# The page's script should never wait on a render for longer than this
+SUBMIT_BUDGET_MS = 50.0
+
+
+def visited_session():
+    at = AppTest.from_file(str(REPO_ROOT / 'app.py'), default_timeout=300)
+    at.run()
+    for page in at.sidebar.selectbox[0].options:
+        at.sidebar.selectbox[0].set_value(page).run()
+    return {key: at.session_state[key] for key in SNAPSHOT_KEYS}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=20)
+    args = parser.parse_args(argv)
+    state = visited_session()
+    process_pool().submit(int).result()
+
+    start = time.perf_counter()
+    snapshot = session_snapshot("Benchmark Student", state)
+    snapshot_ms = (time.perf_counter() - start) * 1000
+    saved = snapshot.to_bytes()
+    print(f"snapshot: {len(snapshot.figures)} figures, {len(snapshot.metrics)} metrics in {snapshot_ms:.1f} ms; "
+          f"{len(saved) / 1024:,.0f} kB saved; figure store {figure_store.size / 1024:,.0f} kB")
+
+    submit_ms = 0.0
+    for fmt in ('html', 'pdf'):
+        start = time.perf_counter()
+        report = render(snapshot, fmt)
+        inline_s = time.perf_counter() - start
+        start = time.perf_counter()
+        future = process_pool().submit(render_timed, snapshot, fmt)
+        submit_ms = max(submit_ms, (time.perf_counter() - start) * 1000)
+        future.result()
+        print(f"{fmt:>5}: {len(report) / 1024:>8,.0f} kB, {inline_s:.2f} s in-process")
+    print(f"submit to pool: {submit_ms:.1f} ms of script time")
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshots, out = Path(directory) / 'snapshots', Path(directory) / 'reports'
+        snapshots.mkdir()
+        for student in range(args.students):
+            (snapshots / f"student{student:03d}{SNAPSHOT_SUFFIX}").write_bytes(saved)
+        for parallel in (False, True):
+            start = time.perf_counter()
+            reports = render_directory(snapshots, out / str(parallel), ('html', 'pdf'), parallel=parallel)
+            print(f"class batch ({'pool' if parallel else 'serial'}): {len(reports)} reports "
+                  f"in {time.perf_counter() - start:.1f} s")
+    return 0 if submit_ms < SUBMIT_BUDGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Correctness and time of the restriction-site scan and the diagnostic digest planner.
+
+Scans ``--sequences`` random circular and linear sequences of up to
+``--kb`` kilobases, with a few unknown bases, for every enzyme of the
+catalog and checks the cuts against a plain per-enzyme regular-expression
+search of both strands (the reference the one-pass scan replaces), then
+plans diagnostic digests for the page's constructs against pET-21a(+).
+
+Run from the repository root::
+
+    python benchmarks/restriction_digest.py
+    python benchmarks/restriction_digest.py --sequences 50 --kb 200
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.assembly import assemble_example, pet21a, reverse_complement  # noqa: E402
+from experiment_platform.digest import IUPAC, catalog, find_sites, plan_digests  # noqa: E402
+from experiment_platform.plasmid import EXAMPLE_CONSTRUCTS  # noqa: E402
+
+# The whole catalog on a 20 kb construct, well under a page rerun
+TARGET_MS = 25.0
+
+
+def reference_cuts(sequence: str, circular: bool) -> set:
+    """(enzyme, cut) of every site, one regular expression per enzyme and strand."""
+    length = len(sequence)
+    longest = max(len(e.site) for e in catalog().values())
+    text = sequence + sequence[:longest - 1] if circular else sequence
+    found = set()
+    for enzyme in catalog().values():
+        strands = [(enzyme.site, 1)]
+        if not enzyme.palindromic:
+            strands.append((reverse_complement(enzyme.site), -1))
+        size = len(enzyme.site)
+        for site, strand in strands:
+            # A site's N matches any base, an unknown one too
+            bases = ''.join('.' if base == 'N' else f"[{IUPAC[base]}]" for base in site)
+            pattern = re.compile(f"(?={bases})")
+            for match in pattern.finditer(text):
+                position = match.start()
+                if circular and position >= length:
+                    continue
+                cut = position + (enzyme.top if strand > 0 else size - enzyme.bottom)
+                bottom = position + (enzyme.bottom if strand > 0 else size - enzyme.top)
+                if circular:
+                    found.add((enzyme.name, cut % length))
+                elif 0 < cut < length and 0 < bottom < length:
+                    found.add((enzyme.name, cut))
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sequences', type=int, default=20)
+    parser.add_argument('--kb', type=int, default=50, help="longest sequence, kilobases")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    find_sites('ACGT')  # builds the catalog's index
+    agree, seconds, reference_seconds, sites, scanned = 0, [], [], 0, 0
+    for index in range(args.sequences):
+        length = int(rng.integers(2000, args.kb * 1000))
+        bases = rng.choice(list('ACGT'), length)
+        bases[rng.integers(0, length, 3)] = 'N'
+        sequence = ''.join(bases)
+        circular = index % 2 == 0
+        start = time.perf_counter()
+        table = find_sites(sequence, circular=circular)
+        seconds.append((time.perf_counter() - start) / length * 20_000)
+        start = time.perf_counter()
+        expected = reference_cuts(sequence, circular)
+        reference_seconds.append((time.perf_counter() - start) / length * 20_000)
+        agree += set(zip(table['enzyme'], table['cut'])) == expected
+        sites += len(table)
+        scanned += length
+    print(f"{len(catalog())} enzymes; {agree}/{args.sequences} sequences match the per-enzyme search "
+          f"({sites:,} cuts in {scanned / 1e6:.1f} Mb)")
+    print(f"scan per 20 kb: {np.median(seconds) * 1000:.1f} ms median one-pass, "
+          f"{np.median(reference_seconds) * 1000:.1f} ms per-enzyme regular expressions")
+
+    vector = pet21a()
+    for construct in EXAMPLE_CONSTRUCTS:
+        plasmid = assemble_example(construct).plasmid
+        start = time.perf_counter()
+        plan = plan_digests(plasmid, vector)
+        elapsed = time.perf_counter() - start
+        best = f"{plan.loc[0, 'enzymes']}: {plan.loc[0, 'sizes (bp)']} bp" if len(plan) else "none"
+        print(f"{construct} ({plasmid.length:,} bp): {len(plan)} diagnostic digests planned in "
+              f"{elapsed * 1000:.0f} ms, best {best}")
+    return 0 if agree == args.sequences and np.median(seconds) * 1000 < TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Per-interaction cost of the protocol step buttons.
+
+Drives the app headlessly with ``streamlit.testing.v1.AppTest`` and records,
+for every step button click, the script time, the number of script runs
+(including the follow-up ``st.rerun``), the time spent inside those runs and
+the bytes of forward messages the server would send to the browser.  Buttons
+that live inside an ``st.fragment`` are clicked as fragment-scoped reruns,
+which is what the browser sends.
+
+Run from the repository root::
+
+    python benchmarks/step_reruns.py
+    python benchmarks/step_reruns.py --app /path/to/older/app.py
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from streamlit.testing.v1 import AppTest
+
+from _apptest import REPO_ROOT, Recorder, RunStats, timed_run
+
+# (sidebar module, experiment, button label, clicks)
+INTERACTIONS = [
+    ("Basic Laboratory Procedures", "LB Medium Preparation", "Start Preparation", 1),
+    ("Basic Laboratory Procedures", "LB Medium Preparation", "Next Step", 4),
+    ("Basic Laboratory Procedures", "Plasmid Extraction", "Next Extraction Step", 3),
+    ("Basic Laboratory Procedures", "Gel Extraction", "Next Step", 3),
+    ("Basic Laboratory Procedures", "Heat Shock Transformation", "Execute Next Step", 3),
+    ("Basic Laboratory Procedures", "Electrocompetent Cell Preparation", "Execute Preparation Step", 3),
+    ("Basic Laboratory Procedures", "Electrocompetent Cell Preparation", "Execute Next Transformation Step", 3),
+    ("CRISPR-Cas9 Gene Integration", None, "Execute Next PCR", 3),
+]
+
+
+def measure(app_path: Path) -> Dict[str, List[RunStats]]:
+    results: Dict[str, List[RunStats]] = {}
+    recorder = Recorder()
+    with recorder.installed():
+        for module, experiment, label, clicks in INTERACTIONS:
+            at = AppTest.from_file(str(app_path), default_timeout=120)
+            at.run()
+            at.sidebar.selectbox[0].set_value(module)
+            at.run()
+            if experiment:
+                at.selectbox[0].set_value(experiment)
+                at.run()
+            if label == "Next Step" and experiment == "LB Medium Preparation":
+                next(b for b in at.button if b.label == "Start Preparation").click()
+                at.run()
+            name = f"{experiment or module} / {label}"
+            stats = results.setdefault(name, [])
+            for _ in range(clicks):
+                buttons = [b for b in at.button if b.label == label]
+                if not buttons:
+                    break
+                recorder.fragment_id = recorder.button_fragment_id(label)
+                buttons[0].click()
+                stats.append(timed_run(at, recorder))
+                recorder.fragment_id = None
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', type=Path, default=REPO_ROOT / 'app.py')
+    args = parser.parse_args(argv)
+
+    os.chdir(args.app.resolve().parent)
+    results = measure(args.app.resolve())
+
+    print(f"{'interaction':70} {'clicks':>6} {'script ms':>9} {'runs':>5} {'msgs':>6} {'bytes':>9}")
+    for name, stats in results.items():
+        if not stats:
+            continue
+        n = len(stats)
+        print(f"{name:70} {n:>6} {1000 * sum(s.seconds for s in stats) / n:>9.1f} "
+              f"{sum(s.script_runs for s in stats) / n:>5.1f} {sum(s.forward_msgs for s in stats) // n:>6} "
+              f"{sum(s.forward_bytes for s in stats) // n:>9}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
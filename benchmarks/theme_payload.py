@@ -0,0 +1,69 @@
+"""Bytes per rerun spent on the app theme.
+
+Runs the landing page in both versions with AppTest and splits the forward
+messages of each rerun into theme payload (``<style>``/``<script>`` markdown
+blocks, or the ``app_theme`` component element) and everything else.  The
+stylesheet linked by the component is fetched by the browser once per page
+load, so its size is reported separately.
+
+Run from the repository root::
+
+    python benchmarks/theme_payload.py
+    python benchmarks/theme_payload.py --app /path/to/older/app.py
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from _apptest import REPO_ROOT, Recorder
+
+RERUNS = 3
+
+
+def is_theme_msg(msg) -> bool:
+    if not msg.HasField('delta') or not msg.delta.HasField('new_element'):
+        return False
+    element = msg.delta.new_element
+    kind = element.WhichOneof('type')
+    if kind == 'markdown':
+        return '<style' in element.markdown.body or '<script' in element.markdown.body
+    if kind == 'component_instance':
+        return element.component_instance.component_name.endswith('app_theme')
+    return False
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', type=Path, default=REPO_ROOT / 'app.py')
+    args = parser.parse_args(argv)
+
+    app_path = args.app.resolve()
+    os.chdir(app_path.parent)
+    recorder = Recorder()
+    print(f"{'version':14} {'theme bytes/rerun':>18} {'total bytes/rerun':>18}")
+    with recorder.installed():
+        for mode in ("Professional", "Kids"):
+            at = AppTest.from_file(str(app_path), default_timeout=120)
+            at.session_state['app_mode'] = mode
+            theme_bytes = total_bytes = 0
+            for _ in range(RERUNS):
+                at.run()
+                msgs = recorder.last_forward_msgs()
+                theme_bytes += sum(m.ByteSize() for m in msgs if is_theme_msg(m))
+                total_bytes += sum(m.ByteSize() for m in msgs)
+            print(f"{mode:14} {theme_bytes // RERUNS:>18} {total_bytes // RERUNS:>18}")
+
+    for stylesheet in (app_path.parent / 'experiment_platform' / 'components' / 'theme' / 'theme.css',
+                       app_path.parent / 'components' / 'theme' / 'theme.css'):
+        if not stylesheet.exists():
+            continue
+        print(f"theme.css (fetched once per page load): {stylesheet.stat().st_size} bytes")
+        break
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""Time of clustering expression matrices for the transcriptome heatmap.
+
+Builds synthetic count matrices of increasing size, then times
+``cluster_matrix`` with the top heatmap view (normalization, sample
+clustering, gene k-means and centroid ordering) and a drill-down into the
+largest gene cluster, and reports the size of the heatmap sent.
+
+Run from the repository root::
+
+    python benchmarks/transcriptome_clustering.py
+"""
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from experiment_platform.transcriptome import cluster_matrix, example_expression_matrix  # noqa: E402
+
+# (genes, replicates of each of the four strains)
+SIZES = ((5_000, 3), (20_000, 6), (40_000, 12))
+TARGET_S = 2.0
+
+
+def main() -> int:
+    print(f"{'genes':>7} {'samples':>8} {'cluster ms':>11} {'drill ms':>9} {'rows x cols':>12}")
+    slowest = 0.0
+    for genes, replicates in SIZES:
+        matrix = example_expression_matrix(genes=genes, replicates=replicates)
+        start = time.perf_counter()
+        clustered = cluster_matrix(matrix)
+        view = clustered.view()
+        cluster_s = time.perf_counter() - start
+        start = time.perf_counter()
+        clustered.view((int(view.sizes.argmax()),))
+        drill_s = time.perf_counter() - start
+        slowest = max(slowest, cluster_s)
+        print(f"{genes:>7} {matrix.shape[1]:>8} {cluster_s * 1000:>11.0f} {drill_s * 1000:>9.0f} "
+              f"{'{} x {}'.format(*view.values.shape):>12}")
+    return 0 if slowest < TARGET_S else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
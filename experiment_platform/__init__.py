@@ -0,0 +1 @@
+"""Molecular biology experiment simulation app, loaded page by page."""
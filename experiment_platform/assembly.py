@@ -0,0 +1,337 @@
+"""In-silico Gibson / homologous-recombination assembly of a linearized vector and PCR fragments.
+
+``assemble`` joins fragments the way the recombinase does, by the homology
+at their ends:
+
+* overlaps: every fragment is taken in both orientations; the first
+  ``k`` bases of each are indexed by their 2-bit k-mer code, and the k-mers
+  of the last ``MAX_OVERLAP`` bases of each are looked up in that index in
+  one vectorized search.  A hit at distance ``L`` from the end is a
+  candidate overlap of ``L`` bases, kept if the whole suffix and prefix
+  agree;
+* order and orientation: starting from the backbone, each fragment's end
+  must overlap the start of exactly one unused fragment (in one
+  orientation), and the last fragment must overlap the backbone's start,
+  closing the circle; a missing or ambiguous junction is an
+  ``AssemblyError``;
+* mispriming: the k-mers of every overlap are looked up in a k-mer index of
+  all fragments, both strands, and a run of hits on one diagonal away from
+  the junction's own ends, ``MIN_OVERLAP`` bases or more, is reported as a
+  warning;
+* the design, if given, is checked against the order and orientations
+  found.
+
+The result is the assembled ``Plasmid`` (sequence and features carried over
+from the fragments), its junctions and its size.
+
+The constructs of the Engineering Bacteria page have no sequences in this
+app, so ``example_fragments`` builds stand-ins: random bases (seeded by
+name) with pET-21a(+)'s feature coordinates and open reading frames of the
+genes' lengths, amplified with homology tails as for a real Gibson design.
+"""
+import dataclasses
+import time
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from experiment_platform.plasmid import (EXAMPLE_CONSTRUCTS, INSERT_SPACER, PET21A_FEATURES, PET21A_INSERT_AT,
+                                         PET21A_LENGTH, Feature, Plasmid)
+
+K = 12  # k-mer length of the overlap index; up to 31 fits a 2-bit code in an int64
+MIN_OVERLAP = 15
+MAX_OVERLAP = 80
+DESIGN_OVERLAP = 20  # homology tail added to each insert by its PCR primers
+
+_COMPLEMENT = str.maketrans('ACGTRYKMBDHVNacgtrykmbdhvn', 'TGCAYRMKVHDBNtgcayrmkvhdbn')
+_CODES = np.full(256, -1, dtype=np.int64)
+for _code, _base in enumerate('ACGT'):
+    _CODES[ord(_base)] = _CODES[ord(_base.lower())] = _code
+
+
+class AssemblyError(ValueError):
+    """The fragments do not assemble into one circle."""
+
+
+@dataclasses.dataclass
+class Fragment:
+    name: str
+    sequence: str
+    features: List[Feature] = dataclasses.field(default_factory=list)  # in the fragment's coordinates
+
+
+@dataclasses.dataclass
+class Junction:
+    left: str
+    right: str
+    overlap: int  # bases of homology
+    position: int  # 0-based start of the overlap in the assembled plasmid
+    sequence: str
+
+    @property
+    def gc(self) -> float:
+        return (self.sequence.count('G') + self.sequence.count('C')) / max(len(self.sequence), 1)
+
+
+@dataclasses.dataclass
+class Assembly:
+    plasmid: Plasmid
+    junctions: List[Junction]
+    order: List[Tuple[str, int]]  # fragment names and orientations (1 as given, -1 reverse-complemented)
+    warnings: List[str]
+    matches_design: Optional[bool]  # None without a design to check
+    seconds: float
+
+    def junction_table(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            'junction': [f"{j.left} / {j.right}" for j in self.junctions],
+            'overlap_bp': [j.overlap for j in self.junctions],
+            'position': [j.position + 1 for j in self.junctions],
+            'gc_percent': [round(100 * j.gc, 1) for j in self.junctions],
+            'sequence': [j.sequence for j in self.junctions],
+        })
+
+
+def reverse_complement(sequence: str) -> str:
+    return sequence.translate(_COMPLEMENT)[::-1]
+
+
+def kmer_codes(sequence: str, k: int = K) -> np.ndarray:
+    """2-bit code of the k-mer at every position, -1 where it holds a base other than A, C, G or T."""
+    bases = _CODES[np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)]
+    if len(bases) < k:
+        return np.zeros(0, dtype=np.int64)
+    windows = np.lib.stride_tricks.sliding_window_view(bases, k)
+    codes = windows @ (4 ** np.arange(k - 1, -1, -1, dtype=np.int64))
+    codes[(windows < 0).any(axis=1)] = -1
+    return codes
+
+
+def find_overlaps(sequences: Sequence[str], k: int = K, min_overlap: int = MIN_OVERLAP,
+                  max_overlap: int = MAX_OVERLAP) -> Dict[Tuple[int, int], int]:
+    """Longest suffix of each sequence that is a prefix of another, {(left, right): bases}."""
+    heads = np.array([kmer_codes(sequence[:k], k)[0] if len(sequence) >= k else -1 for sequence in sequences])
+    order = np.argsort(heads)
+    sorted_heads = heads[order]
+    owners, lengths, codes = [], [], []
+    for index, sequence in enumerate(sequences):
+        window = sequence[-max_overlap:]
+        tail = kmer_codes(window, k)
+        owners.append(np.full(len(tail), index))
+        # The k-mer at window position p starts an overlap of len(window) - p bases
+        lengths.append(len(window) - np.arange(len(tail)))
+        codes.append(tail)
+    owners, lengths, codes = (np.concatenate(values) if values else np.zeros(0, dtype=np.int64)
+                              for values in (owners, lengths, codes))
+    keep = (codes >= 0) & (lengths >= min_overlap)
+    owners, lengths, codes = owners[keep], lengths[keep], codes[keep]
+    first = np.searchsorted(sorted_heads, codes, 'left')
+    last = np.searchsorted(sorted_heads, codes, 'right')
+    overlaps: Dict[Tuple[int, int], int] = {}
+    for hit in np.flatnonzero(last > first):
+        left, length = int(owners[hit]), int(lengths[hit])
+        for right in order[first[hit]:last[hit]]:
+            right = int(right)
+            if right == left or length > len(sequences[right]) or length <= overlaps.get((left, right), 0):
+                continue
+            if sequences[left][-length:] == sequences[right][:length]:
+                overlaps[(left, right)] = length
+    return overlaps
+
+
+def _placed(feature: Feature, offset: int, length: int, strand: int) -> Feature:
+    if strand > 0:
+        return Feature(feature.name, feature.kind, offset + feature.start, offset + feature.end, feature.strand)
+    return Feature(feature.name, feature.kind, offset + length - feature.end, offset + length - feature.start,
+                   -feature.strand)
+
+
+def assemble(backbone: Fragment, inserts: Sequence[Fragment], name: str = 'assembly',
+             design: Optional[Sequence[Tuple[str, int]]] = None, origin: int = 0, k: int = K,
+             min_overlap: int = MIN_OVERLAP, max_overlap: int = MAX_OVERLAP) -> Assembly:
+    """Circular plasmid the fragments assemble into, starting from the backbone as given.
+
+    ``design`` is the intended order of the inserts, as (name, orientation) pairs, to check; ``origin`` is
+    the backbone position that becomes base 1 of the plasmid.
+    """
+    start = time.perf_counter()
+    fragments = [backbone] + list(inserts)
+    sequences = [f.sequence.upper() for f in fragments]
+    # Oriented fragment 2i is fragment i as given, 2i + 1 its reverse complement
+    oriented = [s for sequence in sequences for s in (sequence, reverse_complement(sequence))]
+    overlaps = find_overlaps(oriented, k, min_overlap, max_overlap)
+    following: Dict[int, List[Tuple[int, int]]] = {}
+    for (left, right), length in overlaps.items():
+        following.setdefault(left, []).append((right, length))
+
+    path, lengths, used = [0], [], {0}
+    while True:
+        current = path[-1]
+        choices = [(right, length) for right, length in following.get(current, []) if right // 2 not in used]
+        if not choices:
+            break
+        if len(choices) > 1:
+            names = ', '.join(f"{fragments[right // 2].name}{'' if right % 2 == 0 else ' (reversed)'}"
+                              for right, _ in choices)
+            raise AssemblyError(f"the end of {fragments[current // 2].name} overlaps the start of more than "
+                                f"one fragment: {names}")
+        right, length = choices[0]
+        path.append(right)
+        lengths.append(length)
+        used.add(right // 2)
+    missing = [fragments[index].name for index in range(len(fragments)) if index not in used]
+    if missing:
+        raise AssemblyError(f"no overlap joins {', '.join(missing)} after {fragments[path[-1] // 2].name}")
+    closing = overlaps.get((path[-1], 0))
+    if closing is None:
+        raise AssemblyError(f"the end of {fragments[path[-1] // 2].name} has no homology with the start of "
+                            f"{backbone.name}; the circle does not close")
+    lengths.append(closing)
+
+    # Each fragment follows the previous one less the bases they share
+    parts, offsets, position = [], [], 0
+    for node, shared in zip(path, [0] + lengths[:-1]):
+        parts.append(oriented[node][shared:])
+        offsets.append(position - shared)
+        position += len(oriented[node]) - shared
+    sequence = ''.join(parts)[:position - closing]
+    total = len(sequence)
+    junctions = []
+    for (left, right), shared, offset in zip(zip(path, path[1:] + [0]), lengths, offsets):
+        at = offset + len(oriented[left]) - shared
+        junctions.append(Junction(fragments[left // 2].name, fragments[right // 2].name, shared,
+                                  (at - origin) % total, oriented[left][-shared:]))
+    features = []
+    for node, offset in zip(path, offsets):
+        fragment = fragments[node // 2]
+        for feature in fragment.features:
+            placed = _placed(feature, offset, len(fragment.sequence), 1 if node % 2 == 0 else -1)
+            placed.start, placed.end = (placed.start - origin) % total, (placed.end - origin) % total or total
+            features.append(placed)
+    features.sort(key=lambda feature: feature.start)
+    sequence = sequence[origin % total:] + sequence[:origin % total]
+    order = [(fragments[node // 2].name, 1 if node % 2 == 0 else -1) for node in path]
+
+    warnings = _mispriming(oriented, path, lengths, fragments, k)
+    matches = None
+    if design is not None:
+        matches = [(n, s) for n, s in order[1:]] == [(n, s) for n, s in design]
+        if not matches:
+            found = ', '.join(f"{n} ({'+' if s > 0 else '-'})" for n, s in order[1:])
+            warnings.append(f"assembled order {found} differs from the design")
+    plasmid = Plasmid(name, total, True, features, sequence, f"{backbone.name} + {', '.join(f.name for f in inserts)}")
+    return Assembly(plasmid, junctions, order, warnings, matches, time.perf_counter() - start)
+
+
+def _mispriming(oriented: List[str], path: List[int], lengths: List[int], fragments: List[Fragment],
+                k: int) -> List[str]:
+    """Overlaps that also match elsewhere, on either strand of any fragment, over ``MIN_OVERLAP`` bases."""
+    codes = [kmer_codes(sequence, k) for sequence in oriented]
+    index = np.concatenate(codes)
+    owner = np.repeat(np.arange(len(oriented)), [len(c) for c in codes])
+    at = np.concatenate([np.arange(len(c)) for c in codes])
+    order = np.argsort(index, kind='stable')
+    index, owner, at = index[order], owner[order], at[order]
+    warnings = []
+    for (left, right), shared in zip(zip(path, path[1:] + [0]), lengths):
+        probes = kmer_codes(oriented[left][-shared:], k)
+        first, last = np.searchsorted(index, probes, 'left'), np.searchsorted(index, probes, 'right')
+        hits = np.concatenate([np.arange(a, b) for a, b in zip(first, last)])
+        offsets = np.repeat(np.arange(len(probes)), last - first)
+        # Hits on one diagonal of one sequence are one match; the overlap's own copies are the end of left,
+        # the start of right, and the same on the reverse strands
+        diagonals = at[hits] - offsets
+        own = {(left, len(oriented[left]) - shared), (right, 0), (left ^ 1, 0),
+               (right ^ 1, len(oriented[right]) - shared)}
+        matches: Dict[Tuple[int, int], int] = {}
+        for node, diagonal in zip(owner[hits].tolist(), diagonals.tolist()):
+            if (node, diagonal) not in own:
+                matches[(node, diagonal)] = matches.get((node, diagonal), 0) + 1
+        stray = {node // 2 for (node, _), count in matches.items() if count >= MIN_OVERLAP - k + 1}
+        if stray:
+            names = ', '.join(sorted(fragments[i].name for i in stray))
+            warnings.append(f"the {fragments[left // 2].name} / {fragments[right // 2].name} overlap also "
+                            f"matches {names} over {MIN_OVERLAP}+ bases: possible misassembly")
+    return warnings
+
+
+# ---------------------------------------------------------------------------
+# Stand-in fragments for the page's constructs
+# ---------------------------------------------------------------------------
+
+STOP_CODONS = ('TAA', 'TAG', 'TGA')
+SENSE_CODONS = tuple(a + b + c for a in 'ACGT' for b in 'ACGT' for c in 'ACGT' if a + b + c not in STOP_CODONS)
+
+
+def _rng(name: str) -> np.random.Generator:
+    # crc32, not hash(): the same stand-in in every process
+    return np.random.default_rng(zlib.crc32(name.encode()))
+
+
+def random_bases(length: int, name: str) -> str:
+    return ''.join(_rng(name).choice(list('ACGT'), length))
+
+
+def random_orf(length: int, name: str) -> str:
+    """ATG, sense codons and a stop codon, ``length`` bases (a multiple of 3)."""
+    codons = _rng(name).choice(SENSE_CODONS, length // 3 - 2)
+    return 'ATG' + ''.join(codons) + 'TAA'
+
+
+def pet21a() -> Plasmid:
+    """Stand-in pET-21a(+): random bases with the vector's feature coordinates."""
+    features = [Feature(label, kind, start - 1, end, strand) for label, kind, start, end, strand in PET21A_FEATURES]
+    return Plasmid('pET-21a(+)', PET21A_LENGTH, True, features, random_bases(PET21A_LENGTH, 'pET-21a(+)'))
+
+
+def linearize(plasmid: Plasmid, cut: int, name: str) -> Fragment:
+    """The circle opened at ``cut``, as one linear fragment starting there."""
+    features = [Feature(f.name, f.kind, (f.start - cut) % plasmid.length, (f.end - cut) % plasmid.length or
+                        plasmid.length, f.strand) for f in plasmid.features]
+    return Fragment(name, plasmid.sequence[cut:] + plasmid.sequence[:cut], features)
+
+
+def gibson_fragments(backbone: Fragment, units: Sequence[Fragment], overlap: int = DESIGN_OVERLAP) -> List[Fragment]:
+    """PCR products of ``units`` (in the order and orientation they go in after the backbone's end) with tails.
+
+    Each product starts with the last ``overlap`` bases of what comes before it, and the last one also ends
+    with the first ``overlap`` bases of the backbone.
+    """
+    products, previous = [], backbone.sequence
+    for index, unit in enumerate(units):
+        tail = backbone.sequence[:overlap] if index == len(units) - 1 else ''
+        head = previous[-overlap:]
+        features = [dataclasses.replace(f, start=f.start + overlap, end=f.end + overlap) for f in unit.features]
+        products.append(Fragment(unit.name, head + unit.sequence + tail, features))
+        previous = unit.sequence
+    return products
+
+
+def example_fragments(construct: str) -> Tuple[Fragment, List[Fragment], List[Tuple[str, int]], int]:
+    """Linearized backbone, gene fragments as amplified (coding strand), design and origin for a page construct.
+
+    The genes go in at pET-21a(+)'s MCS, read counterclockwise from the T7 promoter as in
+    ``plasmid.construct``, so each gene fragment goes in reverse-complemented.
+    """
+    vector = pet21a()
+    backbone = linearize(vector, PET21A_INSERT_AT, 'pET-21a(+) linearized')
+    genes = EXAMPLE_CONSTRUCTS[construct]
+    units = []
+    # Along the vector's forward strand the last gene of the operon comes first
+    for gene, bp in reversed(genes):
+        coding = random_bases(INSERT_SPACER, f"{gene} RBS") + random_orf(bp, gene)
+        feature = Feature(gene, 'CDS', 0, bp, -1)
+        units.append(Fragment(gene, reverse_complement(coding), [feature]))
+    products = gibson_fragments(backbone, units)
+    # Amplified and handed over as coding-strand products, in operon order
+    inserts = [Fragment(p.name, reverse_complement(p.sequence),
+                        [_placed(f, 0, len(p.sequence), -1) for f in p.features]) for p in reversed(products)]
+    design = [(gene, -1) for gene, _ in reversed(genes)]
+    return backbone, inserts, design, PET21A_LENGTH - PET21A_INSERT_AT
+
+
+def assemble_example(construct: str) -> Assembly:
+    backbone, inserts, design, origin = example_fragments(construct)
+    return assemble(backbone, inserts, construct, design, origin)
@@ -0,0 +1 @@
+"""Display-string catalogs for translate_display, one module per version."""
@@ -0,0 +1,373 @@
+"""Display strings for the Kids version, keyed by source text."""
+
+CATALOG = {
+    # Basic terminology - Cute version
+    "瀹為獙": "Little Experiment",
+    "鍒嗗瓙鐢熺墿瀛�": "Tiny Molecule Science",
+    "宸ョ▼鑿�": "Helpful Little Bacteria",
+    "鏋勫缓": "Build-Up",
+    "CRISPR-Cas9": "CRISPR Magic Scissors",
+    "鍩哄洜": "DNA Instructions",
+    "鏁村悎": "Stick Together",
+    "缁撴灉": "What We Got",
+    "鍒嗘瀽": "Let's Look",
+    "鑳屾櫙": "Story",
+    "鎿嶄綔": "Steps",
+    "妯℃嫙": "Cartoon Demo",
+    "鍩瑰吇": "Grow-Grow",
+    "璐ㄧ矑": "Tiny Ring DNA",
+    "鎵╁": "Copy More",
+    "PCR": "PCR",
+    "鐞艰剛绯栧嚌鑳剁數娉�": "Jelly Run",
+    "鍑濊兌鐢垫吵": "Jelly Run",
+    "鑳跺洖鏀�": "Scoop from Jelly",
+    "鐑縺杞寲": "Hot-Cold Magic",
+    "鐢靛嚮": "Zap-Zap",
+    "鎰熷彈鎬�": "DNA-Eating Mode",
+    "闃虫€�": "Success",
+    "闃存€�": "Not Yet",
+    "鍙傛暟": "Settings",
+    "缁嗚優": "Little Cells",
+    "鑲跨槫": "Bad Guys",
+    "姣掓€�": "Fighting Power",
+    "鐢熷瓨鏈�": "How Long to Live",
+    "娴撳害": "How Much",
+    "Specific Activity ": "Working Power",
+    "杞寲鐜�": "Change-to-Success %",
+    "琛ㄨ揪": "Make How Much",
+    "浠ｈ阿": "Energy Factory",
+    "閫氳矾": "Little Route",
+    "鐑浘": "Color Map",
+    "鍥捐氨": "Circle Map",
+    "娉抽亾": "Runway",
+    "鏉″甫": "Little Stripes",
+    "妯℃澘": "Original Sample",
+    "寮曠墿": "Starter Piece",
+    "閫€鐏�": "Hug-Hug",
+    "寤朵几": "Grow Longer",
+    "鍙樻€�": "Split Apart",
+    "鐢靛帇": "Little Voltage",
+    "鏃堕棿": "Time",
+    "娓╁害": "Temperature",
+    "pH": "Acidity",
+    "宸ョ▼鑿屾瀯寤�": "Build Helpful Bacteria",
+    "瀹為獙鑳屾櫙浠嬬粛": "Story Time",
+    "鍩虹瀹為獙鎿嶄綔": "Easy Lab Steps",
+    "鍩哄洜鏁村悎绯荤粺": "DNA Scissors Show",
+    "瀹為獙缁撴灉缁煎悎鍒嗘瀽": "Look at Our Results",
+    "閫夋嫨瀹為獙妯″潡": "Pick a Module",
+    # Extended terminology - Cute version
+    "ATRA": "ATRA",
+    "宸ョ▼鑿屾瀯寤轰笌鑲濈檶娌荤枟鐮旂┒瀹為獙妯℃嫙": "ATRA Helpful Bacteria Building and Liver Bad Guy Fighting Research Cartoon",
+    "鍒嗗瓙鐢熺墿瀛﹀疄楠屽湪绾垮姩鐢绘ā鎷熺郴缁�": "Online Tiny Molecule Science Cartoon Show System",
+    "鐢熺墿瀹為獙灏忚鍫�": "Little Biology Lab",
+    "绠€鍗曞ソ鐜╃殑瀹為獙鍔ㄧ敾": "Fun and Simple Experiment Cartoons",
+    "鑲濈粏鑳炵檶娌荤枟鎸戞垬": "Liver Bad Guy Fighting Challenges",
+    "鍏ㄧ悆鍙戠梾鐜�": "Worldwide Sick Rate",
+    "绗叚澶у父瑙佹伓鎬ц偪鐦�": "Sixth Most Common Bad Guy",
+    "涓浗鎯呭喌": "China Stats",
+    "姣忓勾39涓囨浜＄梾渚�": "390,000 Deaths Each Year",
+    "娌荤枟闅剧偣": "Fighting Challenges",
+    "鎮ｈ€呭彂鐜版椂宸蹭腑鏅氭湡": "People Found Sick Too Late",
+    "寮鸿€愯嵂鎬ч檺鍒跺寲鐤楀簲鐢�": "Strong Resistance Stops Medicine",
+    "FOLFOX4鏂规瀹㈣缂撹В鐜囦粎9.1%": "FOLFOX4 Medicine Only Works 9.1%",
+    "ATRA浣滅敤鏈哄埗鍔ㄧ敾": "ATRA Magic Action Cartoon",
+    "璇卞鍒嗗寲": "Make Change",
+    "鏈垎鍖栬偪鐦ょ粏鑳�": "Bad Guy Cells",
+    "ATRA鍒嗗瓙": "ATRA Molecule",
+    "鍒嗗寲鍚庣粏鑳�": "Good Guy Cells",
+    "ATRA娌荤枟閲岀▼纰�": "ATRA Fighting Milestones",
+    "鍙戠幇ATRA": "ATRA Discovery",
+    "APL娌荤枟绐佺牬": "APL Fighting Breakthrough",
+    "瀹炰綋鐦ょ爺绌�": "Solid Bad Guy Research",
+    "鑲濈檶涓村簥璇曢獙": "Liver Bad Guy Tests",
+    "宸ョ▼鑿屽紑鍙�": "Helpful Bacteria Development",
+    "鎬ユ€ф棭骞肩矑缁嗚優鐧借鐥�": "Acute Promyelocytic Leukemia",
+    "5骞寸敓瀛樼巼": "5-Year Living Rate",
+    "绐佺牬鎬ц繘灞�": "Big Breakthrough",
+    "鑲濈檶鑱斿悎FOLFOX4": "Liver Bad Guy + FOLFOX4",
+    "涓綅鐢熷瓨鏈�": "Middle Living Time",
+    "鏄捐憲鏀瑰杽": "Big Improvement",
+    "宸ョ▼鑿岀敓浜ф晥鐜�": "Helpful Bacteria Making Power",
+    "鎻愰珮300%": "300% More",
+    "鎶€鏈潻鏂�": "Tech Revolution",
+    "閫夋嫨瀹為獙椤圭洰": "Pick Experiment",
+    "LB鍩瑰吇鍩哄埗澶�": "LB Food Making",
+    "璐ㄧ矑鎻愬彇": "Tiny Ring DNA Taking",
+    "PCR鎵╁": "PCR Copying",
+    "鐞艰剛绯栧嚌鑳剁數娉�": "Jelly Run",
+    "鑳跺洖鏀�": "Scoop from Jelly",
+    "鐑縺杞寲": "Hot-Cold Magic",
+    "鐢靛嚮鎰熷彈鎬佸埗澶�": "Zap-Zap Mode Making",
+    "瀹為獙鏉愭枡": "Materials",
+    "瀹為獙姝ラ": "Steps",
+    "瀹炴椂鐩戞祴": "Live Watching",
+    "寮€濮嬮厤鍒�": "Start Making",
+    "涓嬩竴姝�": "Next Step",
+    "璋冭妭pH鍊�": "Fix Acidity",
+    "姝ｅ湪璋冭妭pH鍊�": "Fixing Acidity",
+    "pH鍊煎凡璋冭妭鑷�7.4": "Acidity Fixed to 7.4",
+    "鐏弻娓╁害": "Kill-Germ Temperature",
+    "楂樻俯鐏弻涓�": "Hot Kill-Germ Time",
+    "褰撳墠娓╁害": "Now Temperature",
+    "瀹為獙娴佺▼": "Recipe",
+    "杩涜涓嬩竴姝ユ彁鍙�": "Next Taking Step",
+    "姝ｅ湪杩涜姝ラ": "Doing Step",
+    "璐ㄧ矑鎻愬彇瀹屾垚": "Tiny Ring DNA Taking Done",
+    "璐ㄧ矑璐ㄩ噺妫€娴�": "Tiny Ring DNA Quality Check",
+    "璐ㄧ矑娴撳害": "Tiny Ring DNA Amount",
+    "璐ㄧ矑鐢垫吵鍒嗘瀽": "Tiny Ring DNA Jelly Run Check",
+    "DNA Marker": "DNA Marker",
+    "瓒呰灪鏃�": "Super Twisty",
+    "绾挎€�": "Straight Line",
+    "寮€鐜�": "Open Circle",
+    "璇峰畬鎴愯川绮掓彁鍙栨楠や互鏌ョ湅缁撴灉": "Finish Tiny Ring DNA Steps to See Results",
+    "PCR鍙嶅簲浣撶郴": "PCR Mix",
+    "PCR绋嬪簭": "PCR Recipe",
+    "棰勫彉鎬�": "Pre-Split",
+    "鍙樻€�": "Split Apart",
+    "閫€鐏�": "Hug-Hug",
+    "寤朵几": "Grow Longer",
+    "鏈€缁堝欢浼�": "Final Grow",
+    "寰幆娆℃暟": "Round Count",
+    "瀹炴椂鎵╁鏇茬嚎": "Live Copying Line",
+    "寮€濮婸CR鎵╁": "Start PCR Copying",
+    "PCR鎵╁杩涜涓�": "PCR Copying Going",
+    "姝ｅ湪杩涜绗�": "Doing Round",
+    "涓惊鐜�": "Round",
+    "鎵╁鏁堢巼": "Copying Power",
+    "浜х墿娴撳害": "Product Amount",
+    "PCR鍒嗗瓙杩囩▼妯℃嫙": "PCR Tiny Molecule Cartoon",
+    "PCR鍒嗗瓙杩囩▼绀烘剰鍥�": "PCR Tiny Molecule Picture",
+    "鍑濊兌鍒跺": "Jelly Making",
+    "鐞艰剛绯栨祿搴�": "Jelly Amount",
+    "鐢垫吵鐢靛帇": "Jelly Run Power",
+    "鐢垫吵鏃堕棿": "Jelly Run Time",
+    "寮€濮嬬數娉�": "Start Jelly Run",
+    "鐢垫吵杩涜涓�": "Jelly Run Going",
+    "鐢垫吵瀹屾垚": "Jelly Run Done",
+    "鐢垫吵缁撴灉鍒嗘瀽": "Jelly Run Results Check",
+    "鏈€缁堢數娉冲浘璋�": "Final Jelly Run Picture",
+    "鍚勬吵閬撴潯甯﹀己搴�": "Each Lane Stripe Power",
+    "鏍峰搧": "Sample",
+    "鐩稿寮哄害": "Relative Power",
+    "DNA鑳跺洖鏀跺疄楠�": "DNA Jelly Scoop Experiment",
+    "杩涜涓嬩竴姝�": "Next Step",
+    "鎵ц姝ラ": "Do Step",
+    "鑳跺洖鏀跺畬鎴�": "Jelly Scoop Done",
+    "鍥炴敹鏁堢巼": "Scoop Power",
+    "DNA娴撳害": "DNA Amount",
+    "绾害妫€娴�": "Clean Check",
+    "鍥炴敹浜х墿楠岃瘉": "Scoop Product Check",
+    "鍘熷PCR浜х墿": "Original PCR Product",
+    "鑳跺洖鏀朵骇鐗�": "Jelly Scoop Product",
+    "鑳跺洖鏀跺墠鍚庡姣�": "Before/After Jelly Scoop",
+    "鍑濊兌婧惰В鐘舵€�": "Jelly Melt Status",
+    "婧惰В杩涘害": "Melt Progress",
+    "鐑縺杞寲瀹為獙": "Hot-Cold Magic Experiment",
+    "鎵ц涓嬩竴姝�": "Do Next Step",
+    "鐑縺杞寲瀹屾垚": "Hot-Cold Magic Done",
+    "杞寲瀛愭暟": "Magic Change Count",
+    "杞寲鏁堢巼": "Magic Change Power",
+    "闃虫€у厠闅嗙巼": "Success Clone Rate",
+    "杞寲瀛愮敓闀挎儏鍐�": "Magic Change Growth",
+    "杞寲瀛愯繃澶滅敓闀挎洸绾�": "Magic Change Overnight Growth Line",
+    "鑿岃惤鏁伴噺": "Colony Count",
+    "鐢靛嚮鎰熷彈鎬佸埗澶囦笌杞寲": "Zap-Zap Mode Making and Changing",
+    "鎰熷彈鎬佸埗澶�": "Mode Making",
+    "鐢靛嚮杞寲": "Zap-Zap Change",
+    "鐢靛嚮鎰熷彈鎬佺粏鑳炲埗澶�": "Zap-Zap Mode Cell Making",
+    "杩涜鍒跺姝ラ": "Do Making Step",
+    "缁嗚弻鐢熼暱鐩戞祴": "Bacteria Growth Watching",
+    "缁嗚弻鐢熼暱鏇茬嚎": "Bacteria Growth Line",
+    "褰撳墠OD600": "Now OD600",
+    "鐢靛嚮杞寲瀹為獙": "Zap-Zap Change Experiment",
+    "鐢靛嚮鍙傛暟璁剧疆": "Zap-Zap Settings",
+    "鐢靛帇": "Voltage",
+    "鐢靛": "Capacitance",
+    "鐢甸樆": "Resistance",
+    "鎵ц涓嬩竴姝ヨ浆鍖�": "Do Next Change Step",
+    "姝ｅ湪杩涜鐢靛嚮": "Zap-Zap Going",
+    "鐢靛嚮瀹屾垚": "Zap-Zap Done",
+    "鐢靛嚮杞寲瀹為獙瀹屾垚": "Zap-Zap Change Experiment Done",
+    "鐢靛嚮杞寲瀛愭暟": "Zap-Zap Change Count",
+    "鐢靛嚮杞寲鏁堢巼": "Zap-Zap Change Power",
+    "杞寲鏂规硶瀵规瘮": "Change Method Compare",
+    "鐑縺杞寲": "Hot-Cold Magic",
+    "鐢靛嚮杞寲": "Zap-Zap Change",
+    "杞寲瀛愭暟": "Change Count",
+    "杞寲鏁堢巼": "Change Power",
+    "涓嶅悓杞寲鏂规硶鏁堢巼瀵规瘮": "Different Change Method Power Compare",
+    "宸ョ▼鑿屾瀯寤哄疄楠�": "Helpful Bacteria Building Experiment",
+    "涓嬫父璐ㄧ矑鏋勫缓": "Downstream Tiny Ring DNA Building",
+    "涓婃父璐ㄧ矑鏋勫缓": "Upstream Tiny Ring DNA Building",
+    "鍩哄洜鏁村悎楠岃瘉": "DNA Instructions Stick Check",
+    "21a-raldh-IIdR-blh璐ㄧ矑鏋勫缓": "21a-raldh-IIdR-blh Tiny Ring DNA Building",
+    "瀹為獙鐩爣": "Goal",
+    "鍚湁raldh銆両IdR銆乥lh鍩哄洜鐨勯噸缁勮川绮�": "Tiny Ring DNA with raldh, IIdR, blh Instructions",
+    "raldh": "raldh",
+    "瑙嗙綉鑶滈啗鑴辨阿閰跺熀鍥�": "Eye Vitamin Making Instructions",
+    "IIdR": "IIdR",
+    "杞綍璋冩帶鍥犲瓙": "Control Instructions",
+    "blh": "blh",
+    "尾-鑳¤悵鍗滅礌缇熷寲閰跺熀鍥�": "Carrot Color Making Instructions",
+    "鍩哄洜鐗囨鎵╁楠岃瘉": "DNA Instructions Piece Copy Check",
+    "鍩哄洜鎵╁": "DNA Instructions Copy",
+    "鍚屾簮閲嶇粍鏋勫缓": "Same Family Stick Building",
+    "杩涜鍚屾簮閲嶇粍鏋勫缓": "Do Same Family Stick Building",
+    "鍚屾簮閲嶇粍杩涜涓�": "Same Family Stick Going",
+    "绾挎€у寲pET-21a杞戒綋": "Make pET-21a Straight",
+    "娣峰悎涓変釜鍩哄洜鐗囨": "Mix Three DNA Instructions",
+    "鍔犲叆C115閲嶇粍Enzyme": "Add C115 Stick Enzyme",
+    "50鈩冨弽搴�30鍒嗛挓": "50°C Mix for 30 Minutes",
+    "杞寲鎰熷彈鎬佺粏鑳�": "Change Mode Cells",
+    "绛涢€夐槼鎬у厠闅�": "Pick Success Clones",
+    "閲嶇粍璐ㄧ矑21a-raldh-IIdR-blh鏋勫缓鎴愬姛": "Tiny Ring DNA 21a-raldh-IIdR-blh Building Success",
+    "閲嶇粍璐ㄧ矑鍥捐氨": "Tiny Ring DNA Map",
+    "21a-raldh-IIdR-blh 閲嶇粍璐ㄧ矑鍥捐氨": "21a-raldh-IIdR-blh Tiny Ring DNA Map",
+    "21a-crtEBIY璐ㄧ矑鏋勫缓": "21a-crtEBIY Tiny Ring DNA Building",
+    "鍚湁crtE銆乧rtB銆乧rtI銆乧rtY鍩哄洜绨囩殑閲嶇粍璐ㄧ矑": "Tiny Ring DNA with crtE, crtB, crtI, crtY Instructions Group",
+    "crtE": "crtE",
+    "鐗荤墰鍎垮熀鐗荤墰鍎垮熀鐒︾７閰稿悎鎴愰叾": "Color Making Enzyme 1",
+    "crtB": "crtB",
+    "鍏阿鐣寗绾㈢礌鍚堟垚Enzyme": "Color Making Enzyme 2",
+    "crtI": "crtI",
+    "鍏阿鐣寗绾㈢礌鑴辨阿Enzyme": "Color Making Enzyme 3",
+    "crtY": "crtY",
+    "鐣寗绾㈢礌鐜寲Enzyme": "Color Making Enzyme 4",
+    "crtEBIY鍩哄洜绨囨墿澧�": "crtEBIY Instructions Group Copy",
+    "鍩哄洜绨囩粨鏋�": "Instructions Group Structure",
+    "鍩哄洜浣嶇疆": "Instructions Position",
+    "鏋勫缓21a-crtEBIY璐ㄧ矑": "Build 21a-crtEBIY Tiny Ring DNA",
+    "璐ㄧ矑鏋勫缓涓�": "Tiny Ring DNA Building Going",
+    "PCR鎵╁crtEBIY鐗囨": "PCR Copy crtEBIY Piece",
+    "鑳跺洖鏀剁函鍖�": "Jelly Scoop Clean",
+    "绾挎€у寲pET-21a杞戒綋": "Make pET-21a Straight",
+    "鍚屾簮閲嶇粍杩炴帴": "Same Family Stick Connect",
+    "杞寲绛涢€�": "Change and Pick",
+    "闃虫€у厠闅嗛獙璇�": "Success Clone Check",
+    "21a-crtEBIY璐ㄧ矑鏋勫缓鎴愬姛": "21a-crtEBIY Tiny Ring DNA Building Success",
+    "鍩哄洜鏁村悎楠岃瘉": "DNA Instructions Stick Check",
+    "鑿岃惤PCR楠岃瘉": "Colony PCR Check",
+    "閲庣敓鍨�": "Wild Type",
+    "鏁村悎鏍�": "Stick Strain",
+    "闃存€у鐓�": "No Control",
+    "鍩哄洜鏁村悎鑿岃惤PCR楠岃瘉": "DNA Instructions Stick Colony PCR Check",
+    "鍒嗗瓙閲�": "Tiny Molecule Size",
+    "鏁村悎鏁堢巼缁熻": "Stick Power Stats",
+    "Experiment Batch": "Experiment Batch",
+    "Positive Clones": "Success Clone Count",
+    "Total Clones": "Total Clone Count",
+    "Integration Efficiency %": "Stick Power %",
+    "鍩哄洜鏁村悎鏁堢巼缁熻": "DNA Instructions Stick Power Stats",
+    "鍏嬮殕绛涢€夌粨鏋滃垎甯�": "Clone Pick Results Spread",
+    "CRISPR-Cas9鍩哄洜鏁村悎绯荤粺": "CRISPR Magic Scissors DNA Instructions Stick System",
+    "sgRNA璁捐涓庨獙璇�": "sgRNA Design and Check",
+    "sgRNA搴忓垪璁捐": "sgRNA Sequence Design",
+    "闈跺悜搴忓垪": "Target Sequence",
+    "PAM搴忓垪": "PAM Sequence",
+    "楠岃瘉sgRNA璁捐": "Check sgRNA Design",
+    "GC鍚噺": "GC Amount",
+    "鑴遍澏棰勬祴鍒嗘暟": "Wrong Target Guess Score",
+    "sgRNA璁捐浼樿壇": "sgRNA Design Great",
+    "GC鍚噺涓嶅湪鐞嗘兂鑼冨洿": "GC Amount Not Perfect",
+    "sgRNA闀垮害蹇呴』涓�20bp": "sgRNA Length Must Be 20bp",
+    "CRISPR-Cas9宸ヤ綔鍘熺悊": "CRISPR Magic Scissors How It Works",
+    "闈禗NA": "Target DNA",
+    "Cas9": "Cas9",
+    "sgRNA": "sgRNA",
+    "鍒囧壊浣嶇偣": "Cut Spot",
+    "CRISPR-Cas9鍩哄洜缂栬緫鍘熺悊": "CRISPR Magic Scissors DNA Instructions Edit How",
+    "渚涗綋鐗囨鏋勫缓 - 铻嶅悎PCR": "Donor Piece Building - Mix PCR",
+    "绗竴杞甈CR": "First Round PCR",
+    "鎵╁涓婃父鍚屾簮鑷�": "Copy Upstream Same Arm",
+    "绗簩杞甈CR": "Second Round PCR",
+    "鎵╁涓嬫父鍚屾簮鑷�": "Copy Downstream Same Arm",
+    "绗笁杞甈CR": "Third Round PCR",
+    "鎵╁绛涢€夋爣璁�": "Copy Pick Marker",
+    "閲嶅彔寤朵几PCR": "Overlap Grow PCR",
+    "鐗囨铻嶅悎": "Piece Mix",
+    "鑳跺洖鏀剁函鍖栦緵浣撶墖娈�": "Jelly Scoop Clean Donor Piece",
+    "杩涜涓嬩竴姝CR": "Next PCR Step",
+    "杩涜": "Doing",
+    "鐢靛嚮杞寲涓庣瓫閫�": "Zap-Zap Change and Pick",
+    "杩涜鐢靛嚮杞寲": "Do Zap-Zap Change",
+    "鐢靛嚮杞寲杩涜涓�": "Zap-Zap Change Going",
+    "鍒跺鐢靛嚮鎰熷彈鎬佺粏鑳�": "Make Zap-Zap Mode Cells",
+    "娣峰悎渚涗綋鐗囨涓巗gRNA璐ㄧ矑": "Mix Donor Piece with sgRNA Tiny Ring DNA",
+    "鍐版荡10鍒嗛挓": "Ice Bath 10 Minutes",
+    "鐢靛嚮杞寲(2.5kV, 5ms)": "Zap-Zap Change (2.5kV, 5ms)",
+    "澶嶈嫃鍩瑰吇1灏忔椂": "Wake Up Grow 1 Hour",
+    "娑傚竷鍙屾姉骞虫澘": "Spread Double Anti Plate",
+    "37鈩冨煿鍏昏繃澶�": "37°C Grow Overnight",
+    "鐢靛嚮杞寲瀹屾垚": "Zap-Zap Change Done",
+    "寮€濮嬬瓫閫夐槼鎬у厠闅�": "Start Pick Success Clones",
+    "闃虫€у厠闅嗙瓫閫夌粨鏋�": "Success Clone Pick Results",
+    "绛涢€夎疆娆�": "Pick Round",
+    "Total Clones": "Total Clone Count",
+    "Positive Clones": "Success Clone Count",
+    "闃虫€х巼%": "Success Rate %",
+    "闃虫€у厠闅嗙瓫閫夋晥鐜�": "Success Clone Pick Power",
+    "瀹為獙缁撴灉缁煎悎鍒嗘瀽": "Experiment Results All Check",
+    "鍩哄洜琛ㄨ揪楠岃瘉": "DNA Instructions Show Check",
+    "铔嬬櫧鍔熻兘鍒嗘瀽": "Protein Work Check",
+    "浠ｈ阿浜х墿妫€娴�": "Energy Factory Product Check",
+    "娌荤枟鏁堟灉璇勪及": "Fighting Effect Check",
+    "瀹炴椂鑽у厜瀹氶噺PCR": "Live Glow Count PCR",
+    "宸ョ▼鑿屽熀鍥犺〃杈炬按骞�": "Helpful Bacteria DNA Instructions Show Level",
+    "鐩稿琛ㄨ揪閲�": "Relative Show Amount",
+    "杞綍缁勫垎鏋�": "Copy Group Check",
+    "閲庣敓鍨�": "Wild Type",
+    "宸ョ▼鑿�": "Helpful Bacteria",
+    "浠ｈ阿閫氳矾鍩哄洜琛ㄨ揪鐑浘": "Energy Factory Route DNA Instructions Show Heat Map",
+    "SDS-PAGE铔嬬櫧鐢垫吵": "SDS-PAGE Protein Jelly Run",
+    "铔嬬櫧鐢垫吵鍒嗘瀽": "Protein Jelly Run Check",
+    "閰舵椿鎬у垎鏋�": "Enzyme Work Check",
+    "閰舵椿鎬ф祴瀹�": "Enzyme Work Test",
+    "Specific Activity ": "Specific Work",
+    "杞寲鐜�": "Change Rate",
+    "鍏抽敭閰舵椿鎬т笌杞寲鐜囧叧绯�": "Key Enzyme Work and Change Rate Link",
+    "ATRA浜ч噺鍒嗘瀽": "ATRA Making Amount Check",
+    "HPLC妫€娴� - ATRA鏍囧噯鍝�": "HPLC Check - ATRA Standard",
+    "淇濈暀鏃堕棿": "Keep Time",
+    "淇″彿寮哄害": "Signal Power",
+    "浜ч噺缁熻": "Making Stats",
+    "鍩瑰吇鏃堕棿": "Grow Time",
+    "ATRA浜ч噺": "ATRA Making",
+    "缁嗚優瀵嗗害": "Cell Thickness",
+    "ATRA鍙戦叺鐢熶骇鍔ㄥ姏瀛�": "ATRA Ferment Making Power",
+    "浠ｈ阿鐗╃粍瀛﹀垎鏋�": "Energy Factory Product Group Check",
+    "浠ｈ阿鐗╃粍瀛︽瘮杈冨垎鏋�": "Energy Factory Product Group Compare Check",
+    "钁¤悇绯�": "Glucose",
+    "涔抽吀": "Lactate",
+    "涔欓吀": "Acetate",
+    "涔欓唶": "Ethanol",
+    "ATP": "ATP",
+    "NADH": "NADH",
+    "閲庣敓鍨�": "Wild Type",
+    "宸ョ▼鑿�": "Helpful Bacteria",
+    "浣撳鎶楄偪鐦ゆ椿鎬�": "Outside Fight Bad Guy Power",
+    "鍔ㄧ墿妯″瀷鐤楁晥": "Animal Model Effect",
+    "娌荤枟缁�": "Fight Group",
+    "鑲跨槫浣撶Н": "Bad Guy Size",
+    "鐢熷瓨鏈�": "Living Time",
+    "浣撻噸鍙樺寲": "Body Weight Change",
+    "娌荤枟4鍛ㄥ悗鑲跨槫浣撶Н": "Bad Guy Size After 4 Weeks Fighting",
+    "涓綅鐢熷瓨鏈熸瘮杈�": "Middle Living Time Compare",
+    "瀵圭収缁�": "Control Group",
+    "FOLFOX4": "FOLFOX4",
+    "ATRA鏍囧噯": "ATRA Standard",
+    "宸ョ▼鑿孉TRA": "Helpful Bacteria ATRA",
+    "閫夋嫨鐗堟湰": "Pick Version",
+    "涓撲笟鐗�": "Professional",
+    "鍎跨鐗�": "Kids",
+    "閲嶇疆鎵€鏈夊疄楠�": "Reset All Experiments",
+    "鎵€鏈夊疄楠屽凡閲嶇疆": "All Experiments Reset",
+    "褰撳墠瀹為獙鐘舵€�": "Now Experiment Status",
+    "缁嗚弻OD600": "Bacteria OD600",
+    "鍢匡紝灏忕瀛﹀锛佽繖閲屾槸鏁呬簨鏃堕棿锝炴垜浠竴璧风湅鐪嬪皬鍒嗗瓙鏄浣曞府浜轰滑瀵规姉鐢熺梾鐨勫惂锛侌煣戔€嶐煍湪": "Hey little scientist! It's story time~ Let's see how tiny molecules help people fight diseases!",
+    "鍔ㄦ墜鍋氬仛鐪嬶紒杩欎簺鏄疄楠屽閲屾渶甯歌鐨勫皬姝ラ锛屽氨鍍忓仛铔嬬硶鍓嶈鍏堝噯澶囨潗鏂欎竴鏍峰摝锝烉煣侌煣�": "Let's get hands-on! These are the most common little steps in the lab, just like preparing ingredients before making a cake~",
+    "鎶婂ソ鍩哄洜鎷煎湪涓€璧凤紝灏卞儚鎼Н鏈紒璁╁皬缁嗚弻鎷ユ湁鏂版湰棰嗭紝鍋氬嚭鏈夌敤鐨勪笢瑗匡綖馃П馃К": "Put good genes together, just like building blocks! Let little bacteria gain new abilities and make useful things~",
+    "CRISPR灏卞儚涓€鎶婅秴绮惧噯鐨勫皬鍓垁锛屽府鎴戜滑鍦―NA涓�'鍓壀璐磋创'锛佲渹锔忦煋�": "CRISPR is like super precise little scissors, helping us 'cut and paste' on DNA!",
+    "鐪嬬湅鎴愭灉鍚э紒鐢ㄥ浘鐗囧拰鏁板瓧鍛婅瘔鎴戜滑锛氬疄楠屾湁娌℃湁鎴愬姛锝烉煋堭煄�": "Let's see the results! Pictures and numbers tell us: did the experiment succeed~",
+}
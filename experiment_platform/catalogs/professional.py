@@ -0,0 +1,373 @@
+"""Display strings for the Professional version, keyed by source text."""
+
+CATALOG = {
+    # Basic terminology
+    "瀹為獙": "Experiment",
+    "鍒嗗瓙鐢熺墿瀛�": "Molecular Biology",
+    "宸ョ▼鑿�": "Engineered Bacteria",
+    "鏋勫缓": "Construction",
+    "CRISPR-Cas9": "CRISPR-Cas9",
+    "鍩哄洜": "Gene",
+    "鏁村悎": "Integration",
+    "缁撴灉": "Results",
+    "鍒嗘瀽": "Analysis",
+    "鑳屾櫙": "Background",
+    "鎿嶄綔": "Procedure",
+    "妯℃嫙": "Simulation",
+    "鍩瑰吇": "Culture",
+    "璐ㄧ矑": "Plasmid",
+    "鎵╁": "Amplification",
+    "PCR": "PCR",
+    "鐞艰剛绯栧嚌鑳剁數娉�": "Agarose Gel Electrophoresis",
+    "鍑濊兌鐢垫吵": "Gel Electrophoresis",
+    "鑳跺洖鏀�": "Gel Extraction",
+    "鐑縺杞寲": "Heat Shock Transformation",
+    "鐢靛嚮": "Electroporation",
+    "鎰熷彈鎬�": "Competent State",
+    "闃虫€�": "Positive",
+    "闃存€�": "Negative",
+    "鍙傛暟": "Parameters",
+    "缁嗚優": "Cells",
+    "鑲跨槫": "Tumor",
+    "姣掓€�": "Cytotoxicity",
+    "鐢熷瓨鏈�": "Survival",
+    "娴撳害": "Concentration",
+    "Specific Activity ": "Specific Activity",
+    "杞寲鐜�": "Conversion Rate",
+    "琛ㄨ揪": "Expression",
+    "浠ｈ阿": "Metabolism",
+    "閫氳矾": "Pathway",
+    "鐑浘": "Heatmap",
+    "鍥捐氨": "Map",
+    "娉抽亾": "Lane",
+    "鏉″甫": "Band",
+    "妯℃澘": "Template",
+    "寮曠墿": "Primer",
+    "閫€鐏�": "Annealing",
+    "寤朵几": "Extension",
+    "鍙樻€�": "Denaturation",
+    "鐢靛帇": "Voltage",
+    "鏃堕棿": "Time",
+    "娓╁害": "Temperature",
+    "pH": "pH",
+    "宸ョ▼鑿屾瀯寤�": "Engineered Bacteria Construction",
+    "瀹為獙鑳屾櫙浠嬬粛": "Background Introduction",
+    "鍩虹瀹為獙鎿嶄綔": "Basic Laboratory Procedures",
+    "鍩哄洜鏁村悎绯荤粺": "Gene Integration System",
+    "瀹為獙缁撴灉缁煎悎鍒嗘瀽": "Comprehensive Results Analysis",
+    "閫夋嫨瀹為獙妯″潡": "Select Module",
+    # Extended terminology
+    "ATRA": "ATRA",
+    "宸ョ▼鑿屾瀯寤轰笌鑲濈檶娌荤枟鐮旂┒瀹為獙妯℃嫙": "ATRA Engineered Bacteria Construction and Liver Cancer Treatment Research Simulation",
+    "鍒嗗瓙鐢熺墿瀛﹀疄楠屽湪绾垮姩鐢绘ā鎷熺郴缁�": "Online Molecular Biology Experiment Animation Simulation System",
+    "鐢熺墿瀹為獙灏忚鍫�": "Little Biology Lab",
+    "绠€鍗曞ソ鐜╃殑瀹為獙鍔ㄧ敾": "Fun and Simple Experiment Animations",
+    "鑲濈粏鑳炵檶娌荤枟鎸戞垬": "Hepatocellular Carcinoma Treatment Challenges",
+    "鍏ㄧ悆鍙戠梾鐜�": "Global Incidence Rate",
+    "绗叚澶у父瑙佹伓鎬ц偪鐦�": "Sixth Most Common Malignant Tumor",
+    "涓浗鎯呭喌": "China Statistics",
+    "姣忓勾39涓囨浜＄梾渚�": "390,000 Annual Deaths",
+    "娌荤枟闅剧偣": "Treatment Challenges",
+    "鎮ｈ€呭彂鐜版椂宸蹭腑鏅氭湡": "Patients Diagnosed at Advanced Stage",
+    "寮鸿€愯嵂鎬ч檺鍒跺寲鐤楀簲鐢�": "Strong Drug Resistance Limits Chemotherapy",
+    "FOLFOX4鏂规瀹㈣缂撹В鐜囦粎9.1%": "FOLFOX4 Regimen Objective Response Rate Only 9.1%",
+    "ATRA浣滅敤鏈哄埗鍔ㄧ敾": "ATRA Mechanism of Action Animation",
+    "璇卞鍒嗗寲": "Induce Differentiation",
+    "鏈垎鍖栬偪鐦ょ粏鑳�": "Undifferentiated Tumor Cells",
+    "ATRA鍒嗗瓙": "ATRA Molecule",
+    "鍒嗗寲鍚庣粏鑳�": "Differentiated Cells",
+    "ATRA娌荤枟閲岀▼纰�": "ATRA Treatment Milestones",
+    "鍙戠幇ATRA": "ATRA Discovery",
+    "APL娌荤枟绐佺牬": "APL Treatment Breakthrough",
+    "瀹炰綋鐦ょ爺绌�": "Solid Tumor Research",
+    "鑲濈檶涓村簥璇曢獙": "Liver Cancer Clinical Trials",
+    "宸ョ▼鑿屽紑鍙�": "Engineered Bacteria Development",
+    "鎬ユ€ф棭骞肩矑缁嗚優鐧借鐥�": "Acute Promyelocytic Leukemia",
+    "5骞寸敓瀛樼巼": "5-Year Survival Rate",
+    "绐佺牬鎬ц繘灞�": "Breakthrough Progress",
+    "鑲濈檶鑱斿悎FOLFOX4": "Liver Cancer Combined with FOLFOX4",
+    "涓綅鐢熷瓨鏈�": "Median Survival",
+    "鏄捐憲鏀瑰杽": "Significant Improvement",
+    "宸ョ▼鑿岀敓浜ф晥鐜�": "Engineered Bacteria Production Efficiency",
+    "鎻愰珮300%": "300% Increase",
+    "鎶€鏈潻鏂�": "Technological Innovation",
+    "閫夋嫨瀹為獙椤圭洰": "Select Experiment",
+    "LB鍩瑰吇鍩哄埗澶�": "LB Medium Preparation",
+    "璐ㄧ矑鎻愬彇": "Plasmid Extraction",
+    "PCR鎵╁": "PCR Amplification",
+    "鐞艰剛绯栧嚌鑳剁數娉�": "Agarose Gel Electrophoresis",
+    "鑳跺洖鏀�": "Gel Extraction",
+    "鐑縺杞寲": "Heat Shock Transformation",
+    "鐢靛嚮鎰熷彈鎬佸埗澶�": "Electrocompetent Cell Preparation",
+    "瀹為獙鏉愭枡": "Materials",
+    "瀹為獙姝ラ": "Procedure",
+    "瀹炴椂鐩戞祴": "Real-time Monitoring",
+    "寮€濮嬮厤鍒�": "Start Preparation",
+    "涓嬩竴姝�": "Next Step",
+    "璋冭妭pH鍊�": "Adjust pH",
+    "姝ｅ湪璋冭妭pH鍊�": "Adjusting pH",
+    "pH鍊煎凡璋冭妭鑷�7.4": "pH Adjusted to 7.4",
+    "鐏弻娓╁害": "Sterilization Temperature",
+    "楂樻俯鐏弻涓�": "High Temperature Sterilization",
+    "褰撳墠娓╁害": "Current Temperature",
+    "瀹為獙娴佺▼": "Protocol",
+    "杩涜涓嬩竴姝ユ彁鍙�": "Next Extraction Step",
+    "姝ｅ湪杩涜姝ラ": "Executing Step",
+    "璐ㄧ矑鎻愬彇瀹屾垚": "Plasmid Extraction Complete",
+    "璐ㄧ矑璐ㄩ噺妫€娴�": "Plasmid Quality Detection",
+    "璐ㄧ矑娴撳害": "Plasmid Concentration",
+    "璐ㄧ矑鐢垫吵鍒嗘瀽": "Plasmid Electrophoresis Analysis",
+    "DNA Marker": "DNA Marker",
+    "瓒呰灪鏃�": "Supercoiled",
+    "绾挎€�": "Linear",
+    "寮€鐜�": "Open Circular",
+    "璇峰畬鎴愯川绮掓彁鍙栨楠や互鏌ョ湅缁撴灉": "Complete Plasmid Extraction Steps to View Results",
+    "PCR鍙嶅簲浣撶郴": "PCR Reaction System",
+    "PCR绋嬪簭": "PCR Program",
+    "棰勫彉鎬�": "Pre-denaturation",
+    "鍙樻€�": "Denaturation",
+    "閫€鐏�": "Annealing",
+    "寤朵几": "Extension",
+    "鏈€缁堝欢浼�": "Final Extension",
+    "寰幆娆℃暟": "Number of Cycles",
+    "瀹炴椂鎵╁鏇茬嚎": "Real-time Amplification Curve",
+    "寮€濮婸CR鎵╁": "Start PCR Amplification",
+    "PCR鎵╁杩涜涓�": "PCR Amplification in Progress",
+    "姝ｅ湪杩涜绗�": "Executing Cycle",
+    "涓惊鐜�": "Cycle",
+    "鎵╁鏁堢巼": "Amplification Efficiency",
+    "浜х墿娴撳害": "Product Concentration",
+    "PCR鍒嗗瓙杩囩▼妯℃嫙": "PCR Molecular Process Simulation",
+    "PCR鍒嗗瓙杩囩▼绀烘剰鍥�": "PCR Molecular Process Diagram",
+    "鍑濊兌鍒跺": "Gel Preparation",
+    "鐞艰剛绯栨祿搴�": "Agarose Concentration",
+    "鐢垫吵鐢靛帇": "Electrophoresis Voltage",
+    "鐢垫吵鏃堕棿": "Electrophoresis Time",
+    "寮€濮嬬數娉�": "Start Electrophoresis",
+    "鐢垫吵杩涜涓�": "Electrophoresis in Progress",
+    "鐢垫吵瀹屾垚": "Electrophoresis Complete",
+    "鐢垫吵缁撴灉鍒嗘瀽": "Electrophoresis Results Analysis",
+    "鏈€缁堢數娉冲浘璋�": "Final Electrophoresis Pattern",
+    "鍚勬吵閬撴潯甯﹀己搴�": "Lane Band Intensity",
+    "鏍峰搧": "Sample",
+    "鐩稿寮哄害": "Relative Intensity",
+    "DNA鑳跺洖鏀跺疄楠�": "DNA Gel Extraction Experiment",
+    "杩涜涓嬩竴姝�": "Next Step",
+    "鎵ц姝ラ": "Executing Step",
+    "鑳跺洖鏀跺畬鎴�": "Gel Extraction Complete",
+    "鍥炴敹鏁堢巼": "Recovery Efficiency",
+    "DNA娴撳害": "DNA Concentration",
+    "绾害妫€娴�": "Purity Detection",
+    "鍥炴敹浜х墿楠岃瘉": "Recovery Product Validation",
+    "鍘熷PCR浜х墿": "Original PCR Product",
+    "鑳跺洖鏀朵骇鐗�": "Gel Extraction Product",
+    "鑳跺洖鏀跺墠鍚庡姣�": "Before/After Gel Extraction Comparison",
+    "鍑濊兌婧惰В鐘舵€�": "Gel Dissolution Status",
+    "婧惰В杩涘害": "Dissolution Progress",
+    "鐑縺杞寲瀹為獙": "Heat Shock Transformation Experiment",
+    "鎵ц涓嬩竴姝�": "Execute Next Step",
+    "鐑縺杞寲瀹屾垚": "Heat Shock Transformation Complete",
+    "杞寲瀛愭暟": "Transformant Count",
+    "杞寲鏁堢巼": "Transformation Efficiency",
+    "闃虫€у厠闅嗙巼": "Positive Clone Rate",
+    "杞寲瀛愮敓闀挎儏鍐�": "Transformant Growth Status",
+    "杞寲瀛愯繃澶滅敓闀挎洸绾�": "Transformant Overnight Growth Curve",
+    "鑿岃惤鏁伴噺": "Colony Count",
+    "鐢靛嚮鎰熷彈鎬佸埗澶囦笌杞寲": "Electrocompetent Cell Preparation and Transformation",
+    "鎰熷彈鎬佸埗澶�": "Competent Cell Preparation",
+    "鐢靛嚮杞寲": "Electroporation Transformation",
+    "鐢靛嚮鎰熷彈鎬佺粏鑳炲埗澶�": "Electrocompetent Cell Preparation",
+    "杩涜鍒跺姝ラ": "Execute Preparation Step",
+    "缁嗚弻鐢熼暱鐩戞祴": "Bacterial Growth Monitoring",
+    "缁嗚弻鐢熼暱鏇茬嚎": "Bacterial Growth Curve",
+    "褰撳墠OD600": "Current OD600",
+    "鐢靛嚮杞寲瀹為獙": "Electroporation Transformation Experiment",
+    "鐢靛嚮鍙傛暟璁剧疆": "Electroporation Parameter Settings",
+    "鐢靛帇": "Voltage",
+    "鐢靛": "Capacitance",
+    "鐢甸樆": "Resistance",
+    "鎵ц涓嬩竴姝ヨ浆鍖�": "Execute Next Transformation Step",
+    "姝ｅ湪杩涜鐢靛嚮": "Electroporation in Progress",
+    "鐢靛嚮瀹屾垚": "Electroporation Complete",
+    "鐢靛嚮杞寲瀹為獙瀹屾垚": "Electroporation Transformation Complete",
+    "鐢靛嚮杞寲瀛愭暟": "Electroporation Transformant Count",
+    "鐢靛嚮杞寲鏁堢巼": "Electroporation Transformation Efficiency",
+    "杞寲鏂规硶瀵规瘮": "Transformation Method Comparison",
+    "鐑縺杞寲": "Heat Shock Transformation",
+    "鐢靛嚮杞寲": "Electroporation Transformation",
+    "杞寲瀛愭暟": "Transformant Count",
+    "杞寲鏁堢巼": "Transformation Efficiency",
+    "涓嶅悓杞寲鏂规硶鏁堢巼瀵规瘮": "Different Transformation Method Efficiency Comparison",
+    "宸ョ▼鑿屾瀯寤哄疄楠�": "Engineered Bacteria Construction Experiment",
+    "涓嬫父璐ㄧ矑鏋勫缓": "Downstream Plasmid Construction",
+    "涓婃父璐ㄧ矑鏋勫缓": "Upstream Plasmid Construction",
+    "鍩哄洜鏁村悎楠岃瘉": "Gene Integration Validation",
+    "21a-raldh-IIdR-blh璐ㄧ矑鏋勫缓": "21a-raldh-IIdR-blh Plasmid Construction",
+    "瀹為獙鐩爣": "Objective",
+    "鍚湁raldh銆両IdR銆乥lh鍩哄洜鐨勯噸缁勮川绮�": "Recombinant Plasmid Containing raldh, IIdR, blh Genes",
+    "raldh": "raldh",
+    "瑙嗙綉鑶滈啗鑴辨阿閰跺熀鍥�": "Retinal Aldehyde Dehydrogenase Gene",
+    "IIdR": "IIdR",
+    "杞綍璋冩帶鍥犲瓙": "Transcriptional Regulatory Factor",
+    "blh": "blh",
+    "尾-鑳¤悵鍗滅礌缇熷寲閰跺熀鍥�": "尾-Carotene Hydroxylase Gene",
+    "鍩哄洜鐗囨鎵╁楠岃瘉": "Gene Fragment Amplification Validation",
+    "鍩哄洜鎵╁": "Gene Amplification",
+    "鍚屾簮閲嶇粍鏋勫缓": "Homologous Recombination Construction",
+    "杩涜鍚屾簮閲嶇粍鏋勫缓": "Execute Homologous Recombination Construction",
+    "鍚屾簮閲嶇粍杩涜涓�": "Homologous Recombination in Progress",
+    "绾挎€у寲pET-21a杞戒綋": "Linearize pET-21a Vector",
+    "娣峰悎涓変釜鍩哄洜鐗囨": "Mix Three Gene Fragments",
+    "鍔犲叆C115閲嶇粍Enzyme": "Add C115 Recombinase",
+    "50鈩冨弽搴�30鍒嗛挓": "50°C Reaction for 30 Minutes",
+    "杞寲鎰熷彈鎬佺粏鑳�": "Transform Competent Cells",
+    "绛涢€夐槼鎬у厠闅�": "Screen Positive Clones",
+    "閲嶇粍璐ㄧ矑21a-raldh-IIdR-blh鏋勫缓鎴愬姛": "Recombinant Plasmid 21a-raldh-IIdR-blh Construction Successful",
+    "閲嶇粍璐ㄧ矑鍥捐氨": "Recombinant Plasmid Map",
+    "21a-raldh-IIdR-blh 閲嶇粍璐ㄧ矑鍥捐氨": "21a-raldh-IIdR-blh Recombinant Plasmid Map",
+    "21a-crtEBIY璐ㄧ矑鏋勫缓": "21a-crtEBIY Plasmid Construction",
+    "鍚湁crtE銆乧rtB銆乧rtI銆乧rtY鍩哄洜绨囩殑閲嶇粍璐ㄧ矑": "Recombinant Plasmid Containing crtE, crtB, crtI, crtY Gene Cluster",
+    "crtE": "crtE",
+    "鐗荤墰鍎垮熀鐗荤墰鍎垮熀鐒︾７閰稿悎鎴愰叾": "Geranylgeranyl Pyrophosphate Synthase",
+    "crtB": "crtB",
+    "鍏阿鐣寗绾㈢礌鍚堟垚Enzyme": "Phytoene Synthase",
+    "crtI": "crtI",
+    "鍏阿鐣寗绾㈢礌鑴辨阿Enzyme": "Phytoene Desaturase",
+    "crtY": "crtY",
+    "鐣寗绾㈢礌鐜寲Enzyme": "Lycopene Cyclase",
+    "crtEBIY鍩哄洜绨囨墿澧�": "crtEBIY Gene Cluster Amplification",
+    "鍩哄洜绨囩粨鏋�": "Gene Cluster Structure",
+    "鍩哄洜浣嶇疆": "Gene Position",
+    "鏋勫缓21a-crtEBIY璐ㄧ矑": "Construct 21a-crtEBIY Plasmid",
+    "璐ㄧ矑鏋勫缓涓�": "Plasmid Construction in Progress",
+    "PCR鎵╁crtEBIY鐗囨": "PCR Amplify crtEBIY Fragment",
+    "鑳跺洖鏀剁函鍖�": "Gel Extraction and Purification",
+    "绾挎€у寲pET-21a杞戒綋": "Linearize pET-21a Vector",
+    "鍚屾簮閲嶇粍杩炴帴": "Homologous Recombination Ligation",
+    "杞寲绛涢€�": "Transformation and Screening",
+    "闃虫€у厠闅嗛獙璇�": "Positive Clone Validation",
+    "21a-crtEBIY璐ㄧ矑鏋勫缓鎴愬姛": "21a-crtEBIY Plasmid Construction Successful",
+    "鍩哄洜鏁村悎楠岃瘉": "Gene Integration Validation",
+    "鑿岃惤PCR楠岃瘉": "Colony PCR Validation",
+    "閲庣敓鍨�": "Wild Type",
+    "鏁村悎鏍�": "Integration Strain",
+    "闃存€у鐓�": "Negative Control",
+    "鍩哄洜鏁村悎鑿岃惤PCR楠岃瘉": "Gene Integration Colony PCR Validation",
+    "鍒嗗瓙閲�": "Molecular Weight",
+    "鏁村悎鏁堢巼缁熻": "Integration Efficiency Statistics",
+    "Experiment Batch": "Experiment Batch",
+    "Positive Clones": "Positive Clone Count",
+    "Total Clones": "Total Clone Count",
+    "Integration Efficiency %": "Integration Efficiency %",
+    "鍩哄洜鏁村悎鏁堢巼缁熻": "Gene Integration Efficiency Statistics",
+    "鍏嬮殕绛涢€夌粨鏋滃垎甯�": "Clone Screening Results Distribution",
+    "CRISPR-Cas9鍩哄洜鏁村悎绯荤粺": "CRISPR-Cas9 Gene Integration System",
+    "sgRNA璁捐涓庨獙璇�": "sgRNA Design and Validation",
+    "sgRNA搴忓垪璁捐": "sgRNA Sequence Design",
+    "闈跺悜搴忓垪": "Target Sequence",
+    "PAM搴忓垪": "PAM Sequence",
+    "楠岃瘉sgRNA璁捐": "Validate sgRNA Design",
+    "GC鍚噺": "GC Content",
+    "鑴遍澏棰勬祴鍒嗘暟": "Off-target Prediction Score",
+    "sgRNA璁捐浼樿壇": "sgRNA Design Excellent",
+    "GC鍚噺涓嶅湪鐞嗘兂鑼冨洿": "GC Content Not in Ideal Range",
+    "sgRNA闀垮害蹇呴』涓�20bp": "sgRNA Length Must Be 20bp",
+    "CRISPR-Cas9宸ヤ綔鍘熺悊": "CRISPR-Cas9 Working Principle",
+    "闈禗NA": "Target DNA",
+    "Cas9": "Cas9",
+    "sgRNA": "sgRNA",
+    "鍒囧壊浣嶇偣": "Cleavage Site",
+    "CRISPR-Cas9鍩哄洜缂栬緫鍘熺悊": "CRISPR-Cas9 Gene Editing Principle",
+    "渚涗綋鐗囨鏋勫缓 - 铻嶅悎PCR": "Donor Fragment Construction - Fusion PCR",
+    "绗竴杞甈CR": "First Round PCR",
+    "鎵╁涓婃父鍚屾簮鑷�": "Amplify Upstream Homology Arm",
+    "绗簩杞甈CR": "Second Round PCR",
+    "鎵╁涓嬫父鍚屾簮鑷�": "Amplify Downstream Homology Arm",
+    "绗笁杞甈CR": "Third Round PCR",
+    "鎵╁绛涢€夋爣璁�": "Amplify Selection Marker",
+    "閲嶅彔寤朵几PCR": "Overlap Extension PCR",
+    "鐗囨铻嶅悎": "Fragment Fusion",
+    "鑳跺洖鏀剁函鍖栦緵浣撶墖娈�": "Gel Extraction and Purification of Donor Fragment",
+    "杩涜涓嬩竴姝CR": "Next PCR Step",
+    "杩涜": "Executing",
+    "鐢靛嚮杞寲涓庣瓫閫�": "Electroporation Transformation and Screening",
+    "杩涜鐢靛嚮杞寲": "Execute Electroporation Transformation",
+    "鐢靛嚮杞寲杩涜涓�": "Electroporation Transformation in Progress",
+    "鍒跺鐢靛嚮鎰熷彈鎬佺粏鑳�": "Prepare Electrocompetent Cells",
+    "娣峰悎渚涗綋鐗囨涓巗gRNA璐ㄧ矑": "Mix Donor Fragment with sgRNA Plasmid",
+    "鍐版荡10鍒嗛挓": "Ice Bath for 10 Minutes",
+    "鐢靛嚮杞寲(2.5kV, 5ms)": "Electroporation Transformation (2.5kV, 5ms)",
+    "澶嶈嫃鍩瑰吇1灏忔椂": "Recovery Culture for 1 Hour",
+    "娑傚竷鍙屾姉骞虫澘": "Plate on Double Antibiotic Plate",
+    "37鈩冨煿鍏昏繃澶�": "37°C Overnight Culture",
+    "鐢靛嚮杞寲瀹屾垚": "Electroporation Transformation Complete",
+    "寮€濮嬬瓫閫夐槼鎬у厠闅�": "Start Screening Positive Clones",
+    "闃虫€у厠闅嗙瓫閫夌粨鏋�": "Positive Clone Screening Results",
+    "绛涢€夎疆娆�": "Screening Round",
+    "Total Clones": "Total Clone Count",
+    "Positive Clones": "Positive Clone Count",
+    "闃虫€х巼%": "Positive Rate %",
+    "闃虫€у厠闅嗙瓫閫夋晥鐜�": "Positive Clone Screening Efficiency",
+    "瀹為獙缁撴灉缁煎悎鍒嗘瀽": "Comprehensive Experimental Results Analysis",
+    "鍩哄洜琛ㄨ揪楠岃瘉": "Gene Expression Validation",
+    "铔嬬櫧鍔熻兘鍒嗘瀽": "Protein Function Analysis",
+    "浠ｈ阿浜х墿妫€娴�": "Metabolite Detection",
+    "娌荤枟鏁堟灉璇勪及": "Therapeutic Effect Evaluation",
+    "瀹炴椂鑽у厜瀹氶噺PCR": "Real-time Quantitative PCR",
+    "宸ョ▼鑿屽熀鍥犺〃杈炬按骞�": "Engineered Bacteria Gene Expression Level",
+    "鐩稿琛ㄨ揪閲�": "Relative Expression Level",
+    "杞綍缁勫垎鏋�": "Transcriptome Analysis",
+    "閲庣敓鍨�": "Wild Type",
+    "宸ョ▼鑿�": "Engineered Bacteria",
+    "浠ｈ阿閫氳矾鍩哄洜琛ㄨ揪鐑浘": "Metabolic Pathway Gene Expression Heatmap",
+    "SDS-PAGE铔嬬櫧鐢垫吵": "SDS-PAGE Protein Electrophoresis",
+    "铔嬬櫧鐢垫吵鍒嗘瀽": "Protein Electrophoresis Analysis",
+    "閰舵椿鎬у垎鏋�": "Enzyme Activity Analysis",
+    "閰舵椿鎬ф祴瀹�": "Enzyme Activity Assay",
+    "Specific Activity ": "Specific Activity",
+    "杞寲鐜�": "Conversion Rate",
+    "鍏抽敭閰舵椿鎬т笌杞寲鐜囧叧绯�": "Key Enzyme Activity and Conversion Rate Relationship",
+    "ATRA浜ч噺鍒嗘瀽": "ATRA Production Analysis",
+    "HPLC妫€娴� - ATRA鏍囧噯鍝�": "HPLC Detection - ATRA Standard",
+    "淇濈暀鏃堕棿": "Retention Time",
+    "淇″彿寮哄害": "Signal Intensity",
+    "浜ч噺缁熻": "Production Statistics",
+    "鍩瑰吇鏃堕棿": "Culture Time",
+    "ATRA浜ч噺": "ATRA Production",
+    "缁嗚優瀵嗗害": "Cell Density",
+    "ATRA鍙戦叺鐢熶骇鍔ㄥ姏瀛�": "ATRA Fermentation Production Kinetics",
+    "浠ｈ阿鐗╃粍瀛﹀垎鏋�": "Metabolomics Analysis",
+    "浠ｈ阿鐗╃粍瀛︽瘮杈冨垎鏋�": "Metabolomics Comparative Analysis",
+    "钁¤悇绯�": "Glucose",
+    "涔抽吀": "Lactate",
+    "涔欓吀": "Acetate",
+    "涔欓唶": "Ethanol",
+    "ATP": "ATP",
+    "NADH": "NADH",
+    "閲庣敓鍨�": "Wild Type",
+    "宸ョ▼鑿�": "Engineered Bacteria",
+    "浣撳鎶楄偪鐦ゆ椿鎬�": "In Vitro Antitumor Activity",
+    "鍔ㄧ墿妯″瀷鐤楁晥": "Animal Model Efficacy",
+    "娌荤枟缁�": "Treatment Group",
+    "鑲跨槫浣撶Н": "Tumor Volume",
+    "鐢熷瓨鏈�": "Survival",
+    "浣撻噸鍙樺寲": "Body Weight Change",
+    "娌荤枟4鍛ㄥ悗鑲跨槫浣撶Н": "Tumor Volume After 4 Weeks of Treatment",
+    "涓綅鐢熷瓨鏈熸瘮杈�": "Median Survival Comparison",
+    "瀵圭収缁�": "Control Group",
+    "FOLFOX4": "FOLFOX4",
+    "ATRA鏍囧噯": "ATRA Standard",
+    "宸ョ▼鑿孉TRA": "Engineered Bacteria ATRA",
+    "閫夋嫨鐗堟湰": "Select Version",
+    "涓撲笟鐗�": "Professional",
+    "鍎跨鐗�": "Kids",
+    "閲嶇疆鎵€鏈夊疄楠�": "Reset All Experiments",
+    "鎵€鏈夊疄楠屽凡閲嶇疆": "All Experiments Reset",
+    "褰撳墠瀹為獙鐘舵€�": "Current Experiment Status",
+    "缁嗚弻OD600": "Bacterial OD600",
+    "鍢匡紝灏忕瀛﹀锛佽繖閲屾槸鏁呬簨鏃堕棿锝炴垜浠竴璧风湅鐪嬪皬鍒嗗瓙鏄浣曞府浜轰滑瀵规姉鐢熺梾鐨勫惂锛侌煣戔€嶐煍湪": "Hey little scientist! It's story time~ Let's see how tiny molecules help people fight diseases!",
+    "鍔ㄦ墜鍋氬仛鐪嬶紒杩欎簺鏄疄楠屽閲屾渶甯歌鐨勫皬姝ラ锛屽氨鍍忓仛铔嬬硶鍓嶈鍏堝噯澶囨潗鏂欎竴鏍峰摝锝烉煣侌煣�": "Let's get hands-on! These are the most common little steps in the lab, just like preparing ingredients before making a cake~",
+    "鎶婂ソ鍩哄洜鎷煎湪涓€璧凤紝灏卞儚鎼Н鏈紒璁╁皬缁嗚弻鎷ユ湁鏂版湰棰嗭紝鍋氬嚭鏈夌敤鐨勪笢瑗匡綖馃П馃К": "Put good genes together, just like building blocks! Let little bacteria gain new abilities and make useful things~",
+    "CRISPR灏卞儚涓€鎶婅秴绮惧噯鐨勫皬鍓垁锛屽府鎴戜滑鍦―NA涓�'鍓壀璐磋创'锛佲渹锔忦煋�": "CRISPR is like super precise little scissors, helping us 'cut and paste' on DNA!",
+    "鐪嬬湅鎴愭灉鍚э紒鐢ㄥ浘鐗囧拰鏁板瓧鍛婅瘔鎴戜滑锛氬疄楠屾湁娌℃湁鎴愬姛锝烉煋堭煄�": "Let's see the results! Pictures and numbers tell us: did the experiment succeed~",
+}
@@ -0,0 +1,417 @@
+"""Colony counting from photos of agar plates, with NumPy and Pillow only.
+
+``count_plate`` works on a grayscale copy of the photo no larger than
+``MAX_SIDE`` pixels:
+
+* the dish: the inscribed circle of the image, less its rim;
+* background: uneven lighting is removed by subtracting the agar's
+  brightness, a quadratic surface fitted to medians of the dish in blocks
+  and refitted without blocks far off it (a smear or a lawn), so colonies
+  stand out as a tail of the residual on one side, light colonies on dark
+  agar or the reverse;
+* threshold: the larger of Otsu's threshold of the residual and a multiple
+  of the noise between neighbouring pixels, so a sparse plate does not pick
+  up noise;
+* connected components: the foreground is cut into runs along each row, runs
+  overlapping runs on the next row are joined, and the joins are resolved by
+  a vectorized union-find over runs;
+* touching colonies: the typical single-colony area is the median component
+  area; a component above it is split at the maxima of its distance
+  transform that have a neck between them, or counted by its area when the
+  colonies have merged too far for a neck to show.
+
+``count_images`` and ``count_folder`` count many plates, timing each image,
+in the process pool when there are enough plates and CPUs to gain from it.
+"""
+import dataclasses
+import io
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from PIL import Image, ImageDraw
+
+from experiment_platform.parallel import process_pool, worth_parallel
+
+MAX_SIDE = 1024
+IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.tif', '.tiff', '.bmp')
+
+PLATE_MARGIN = 0.9  # fraction of the inscribed circle's radius inside the rim
+BACKGROUND_BLOCK = 1 / 16  # block of the background estimate, as a fraction of the image side
+BACKGROUND_TERMS = 6  # of the quadratic surface
+# Blocks further than this many robust standard deviations (and gray levels) off the surface are refitted without
+BACKGROUND_CLIP = 3.0
+BACKGROUND_MIN_CLIP = 1.0
+BACKGROUND_ITERATIONS = 10
+NOISE_SIGMAS = 5.0
+# Noise is at least this many gray levels, about the rounding to 8 bits, so a noiseless image is not
+# thresholded at its rounding errors
+NOISE_FLOOR = 0.3
+MIN_AREA_PX = 6
+# Components below this fraction of the single-colony area are dust or noise
+MIN_AREA_FRACTION = 0.2
+# Components above this many single-colony areas are examined as touching colonies
+CLUMP_RATIO = 1.2
+# Maxima of a clump's distance transform count as colonies if at least this many single-colony radii deep,
+# and as separate colonies if the transform dips below SADDLE_RATIO of the lower one on the line between them
+MIN_PEAK_RADIUS = 0.5
+SADDLE_RATIO = 0.85
+SADDLE_SAMPLES = 16
+# A clump without a neck is counted by area, in colonies this much larger than the typical one
+FALLBACK_SLACK = 1.25
+
+# Plates per pool job; decoding dominates, so a job is a handful of files
+CHUNK_PLATES = 8
+# Fewer plates are counted serially: starting the workers and shipping the files costs about what they save
+PARALLEL_MIN_PLATES = 32
+
+
+@dataclasses.dataclass
+class PlateCount:
+    colonies: int
+    centers: np.ndarray  # (colonies, 2) x, y in pixels of the original image
+    components: int  # connected components counted (before splitting)
+    split: int  # colonies found by splitting touching ones
+    single_area: float  # typical colony area, pixels of the analysed image
+    scale: float  # original pixels per analysed pixel
+    seconds: float
+
+
+def load_plate(source) -> Tuple[np.ndarray, float]:
+    """Grayscale float32 image (at most ``MAX_SIDE`` on a side) and the original pixels per pixel."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    with Image.open(source) as image:
+        size = image.size
+        # JPEG decoders can scale down while decoding, much faster than decoding and resizing
+        image.draft('L', (MAX_SIDE, MAX_SIDE))
+        image = image.convert('L')
+        image.thumbnail((MAX_SIDE, MAX_SIDE))
+        return np.asarray(image, dtype=np.float32), size[0] / image.size[0]
+
+
+def _background(image: np.ndarray, dish: np.ndarray, block: int) -> np.ndarray:
+    """Agar brightness under each pixel: a quadratic surface fitted to medians of the dish in blocks (colonies are
+    a minority of any block), leaving out blocks far off the surface, such as ones inside a smear."""
+    h, w = image.shape
+    rows, cols = -(-h // block), -(-w // block)
+    pad = ((0, rows * block - h), (0, cols * block - w))
+
+    def per_block(values):
+        return np.pad(values, pad).reshape(rows, block, cols, block).transpose(0, 2, 1, 3).reshape(rows * cols, -1)
+
+    with warnings.catch_warnings():
+        # Blocks outside the dish are all NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        medians = np.nanmedian(per_block(np.where(dish, image, np.nan)), axis=1)
+        # Blocks across the rim are centred on their part of the dish
+        inside = per_block(dish).sum(axis=1)
+        y = per_block(dish * np.arange(h, dtype=np.float32)[:, None]).sum(axis=1) / inside / max(h, w)
+        x = per_block(dish * np.arange(w, dtype=np.float32)[None]).sum(axis=1) / inside / max(h, w)
+    valid = np.isfinite(medians)
+    terms = np.column_stack([np.ones_like(x), x, y, x * x, x * y, y * y])
+    # From a flat background, which a smear in the middle of the dish cannot bend as a quadratic would
+    coefficients = np.zeros(BACKGROUND_TERMS)
+    coefficients[0] = np.median(medians[valid]) if valid.any() else 0.0
+    kept = valid
+    for _ in range(BACKGROUND_ITERATIONS):
+        off = np.abs(medians - terms @ coefficients)
+        spread = 1.4826 * float(np.median(off[kept]))
+        refit = valid & (off <= max(BACKGROUND_CLIP * spread, BACKGROUND_MIN_CLIP))
+        if refit.sum() < BACKGROUND_TERMS:
+            break
+        coefficients = np.linalg.lstsq(terms[refit], medians[refit], rcond=None)[0]
+        if np.array_equal(refit, kept):
+            break
+        kept = refit
+    c0, cx, cy, cxx, cxy, cyy = coefficients
+    yy, xx = np.ogrid[:h, :w]
+    yy, xx = yy / max(h, w), xx / max(h, w)
+    return (c0 + xx * (cx + cxx * xx + cxy * yy) + yy * (cy + cyy * yy)).astype(np.float32)
+
+
+def _otsu(values: np.ndarray, bins: int = 256) -> float:
+    counts, edges = np.histogram(values, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    weight = np.cumsum(counts)
+    mean = np.cumsum(counts * centers)
+    total_weight, total_mean = weight[-1], mean[-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        between = (total_mean * weight - mean * total_weight) ** 2 / (weight * (total_weight - weight))
+    if not np.isfinite(between[:-1]).any():
+        # A uniform image: nothing above any threshold
+        return float(edges[-1])
+    return float(centers[np.nanargmax(between[:-1])])
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Row, start and end (exclusive) of every horizontal run of True pixels, in row-major order."""
+    h, w = mask.shape
+    padded = np.zeros((h, w + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    start_rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return start_rows, starts, ends
+
+
+def label_components(mask: np.ndarray) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Component of each run (8-connected), numbered from 0, and the runs themselves (see ``_runs``)."""
+    rows, starts, ends = _runs(mask)
+    n = len(rows)
+    if not n:
+        return np.zeros(0, dtype=np.int64), (rows, starts, ends)
+    width = mask.shape[1] + 2
+    start_keys, end_keys = rows * width + starts, rows * width + ends
+    # Runs of row r - 1 that overlap run b of row r (diagonal contact included): end > start_b - 1 and
+    # start < end_b + 1; keys are in row-major order, so each is a contiguous range
+    lo = np.searchsorted(end_keys, (rows - 1) * width + starts - 1, side='right')
+    hi = np.searchsorted(start_keys, (rows - 1) * width + ends + 1, side='left')
+    counts = np.clip(hi - lo, 0, None)
+    b = np.repeat(np.arange(n), counts)
+    a = np.repeat(lo, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        updated = labels.copy()
+        np.minimum.at(updated, a, low)
+        np.minimum.at(updated, b, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    return np.unique(labels, return_inverse=True)[1], (rows, starts, ends)
+
+
+def _distance_transform(mask: np.ndarray) -> np.ndarray:
+    """Euclidean distance of each pixel of a mask to the nearest pixel outside it.
+
+    Separable: the distance to the background along each column, then the nearest of those along each row,
+    widening the search one column at a time until it can find nothing nearer.
+    """
+    padded = np.pad(mask, 1)
+    h, w = padded.shape
+    index = np.arange(h)[:, None]
+    above = np.maximum.accumulate(np.where(padded, -h, index), axis=0)
+    below = np.minimum.accumulate(np.where(padded, 2 * h, index)[::-1], axis=0)[::-1]
+    column = np.minimum(index - above, below - index).astype(np.float64) ** 2
+    squared = column.copy()
+    for step in range(1, w):
+        if step * step >= squared.max():
+            break
+        np.minimum(squared[:, step:], column[:, :-step] + step * step, out=squared[:, step:])
+        np.minimum(squared[:, :-step], column[:, step:] + step * step, out=squared[:, :-step])
+    return np.sqrt(squared[1:-1, 1:-1]).astype(np.float32)
+
+
+def _split_clump(mask: np.ndarray, radius: float, area_estimate: int) -> np.ndarray:
+    """Centres (row, col) of the colonies in a clump: maxima of its distance transform with a neck between them."""
+    distance = _distance_transform(mask)
+    padded = np.pad(distance, 1)
+    neighbours = np.stack([padded[1 + dy:padded.shape[0] - 1 + dy, 1 + dx:padded.shape[1] - 1 + dx]
+                           for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx])
+    peaks = np.argwhere((distance >= neighbours.max(axis=0)) & (distance >= MIN_PEAK_RADIUS * radius))
+    heights = distance[tuple(peaks.T)]
+    order = np.argsort(-heights)
+    along = np.linspace(0, 1, SADDLE_SAMPLES)[:, None]
+    kept = []
+    for peak, height in zip(peaks[order], heights[order]):
+        separate = True
+        for other, other_height in kept:
+            # Two colonies have a neck between them; two maxima of one colony do not
+            line = np.rint(other + along * (peak - other)).astype(int)
+            if distance[tuple(line.T)].min() >= SADDLE_RATIO * min(height, other_height):
+                separate = False
+                break
+        if separate:
+            kept.append((peak, height))
+    if len(kept) < 2 and area_estimate > 1:
+        # Too merged for a neck to show; count the clump by its area
+        center = np.argwhere(mask).mean(axis=0)
+        return np.repeat(center[None], area_estimate, axis=0)
+    return np.array([peak for peak, _ in kept] or [np.argwhere(mask).mean(axis=0)], dtype=np.float64)
+
+
+def count_plate(source, polarity: str = 'auto') -> PlateCount:
+    """Colonies on a plate photo (path, bytes, file object or grayscale array).
+
+    ``polarity`` is ``'light'`` for colonies lighter than the agar, ``'dark'`` for darker ones, or ``'auto'``.
+    """
+    start = time.perf_counter()
+    if isinstance(source, np.ndarray):
+        image, scale = source.astype(np.float32), 1.0
+    else:
+        image, scale = load_plate(source)
+    h, w = image.shape
+    yy, xx = np.ogrid[:h, :w]
+    radius = PLATE_MARGIN * min(h, w) / 2
+    dish = (yy - (h - 1) / 2) ** 2 + (xx - (w - 1) / 2) ** 2 <= radius ** 2
+
+    residual = image - _background(image, dish, max(int(min(h, w) * BACKGROUND_BLOCK), 4))
+    values = residual[dish]
+    # Noise from differences of neighbouring pixels, which colonies (smooth inside) hardly affect
+    steps = np.diff(residual, axis=1)[dish[:, 1:] & dish[:, :-1]]
+    noise = 1.4826 * float(np.median(np.abs(steps - np.median(steps)))) / np.sqrt(2)
+    noise = max(noise, NOISE_FLOOR)
+    median = float(np.median(values))
+    if polarity == 'auto':
+        # Colonies are the heavier tail of the residual
+        polarity = 'light' if np.percentile(values, 99.5) - median >= median - np.percentile(values, 0.5) else 'dark'
+    if polarity == 'dark':
+        residual, values, median = -residual, -values, -median
+    threshold = max(_otsu(values), median + NOISE_SIGMAS * noise)
+    mask = (residual > threshold) & dish
+
+    component, (rows, starts, ends) = label_components(mask)
+    lengths = ends - starts
+    n = int(component.max()) + 1 if len(component) else 0
+    area = np.bincount(component, lengths, minlength=n)
+    # Sums of x and y over each run give the centroids
+    sum_x = np.bincount(component, (starts + ends - 1) * lengths / 2, minlength=n)
+    sum_y = np.bincount(component, rows * lengths, minlength=n)
+    kept = area >= MIN_AREA_PX
+    single_area = float(np.median(area[kept])) if kept.any() else 0.0
+    kept &= area >= MIN_AREA_FRACTION * single_area
+    singles = kept & (area <= CLUMP_RATIO * single_area)
+    centers = [np.column_stack([sum_x[singles], sum_y[singles]]) / area[singles, None]]
+
+    split = 0
+    single_radius = np.sqrt(single_area / np.pi)
+    clumps = np.flatnonzero(kept & ~singles)
+    if len(clumps):
+        top = np.full(n, h)
+        bottom = np.zeros(n, dtype=np.int64)
+        left = np.full(n, w)
+        right = np.zeros(n, dtype=np.int64)
+        np.minimum.at(top, component, rows)
+        np.maximum.at(bottom, component, rows + 1)
+        np.minimum.at(left, component, starts)
+        np.maximum.at(right, component, ends)
+        for clump in clumps:
+            runs = component == clump
+            crop = np.zeros((bottom[clump] - top[clump], right[clump] - left[clump]), dtype=bool)
+            for row, run_start, run_end in zip(rows[runs] - top[clump], starts[runs] - left[clump],
+                                               ends[runs] - left[clump]):
+                crop[row, run_start:run_end] = True
+            peaks = _split_clump(crop, single_radius, int(area[clump] / (FALLBACK_SLACK * single_area)))
+            centers.append(peaks[:, ::-1] + [left[clump], top[clump]])
+            split += len(peaks) - 1
+    centers = np.concatenate(centers)
+    return PlateCount(len(centers), centers * scale, int(kept.sum()), split, single_area, scale,
+                      time.perf_counter() - start)
+
+
+def cfu_per_ug(colonies: int, dna_ug: float, plated_fraction: float = 1.0) -> float:
+    """Transformation efficiency: colonies per µg of DNA, scaled up for the share of the recovery plated."""
+    return colonies / (dna_ug * plated_fraction)
+
+
+def _count_image(job: Tuple[str, object]) -> dict:
+    name, source = job
+    try:
+        count = count_plate(source)
+    except (OSError, ValueError) as exc:
+        return {'file': name, 'colonies': np.nan, 'split': np.nan, 'seconds': np.nan, 'error': str(exc)}
+    return {'file': name, 'colonies': count.colonies, 'split': count.split, 'seconds': count.seconds, 'error': ''}
+
+
+def _count_chunk(jobs: Sequence[Tuple[str, object]]) -> List[dict]:
+    return [_count_image(job) for job in jobs]
+
+
+def count_images(images: Sequence[Tuple[str, object]], parallel: bool = None) -> pd.DataFrame:
+    """Colonies per plate, with the seconds each took; ``images`` are (name, path or bytes) pairs."""
+    chunks = [images[i:i + CHUNK_PLATES] for i in range(0, len(images), CHUNK_PLATES)]
+    if parallel is None:
+        parallel = len(images) >= PARALLEL_MIN_PLATES and worth_parallel(len(chunks))
+    results = process_pool().map(_count_chunk, chunks) if parallel else map(_count_chunk, chunks)
+    return pd.DataFrame([row for chunk in results for row in chunk],
+                        columns=['file', 'colonies', 'split', 'seconds', 'error'])
+
+
+def count_folder(directory, parallel: bool = None) -> pd.DataFrame:
+    """``count_images`` of every plate photo in a directory."""
+    paths = sorted(p for p in Path(directory).iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+    return count_images([(path.name, str(path)) for path in paths], parallel)
+
+
+def overlay(source, count: PlateCount, max_side: int = 800) -> Image.Image:
+    """The plate photo with a ring around every colony counted, at most ``max_side`` on a side."""
+    if isinstance(source, np.ndarray):
+        image = Image.fromarray(np.clip(source, 0, 255).astype(np.uint8))
+    else:
+        image = Image.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+    image = image.convert('RGB')
+    factor = min(max_side / max(image.size), 1.0)
+    image = image.resize((round(image.width * factor), round(image.height * factor)))
+    draw = ImageDraw.Draw(image)
+    radius = max(np.sqrt(count.single_area / np.pi) * count.scale * factor * 1.4, 3)
+    for x, y in count.centers * factor:
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), outline=(230, 40, 40), width=2)
+    return image
+
+
+def _place_colonies(colonies: int, size: int, clumped: float, rng) -> Tuple[np.ndarray, np.ndarray]:
+    """Centres (x, y) and radii of synthetic colonies: apart, except a ``clumped`` share grown against another."""
+    center = (size - 1) / 2
+    reach = 0.9 * PLATE_MARGIN * 0.47 * size
+    radii = rng.uniform(0.007, 0.012, colonies) * size
+    placed = np.empty((0, 2))
+    for i, radius in enumerate(radii):
+        if len(placed) and rng.random() < clumped:
+            # Grows against the last colony, overlapping it a little
+            angle = rng.uniform(0, 2 * np.pi)
+            candidate = placed[-1] + 0.9 * (radius + radii[i - 1]) * np.array([np.cos(angle), np.sin(angle)])
+            if np.hypot(*(candidate - center)) < reach:
+                placed = np.vstack([placed, candidate])
+                continue
+        for _ in range(1000):
+            candidate = center + rng.uniform(-reach, reach, 2)
+            if np.hypot(*(candidate - center)) < reach and (
+                    not len(placed) or np.hypot(*(placed - candidate).T).min() > 2.6 * radii.max()):
+                break
+        placed = np.vstack([placed, candidate])
+    return placed, radii
+
+
+def synthetic_plate(colonies: int = 150, size: int = 800, seed: int = 0, clumped: float = 0.15) -> np.ndarray:
+    """Grayscale photo of a plate with this many cream colonies on amber agar, a ``clumped`` share touching another."""
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[:size, :size].astype(np.float32)
+    center = (size - 1) / 2
+    dish_radius = 0.47 * size
+    r = np.hypot(yy - center, xx - center)
+    # Agar with a lighting gradient, darker table around the dish and a bright rim
+    image = np.where(r <= dish_radius, 95 + 25 * (xx / size) + 10 * (yy / size), 35).astype(np.float32)
+    image += 60 * np.exp(-((r - dish_radius) / 3) ** 2)
+    for (x, y), radius in zip(*_place_colonies(colonies, size, clumped, rng)):
+        y0, y1 = int(max(y - 2 * radius, 0)), int(min(y + 2 * radius + 1, size))
+        x0, x1 = int(max(x - 2 * radius, 0)), int(min(x + 2 * radius + 1, size))
+        d = np.hypot(yy[y0:y1, x0:x1] - y, xx[y0:y1, x0:x1] - x) / radius
+        image[y0:y1, x0:x1] = np.maximum(image[y0:y1, x0:x1], np.where(d <= 1, 200 - 40 * d ** 2, 0))
+    image += rng.normal(0, 3, image.shape)
+    return np.clip(image, 0, 255).astype(np.uint8)
+
+
+def main(argv=None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(description="Count colonies on every plate photo in a directory.")
+    parser.add_argument('directory', type=Path)
+    parser.add_argument('--out', type=Path, help="CSV of counts (default: print)")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    counts = count_folder(args.directory)
+    if args.out:
+        counts.to_csv(args.out, index=False)
+    else:
+        print(counts.to_string(index=False))
+    print(f"{len(counts)} plate(s) in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""Lab datasets for the Results Analysis page.
+
+Five kinds of table are understood (see ``SCHEMAS``): qPCR Ct exports, HPLC
+detector traces, fermentation time courses, plate-reader viability tables
+and animal-study sheets.  A
+file is read from CSV, Excel or Parquet in chunks of ``CHUNK_ROWS`` rows, and
+each chunk is cut down to the schema's columns as it arrives: text columns
+become categoricals and numbers float32, so a large export never sits in
+memory as object columns.
+
+Expression matrices for the transcriptome heatmap are wide instead (one row
+per gene, one column per sample) and are read by ``read_matrix`` into a
+float32 frame indexed by gene.
+
+Uploaded files are parsed once per file content: ``load_uploaded_dataset``
+keys the parsed frame by the SHA-256 of the file and keeps it in a
+process-wide cache, so every session that uploads the same file shares it.
+Frames from the cache are shared and must not be modified in place.
+"""
+import dataclasses
+import hashlib
+import io
+import os
+import re
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from pandas.api.types import union_categoricals
+
+CHUNK_ROWS = 200_000
+
+# Spellings of a missing value seen in instrument exports (qPCR "Undetermined" wells)
+NA_VALUES = ('', 'NA', 'N/A', 'NaN', 'nan', '-', 'Undetermined', 'No Ct')
+
+FILE_TYPES = ('csv', 'tsv', 'txt', 'xlsx', 'xlsm', 'parquet')
+
+# Gene-length columns of an expression matrix, used to turn counts into TPM
+LENGTH_HEADERS = ('length', 'gene length', 'effective length', 'efflength', 'transcript length')
+
+
+@dataclasses.dataclass(frozen=True)
+class Column:
+    name: str
+    kind: str  # 'category' or 'float'
+    aliases: Tuple[str, ...] = ()
+    required: bool = True
+
+
+@dataclasses.dataclass(frozen=True)
+class DatasetSchema:
+    label: str
+    columns: Tuple[Column, ...]
+
+
+SCHEMAS: Dict[str, DatasetSchema] = {
+    'qpcr': DatasetSchema('qPCR Ct export', (
+        Column('sample', 'category', ('sample name', 'sample id', 'strain')),
+        Column('gene', 'category', ('target', 'target name', 'detector', 'gene name')),
+        Column('ct', 'float', ('cq', 'ct mean', 'crt', 'cp')),
+        Column('plate', 'category', ('plate id', 'run', 'experiment'), required=False),
+        Column('well', 'category', ('well position', 'pos'), required=False),
+        Column('efficiency', 'float', ('amplification efficiency', 'primer efficiency', 'amp efficiency'),
+               required=False),
+    )),
+    'hplc': DatasetSchema('HPLC trace', (
+        Column('time', 'float', ('retention time', 'rt', 'time min', 'minutes')),
+        Column('signal', 'float', ('intensity', 'absorbance', 'mau', 'response', 'value')),
+        Column('injection', 'category', ('sample', 'sample name', 'run', 'file'), required=False),
+        # Per-injection metadata for quantification, repeated on each row of the injection
+        Column('culture_time', 'float', ('culture time h', 'culture time hours', 'sampling time',
+                                         'fermentation time'), required=False),
+        Column('standard_concentration', 'float', ('standard concentration mg l', 'std concentration',
+                                                   'standard mg l'), required=False),
+    )),
+    'fermentation': DatasetSchema('Fermentation time course', (
+        Column('time', 'float', ('culture time', 'culture time h', 'time h', 'hours', 'fermentation time')),
+        Column('od600', 'float', ('od', 'od 600', 'cell density', 'biomass', 'cell density od600'),
+               required=False),
+        Column('atra', 'float', ('atra mg l', 'atra production mg l', 'titre', 'titer', 'product mg l'),
+               required=False),
+        Column('run', 'category', ('batch', 'flask', 'culture', 'run id'), required=False),
+    )),
+    'plate_reader': DatasetSchema('Plate-reader viability table', (
+        Column('treatment', 'category', ('compound', 'drug', 'sample')),
+        Column('concentration', 'float', ('conc', 'dose', 'concentration um', 'concentration μm')),
+        Column('viability', 'float', ('cell viability', 'survival', 'cell survival rate', 'response',
+                                      'viability percent')),
+        Column('plate', 'category', ('plate id',), required=False),
+        Column('well', 'category', ('well position',), required=False),
+        Column('cell_line', 'category', ('cell line', 'cells', 'line', 'cell type'), required=False),
+        Column('replicate', 'category', ('rep', 'replicate series', 'series', 'biological replicate'),
+               required=False),
+    )),
+    'animal': DatasetSchema('Animal-study sheet', (
+        Column('group', 'category', ('treatment group', 'treatment', 'arm')),
+        Column('tumor_volume', 'float', ('tumor volume', 'tumor volume mm3', 'tumour volume', 'volume')),
+        Column('survival_days', 'float', ('survival', 'survival days', 'survival time')),
+        Column('body_weight_change', 'float', ('body weight change', 'weight change', 'body weight change percent'),
+               required=False),
+        Column('animal', 'category', ('animal id', 'mouse', 'mouse id', 'id'), required=False),
+    )),
+}
+
+
+def _normalize(header) -> str:
+    return re.sub(r'[^0-9a-zμ]+', ' ', str(header).lower()).strip()
+
+
+def resolve_columns(headers: List, schema: DatasetSchema) -> Dict[str, str]:
+    """Map each source header the schema uses to its column name; raise ValueError if a required one is missing."""
+    by_spelling = {}
+    for header in headers:
+        by_spelling.setdefault(_normalize(header), header)
+    mapping = {}
+    missing = []
+    for column in schema.columns:
+        for spelling in (column.name.replace('_', ' '),) + column.aliases:
+            if spelling in by_spelling:
+                mapping[by_spelling[spelling]] = column.name
+                break
+        else:
+            if column.required:
+                missing.append(column.name)
+    if missing:
+        raise ValueError(f"{schema.label} is missing column(s): {', '.join(missing)} "
+                         f"(found: {', '.join(str(h) for h in headers)})")
+    return mapping
+
+
+def _sniff_separator(buffer) -> str:
+    first_line = buffer.readline()
+    buffer.seek(0)
+    if isinstance(first_line, bytes):
+        first_line = first_line.decode('utf-8', errors='replace')
+    return max((',', '\t', ';'), key=first_line.count)
+
+
+def _csv_chunks(buffer, pick: Callable[[List], Dict], chunk_rows: int, typed: bool = True) -> Iterator[pd.DataFrame]:
+    """Typed reads let the C parser produce float32/categorical directly; they fail on stray text in a number column."""
+    sep = _sniff_separator(buffer)
+    kinds = pick(list(pd.read_csv(buffer, sep=sep, nrows=0).columns))
+    buffer.seek(0)
+    dtype = {header: np.float32 if kind == 'float' else 'category' for header, kind in kinds.items()} if typed else str
+    yield from pd.read_csv(buffer, sep=sep, usecols=list(kinds), dtype=dtype, na_values=NA_VALUES,
+                           keep_default_na=False, skipinitialspace=True, chunksize=chunk_rows)
+
+
+def _excel_chunks(buffer, pick: Callable[[List], Dict], chunk_rows: int) -> Iterator[pd.DataFrame]:
+    try:
+        import openpyxl
+    except ImportError as exc:
+        raise ValueError("Reading Excel files needs the openpyxl package") from exc
+    workbook = openpyxl.load_workbook(buffer, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        headers = list(next(rows, ()))
+        used = list(pick(headers))
+        indices = [headers.index(header) for header in used]
+        batch = []
+        for row in rows:
+            batch.append([row[i] if i < len(row) else None for i in indices])
+            if len(batch) == chunk_rows:
+                yield pd.DataFrame(batch, columns=used)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=used)
+    finally:
+        workbook.close()
+
+
+def _parquet_chunks(buffer, pick: Callable[[List], Dict], chunk_rows: int) -> Iterator[pd.DataFrame]:
+    import pyarrow.parquet as pq
+    parquet = pq.ParquetFile(buffer)
+    for batch in parquet.iter_batches(batch_size=chunk_rows, columns=list(pick(parquet.schema_arrow.names))):
+        yield batch.to_pandas()
+
+
+_READERS = {
+    'csv': _csv_chunks,
+    'txt': _csv_chunks,
+    'tsv': _csv_chunks,
+    'xlsx': _excel_chunks,
+    'xlsm': _excel_chunks,
+    'parquet': _parquet_chunks,
+}
+
+
+def _compact(chunk: pd.DataFrame, mapping: Dict[str, str], schema: DatasetSchema) -> pd.DataFrame:
+    kinds = {column.name: column.kind for column in schema.columns}
+    chunk = chunk[list(mapping)].rename(columns=mapping)
+    out = {}
+    for name in chunk.columns:
+        values = chunk[name]
+        if kinds[name] == 'float':
+            out[name] = pd.to_numeric(values, errors='coerce').astype(np.float32)
+        else:
+            if not (pd.api.types.is_string_dtype(values) or isinstance(values.dtype, pd.CategoricalDtype)):
+                values = values.where(values.isna(), values.astype(str))
+            out[name] = values.astype('category')
+    return pd.DataFrame(out)
+
+
+def _reader(filename: str) -> Callable:
+    extension = os.path.splitext(filename or '')[1].lower().lstrip('.')
+    if extension not in _READERS:
+        raise ValueError(f"Unsupported file type: {filename}")
+    return _READERS[extension]
+
+
+def read_dataset(source, kind: str, filename: str = None, chunk_rows: int = CHUNK_ROWS) -> pd.DataFrame:
+    """Parse a dataset of the given kind from a path, bytes or binary file object."""
+    schema = SCHEMAS[kind]
+    if isinstance(source, (str, os.PathLike)):
+        filename = filename or os.fspath(source)
+        with open(source, 'rb') as f:
+            return read_dataset(f, kind, filename, chunk_rows)
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    source.seek(0)
+
+    reader = _reader(filename)
+    kinds = {column.name: column.kind for column in schema.columns}
+    mapping = {}
+
+    def pick(headers: List) -> Dict[str, str]:
+        mapping.update(resolve_columns(headers, schema))
+        return {header: kinds[name] for header, name in mapping.items()}
+
+    try:
+        parts = [_compact(chunk, mapping, schema) for chunk in reader(source, pick, chunk_rows)]
+    except ValueError:
+        if reader is not _csv_chunks or not mapping:
+            raise
+        # Text other than NA_VALUES in a number column; parse as text and coerce it to NaN
+        source.seek(0)
+        parts = [_compact(chunk, mapping, schema) for chunk in _csv_chunks(source, pick, chunk_rows, typed=False)]
+    if not parts:
+        return _compact(pd.DataFrame(columns=list(mapping)), mapping, schema)
+    out = {}
+    for name in parts[0].columns:
+        if isinstance(parts[0][name].dtype, pd.CategoricalDtype):
+            out[name] = union_categoricals([part[name] for part in parts])
+        else:
+            out[name] = np.concatenate([part[name].to_numpy() for part in parts])
+    return pd.DataFrame(out)
+
+
+def _matrix_chunk(chunk: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    genes = chunk.iloc[:, 0]
+    named = genes.notna().to_numpy()
+    values = chunk.iloc[named, 1:].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float32)
+    return genes[named].astype(str).to_numpy(), values
+
+
+def read_matrix(source, filename: str = None, chunk_rows: int = CHUNK_ROWS) -> pd.DataFrame:
+    """Parse a genes × samples matrix: gene IDs in the first column, one numeric column per sample.
+
+    Text columns other than the gene IDs are dropped.  A gene-length column (see ``LENGTH_HEADERS``)
+    is moved to ``attrs['length']``.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        filename = filename or os.fspath(source)
+        with open(source, 'rb') as f:
+            return read_matrix(f, filename, chunk_rows)
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    source.seek(0)
+
+    reader = _reader(filename)
+    headers = []
+
+    def pick(found: List) -> Dict[str, str]:
+        if len(found) < 2:
+            raise ValueError("An expression matrix needs a gene column and at least one sample column")
+        headers[:] = found
+        return {header: 'category' if i == 0 else 'float' for i, header in enumerate(found)}
+
+    try:
+        parts = [_matrix_chunk(chunk) for chunk in reader(source, pick, chunk_rows)]
+    except ValueError:
+        if reader is not _csv_chunks or not headers:
+            raise
+        # Text columns (gene symbols, descriptions) next to the counts
+        source.seek(0)
+        parts = [_matrix_chunk(chunk) for chunk in _csv_chunks(source, pick, chunk_rows, typed=False)]
+    samples = [str(header) for header in headers[1:]]
+    if parts:
+        matrix = pd.DataFrame(np.concatenate([values for _, values in parts]), columns=samples,
+                              index=pd.Index(np.concatenate([genes for genes, _ in parts]), name='gene'))
+    else:
+        matrix = pd.DataFrame(columns=samples, dtype=np.float32)
+    matrix = matrix.loc[:, matrix.notna().any()] if len(matrix) else matrix
+    lengths = [column for column in matrix.columns if _normalize(column) in LENGTH_HEADERS]
+    attrs = {'length': matrix.pop(lengths[0]).to_numpy()} if lengths else {}
+    if matrix.shape[1] == 0:
+        raise ValueError("The expression matrix has no numeric sample columns")
+    matrix.attrs.update(attrs)
+    return matrix
+
+
+def upload_digest(uploaded) -> str:
+    """SHA-256 of an uploaded file, computed once per upload and session."""
+    digests = st.session_state.setdefault('_upload_digests', {})
+    if uploaded.file_id not in digests:
+        digests[uploaded.file_id] = hashlib.sha256(uploaded.getbuffer()).hexdigest()
+    return digests[uploaded.file_id]
+
+
+@st.cache_resource(max_entries=32, show_spinner="Parsing dataset...")
+def _parse_cached(digest: str, kind: str, filename: str, _source) -> pd.DataFrame:
+    frame = read_dataset(_source, kind, filename)
+    # Lets analyses of the frame be cached by file content too
+    frame.attrs['sha256'] = digest
+    return frame
+
+
+def load_uploaded_dataset(uploaded, kind: str) -> pd.DataFrame:
+    """Parsed frame for an ``st.file_uploader`` file, shared across sessions by file content."""
+    return _parse_cached(upload_digest(uploaded), kind, uploaded.name, uploaded)
+
+
+@st.cache_resource(max_entries=8, show_spinner="Parsing expression matrix...")
+def _parse_matrix_cached(digest: str, filename: str, _source) -> pd.DataFrame:
+    matrix = read_matrix(_source, filename)
+    matrix.attrs['sha256'] = digest
+    return matrix
+
+
+def load_uploaded_matrix(uploaded) -> pd.DataFrame:
+    """Parsed expression matrix for an ``st.file_uploader`` file, shared across sessions by file content."""
+    return _parse_matrix_cached(upload_digest(uploaded), uploaded.name, uploaded)
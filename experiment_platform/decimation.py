@@ -0,0 +1,75 @@
+"""Point reduction for line traces too long to send to the browser.
+
+``minmax_indices`` keeps the lowest and highest point of equal-sized
+buckets (one vectorized pass, keeps every peak).  ``lttb_indices`` is
+Largest-Triangle-Three-Buckets: from each bucket it keeps the point that
+spans the largest triangle with the point kept before it and the average of
+the next bucket, which follows the shape of the line closely.
+``decimate_indices`` combines them: very long traces are first cut down with
+min-max, then LTTB picks the final points.
+"""
+import numpy as np
+
+# Traces longer than this multiple of the target get a min-max pass before LTTB
+LTTB_PREFILTER = 8
+
+
+def _as_float(values) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype.kind == 'M':
+        values = values.view(np.int64)
+    return np.nan_to_num(values.astype(np.float64))
+
+
+def minmax_indices(y, n_out: int) -> np.ndarray:
+    """Sorted indices of about n_out points: first, last and the extremes of n_out // 2 buckets."""
+    y = _as_float(y)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    buckets = max(1, n_out // 2 - 1)
+    size = (n - 2) // buckets
+    body = y[1:1 + size * buckets].reshape(buckets, size)
+    offsets = 1 + np.arange(buckets) * size
+    picked = [[0, n - 1], offsets + body.argmin(axis=1), offsets + body.argmax(axis=1)]
+    tail = np.arange(1 + size * buckets, n - 1)
+    if len(tail):
+        picked.append(tail[[y[tail].argmin(), y[tail].argmax()]])
+    return np.unique(np.concatenate(picked))
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """Sorted indices of n_out points chosen by Largest-Triangle-Three-Buckets."""
+    x, y = _as_float(x), _as_float(y)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Average of every bucket, for the third corner of the triangles
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    avg_x = np.append(avg_x, x[-1])
+    avg_y = np.append(avg_y, y[-1])
+
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Twice the triangle area, up to sign
+        area = np.abs((x[a] - avg_x[i + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i + 1] - y[a]))
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+
+def decimate_indices(x, y, n_out: int) -> np.ndarray:
+    """Indices of at most about n_out points that keep the shape of the line y(x); x must be sorted."""
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n > LTTB_PREFILTER * n_out:
+        coarse = minmax_indices(y, LTTB_PREFILTER * n_out)
+        return coarse[lttb_indices(np.asarray(x)[coarse], np.asarray(y)[coarse], n_out)]
+    return lttb_indices(x, y, n_out)
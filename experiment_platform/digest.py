@@ -0,0 +1,316 @@
+"""Restriction digests of plasmid sequences: sites of a whole enzyme catalog, fragments and diagnostic digests.
+
+``find_sites`` finds every site of every enzyme in one pass over the
+sequence:
+
+* index: each site, and for a non-palindromic site its reverse complement
+  too, is expanded into the concrete sequences its IUPAC letters allow,
+  except that ``N`` positions are left out of the code rather than
+  expanded (an ``N`` run would otherwise multiply the patterns by four per
+  base).  Patterns with the same length and the same ``N`` positions share
+  one sorted array of 2-bit codes;
+* scan: the sequence, extended by its first bases when it is circular so
+  that sites across the origin are found, is coded once; for each group
+  the codes of all windows are computed at once and looked up in its
+  sorted array in one vectorized search, so the cost grows with the
+  number of groups (a few dozen for the whole catalog), not of enzymes.
+
+A site's cuts follow from its position and strand; ``digest`` turns the cuts
+of any set of enzymes into fragments, for a circle or a linear molecule.
+``plan_digests`` tries the single and double digests of the enzymes that cut
+a construct a few times and ranks those whose bands are all resolved on a
+1 kb-ladder gel, well apart, and different from the parent vector's.
+"""
+import dataclasses
+import functools
+import itertools
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from experiment_platform.assembly import reverse_complement
+from experiment_platform.enzymes import ENZYMES
+from experiment_platform.gel import LADDER_1KB
+from experiment_platform.plasmid import Plasmid
+
+IUPAC = {'A': 'A', 'C': 'C', 'G': 'G', 'T': 'T', 'R': 'AG', 'Y': 'CT', 'S': 'CG', 'W': 'AT', 'K': 'GT',
+         'M': 'AC', 'B': 'CGT', 'D': 'AGT', 'H': 'ACT', 'V': 'ACG', 'N': 'ACGT'}
+_NOTATION = re.compile(r'^([ACGTRYSWKMBDHVN^]+)(?:\((-?\d+)/(-?\d+)\))?$')
+_CODES = np.full(256, -1, dtype=np.int64)
+for _code, _base in enumerate('ACGT'):
+    _CODES[ord(_base)] = _CODES[ord(_base.lower())] = _code
+
+SITE_COLUMNS = ['enzyme', 'position', 'strand', 'cut', 'bottom_cut']
+FRAGMENT_COLUMNS = ['start', 'end', 'size', 'left', 'right']
+
+DENSE_LENGTH = 8  # sites this long or shorter are looked up in a table of all 4 ** length codes
+
+MIN_SITE = 6  # diagnostic digests use enzymes with sites this long or longer; shorter ones cut too often
+MAX_CUTS = 3  # per enzyme, for a diagnostic digest
+MAX_BANDS = 6
+RESOLVED = (min(LADDER_1KB), max(LADDER_1KB))  # bp; smaller fragments run off, larger ones do not separate
+MIN_SEPARATION = 0.05  # log10 of the size ratio of neighbouring bands, about 12%
+DIGEST_NG = 500.0  # DNA loaded per lane
+
+
+@dataclasses.dataclass(frozen=True)
+class Enzyme:
+    name: str
+    site: str  # IUPAC, 5' to 3' on the top strand
+    top: int  # top-strand cut, in bases from the start of the site (past its end for type IIS)
+    bottom: int  # bottom-strand cut, in the same top-strand coordinates
+
+    @property
+    def palindromic(self) -> bool:
+        return reverse_complement(self.site) == self.site
+
+    @property
+    def overhang(self) -> str:
+        width = self.bottom - self.top
+        return 'blunt' if width == 0 else f"{abs(width)} nt {5 if width > 0 else 3}'"
+
+
+def parse_site(name: str, notation: str) -> Enzyme:
+    """Enzyme from its catalog notation, ``G^AATTC`` or ``GGTCTC(1/5)``."""
+    match = _NOTATION.match(notation.upper())
+    if match is None or match.group(1).count('^') + bool(match.group(2)) != 1:
+        raise ValueError(f"{name}: cannot read the site {notation!r}")
+    site = match.group(1).replace('^', '')
+    if match.group(2):
+        return Enzyme(name, site, len(site) + int(match.group(2)), len(site) + int(match.group(3)))
+    top = match.group(1).index('^')
+    return Enzyme(name, site, top, len(site) - top)
+
+
+@functools.lru_cache(maxsize=1)
+def catalog() -> Dict[str, Enzyme]:
+    return {name: parse_site(name, notation) for name, notation in ENZYMES.items()}
+
+
+@dataclasses.dataclass
+class SiteIndex:
+    enzymes: List[Enzyme]
+    longest: int
+    # (length, positions coded (not N), weights, sorted codes, enzyme index, strand, lookup) per group
+    groups: List[Tuple[int, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]]
+
+
+def build_index(enzymes: Sequence[Enzyme]) -> SiteIndex:
+    patterns: Dict[Tuple[int, Tuple[bool, ...]], List[Tuple[int, int, int]]] = {}
+    for index, enzyme in enumerate(enzymes):
+        strands = [(enzyme.site, 1)] if enzyme.palindromic else [(enzyme.site, 1), (reverse_complement(enzyme.site), -1)]
+        for site, strand in strands:
+            coded = tuple(base != 'N' for base in site)
+            weights = np.where(coded, 4 ** np.arange(len(site) - 1, -1, -1, dtype=np.int64), 0)
+            choices = [IUPAC[base] if base != 'N' else 'A' for base in site]
+            group = patterns.setdefault((len(site), coded), [])
+            for bases in itertools.product(*choices):
+                group.append((int(_CODES[np.frombuffer(''.join(bases).encode(), dtype=np.uint8)] @ weights),
+                              index, strand))
+    groups = []
+    for (length, coded), rows in patterns.items():
+        rows = np.array(sorted(rows), dtype=np.int64)
+        coded = np.array(coded)
+        weights = np.where(coded, 4 ** np.arange(length - 1, -1, -1, dtype=np.int64), 0)
+        lookup = None
+        if length <= DENSE_LENGTH:
+            # First row of every code, -1 for none; the extra last slot is where the key -1 (unknown base) lands
+            lookup = np.full(4 ** length + 1, -1, dtype=np.int64)
+            lookup[rows[::-1, 0]] = np.arange(len(rows) - 1, -1, -1)
+        groups.append((length, coded, weights, rows[:, 0], rows[:, 1], rows[:, 2], lookup))
+    return SiteIndex(list(enzymes), max((len(e.site) for e in enzymes), default=1), groups)
+
+
+@functools.lru_cache(maxsize=1)
+def catalog_index() -> SiteIndex:
+    return build_index(list(catalog().values()))
+
+
+def _enzymes(names: Optional[Sequence[str]]) -> List[Enzyme]:
+    enzymes = catalog()
+    unknown = [name for name in names or () if name not in enzymes]
+    if unknown:
+        raise ValueError(f"not in the enzyme catalog: {', '.join(unknown)}")
+    return list(enzymes.values()) if names is None else [enzymes[name] for name in names]
+
+
+def find_sites(sequence: str, enzymes: Optional[Sequence[str]] = None, circular: bool = True) -> pd.DataFrame:
+    """Every site of ``enzymes`` (the whole catalog by default), one row per cut, sorted by enzyme and cut.
+
+    ``position`` is the 0-based start of the site on the top strand and ``strand`` is -1 where the site reads
+    on the bottom strand; ``cut`` and ``bottom_cut`` are the positions the two strands are cut before, taken
+    round the circle for a circular sequence and dropped if off the end of a linear one.  A base other than
+    A, C, G or T matches only a site's ``N``.
+    """
+    index = catalog_index() if enzymes is None else build_index(_enzymes(enzymes))
+    length = len(sequence)
+    bases = _CODES[np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)]
+    if circular and length:
+        bases = np.concatenate([bases, np.resize(bases, index.longest - 1)])
+    values, unknown = np.maximum(bases, 0), bases < 0
+    found = [(np.zeros(0, dtype=np.int64),) * 4]
+    for size, coded, weights, codes, owners, strands, lookup in index.groups:
+        if len(bases) < size:
+            continue
+        windows = length if circular else len(bases) - size + 1
+        # One shifted slice per coded base: much faster than a product with a strided window view
+        keys = np.zeros(windows, dtype=np.int64)
+        for offset in np.flatnonzero(coded):
+            keys += values[offset:offset + windows] * weights[offset]
+        if unknown.any():
+            missing = np.zeros(windows, dtype=bool)
+            for offset in np.flatnonzero(coded):
+                missing |= unknown[offset:offset + windows]
+            keys[missing] = -1
+        if lookup is not None:
+            first = lookup[keys]
+            hits = np.flatnonzero(first >= 0)
+        else:
+            first = np.minimum(np.searchsorted(codes, keys), len(codes) - 1)
+            hits = np.flatnonzero(codes[first] == keys)
+        # A code can belong to several enzymes (neoschizomers): take the whole run of equal codes
+        first = first[hits]
+        count = np.searchsorted(codes, keys[hits], 'right') - first
+        rows = np.repeat(first, count) + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        found.append((np.repeat(hits, count), owners[rows], strands[rows], np.full(len(rows), size)))
+    positions, owners, strands, sizes = (np.concatenate(column) for column in zip(*found))
+    top = np.array([e.top for e in index.enzymes], dtype=np.int64)[owners]
+    bottom = np.array([e.bottom for e in index.enzymes], dtype=np.int64)[owners]
+    forward = strands > 0
+    cut = positions + np.where(forward, top, sizes - bottom)
+    bottom_cut = positions + np.where(forward, bottom, sizes - top)
+    if circular:
+        cut, bottom_cut = cut % max(length, 1), bottom_cut % max(length, 1)
+    else:
+        inside = (cut > 0) & (cut < length) & (bottom_cut > 0) & (bottom_cut < length)
+        positions, owners, strands, cut, bottom_cut = (a[inside] for a in (positions, owners, strands, cut,
+                                                                           bottom_cut))
+    names = np.array([e.name for e in index.enzymes], dtype=object)
+    table = pd.DataFrame({'enzyme': names[owners], 'position': positions, 'strand': strands, 'cut': cut,
+                          'bottom_cut': bottom_cut}, columns=SITE_COLUMNS)
+    return table.drop_duplicates(['enzyme', 'cut']).sort_values(['enzyme', 'cut'], ignore_index=True)
+
+
+def cut_counts(sites: pd.DataFrame) -> pd.Series:
+    """Cuts per enzyme, for every enzyme of the catalog (0 for enzymes that do not cut)."""
+    return sites['enzyme'].value_counts().reindex(list(catalog()), fill_value=0)
+
+
+@dataclasses.dataclass
+class Digest:
+    name: str
+    enzymes: Tuple[str, ...]
+    length: int
+    circular: bool
+    fragments: pd.DataFrame  # FRAGMENT_COLUMNS, largest first; ``left``/``right`` name the enzymes cutting there
+
+    @property
+    def sizes(self) -> List[int]:
+        return self.fragments['size'].tolist()
+
+    @property
+    def label(self) -> str:
+        return ' + '.join(self.enzymes) or 'uncut'
+
+    def lane(self, ng: float = DIGEST_NG) -> List[Tuple[int, float]]:
+        """(size, ng) bands for ``gel.synthetic_gel``, the DNA shared by length."""
+        return [(size, ng * size / self.length) for size in self.sizes]
+
+
+def fragment_sizes(cuts: Sequence[int], length: int, circular: bool) -> List[int]:
+    """Fragment sizes, largest first, of a molecule cut before each position of ``cuts``."""
+    cuts = sorted(set(cuts))
+    if not cuts:
+        return [length]
+    if circular:
+        sizes = [b - a for a, b in zip(cuts, cuts[1:])] + [length - cuts[-1] + cuts[0]]
+    else:
+        bounds = [0] + cuts + [length]
+        sizes = [b - a for a, b in zip(bounds, bounds[1:])]
+    return sorted(sizes, reverse=True)
+
+
+def digest(plasmid: Plasmid, enzymes: Sequence[str], sites: Optional[pd.DataFrame] = None) -> Digest:
+    """Fragments of ``plasmid`` cut by all of ``enzymes``; ``sites`` from ``find_sites`` saves a rescan."""
+    if not plasmid.sequence:
+        raise ValueError(f"{plasmid.name} has no sequence to digest")
+    enzymes = tuple(enzymes)
+    if sites is None:
+        sites = find_sites(plasmid.sequence, enzymes, plasmid.circular)
+    else:
+        _enzymes(enzymes)
+    cuts = sites[sites['enzyme'].isin(enzymes)].groupby('cut')['enzyme'].agg('/'.join)
+    length = plasmid.length
+    if cuts.empty:
+        rows = [(0, length, length, '', '')]
+    elif plasmid.circular:
+        starts = cuts.index.to_numpy()
+        ends = np.roll(starts, -1)
+        ends[-1] += length
+        rows = list(zip(starts, ends % length, ends - starts, cuts.to_numpy(), np.roll(cuts.to_numpy(), -1)))
+    else:
+        bounds = np.concatenate([[0], cuts.index.to_numpy(), [length]])
+        names = [''] + cuts.tolist() + ['']
+        rows = list(zip(bounds[:-1], bounds[1:], np.diff(bounds), names[:-1], names[1:]))
+    fragments = pd.DataFrame(rows, columns=FRAGMENT_COLUMNS).sort_values('size', ascending=False,
+                                                                        ignore_index=True)
+    return Digest(plasmid.name, enzymes, length, plasmid.circular, fragments)
+
+
+def separation(sizes: Sequence[int]) -> float:
+    """Smallest log10 ratio between neighbouring band sizes; inf for one band."""
+    logs = np.log10(sorted(sizes))
+    return float(np.diff(logs).min()) if len(logs) > 1 else np.inf
+
+
+def _distinct(sizes: Sequence[int], others: Sequence[int]) -> bool:
+    if len(sizes) != len(others):
+        return True
+    return bool(np.any(np.abs(np.log10(sorted(sizes)) - np.log10(sorted(others))) >= MIN_SEPARATION))
+
+
+def plan_digests(plasmid: Plasmid, parent: Optional[Plasmid] = None, max_enzymes: int = 2,
+                 limit: int = 10) -> pd.DataFrame:
+    """Single and combined digests that check ``plasmid`` on a gel, best first.
+
+    A digest qualifies if it gives 2 to ``MAX_BANDS`` bands, all within the 1 kb ladder and
+    ``MIN_SEPARATION`` apart; those that also tell the construct from ``parent`` (the empty vector) come
+    first, then those with fewer enzymes, then those whose smallest band is largest (and so brightest).
+    """
+    sites = find_sites(plasmid.sequence, circular=plasmid.circular)
+    parent_sites = find_sites(parent.sequence, circular=parent.circular) if parent is not None else None
+    counts = cut_counts(sites)
+    enzymes = catalog()
+    candidates = [name for name, count in counts.items()
+                  if 0 < count <= MAX_CUTS and len(enzymes[name].site) >= MIN_SITE]
+    cuts = {name: group.tolist() for name, group in sites.groupby('enzyme')['cut']}
+    parent_cuts = ({name: group.tolist() for name, group in parent_sites.groupby('enzyme')['cut']}
+                   if parent is not None else {})
+    rows = []
+    for number in range(1, max_enzymes + 1):
+        for combination in itertools.combinations(candidates, number):
+            sizes = fragment_sizes([c for name in combination for c in cuts[name]], plasmid.length,
+                                   plasmid.circular)
+            if not 2 <= len(sizes) <= MAX_BANDS or sizes[0] > RESOLVED[1] or sizes[-1] < RESOLVED[0]:
+                continue
+            spread = separation(sizes)
+            if spread < MIN_SEPARATION:
+                continue
+            row = {'enzymes': ' + '.join(combination), 'bands': len(sizes),
+                   'sizes (bp)': ' / '.join(f"{size:,}" for size in sizes),
+                   'separation': round(spread, 3), '_enzymes': number, '_smallest': sizes[-1]}
+            if parent is not None:
+                vector = fragment_sizes([c for name in combination for c in parent_cuts.get(name, [])],
+                                        parent.length, parent.circular)
+                row[f"{parent.name} (bp)"] = ' / '.join(f"{size:,}" for size in vector)
+                row['distinguishes'] = _distinct(sizes, vector)
+            rows.append(row)
+    table = pd.DataFrame(rows)
+    if table.empty:
+        return table
+    order = (['distinguishes'] if parent is not None else []) + ['_enzymes', '_smallest']
+    ascending = ([False] if parent is not None else []) + [True, False]
+    return (table.sort_values(order, ascending=ascending, kind='stable').drop(columns=['_enzymes', '_smallest'])
+            .head(limit).reset_index(drop=True))
@@ -0,0 +1,309 @@
+"""Four-parameter logistic (4PL) dose-response fits with bootstrap confidence intervals.
+
+    viability = bottom + (top - bottom) / (1 + (concentration / IC50) ** hill)
+
+``fit_curves`` fits every curve of a plate-reader table (the
+``plate_reader`` dataset: one row per well) together: the curves are padded
+into one curves × points array and fitted by Levenberg-Marquardt, each step
+a batched 4×4 solve.  A bootstrap resample is a fit of the same points with
+multinomial weights, so the resamples of all curves are one more batch.
+Resampling n wells spreads the refits by about sqrt((n - 4) / n) less than
+the fit's sampling error (four parameters are fitted to them), so the
+resamples' deviations from the fit are widened by the inverse.
+Large batches are cut into chunks of ``CHUNK_CURVES`` curves that run in the
+process pool.
+"""
+import dataclasses
+import math
+import time
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from experiment_platform.parallel import process_pool, worth_parallel
+
+PARAMETERS = ('bottom', 'top', 'log_ic50', 'hill')
+BOOTSTRAP_RESAMPLES = 200
+ITERATIONS = 40
+BOOTSTRAP_ITERATIONS = 15  # resamples start from the curve's own fit
+HILL_RANGE = (0.05, 10.0)
+# A fit is done when a step changes its residual sum of squares by less than this fraction, either way: a
+# step rejected for rounding errors near the minimum ends the fit rather than raising the damping until it stops
+SETTLED = 1e-6
+# Resamples are fitted in float32, whose sums of squares are good to about this fraction
+SETTLED_FLOAT32 = 1e-5
+
+# Curves per job; with their resamples about 20k fits, a few tens of MB of Jacobians
+CHUNK_CURVES = 100
+# Below this many fits (curves × (resamples + 1)) a table is fitted in this process
+PARALLEL_MIN_FITS = 100_000
+
+# log10 dose standing in for the no-drug control: far enough below any IC50 that the response is the top
+NO_DOSE = -1e4
+
+_LN10 = math.log(10)
+
+
+def _log_dose(concentration: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(concentration > 0, np.log10(concentration), NO_DOSE)
+
+
+def logistic(log_dose: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """4PL response at log10 doses (``NO_DOSE`` for no drug); params (..., 4) as in ``PARAMETERS``.
+
+    The result has the parameters' leading axes followed by the doses' axes.
+    """
+    params = np.moveaxis(np.asarray(params, dtype=np.float64), -1, 0)
+    return _logistic(log_dose, params.reshape(params.shape + (1,) * np.ndim(log_dose)))[0]
+
+
+def _logistic(log_dose: np.ndarray, params, derivatives: bool = False):
+    """Response and, if asked, its derivatives by each parameter; params are indexed on their first axis."""
+    bottom, top, log_ic50, hill = params
+    offset = log_dose - log_ic50
+    power = np.exp(np.clip(hill * offset * _LN10, -80, 80))  # within float32 range
+    g = 1 / (1 + power)
+    span = top - bottom
+    response = bottom + span * g
+    if not derivatives:
+        return response, None
+    shared = span * g * g * power * _LN10
+    return response, (1 - g, g, shared * hill, -shared * offset)
+
+
+def _initial(log_dose: np.ndarray, response: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    low = np.where(valid, response, np.inf).min(axis=1)
+    high = np.where(valid, response, -np.inf).max(axis=1)
+    # IC50 starts at the dose whose response is closest to halfway
+    distance = np.where(valid & (log_dose > NO_DOSE), np.abs(response - (low + high)[:, None] / 2), np.inf)
+    middle = log_dose[np.arange(len(log_dose)), distance.argmin(axis=1)]
+    return np.column_stack([low, high, np.where(middle > NO_DOSE, middle, 0.0), np.ones(len(low))])
+
+
+def _solve(normal: np.ndarray, gradient: np.ndarray) -> np.ndarray:
+    """Solutions of many symmetric positive-definite systems (n × n × systems) by Cholesky.
+
+    Vectorized across systems; for 4×4 systems several times faster than ``np.linalg.solve``.
+    """
+    n = len(normal)
+    lower = np.zeros_like(normal)
+    for j in range(n):
+        lower[j, j] = np.sqrt(np.maximum(normal[j, j] - (lower[j, :j] ** 2).sum(axis=0), np.finfo(normal.dtype).tiny))
+        for i in range(j + 1, n):
+            lower[i, j] = (normal[i, j] - (lower[i, :j] * lower[j, :j]).sum(axis=0)) / lower[j, j]
+    forward = np.empty_like(gradient)
+    for i in range(n):
+        forward[i] = (gradient[i] - (lower[i, :i] * forward[:i]).sum(axis=0)) / lower[i, i]
+    solution = np.empty_like(gradient)
+    for i in reversed(range(n)):
+        solution[i] = (forward[i] - (lower[i + 1:, i] * solution[i + 1:]).sum(axis=0)) / lower[i, i]
+    return solution
+
+
+def _levenberg_marquardt(log_dose, response, weights, params, bounds, iterations=ITERATIONS):
+    """Weighted least-squares fits of many curves at once.
+
+    Arrays are points × fits and params 4 × fits, so every sum over points adds contiguous rows.
+    A fit leaves the batch once a step no longer lowers its residual sum of squares noticeably.
+    """
+    params = params.astype(response.dtype)
+    tolerance = SETTLED if response.dtype == np.float64 else SETTLED_FLOAT32
+    sse = (weights * (response - _logistic(log_dose, params)[0]) ** 2).sum(axis=0)
+    damping = np.full(params.shape[1], 1e-2, dtype=response.dtype)
+    active = np.arange(params.shape[1])
+    identity = np.eye(4, dtype=response.dtype)[..., None]
+    # Wild trial steps can overflow; they are rejected like any step that does not lower the residuals
+    with np.errstate(over='ignore', invalid='ignore'):
+        for _ in range(iterations):
+            if not len(active):
+                break
+            dose, y, w, current = log_dose[:, active], response[:, active], weights[:, active], params[:, active]
+            fitted, derivatives = _logistic(dose, current, derivatives=True)
+            residual = y - fitted
+            weighted = [w * d for d in derivatives]
+            normal = np.empty((4, 4, len(active)), dtype=response.dtype)
+            for i in range(4):
+                for j in range(i, 4):
+                    normal[i, j] = normal[j, i] = (weighted[i] * derivatives[j]).sum(axis=0)
+            gradient = np.stack([(d * residual).sum(axis=0) for d in weighted])
+            normal += identity * (damping[active] * normal[range(4), range(4)] + 1e-9)
+            trial = current + _solve(normal, gradient)
+            trial[2] = np.clip(trial[2], bounds[0, active], bounds[1, active])
+            trial[3] = np.clip(trial[3], *HILL_RANGE)
+            trial_sse = (w * (y - _logistic(dose, trial)[0]) ** 2).sum(axis=0)
+
+            before = sse[active]
+            better = trial_sse < before
+            params[:, active[better]], sse[active[better]] = trial[:, better], trial_sse[better]
+            damping[active] = np.where(better, damping[active] / 3, damping[active] * 4)
+            settled = (np.abs(before - trial_sse) <= tolerance * before) | (damping[active] > 1e8)
+            active = active[~settled]
+    return params, sse
+
+
+def _fit_chunk(args) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fits, residual sums of squares and bootstrap fits of one chunk of curves.
+
+    Wells are fitted as one point per dose (the mean of its wells, weighted by their number), which
+    has the same least-squares solution as fitting the wells one by one.
+    """
+    dose, well_dose, well_response, resamples, seed = args
+    wells = well_dose >= 0
+    by_dose = (well_dose[..., None] == np.arange(dose.shape[1])).astype(np.float64)  # curves × wells × doses
+    weights = by_dose.sum(axis=1)
+    means = (well_response[:, None, :] @ by_dose)[:, 0] / np.maximum(weights, 1)
+    # log10 IC50 may move up to 3 decades beyond the tested doses
+    tested = np.where((weights > 0) & (dose > NO_DOSE), dose, np.nan)
+    bounds = np.column_stack([np.nanmin(tested, axis=1) - 3, np.nanmax(tested, axis=1) + 3])
+    params, _ = _levenberg_marquardt(dose.T, means.T, weights.T, _initial(dose, means, weights > 0).T, bounds.T)
+    well_log_dose = np.take_along_axis(dose, np.maximum(well_dose, 0), axis=1)
+    sse = (wells * (well_response - _logistic(well_log_dose.T, params)[0].T) ** 2).sum(axis=1)
+    params = params.T
+
+    bootstrap = np.empty((len(params), resamples, 4), dtype=np.float32)
+    if resamples:
+        rng = np.random.default_rng(seed)
+        points = wells.sum(axis=1)
+        # Each resample draws as many wells as its curve has (the curve's wells come first), and the draws
+        # are summed into its dose slots
+        picks = np.minimum(rng.random((len(params), resamples, wells.shape[1])) * points[:, None, None],
+                           points[:, None, None] - 1).astype(np.intp)
+        drawn = np.broadcast_to(wells[:, None, :], picks.shape).ravel()
+        slots = (np.arange(len(params) * resamples).reshape(len(params), resamples, 1) * dose.shape[1]
+                 + np.take_along_axis(well_dose[:, None, :], picks, axis=2)).ravel()[drawn]
+        responses = np.take_along_axis(well_response[:, None, :], picks, axis=2).ravel()[drawn]
+        size = len(params) * resamples * dose.shape[1]
+        # Resamples are fitted in float32: half the memory traffic, ample precision for percentiles
+        resampled_weights = np.bincount(slots, minlength=size).astype(np.float32)
+        resampled_sums = np.bincount(slots, responses, minlength=size).astype(np.float32)
+        resampled_means = resampled_sums / np.maximum(resampled_weights, 1)
+        refits, _ = _levenberg_marquardt(
+            np.repeat(dose.astype(np.float32), resamples, axis=0).T, resampled_means.reshape(-1, dose.shape[1]).T,
+            resampled_weights.reshape(-1, dose.shape[1]).T, np.repeat(params, resamples, axis=0).T,
+            np.repeat(bounds, resamples, axis=0).T.astype(np.float32), BOOTSTRAP_ITERATIONS)
+        widen = np.sqrt(points / np.maximum(points - 4, 1))[:, None, None]
+        bootstrap[:] = params[:, None] + widen * (refits.T.reshape(len(params), resamples, 4) - params[:, None])
+        bootstrap[..., 2] = np.clip(bootstrap[..., 2], bounds[:, :1], bounds[:, 1:])
+        bootstrap[..., 3] = np.clip(bootstrap[..., 3], *HILL_RANGE)
+    return params, sse, bootstrap
+
+
+@dataclasses.dataclass
+class DoseResponseFits:
+    """One fitted curve per row of ``curves``; shared by sessions, so read-only."""
+    curves: pd.DataFrame
+    params: np.ndarray  # curves × 4, as in PARAMETERS
+    bootstrap: np.ndarray  # curves × resamples × 4
+    seconds: float = 0.0
+
+    def predict(self, curve: int, concentration) -> np.ndarray:
+        return logistic(_log_dose(np.asarray(concentration, dtype=np.float64)), self.params[curve])
+
+    def band(self, curve: int, concentration, level: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+        """Pointwise bootstrap confidence band of the fitted curve."""
+        log_dose = _log_dose(np.asarray(concentration, dtype=np.float64))
+        resampled = logistic(log_dose, self.bootstrap[curve].astype(np.float64))
+        tail = (1 - level) / 2 * 100
+        return tuple(np.nanpercentile(resampled, [tail, 100 - tail], axis=0))
+
+
+def fit_curves(table: pd.DataFrame, by: Sequence[str] = ('treatment',), resamples: int = BOOTSTRAP_RESAMPLES,
+               level: float = 0.95, seed: int = 0, parallel: bool = None) -> DoseResponseFits:
+    """4PL fit of every curve of a plate-reader table, one curve per combination of the ``by`` columns.
+
+    ``curves`` has the ``by`` columns, bottom, top, ic50, hill, their bootstrap confidence limits
+    (ic50_lower, ic50_upper, hill_lower, hill_upper), r_squared, points, and ic50_determined: whether
+    viability falls with dose and the IC50 lies within the tested doses (a flat or rising curve, or
+    one that never gets halfway down, has no meaningful IC50).
+    Curves with fewer than four valid wells are left unfitted (NaN).
+    """
+    start = time.perf_counter()
+    by = [name for name in by if name in table.columns]
+    groups = table.groupby(by, observed=True, sort=True)
+    curve = groups.ngroup().to_numpy()
+    keys = groups.size().index.to_frame(index=False)
+    named = curve >= 0
+    curve = curve[named]
+    concentration = table['concentration'].to_numpy(dtype=np.float64)[named]
+    viability = table['viability'].to_numpy(dtype=np.float64)[named]
+
+    # Pad into curves × doses and curves × wells (the dose slot of each well, -1 for padding)
+    usable = np.isfinite(viability) & (concentration >= 0)
+    curve, concentration, viability = curve[usable], concentration[usable], viability[usable]
+    order = np.lexsort((concentration, curve))
+    curve, concentration, viability = curve[order], concentration[order], viability[order]
+    first_well = np.r_[True, curve[1:] != curve[:-1]]
+    new_dose = first_well | np.r_[True, concentration[1:] != concentration[:-1]]
+    dose_index = np.cumsum(new_dose) - 1
+    slot = dose_index - np.maximum.accumulate(np.where(first_well, dose_index, 0))
+    points = np.bincount(curve, minlength=len(keys))
+    position = np.arange(len(curve)) - np.repeat(np.cumsum(points) - points, points)
+    doses = np.bincount(curve[new_dose], minlength=len(keys))
+    dose = np.full((len(keys), doses.max(initial=0)), NO_DOSE)
+    dose[curve, slot] = _log_dose(concentration)
+    well_dose = np.full((len(keys), points.max(initial=0)), -1)
+    well_dose[curve, position] = slot
+    well_response = np.zeros(well_dose.shape)
+    well_response[curve, position] = viability
+
+    fittable = np.flatnonzero(points >= 4)
+    chunks = [fittable[i:i + CHUNK_CURVES] for i in range(0, len(fittable), CHUNK_CURVES)]
+    # Chunks are trimmed to their own widest curve
+    jobs = [(dose[c][:, :doses[c].max()], well_dose[c][:, :points[c].max()], well_response[c][:, :points[c].max()],
+             resamples, seed + i) for i, c in enumerate(chunks)]
+    if parallel is None:
+        parallel = worth_parallel(len(jobs)) and len(fittable) * (resamples + 1) >= PARALLEL_MIN_FITS
+    results = list(process_pool().map(_fit_chunk, jobs)) if parallel else [_fit_chunk(job) for job in jobs]
+
+    params = np.full((len(keys), 4), np.nan)
+    sse = np.full(len(keys), np.nan)
+    bootstrap = np.full((len(keys), resamples, 4), np.nan, dtype=np.float32)
+    for rows, (chunk_params, chunk_sse, chunk_bootstrap) in zip(chunks, results):
+        params[rows], sse[rows], bootstrap[rows] = chunk_params, chunk_sse, chunk_bootstrap
+
+    wells = well_dose >= 0
+    mean = well_response.sum(axis=1) / np.maximum(points, 1)
+    total = (np.where(wells, well_response - mean[:, None], 0) ** 2).sum(axis=1)
+    tail = (1 - level) / 2 * 100
+    with np.errstate(invalid='ignore', divide='ignore'):
+        lower, upper = np.percentile(bootstrap, [tail, 100 - tail], axis=1) if resamples else (
+            np.full((2,) + params.shape, np.nan))
+        r_squared = np.where(total > 0, 1 - sse / total, np.nan)
+    tested = dose > NO_DOSE
+    tested_low = np.where(tested, dose, np.inf).min(axis=1)
+    tested_high = np.where(tested, dose, -np.inf).max(axis=1)
+
+    curves = keys.assign(
+        bottom=params[:, 0], top=params[:, 1], ic50=10 ** params[:, 2], hill=params[:, 3],
+        ic50_lower=10 ** lower[:, 2], ic50_upper=10 ** upper[:, 2], hill_lower=lower[:, 3], hill_upper=upper[:, 3],
+        r_squared=r_squared, points=points,
+        ic50_determined=(params[:, 1] > params[:, 0]) & (params[:, 2] >= tested_low) & (params[:, 2] <= tested_high),
+    )
+    return DoseResponseFits(curves, params, bootstrap, time.perf_counter() - start)
+
+
+def curve_labels(curves: pd.DataFrame, by: Sequence[str]) -> List[str]:
+    """Display name of each curve: its key values joined with ' · '."""
+    columns = [name for name in by if name in curves.columns]
+    return [' · '.join(map(str, values)) for values in curves[columns].itertuples(index=False)]
+
+
+def example_viability_table(replicates: int = 3, seed: int = 5) -> pd.DataFrame:
+    """Synthetic viability wells of three drugs and a vehicle control, for the page's example chart."""
+    rng = np.random.default_rng(seed)
+    concentrations = np.array([0, 0.01, 0.03, 0.1, 0.3, 1, 3, 10, 30, 100])  # μM
+    # bottom, top (% viability), IC50 (μM), Hill slope
+    treatments = {
+        'ATRA Standard': (15, 100, 6.0, 0.8),
+        'Engineered Bacteria Product': (17, 100, 7.5, 0.8),
+        'FOLFOX4': (10, 100, 1.5, 0.7),
+        'Control': (90, 100, 1e4, 1.0),
+    }
+    frames = []
+    for treatment, (bottom, top, ic50, hill) in treatments.items():
+        dose = np.repeat(concentrations, replicates)
+        viability = bottom + (top - bottom) / (1 + (dose / ic50) ** hill) + rng.normal(0, 4, len(dose))
+        frames.append(pd.DataFrame({'treatment': treatment, 'concentration': dose, 'viability': viability}))
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,230 @@
+"""Restriction enzyme catalog: recognition sites and cut positions of commercially sold enzymes.
+
+Sites are in IUPAC letters, written 5' to 3' on the top strand, in the
+supplier's notation: ``^`` marks the top-strand cut of an enzyme that cuts
+inside its site (the bottom strand is cut symmetrically), and ``(a/b)``
+after the site gives the top- and bottom-strand cuts of a type IIS enzyme,
+in bases past the site's 3' end.  One enzyme of each set of
+isoschizomers is listed; enzymes that cut on both sides of their site,
+nicking enzymes and methylation-dependent enzymes are left out.
+"""
+
+ENZYMES = {
+    # Four- and five-base cutters
+    'AluI': 'AG^CT',
+    'BfaI': 'C^TAG',
+    'BstUI': 'CG^CG',
+    'CviAII': 'C^ATG',
+    'CviQI': 'G^TAC',
+    'FatI': '^CATG',
+    'HaeIII': 'GG^CC',
+    'HhaI': 'GCG^C',
+    'HinP1I': 'G^CGC',
+    'HpyCH4IV': 'A^CGT',
+    'HpyCH4V': 'TG^CA',
+    'MluCI': '^AATT',
+    'MseI': 'T^TAA',
+    'MspI': 'C^CGG',
+    'NlaIII': 'CATG^',
+    'RsaI': 'GT^AC',
+    'Sau3AI': '^GATC',
+    'TaqI': 'T^CGA',
+    'AvaII': 'G^GWCC',
+    'BssKI': '^CCNGG',
+    'BstNI': 'CC^WGG',
+    'Cac8I': 'GCN^NGC',
+    'CviKI-1': 'RG^CY',
+    'DdeI': 'C^TNAG',
+    'Fnu4HI': 'GC^NGC',
+    'HinfI': 'G^ANTC',
+    'Hpy166II': 'GTN^NAC',
+    'Hpy188I': 'TCN^GA',
+    'Hpy188III': 'TC^NNGA',
+    'HpyCH4III': 'ACN^GT',
+    'NciI': 'CC^SGG',
+    'NlaIV': 'GGN^NCC',
+    'PspGI': '^CCWGG',
+    'Sau96I': 'G^GNCC',
+    'ScrFI': 'CC^NGG',
+    'TfiI': 'G^AWTC',
+    'TseI': 'G^CWGC',
+    # Six-base and longer palindromic sites
+    'AatII': 'GACGT^C',
+    'Acc65I': 'G^GTACC',
+    'AccI': 'GT^MKAC',
+    'AclI': 'AA^CGTT',
+    'AfeI': 'AGC^GCT',
+    'AflII': 'C^TTAAG',
+    'AflIII': 'A^CRYGT',
+    'AgeI': 'A^CCGGT',
+    'AhdI': 'GACNNN^NNGTC',
+    'AleI': 'CACNN^NNGTG',
+    'AlwNI': 'CAGNNN^CTG',
+    'ApaI': 'GGGCC^C',
+    'ApaLI': 'G^TGCAC',
+    'ApoI': 'R^AATTY',
+    'AscI': 'GG^CGCGCC',
+    'AseI': 'AT^TAAT',
+    'AsiSI': 'GCGAT^CGC',
+    'AvaI': 'C^YCGRG',
+    'AvrII': 'C^CTAGG',
+    'BaeGI': 'GKGCM^C',
+    'BamHI': 'G^GATCC',
+    'BanI': 'G^GYRCC',
+    'BanII': 'GRGCY^C',
+    'BclI': 'T^GATCA',
+    'BglI': 'GCCNNNN^NGGC',
+    'BglII': 'A^GATCT',
+    'BlpI': 'GC^TNAGC',
+    'BmtI': 'GCTAG^C',
+    'BsaAI': 'YAC^GTR',
+    'BsaBI': 'GATNN^NNATC',
+    'BsaHI': 'GR^CGYC',
+    'BsaJI': 'C^CNNGG',
+    'BsaWI': 'W^CCGGW',
+    'BsiEI': 'CGRY^CG',
+    'BsiHKAI': 'GWGCW^C',
+    'BsiWI': 'C^GTACG',
+    'BslI': 'CCNNNNN^NNGG',
+    'Bsp1286I': 'GDGCH^C',
+    'BspEI': 'T^CCGGA',
+    'BspHI': 'T^CATGA',
+    'BsrFI': 'R^CCGGY',
+    'BsrGI': 'T^GTACA',
+    'BssHII': 'G^CGCGC',
+    'BstAPI': 'GCANNNN^NTGC',
+    'BstBI': 'TT^CGAA',
+    'BstEII': 'G^GTNACC',
+    'BstXI': 'CCANNNNN^NTGG',
+    'BstYI': 'R^GATCY',
+    'BstZ17I': 'GTA^TAC',
+    'Bsu36I': 'CC^TNAGG',
+    'BtgI': 'C^CRYGG',
+    'ClaI': 'AT^CGAT',
+    'DraI': 'TTT^AAA',
+    'DraIII': 'CACNNN^GTG',
+    'DrdI': 'GACNNNN^NNGTC',
+    'EaeI': 'Y^GGCCR',
+    'EagI': 'C^GGCCG',
+    'EcoNI': 'CCTNN^NNNAGG',
+    'EcoO109I': 'RG^GNCCY',
+    'EcoRI': 'G^AATTC',
+    'EcoRV': 'GAT^ATC',
+    'FseI': 'GGCCGG^CC',
+    'FspAI': 'RTGC^GCAY',
+    'FspI': 'TGC^GCA',
+    'HaeII': 'RGCGC^Y',
+    'HincII': 'GTY^RAC',
+    'HindIII': 'A^AGCTT',
+    'HpaI': 'GTT^AAC',
+    'Hpy99I': 'CGWCG^',
+    'KasI': 'G^GCGCC',
+    'KpnI': 'GGTAC^C',
+    'MauBI': 'CG^CGCGCG',
+    'MfeI': 'C^AATTG',
+    'MluI': 'A^CGCGT',
+    'MreI': 'CG^CCGGCG',
+    'MscI': 'TGG^CCA',
+    'MslI': 'CAYNN^NNRTG',
+    'MspA1I': 'CMG^CKG',
+    'MwoI': 'GCNNNNN^NNGC',
+    'NaeI': 'GCC^GGC',
+    'NarI': 'GG^CGCC',
+    'NcoI': 'C^CATGG',
+    'NdeI': 'CA^TATG',
+    'NgoMIV': 'G^CCGGC',
+    'NheI': 'G^CTAGC',
+    'NotI': 'GC^GGCCGC',
+    'NruI': 'TCG^CGA',
+    'NsiI': 'ATGCA^T',
+    'NspI': 'RCATG^Y',
+    'PacI': 'TTAAT^TAA',
+    'PciI': 'A^CATGT',
+    'PflMI': 'CCANNNN^NTGG',
+    'PmeI': 'GTTT^AAAC',
+    'PmlI': 'CAC^GTG',
+    'PpuMI': 'RG^GWCCY',
+    'PshAI': 'GACNN^NNGTC',
+    'PsiI': 'TTA^TAA',
+    'PspOMI': 'G^GGCCC',
+    'PspXI': 'VC^TCGAGB',
+    'PstI': 'CTGCA^G',
+    'PvuI': 'CGAT^CG',
+    'PvuII': 'CAG^CTG',
+    'RsrII': 'CG^GWCCG',
+    'SacI': 'GAGCT^C',
+    'SacII': 'CCGC^GG',
+    'SalI': 'G^TCGAC',
+    'SbfI': 'CCTGCA^GG',
+    'ScaI': 'AGT^ACT',
+    'SexAI': 'A^CCWGGT',
+    'SfcI': 'C^TRYAG',
+    'SfiI': 'GGCCNNNN^NGGCC',
+    'SfoI': 'GGC^GCC',
+    'SgrAI': 'CR^CCGGYG',
+    'SgrDI': 'CG^TCGACG',
+    'SmaI': 'CCC^GGG',
+    'SmlI': 'C^TYRAG',
+    'SnaBI': 'TAC^GTA',
+    'SpeI': 'A^CTAGT',
+    'SphI': 'GCATG^C',
+    'SrfI': 'GCCC^GGGC',
+    'SspI': 'AAT^ATT',
+    'StuI': 'AGG^CCT',
+    'StyI': 'C^CWWGG',
+    'SwaI': 'ATTT^AAAT',
+    'TatI': 'W^GTACW',
+    'Tth111I': 'GACN^NNGTC',
+    'XbaI': 'T^CTAGA',
+    'XcmI': 'CCANNNNN^NNNNTGG',
+    'XhoI': 'C^TCGAG',
+    'XmaI': 'C^CCGGG',
+    'XmnI': 'GAANN^NNTTC',
+    'ZraI': 'GAC^GTC',
+    'AbsI': 'CC^TCGAGG',
+    # Non-palindromic sites cut inside
+    'BbvCI': 'CC^TCAGC',
+    'BmgBI': 'CAC^GTC',
+    'BssSI': 'C^ACGAG',
+    # Type IIS: cut outside the site
+    'AcuI': 'CTGAAG(16/14)',
+    'AlwI': 'GGATC(4/5)',
+    'BbsI': 'GAAGAC(2/6)',
+    'BbvI': 'GCAGC(8/12)',
+    'BccI': 'CCATC(4/5)',
+    'BceAI': 'ACGGC(12/14)',
+    'BfuAI': 'ACCTGC(4/8)',
+    'BmrI': 'ACTGGG(5/4)',
+    'BpmI': 'CTGGAG(16/14)',
+    'BpuEI': 'CTTGAG(16/14)',
+    'BsaI': 'GGTCTC(1/5)',
+    'BseRI': 'GAGGAG(10/8)',
+    'BsgI': 'GTGCAG(16/14)',
+    'BsmAI': 'GTCTC(1/5)',
+    'BsmBI': 'CGTCTC(1/5)',
+    'BsmFI': 'GGGAC(10/14)',
+    'BsmI': 'GAATGC(1/-1)',
+    'BspCNI': 'CTCAG(9/7)',
+    'BsrDI': 'GCAATG(2/0)',
+    'BsrI': 'ACTGG(1/-1)',
+    'BtgZI': 'GCGATG(10/14)',
+    'BtsCI': 'GGATG(2/0)',
+    'BtsI': 'GCAGTG(2/0)',
+    'BtsIMutI': 'CAGTG(2/0)',
+    'EarI': 'CTCTTC(1/4)',
+    'EciI': 'GGCGGA(11/9)',
+    'FauI': 'CCCGC(4/6)',
+    'FokI': 'GGATG(9/13)',
+    'HgaI': 'GACGC(5/10)',
+    'HphI': 'GGTGA(8/7)',
+    'HpyAV': 'CCTTC(6/5)',
+    'MboII': 'GAAGA(8/7)',
+    'MlyI': 'GAGTC(5/5)',
+    'MmeI': 'TCCRAC(20/18)',
+    'MnlI': 'CCTC(7/6)',
+    'NmeAIII': 'GCCGAG(21/19)',
+    'PaqCI': 'CACCTGC(4/8)',
+    'PleI': 'GAGTC(4/5)',
+    'SapI': 'GCTCTTC(1/4)',
+    'SfaNI': 'GCATC(5/9)',
+}
@@ -0,0 +1,386 @@
+"""Densitometry of agarose gel photos: lanes, bands, fragment sizes and band volumes.
+
+``analyze_gel`` works on a grayscale copy of the photo no larger than
+``MAX_SIDE`` pixels, with bands made bright (a photo of dark bands on a
+light background is inverted):
+
+* lanes: wells are cut by a comb, so lanes repeat at a fixed pitch, found
+  from the autocorrelation of the columns' mean down the gel (less a
+  rolling-minimum baseline across it); lanes are where that comb puts the
+  most signal, from the first to the last lane standing out from the gaps,
+  so empty lanes between them (a negative control) are kept;
+* profiles: the mean of the central columns of every lane, for all lanes at
+  once from one cumulative sum over columns, less a rolling-minimum
+  background along the lane;
+* wells: the topmost peak found at the same row in most lanes; migration is
+  measured from it and nothing above it is a band;
+* bands: maxima of the profile above the noise, split at the valleys
+  between them; a band's volume is its background-subtracted profile summed
+  over its rows, times the lane width;
+* sizes: the ladder lane's bands are matched to the ladder's fragment sizes
+  by the subset that lies best on a semi-log line, and every band is sized
+  by interpolating log(size) between the ladder bands around it.
+
+``analyze_gels`` runs a batch of gels, one after another: a gel takes tens
+of milliseconds, less than shipping it to a worker process and back.
+"""
+import dataclasses
+import io
+import itertools
+import time
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from PIL import Image, ImageDraw
+
+MAX_SIDE = 1200
+IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.tif', '.tiff', '.bmp')
+
+# GeneRuler-style 1 kb ladder, bp, largest first
+LADDER_1KB = (10000, 8000, 6000, 5000, 4000, 3500, 3000, 2500, 2000, 1500, 1000, 750, 500, 250)
+
+LANE_SIGMAS = 3.0  # lane centres against the gaps between lanes, in column noise levels
+LANE_SATURATION = 3.0  # column signal, in noise levels, counted half as much as a bright lane
+# A peak of the autocorrelation at a divisor of its highest peak's lag, and at least this share of its height,
+# is the lane pitch
+PITCH_PEAK_SHARE = 0.15
+MAX_PITCH_DIVISOR = 8
+LANE_CORE = 0.7  # central share of a lane's width averaged into its profile
+BACKGROUND_WINDOW = 1 / 12  # rolling-minimum window along a lane, as a fraction of the gel height
+NOISE_SIGMAS = 6.0
+MIN_BAND_FRACTION = 0.02  # of the brightest band on the gel
+# Two maxima are one band unless the profile between them drops below this share of the lower one
+VALLEY_RATIO = 0.8
+BAND_EDGE = 0.05  # a band ends where the profile falls below this share of its peak
+WELL_REGION = 0.25  # top share of the gel searched for the wells
+WELL_LANE_SHARE = 0.7  # share of lanes with a peak at the well row
+MAX_LADDER_SUBSETS = 20_000
+
+BAND_COLUMNS = ['lane', 'row', 'top', 'bottom', 'migration', 'volume', 'size_bp']
+
+
+@dataclasses.dataclass
+class GelAnalysis:
+    lanes: np.ndarray  # (lanes, 2) first and last + 1 column, in analysed pixels
+    well_row: int
+    bands: pd.DataFrame  # BAND_COLUMNS
+    ladder_lane: int
+    ladder_rows: np.ndarray  # rows of the ladder bands matched to sizes
+    ladder_sizes: np.ndarray
+    scale: float  # original pixels per analysed pixel
+    seconds: float
+
+    def lane_volumes(self) -> np.ndarray:
+        """Total band volume of each lane."""
+        return np.bincount(self.bands['lane'], self.bands['volume'], minlength=len(self.lanes))
+
+    def main_bands(self) -> pd.DataFrame:
+        """Strongest band of every lane, lanes without bands included with zero volume."""
+        strongest = self.bands.loc[self.bands.groupby('lane')['volume'].idxmax()].set_index('lane')
+        return strongest.reindex(range(len(self.lanes))).fillna({'volume': 0.0}).rename_axis('lane').reset_index()
+
+
+def load_gel(source) -> Tuple[np.ndarray, float]:
+    """Grayscale float32 image (at most ``MAX_SIDE`` on a side) and the original pixels per pixel."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    with Image.open(source) as image:
+        size = image.size
+        image.draft('L', (MAX_SIDE, MAX_SIDE))
+        image = image.convert('L')
+        image.thumbnail((MAX_SIDE, MAX_SIDE))
+        return np.asarray(image, dtype=np.float32), size[0] / image.size[0]
+
+
+def _rolling_min(profiles: np.ndarray, window: int) -> np.ndarray:
+    """Grey opening of every row (rolling minimum, then rolling maximum): the baseline under narrow peaks."""
+    half = window // 2
+    padded = np.pad(profiles, ((0, 0), (half, half)), mode='edge')
+    low = np.lib.stride_tricks.sliding_window_view(padded, window, axis=1).min(axis=2)
+    padded = np.pad(low, ((0, 0), (half, half)), mode='edge')
+    return np.lib.stride_tricks.sliding_window_view(padded, window, axis=1).max(axis=2)
+
+
+def _runs(above: np.ndarray) -> np.ndarray:
+    """First and last + 1 index of every run of True, (runs, 2)."""
+    edges = np.diff(np.concatenate([[0], above.astype(np.int8), [0]]))
+    return np.column_stack([np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)])
+
+
+def _lane_pitch(signal: np.ndarray) -> int:
+    """Spacing of the lanes, from the autocorrelation of the column profile."""
+    n = len(signal)
+    centred = signal - signal.mean()
+    spectrum = np.fft.rfft(centred, 2 * n)
+    correlation = np.fft.irfft(spectrum * spectrum.conj())[:n] / (n - np.arange(n))
+    lags = np.arange(max(n // 60, 3), n // 2)
+    if len(lags) < 3:
+        return 0
+    values = correlation[lags]
+    peaks = lags[1:-1][(values[1:-1] >= values[:-2]) & (values[1:-1] > values[2:]) & (values[1:-1] > 0)]
+    if not len(peaks):
+        return 0
+    # Peaks scored by their rise over the lowest correlation at a shorter lag: a comb of lanes swings to
+    # anti-correlation at half its pitch, the grain within the lanes does not
+    rise = correlation[peaks] - np.minimum.accumulate(correlation[lags[0]:])[peaks - lags[0]]
+    best = np.argmax(rise)
+    # Lanes of unequal strength can correlate best at a multiple of the pitch; take the smallest divisor
+    # of the best lag that is a peak of its own
+    for divisor in range(MAX_PITCH_DIVISOR, 1, -1):
+        near = np.flatnonzero(np.abs(peaks - peaks[best] / divisor) <= max(2, peaks[best] / divisor / 20))
+        if len(near) and rise[near].max() >= PITCH_PEAK_SHARE * rise[best]:
+            return int(peaks[near[np.argmax(rise[near])]])
+    return int(peaks[best])
+
+
+def detect_lanes(image: np.ndarray) -> np.ndarray:
+    """Column bounds of every lane, (lanes, 2), in order across the gel."""
+    w = image.shape[1]
+    # Every band of a lane raises the lane's mean down the gel; the opening takes off the smooth background
+    columns = image.mean(axis=0)[None]
+    signal = (columns - _rolling_min(columns, max(w // 3, 3) | 1))[0]
+    # Saturated, so empty lanes (with no more than the glow of their wells) weigh about as much in the pitch
+    # and phase as the ladder's bright lane
+    steps = np.diff(signal)
+    noise = 1.4826 * np.median(np.abs(steps - np.median(steps))) + 1e-6
+    positive = np.clip(signal, 0, None)
+    compressed = positive / (positive + LANE_SATURATION * noise)
+    pitch = _lane_pitch(compressed)
+    if pitch < 3:
+        return np.zeros((0, 2), dtype=np.int64)
+    # Comb phase that puts the most signal at the lane centres
+    lanes = (w - 1) // pitch + 1
+    padded = np.pad(compressed, (0, lanes * pitch - w))
+    folded = padded.reshape(lanes, pitch).sum(axis=0)
+    # Smoothed around the circle, so the phase lands in the middle of the lanes' plateau
+    box = np.ones(max(pitch // 3, 1))
+    smoothed = np.convolve(np.tile(folded, 3), box, mode='same')[pitch:2 * pitch]
+    phase = int(np.argmax(smoothed))
+    centers = np.arange(phase, w, pitch)
+    # Lane width: columns above half the peak in a pitch-wide window around each centre
+    offsets = np.arange(pitch) - pitch // 2
+    windows = np.take(signal, np.clip(centers[:, None] + offsets, 0, w - 1))
+    gaps = np.take(signal, np.clip(centers + pitch // 2, 0, w - 1))
+    cores = windows[:, np.abs(offsets) <= pitch // 6].mean(axis=1)
+    occupied = np.flatnonzero(cores > np.median(gaps) + LANE_SIGMAS * noise)
+    if not len(occupied):
+        return np.zeros((0, 2), dtype=np.int64)
+    above = windows[occupied] >= 0.5 * windows[occupied].max(axis=1, keepdims=True)
+    width = int(np.median(above.sum(axis=1)))
+    # Lanes between the first and last with bands in them are lanes, empty or not
+    centers = centers[occupied[0]:occupied[-1] + 1]
+    return np.column_stack([np.clip(centers - width // 2, 0, w), np.clip(centers - width // 2 + width, 0, w)])
+
+
+def lane_profiles(image: np.ndarray, lanes: np.ndarray) -> np.ndarray:
+    """Mean of the central columns of every lane, down the gel, (lanes, rows)."""
+    margin = ((lanes[:, 1] - lanes[:, 0]) * (1 - LANE_CORE) / 2).astype(np.int64)
+    first, last = lanes[:, 0] + margin, np.maximum(lanes[:, 1] - margin, lanes[:, 0] + margin + 1)
+    cumulative = np.concatenate([np.zeros((image.shape[0], 1)), image.cumsum(axis=1, dtype=np.float64)], axis=1)
+    return ((cumulative[:, last] - cumulative[:, first]) / (last - first)).T
+
+
+def _peaks(signal: np.ndarray, floor: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Lane and row of every local maximum of each lane's signal above that lane's floor."""
+    left = np.pad(signal, ((0, 0), (1, 0)), constant_values=-np.inf)[:, :-1]
+    right = np.pad(signal, ((0, 0), (0, 1)), constant_values=-np.inf)[:, 1:]
+    return np.nonzero((signal >= left) & (signal > right) & (signal > floor[:, None]))
+
+
+def _bands(signal: np.ndarray, rows: np.ndarray, noise: float) -> List[Tuple[int, int, int]]:
+    """Peak, top and bottom + 1 rows of the bands of one lane, merging maxima without a valley between."""
+    bands = []
+    for row in rows:
+        if bands:
+            previous = bands[-1][0]
+            valley = previous + int(np.argmin(signal[previous:row + 1]))
+            if signal[valley] >= VALLEY_RATIO * min(signal[previous], signal[row]):
+                if signal[row] > signal[previous]:
+                    bands[-1][0] = row
+                continue
+            bands[-1][2] = valley
+            bands.append([row, valley, len(signal)])
+        else:
+            bands.append([row, 0, len(signal)])
+    # A band ends where the signal falls to the background, or at the valley to its neighbour
+    for band in bands:
+        peak, top, bottom = band
+        below = signal <= max(BAND_EDGE * signal[peak], 2 * noise)
+        under = np.flatnonzero(below[top:peak])
+        band[1] = top + under[-1] + 1 if len(under) else top
+        under = np.flatnonzero(below[peak:bottom])
+        band[2] = peak + under[0] if len(under) else bottom
+    return [tuple(band) for band in bands]
+
+
+def match_ladder(rows: np.ndarray, sizes: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Ladder band rows paired with fragment sizes, the subset lying best on a line of row against log(size)."""
+    rows = np.sort(np.asarray(rows, dtype=np.float64))
+    sizes = np.sort(np.asarray(sizes, dtype=np.float64))[::-1]
+    n = min(len(rows), len(sizes))
+    if n < 2:
+        return rows[:0], sizes[:0]
+    longer, shorter = (rows, sizes) if len(rows) > len(sizes) else (sizes, rows)
+    subsets = itertools.islice(itertools.combinations(range(len(longer)), n), MAX_LADDER_SUBSETS)
+    subsets = np.array(list(subsets))
+    chosen = longer[subsets]  # subsets × n
+    x = chosen if longer is rows else np.broadcast_to(rows[:n], chosen.shape)
+    y = np.log10(chosen if longer is sizes else np.broadcast_to(sizes[:n], chosen.shape))
+    # Residual of the least-squares line through every subset at once
+    xc, yc = x - x.mean(axis=1, keepdims=True), y - y.mean(axis=1, keepdims=True)
+    slope = (xc * yc).sum(axis=1) / np.maximum((xc ** 2).sum(axis=1), 1e-12)
+    residual = ((yc - slope[:, None] * xc) ** 2).sum(axis=1) + (slope >= 0) * 1e6
+    best = subsets[np.argmin(residual)]
+    return (rows[best], sizes[:n]) if longer is rows else (rows[:n], sizes[best])
+
+
+def size_bands(rows: np.ndarray, ladder_rows: np.ndarray, ladder_sizes: np.ndarray) -> np.ndarray:
+    """Fragment size (bp) at each row, interpolating log(size) between the ladder bands around it."""
+    rows = np.asarray(rows, dtype=np.float64)
+    if len(ladder_rows) < 2:
+        return np.full(len(rows), np.nan)
+    log_sizes = np.log10(ladder_sizes)
+    inside = np.interp(rows, ladder_rows, log_sizes)
+    # Beyond the ladder, extend the line through its two outermost bands on that side
+    top_slope = (log_sizes[1] - log_sizes[0]) / (ladder_rows[1] - ladder_rows[0])
+    bottom_slope = (log_sizes[-1] - log_sizes[-2]) / (ladder_rows[-1] - ladder_rows[-2])
+    log_size = np.where(rows < ladder_rows[0], log_sizes[0] + top_slope * (rows - ladder_rows[0]),
+                        np.where(rows > ladder_rows[-1], log_sizes[-1] + bottom_slope * (rows - ladder_rows[-1]),
+                                 inside))
+    return 10 ** log_size
+
+
+def analyze_gel(source, ladder_lane: int = 0, ladder: Sequence[int] = LADDER_1KB) -> GelAnalysis:
+    """Lanes, bands, sizes and volumes of a gel photo (path, bytes, file object or grayscale array).
+
+    Raises ValueError if ``ladder_lane`` is not one of the lanes found.
+    """
+    start = time.perf_counter()
+    if isinstance(source, np.ndarray):
+        image, scale = source.astype(np.float32), 1.0
+    else:
+        image, scale = load_gel(source)
+    if np.median(image) > (image.min() + image.max()) / 2:
+        # Dark bands on a light background
+        image = image.max() - image
+    h = image.shape[0]
+    lanes = detect_lanes(image)
+    if not len(lanes):
+        return GelAnalysis(lanes, 0, pd.DataFrame(columns=BAND_COLUMNS), 0, np.zeros(0), np.zeros(0), scale,
+                           time.perf_counter() - start)
+    profiles = lane_profiles(image, lanes)
+    signal = profiles - _rolling_min(profiles, max(int(h * BACKGROUND_WINDOW), 3) | 1)
+    steps = np.diff(signal, axis=1)
+    noise = 1.4826 * np.median(np.abs(steps - np.median(steps)), axis=1, keepdims=True) / np.sqrt(2) + 1e-6
+    # Compression blocks and uneven staining drift slower than from row to row; most of a lane is background
+    centred = signal - np.median(signal, axis=1, keepdims=True)
+    noise = np.maximum(noise, 1.4826 * np.median(np.abs(centred), axis=1, keepdims=True))
+    # A light smoothing keeps noise from splitting a band into many maxima
+    kernel = np.ones(3) / 3
+    smooth = np.apply_along_axis(np.convolve, 1, signal, kernel, mode='same')
+    floor = np.maximum(NOISE_SIGMAS * noise[:, 0], MIN_BAND_FRACTION * smooth.max())
+    peak_lanes, peak_rows = _peaks(smooth, floor)
+
+    # Wells: the top region's row with a peak in most lanes
+    well_row = 0
+    near_top = peak_rows < WELL_REGION * h
+    if near_top.any():
+        counts = np.bincount(peak_rows[near_top] // 3, minlength=int(WELL_REGION * h) // 3 + 1)
+        counts = counts + np.append(counts[1:], 0) + np.concatenate([[0], counts[:-1]])
+        best = int(np.argmax(counts))
+        if counts[best] >= WELL_LANE_SHARE * len(lanes):
+            shared = near_top & (np.abs(peak_rows // 3 - best) <= 1)
+            well_row = int(peak_rows[shared].max()) + 1
+    width = lanes[:, 1] - lanes[:, 0]
+
+    records = []
+    for lane in range(len(lanes)):
+        rows = peak_rows[(peak_lanes == lane) & (peak_rows > well_row + 2)]
+        for peak, top, bottom in _bands(smooth[lane], rows, noise[lane, 0]):
+            top = max(top, well_row + 1)
+            volume = float(np.clip(signal[lane, top:bottom], 0, None).sum() * width[lane])
+            records.append((lane, peak, top, bottom, peak - well_row, volume))
+    bands = pd.DataFrame(records, columns=BAND_COLUMNS[:-1])
+
+    if not 0 <= ladder_lane < len(lanes):
+        raise ValueError(f"Ladder lane {ladder_lane + 1} is not on the gel: {len(lanes)} lanes were found")
+    on_ladder = bands['lane'] == ladder_lane
+    ladder_rows, ladder_sizes = match_ladder(bands.loc[on_ladder, 'row'].to_numpy(), ladder)
+    bands['size_bp'] = size_bands(bands['row'].to_numpy(), ladder_rows, ladder_sizes).round()
+    return GelAnalysis(lanes, well_row, bands, ladder_lane, ladder_rows, ladder_sizes, scale,
+                       time.perf_counter() - start)
+
+
+def _analyze_image(job: Tuple[str, object]) -> pd.DataFrame:
+    name, source = job
+    try:
+        analysis = analyze_gel(source)
+    except (OSError, ValueError) as exc:
+        return pd.DataFrame({'gel': [name], 'error': [str(exc)]})
+    return analysis.bands.assign(gel=name, seconds=analysis.seconds, error='')
+
+
+def analyze_gels(images: Sequence[Tuple[str, object]]) -> pd.DataFrame:
+    """Bands of every gel, with the gel's name and the seconds it took; ``images`` are (name, path or bytes)."""
+    frames = [_analyze_image(job) for job in images]
+    columns = ['gel'] + BAND_COLUMNS + ['seconds', 'error']
+    return pd.concat(frames, ignore_index=True).reindex(columns=columns) if frames else pd.DataFrame(columns=columns)
+
+
+def annotate(source, analysis: GelAnalysis, labels: Sequence[str] = (), max_side: int = 800) -> Image.Image:
+    """The gel photo with its lanes outlined and every band boxed and sized."""
+    if isinstance(source, np.ndarray):
+        image = Image.fromarray(np.clip(source, 0, 255).astype(np.uint8))
+    else:
+        image = Image.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+    image = image.convert('RGB')
+    factor = min(max_side / max(image.size), 1.0)
+    image = image.resize((round(image.width * factor), round(image.height * factor)))
+    draw = ImageDraw.Draw(image)
+    k = analysis.scale * factor
+    for lane, (first, last) in enumerate(analysis.lanes):
+        colour = (90, 170, 255) if lane == analysis.ladder_lane else (120, 120, 120)
+        draw.rectangle((first * k, analysis.well_row * k, last * k, image.height - 1), outline=colour)
+        label = labels[lane] if lane < len(labels) else f"Lane {lane + 1}"
+        draw.text((first * k + 2, 2), label, fill=(255, 255, 255))
+    for band in analysis.bands.itertuples():
+        first, last = analysis.lanes[band.lane]
+        draw.rectangle((first * k, band.top * k, last * k, band.bottom * k), outline=(255, 80, 60))
+        if band.lane != analysis.ladder_lane and np.isfinite(band.size_bp):
+            draw.text((last * k + 2, band.row * k - 5), f"{band.size_bp:,.0f}", fill=(255, 220, 120))
+    return image
+
+
+def _band_profile(rows: np.ndarray, center: float, sigma: float) -> np.ndarray:
+    return np.exp(-0.5 * ((rows - center) / sigma) ** 2)
+
+
+def synthetic_gel(lanes: Sequence[Sequence[Tuple[int, float]]], ladder: Sequence[int] = LADDER_1KB,
+                  ladder_ng: float = 50.0, agarose: float = 1.0, height: int = 520, lane_width: int = 44,
+                  seed: int = 0) -> np.ndarray:
+    """Grayscale photo of a stained gel: a ladder lane, then lanes of (size bp, ng) fragments."""
+    rng = np.random.default_rng(seed)
+    lanes = [[(size, ladder_ng) for size in ladder]] + [list(lane) for lane in lanes]
+    gap = lane_width * 3 // 4
+    width = len(lanes) * (lane_width + gap) + gap
+    rows = np.arange(height, dtype=np.float64)[:, None]
+    columns = np.arange(width, dtype=np.float64)[None]
+    well_row = 0.08 * height
+    run = 0.85 * height - well_row
+    # Background glow brighter towards the centre of the transilluminator
+    image = 18 + 10 * np.exp(-((columns - width / 2) / width) ** 2 - ((rows - height / 2) / height) ** 2)
+    image = np.broadcast_to(image, (height, width)).copy()
+    for lane, fragments in enumerate(lanes):
+        first = gap + lane * (lane_width + gap)
+        across = np.clip(np.minimum(columns - first, first + lane_width - columns) / 3, 0, 1)
+        # A faint glow of DNA stuck in every well
+        image += 30 * _band_profile(rows, well_row, 2.0) * across
+        for size, ng in fragments:
+            # Semi-log migration that compresses the largest fragments, more so in denser gels
+            fraction = np.clip((np.log10(20000) - np.log10(size)) / (np.log10(20000) - np.log10(100)), 0, 1)
+            center = well_row + run * fraction ** (1 + 0.2 * agarose)
+            sigma = 1.5 + 4 * fraction
+            image += 3.5 * ng / sigma * _band_profile(rows, center, sigma) * across
+    image += rng.normal(0, 1.5, image.shape)
+    return np.clip(image, 0, 255).astype(np.uint8)
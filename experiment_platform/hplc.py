@@ -0,0 +1,250 @@
+"""HPLC chromatogram processing for ATRA quantification.
+
+Every step works on whole arrays, so a detector trace of millions of points
+is processed in well under a second:
+
+* baseline: a morphological opening of the trace with a
+  ``baseline_window``-minute window (rolling minimum, then rolling maximum,
+  each from running extremes over window-long blocks), which follows a
+  drifting baseline but not a narrower peak, smoothed with a moving average
+  and lifted by the median residual, as the rolling minimum sits in the
+  noise's troughs;
+* smoothing: Savitzky-Golay (least-squares polynomial) convolution over
+  ``smooth_window`` minutes, whatever the sampling rate, which keeps peak
+  heights and areas;
+* peaks: runs where the smoothed signal stays above one noise level and
+  reaches ``min_snr`` noise levels somewhere (noise from the median absolute
+  point-to-point difference), apex found per run;
+* area: trapezoid integral of the baseline-corrected signal over each run,
+  from one cumulative sum.
+
+``process_injections`` runs the peak finder over every injection of a trace
+table (the ``hplc`` dataset), and ``production_kinetics``
+turns the ATRA peaks into mg/L with a calibration curve fitted to the
+standard injections.
+"""
+import dataclasses
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+ATRA_RETENTION_MIN = 5.0
+RETENTION_TOLERANCE_MIN = 0.3
+# Savitzky-Golay window in minutes, and its bounds in points
+SMOOTH_WINDOW_MIN = 0.03
+SMOOTH_MIN_POINTS = 5
+SMOOTH_MAX_POINTS = 51
+# Blocks per baseline window whose minima the baseline is worked on, and residuals sampled for its offset
+BASELINE_BLOCKS = 32
+MEDIAN_SAMPLE = 200_000
+
+
+def savgol_coefficients(window: int, order: int) -> np.ndarray:
+    half = window // 2
+    vander = np.vander(np.arange(-half, half + 1), order + 1, increasing=True)
+    return np.linalg.pinv(vander)[0]
+
+
+def smooth(signal: np.ndarray, window: int = 11, order: int = 3) -> np.ndarray:
+    """Savitzky-Golay smoothing over ``window`` points."""
+    window = min(window | 1, (len(signal) - 1) | 1)
+    if window <= order + 1:
+        return signal.astype(np.float64)
+    half = window // 2
+    padded = np.pad(signal.astype(np.float64), half, mode='reflect')
+    return np.convolve(padded, savgol_coefficients(window, order)[::-1], mode='valid')
+
+
+def _sample_step(time: np.ndarray) -> float:
+    return float(np.median(np.diff(time))) if len(time) > 1 else 1.0
+
+
+def _rolling(values: np.ndarray, window: int, extreme: np.ufunc) -> np.ndarray:
+    """``extreme`` (np.minimum or np.maximum) over a centred window of ``window`` (odd) points, edges extended.
+
+    From running extremes within window-long blocks forward and backward: any window spans the end of one
+    block and the start of the next.
+    """
+    half = window // 2
+    size = len(values)
+    padded = np.pad(values, (half, half + (-(size + 2 * half)) % window), mode='edge').reshape(-1, window)
+    forward = extreme.accumulate(padded, axis=1).ravel()
+    backward = extreme.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return extreme(backward[:size], forward[window - 1:window - 1 + size])
+
+
+def baseline(time: np.ndarray, signal: np.ndarray, baseline_window: float = 1.0) -> np.ndarray:
+    """Opening of the trace over ``baseline_window`` minutes, smoothed and lifted to the middle of the noise.
+
+    Worked on the minima of blocks of 1/``BASELINE_BLOCKS`` of the window, then interpolated back.
+    """
+    signal = signal.astype(np.float64)
+    size = len(signal)
+    window = int(max(3, min(size, baseline_window / _sample_step(time))))
+    block = max(1, window // BASELINE_BLOCKS)
+    blocks = -(-size // block)
+    lows = np.pad(signal, (0, blocks * block - size), mode='edge').reshape(blocks, block).min(axis=1)
+    span = (window // block) | 1
+    opened = _rolling(_rolling(lows, span, np.minimum), span, np.maximum)
+    half = span // 2
+    padded = np.concatenate(([0.0], np.cumsum(np.pad(opened, half, mode='edge'))))
+    level = np.interp(np.arange(size), np.arange(blocks) * block + (block - 1) / 2,
+                      (padded[span:] - padded[:-span]) / span)
+    # Peaks are a minority of the trace: the median residual (of a sample of it) is the baseline's offset
+    return level + np.median((signal - level)[::max(1, size // MEDIAN_SAMPLE)])
+
+
+def noise_level(signal: np.ndarray) -> float:
+    """Standard deviation of white noise estimated from the median absolute point-to-point difference."""
+    if len(signal) < 3:
+        return 0.0
+    return float(1.4826 * np.median(np.abs(np.diff(signal))) / np.sqrt(2))
+
+
+def correct_and_smooth(time: np.ndarray, signal: np.ndarray, baseline_window: float = 1.0,
+                       smooth_window: float = SMOOTH_WINDOW_MIN) -> Tuple[np.ndarray, np.ndarray]:
+    """Baseline-corrected signal and its version smoothed over ``smooth_window`` minutes."""
+    corrected = signal - baseline(time, signal, baseline_window)
+    points = int(np.clip(round(smooth_window / _sample_step(time)), SMOOTH_MIN_POINTS, SMOOTH_MAX_POINTS))
+    return corrected, smooth(corrected, points)
+
+
+def find_peaks(time: np.ndarray, signal: np.ndarray, baseline_window: float = 1.0,
+               smooth_window: float = SMOOTH_WINDOW_MIN, min_snr: float = 5.0, min_points: int = 3) -> pd.DataFrame:
+    """Peaks of one trace: apex time, height, area, start and end time."""
+    time = np.asarray(time, dtype=np.float64)
+    signal = np.asarray(signal, dtype=np.float64)
+    order = np.argsort(time, kind='stable')
+    time, signal = time[order], signal[order]
+    keep = np.isfinite(time) & np.isfinite(signal)
+    time, signal = time[keep], signal[keep]
+    columns = ['retention_time', 'height', 'area', 'start_time', 'end_time']
+    if len(time) < 5:
+        return pd.DataFrame(columns=columns, dtype=np.float64)
+
+    corrected, smoothed = correct_and_smooth(time, signal, baseline_window, smooth_window)
+    noise = noise_level(corrected) or np.finfo(np.float64).eps
+
+    # Runs above one noise level; a run is a peak if it reaches min_snr noise levels
+    above = np.concatenate(([False], smoothed > noise, [False]))
+    edges = np.flatnonzero(np.diff(above.astype(np.int8)))
+    starts, ends = edges[::2], edges[1::2]  # ends are exclusive
+    wide = ends - starts >= min_points
+    starts, ends = starts[wide], ends[wide]
+    if not len(starts):
+        return pd.DataFrame(columns=columns, dtype=np.float64)
+    # Each run's maximum over its own points only: dropped narrow runs and the gaps lie between kept runs
+    in_runs = _run_indices(starts, ends)
+    heights = np.maximum.reduceat(smoothed[in_runs], np.r_[0, np.cumsum(ends - starts)[:-1]])
+    run_id = np.repeat(np.arange(len(starts)), ends - starts)
+    peak = heights >= min_snr * noise
+    apex = np.full(len(starts), -1)
+    is_apex = smoothed[in_runs] == heights[run_id]
+    first = np.unique(run_id[is_apex], return_index=True)
+    apex[first[0]] = in_runs[is_apex][first[1]]
+
+    cumulative = np.concatenate(([0.0], np.cumsum(np.diff(time) * (corrected[1:] + corrected[:-1]) / 2)))
+    last = ends - 1
+    return pd.DataFrame({
+        'retention_time': time[apex[peak]],
+        'height': heights[peak],
+        'area': (cumulative[last] - cumulative[starts])[peak],
+        'start_time': time[starts[peak]],
+        'end_time': time[last[peak]],
+    })
+
+
+def _run_indices(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenated aranges start..end of every run."""
+    lengths = ends - starts
+    offsets = np.repeat(starts - np.r_[0, np.cumsum(lengths)[:-1]], lengths)
+    return np.arange(lengths.sum()) + offsets
+
+
+def _injection_peaks(args) -> pd.DataFrame:
+    name, time, signal = args
+    peaks = find_peaks(time, signal)
+    peaks.insert(0, 'injection', name)
+    return peaks
+
+
+def _split_injections(traces: pd.DataFrame) -> List[Tuple[str, np.ndarray, np.ndarray]]:
+    if 'injection' not in traces.columns:
+        return [('trace', traces['time'].to_numpy(), traces['signal'].to_numpy())]
+    injection = traces['injection']
+    if not isinstance(injection.dtype, pd.CategoricalDtype):
+        injection = injection.astype('category')
+    codes, names = injection.cat.codes.to_numpy(), injection.cat.categories
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+    time, signal = traces['time'].to_numpy()[order], traces['signal'].to_numpy()[order]
+    return [(str(names[i]), time[bounds[i]:bounds[i + 1]], signal[bounds[i]:bounds[i + 1]])
+            for i in range(len(names)) if bounds[i + 1] > bounds[i]]
+
+
+def process_injections(traces: pd.DataFrame) -> pd.DataFrame:
+    """Peaks of every injection of a trace table (time, signal and optionally injection columns).
+
+    In this process: sending a trace to a worker process costs about half of processing it.
+    """
+    results = [_injection_peaks(job) for job in _split_injections(traces)]
+    if not results:
+        return pd.DataFrame(columns=['injection', 'retention_time', 'height', 'area', 'start_time', 'end_time'])
+    return pd.concat(results, ignore_index=True)
+
+
+def atra_peaks(peaks: pd.DataFrame, retention_time: float = ATRA_RETENTION_MIN,
+               tolerance: float = RETENTION_TOLERANCE_MIN) -> pd.DataFrame:
+    """The largest peak of each injection within tolerance of the ATRA retention time."""
+    window = peaks[(peaks['retention_time'] - retention_time).abs() <= tolerance]
+    return window.sort_values('area').groupby('injection', sort=False).tail(1).set_index('injection')
+
+
+@dataclasses.dataclass
+class CalibrationCurve:
+    """Linear peak area = slope * concentration + intercept."""
+    slope: float
+    intercept: float
+    r_squared: float
+
+    @classmethod
+    def fit(cls, concentration: np.ndarray, area: np.ndarray) -> 'CalibrationCurve':
+        concentration = np.asarray(concentration, dtype=np.float64)
+        area = np.asarray(area, dtype=np.float64)
+        if len(np.unique(concentration)) < 2:
+            raise ValueError("The calibration curve needs standards at two or more concentrations")
+        slope, intercept = np.polyfit(concentration, area, 1)
+        residual = area - (slope * concentration + intercept)
+        total = np.sum((area - area.mean()) ** 2)
+        return cls(float(slope), float(intercept), float(1 - residual @ residual / total) if total else 1.0)
+
+    def concentration(self, area):
+        return (np.asarray(area, dtype=np.float64) - self.intercept) / self.slope
+
+
+def production_kinetics(traces: pd.DataFrame) -> Tuple[pd.DataFrame, CalibrationCurve]:
+    """ATRA titre (mg/L) against culture time from a trace table with standard and sample injections.
+
+    Standards carry a ``standard_concentration`` (mg/L), samples a ``culture_time`` (hours); both are
+    constant within an injection.  Replicate injections at the same culture time are averaged.
+    """
+    for column in ('injection', 'standard_concentration', 'culture_time'):
+        if column not in traces.columns:
+            raise ValueError(f"HPLC traces need an {column} column to quantify ATRA")
+    meta = traces.groupby('injection', observed=True)[['standard_concentration', 'culture_time']].first()
+    atra = atra_peaks(process_injections(traces)).join(meta, how='inner')
+    standards = atra.dropna(subset=['standard_concentration'])
+    curve = CalibrationCurve.fit(standards['standard_concentration'], standards['area'])
+    samples = atra.dropna(subset=['culture_time']).copy()
+    samples['atra_mg_l'] = curve.concentration(samples['area'])
+    kinetics = (samples.groupby('culture_time')['atra_mg_l'].agg(['mean', 'std', 'count'])
+                .rename(columns={'mean': 'atra_mg_l', 'std': 'atra_sd', 'count': 'injections'}).reset_index())
+    return kinetics, curve
+
+
+def example_chromatogram(points: int = 100, seed: int = None) -> Tuple[np.ndarray, np.ndarray]:
+    """ATRA standard peak at 5 min on a noisy flat baseline, as shown before any data is loaded."""
+    rng = np.random.default_rng(seed)
+    time = np.linspace(0, 10, points)
+    return time, 5 * np.exp(-0.5 * (time - ATRA_RETENTION_MIN) ** 2) + 0.1 * rng.normal(size=points)
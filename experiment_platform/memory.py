@@ -0,0 +1,321 @@
+"""Memory of the server process and of every session, sampled in the background for the Server Memory page.
+
+Opt-in: with ``MEMORY_ENV`` set, the first run starts a ``MemorySampler``
+thread that every ``SAMPLE_S`` records the process RSS, the pyplot figures
+left open (by title, so the page that forgot to close them shows) and the
+number of sessions, into a history of ``HISTORY`` samples.  Each sample also
+sizes a few session states and one cache, round robin, so it stays cheap
+however many sessions are open; a session's size is charged to the page it
+is on.  The hits and misses of every ``st.cache_resource``/``st.cache_data``
+function, and of the ``FigureStore``, are counted as they happen.
+
+The latest numbers are also served with Streamlit's own metrics, in the
+OpenMetrics text format at ``/_stcore/metrics`` (families ``experiment_*``,
+e.g. ``/_stcore/metrics?families=experiment_session_state_bytes``).  Sizes
+are deep sizes (``asizeof``, vendored by Streamlit): an object a session
+shares with a cache counts in both.
+"""
+import collections
+import dataclasses
+import os
+import sys
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from experiment_platform.rendering import figure_label
+from experiment_platform.session_log import figure_store
+
+if TYPE_CHECKING:
+    # Only the summary builds frames; the sampler and the metrics do not need pandas
+    import pandas as pd
+
+# Environment variable that adds the Server Memory page to the sidebar and starts the sampler
+MEMORY_ENV = 'EXPERIMENT_MEMORY_PANEL'
+SAMPLE_S = 5.0
+HISTORY = 720  # samples kept: an hour
+SESSIONS_PER_SAMPLE = 4  # session states sized per sample
+FIGURE_STORE = 'figure store'
+
+
+@dataclasses.dataclass(frozen=True)
+class SessionSize:
+    page: str
+    keys: Dict[str, int]  # bytes by session state key
+    sized: float
+
+    @property
+    def bytes(self) -> int:
+        return sum(self.keys.values())
+
+
+@dataclasses.dataclass
+class MemorySummary:
+    history: 'pd.DataFrame'  # time, RSS (MB), open figures, sessions, session state (MB), caches (MB)
+    sessions: 'pd.DataFrame'  # session, page, state (kB), largest keys, sized (s ago)
+    pages: 'pd.DataFrame'  # page, sessions, mean and max state (kB)
+    keys: 'pd.DataFrame'  # session state key, sessions, total and max (kB)
+    caches: 'pd.DataFrame'  # cache, entries, size (MB), hits, misses, hit rate
+    figures: 'pd.Series'  # open pyplot figures by label
+    sample_ms: float  # mean time a sample takes
+    error: Optional[str]  # the last sample's, if it failed
+
+
+def process_rss() -> int:
+    """Resident set size of this process in bytes (the peak where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        try:
+            import resource
+        except ImportError:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def open_figures() -> collections.Counter:
+    """Figures pyplot still holds, by label; pyplot is not imported for this."""
+    if 'matplotlib.pyplot' not in sys.modules:
+        return collections.Counter()
+    from matplotlib._pylab_helpers import Gcf
+    return collections.Counter(figure_label(manager.canvas.figure) for manager in Gcf.get_all_fig_managers())
+
+
+_requests_lock = threading.Lock()
+_requests: Dict[str, list] = collections.defaultdict(lambda: [0, 0])  # cache: [hits, misses]
+_caches = weakref.WeakValueDictionary()  # cache: Streamlit's cache object
+
+
+def _cache_name(display_name: str) -> str:
+    """``page.function`` of a cached function's ``module.function``."""
+    return '.'.join(display_name.split('.')[-2:])
+
+
+def count_cache_requests():
+    """Count the hits and misses of every st.cache_resource and st.cache_data function from now on (idempotent)."""
+    from streamlit.runtime.caching.cache_errors import CacheKeyNotFoundError
+    from streamlit.runtime.caching.cache_utils import Cache
+
+    read = Cache.read_result_and_freshness
+    if getattr(read, 'counted', False):
+        return
+
+    def counted_read(cache, value_key):
+        name = _cache_name(cache.display_name)
+        try:
+            result = read(cache, value_key)
+        except CacheKeyNotFoundError:
+            with _requests_lock:
+                _requests[name][1] += 1
+                _caches[name] = cache
+            raise
+        with _requests_lock:
+            _requests[name][0] += 1
+        return result
+
+    counted_read.counted = True
+    Cache.read_result_and_freshness = counted_read
+
+
+def _cache_size(cache) -> Tuple[int, int]:
+    """Entries and bytes of a Streamlit function cache."""
+    from streamlit.runtime.stats import safe_sizeof
+
+    if hasattr(cache, 'storage'):
+        # st.cache_data keeps pickled entries: their lengths are their sizes
+        stats = [stat for family in cache.get_stats().values() for stat in family]
+        return len(stats), sum(stat.byte_length for stat in stats)
+    with cache._mem_cache_lock:
+        values = [result.value for result in cache._mem_cache.values()]
+    return len(values), sum(safe_sizeof(value) for value in values)
+
+
+def _session_states() -> Dict[str, object]:
+    """Session state of every session this server holds (connected, or kept for a reconnect), by session id."""
+    from streamlit.runtime import Runtime
+
+    if not Runtime.exists():
+        return {}
+    return {info.session.id: info.session.session_state
+            for info in Runtime.instance()._session_mgr.list_sessions()}
+
+
+def size_session(state) -> SessionSize:
+    """Deep size of each key of a session's state; raises RuntimeError if the session changed it meanwhile."""
+    from streamlit.runtime.stats import safe_sizeof
+
+    values = state.filtered_state
+    return SessionSize(str(values.get('_report_page', '')),
+                       {str(key): safe_sizeof(value) for key, value in values.items()}, time.time())
+
+
+class MemorySampler(threading.Thread):
+    """Samples the process every ``interval`` seconds; ``summary`` reads the samples."""
+
+    def __init__(self, interval: float = SAMPLE_S):
+        super().__init__(daemon=True, name='memory-sampler')
+        self.interval = interval
+        self.samples = collections.deque(maxlen=HISTORY)  # (time, RSS, figures, sessions, state, cache bytes, s)
+        self.figures = collections.Counter()
+        self.sessions: Dict[str, SessionSize] = {}
+        self.caches: Dict[str, Tuple[int, int]] = {}  # cache: (entries, bytes)
+        self.error: Optional[str] = None
+        self._session_queue = collections.deque()
+        self._cache_queue = collections.deque()
+        self._lock = threading.Lock()
+
+    def run(self):
+        while True:
+            try:
+                self.sample()
+                self.error = None
+            except Exception as exc:  # keep sampling: one failed sample must not end the history
+                self.error = f"{type(exc).__name__}: {exc}"
+            time.sleep(self.interval)
+
+    def sample(self):
+        began = time.perf_counter()
+        states = _session_states()
+        if not self._session_queue:
+            self._session_queue.extend(states)
+        sizes = {}
+        for _ in range(min(SESSIONS_PER_SAMPLE, len(self._session_queue))):
+            session = self._session_queue.popleft()
+            if session in states:
+                try:
+                    sizes[session] = size_session(states[session])
+                except RuntimeError:
+                    # Its script changed the state while it was sized: again next round
+                    self._session_queue.append(session)
+        if not self._cache_queue:
+            self._cache_queue.extend(list(_caches.items()))
+        cache_size = None
+        if self._cache_queue:
+            name, cache = self._cache_queue.popleft()
+            cache_size = (name, _cache_size(cache))
+        figures = open_figures()
+        rss = process_rss()
+        with self._lock:
+            self.sessions = {session: size for session, size in {**self.sessions, **sizes}.items()
+                             if session in states}
+            if cache_size is not None:
+                self.caches[cache_size[0]] = cache_size[1]
+            self.figures = figures
+            self.samples.append((time.time(), rss, sum(figures.values()), len(states),
+                                 sum(size.bytes for size in self.sessions.values()),
+                                 sum(size for _, size in self.caches.values()) + figure_store.size,
+                                 time.perf_counter() - began))
+
+    def cache_rows(self) -> list:
+        """(cache, entries, bytes, hits, misses) of every cache seen, the figure store first."""
+        with _requests_lock:
+            requests = {name: tuple(counts) for name, counts in _requests.items()}
+        with self._lock:
+            caches = dict(self.caches)
+        rows = [(FIGURE_STORE, len(figure_store), figure_store.size, figure_store.hits, figure_store.misses)]
+        for name in sorted(set(requests) | set(caches)):
+            entries, size = caches.get(name, (0, 0))
+            rows.append((name, entries, size, *requests.get(name, (0, 0))))
+        return rows
+
+    def summary(self, now: Optional[float] = None) -> MemorySummary:
+        import pandas as pd
+
+        now = time.time() if now is None else now
+        with self._lock:
+            samples = list(self.samples)
+            sessions = dict(self.sessions)
+            figures = self.figures
+        history = pd.DataFrame(samples, columns=['time', 'RSS (MB)', 'open figures', 'sessions',
+                                                 'session state (MB)', 'caches (MB)', 'seconds'])
+        history['time'] = pd.to_datetime(history['time'], unit='s')
+        for column in ('RSS (MB)', 'session state (MB)', 'caches (MB)'):
+            history[column] = history[column] / 2 ** 20
+        rows = [(session[:8], size.page, size.bytes / 1024,
+                 ', '.join(f"{key} ({value / 1024:,.0f} kB)" for key, value in
+                           sorted(size.keys.items(), key=lambda item: -item[1])[:3]), round(now - size.sized))
+                for session, size in sessions.items()]
+        by_session = pd.DataFrame(rows, columns=['session', 'page', 'state (kB)', 'largest keys', 'sized (s ago)'])
+        pages = (by_session.groupby('page')['state (kB)'].agg(['count', 'mean', 'max'])
+                 .set_axis(['sessions', 'mean (kB)', 'max (kB)'], axis=1).reset_index()
+                 .sort_values('mean (kB)', ascending=False))
+        keys = pd.DataFrame([(key, value / 1024) for size in sessions.values() for key, value in size.keys.items()],
+                            columns=['key', 'kB'])
+        keys = (keys.groupby('key')['kB'].agg(['count', 'sum', 'max'])
+                .set_axis(['sessions', 'total (kB)', 'max (kB)'], axis=1).reset_index()
+                .sort_values('total (kB)', ascending=False))
+        caches = pd.DataFrame(self.cache_rows(), columns=['cache', 'entries', 'size (MB)', 'hits', 'misses'])
+        caches['size (MB)'] = caches['size (MB)'] / 2 ** 20
+        requests = caches['hits'] + caches['misses']
+        caches['hit rate'] = (caches['hits'] / requests.where(requests > 0)).round(3)
+        return MemorySummary(history.drop(columns='seconds'),
+                             by_session.sort_values('state (kB)', ascending=False), pages, keys, caches,
+                             pd.Series(dict(figures.most_common()), dtype='int64'),
+                             float(history['seconds'].mean() * 1000) if len(history) else 0.0, self.error)
+
+
+class MemoryMetrics:
+    """The sampler's latest numbers as Streamlit stats, served at ``/_stcore/metrics``."""
+
+    stats_families = ('experiment_process_rss_bytes', 'experiment_open_figures', 'experiment_session_state_bytes',
+                      'experiment_cache_entries', 'experiment_cache_bytes', 'experiment_cache_requests',
+                      'experiment_memory_sample_microseconds')
+
+    def __init__(self, sampler: MemorySampler):
+        self.sampler = sampler
+
+    def get_stats(self, family_names=None):
+        from streamlit.runtime.stats import CounterStat, GaugeStat
+
+        with self.sampler._lock:
+            last = self.sampler.samples[-1] if self.sampler.samples else (0, process_rss(), 0, 0, 0, 0, 0.0)
+            figures = self.sampler.figures
+            sessions = dict(self.sampler.sessions)
+        caches = self.sampler.cache_rows()
+        stats = {
+            'experiment_process_rss_bytes': [GaugeStat('experiment_process_rss_bytes', last[1], unit='bytes',
+                                                       help="Resident set size of the server process.")],
+            'experiment_open_figures': [GaugeStat('experiment_open_figures', count, {'figure': label},
+                                                  help="Figures pyplot still holds, by label.")
+                                        for label, count in figures.items()],
+            'experiment_session_state_bytes': [
+                GaugeStat('experiment_session_state_bytes', size.bytes, {'session': session, 'page': size.page},
+                          unit='bytes', help="Deep size of a session's state, last sized.")
+                for session, size in sessions.items()],
+            'experiment_cache_entries': [GaugeStat('experiment_cache_entries', entries, {'cache': name},
+                                                   help="Entries of a cache.")
+                                         for name, entries, _, _, _ in caches],
+            'experiment_cache_bytes': [GaugeStat('experiment_cache_bytes', size, {'cache': name}, unit='bytes',
+                                                 help="Deep size of a cache's entries, last sized.")
+                                       for name, _, size, _, _ in caches],
+            'experiment_cache_requests': [
+                CounterStat('experiment_cache_requests', count, {'cache': name, 'result': result},
+                            help="Requests to a cache, by hit or miss.")
+                for name, _, _, hits, misses in caches for result, count in (('hit', hits), ('miss', misses))],
+            'experiment_memory_sample_microseconds': [
+                GaugeStat('experiment_memory_sample_microseconds', int(last[6] * 1e6), unit='microseconds',
+                          help="Time the last memory sample took.")],
+        }
+        return {family: stats[family] for family in family_names or self.stats_families if family in stats}
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def memory_sampler() -> MemorySampler:
+    """The sampler of this process, started (with cache counting and the metrics) on first use."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            from streamlit.runtime import Runtime
+
+            count_cache_requests()
+            _sampler = MemorySampler()
+            _sampler.start()
+            if Runtime.exists():
+                Runtime.instance().stats_mgr.register_provider(MemoryMetrics(_sampler))
+    return _sampler
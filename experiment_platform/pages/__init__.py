@@ -0,0 +1,23 @@
+"""Sidebar pages, imported the first time they are shown."""
+import importlib
+from typing import Callable
+
+from experiment_platform.timing import instrument_page
+
+# (module, render function), in sidebar order
+PAGES = [
+    ("background", "show_background"),
+    ("basic_experiments", "show_basic_experiments"),
+    ("engineering_bacteria", "show_engineering_bacteria"),
+    ("crispr_cas9", "show_crispr_cas9"),
+    ("results_analysis", "show_results_analysis"),
+    ("instructor", "show_instructor_dashboard"),
+    ("memory", "show_memory_profile"),
+]
+
+
+def load_page(index: int) -> Callable[[], None]:
+    module, function = PAGES[index]
+    page = importlib.import_module(f"{__name__}.{module}")
+    instrument_page(page)
+    return getattr(page, function)
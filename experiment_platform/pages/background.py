@@ -0,0 +1,87 @@
+"""Background Introduction page."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from experiment_platform.state import is_kids_mode
+
+
+def show_background():
+    st.header("🎯 Background Introduction")
+    if is_kids_mode():
+        st.info("Hey little scientist! It's story time~ Let's see how tiny molecules help people fight diseases!")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("Hepatocellular Carcinoma Treatment Challenges")
+        st.markdown("""
+        - **Global Incidence**: Sixth most common malignant tumor
+        - **China Statistics**: 390,000 annual deaths
+        - **Treatment Challenges**: 
+          - 70-80% of patients diagnosed at advanced stage
+          - Strong drug resistance limits chemotherapy application
+          - FOLFOX4 regimen objective response rate only 9.1%
+        """)
+
+        # Liver cancer incidence animation
+        fig = go.Figure()
+        cancers = ['Liver Cancer', 'Pancreatic Cancer', 'Leukemia', 'Other Solid Tumors']
+        survival_rates = [16.2, 10.9, 90, 25]
+
+        fig.add_trace(go.Bar(
+            x=cancers,
+            y=survival_rates,
+            marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'],
+            text=survival_rates,
+            textposition='auto',
+        ))
+        fig.update_layout(
+            title="Median Survival Time of ATRA in Different Cancers (months)",
+            yaxis_title="Survival Time (months)",
+            showlegend=False
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        # ATRA mechanism of action dynamic diagram
+        st.subheader("ATRA Mechanism of Action Animation")
+        col_a, col_b, col_c = st.columns(3)
+
+        with col_a:
+            st.markdown("**1. Induce Differentiation**")
+            st.image("images/Tumor Cell.png",
+                     caption="Undifferentiated Tumor Cells")
+
+        with col_b:
+            st.markdown("**2. ATRA Action**")
+            st.image("images/ATRA.png",
+                     caption="ATRA Molecule")
+
+        with col_c:
+            st.markdown("**3. Differentiation Maturation**")
+            st.image("images/Tumor Cell(differentiated).png",
+                     caption="Differentiated Cells")
+
+    with col2:
+        st.subheader("ATRA Treatment Milestones")
+
+        timeline_data = {
+            'Year': [1980, 1990, 2000, 2010, 2020],
+            'Event': ['ATRA Discovery', 'APL Treatment Breakthrough', 'Solid Tumor Research',
+                      'Liver Cancer Clinical Trials', 'Engineered Bacteria Development'],
+            'Importance': [1, 10, 3, 7, 8]
+        }
+
+        # Plain graph_objects keeps plotly.express and pandas off the landing page
+        fig = go.Figure(go.Scatter(
+            x=timeline_data['Year'], y=timeline_data['Importance'],
+            mode='markers+text', text=timeline_data['Event'], textposition='top center',
+            marker=dict(size=timeline_data['Importance'], sizemode='area',
+                        sizeref=2.0 * max(timeline_data['Importance']) / 20 ** 2)
+        ))
+        fig.update_layout(title='ATRA Research Development Timeline', height=500)
+        st.plotly_chart(fig, use_container_width=True)
+
+        st.metric("Acute Promyelocytic Leukemia", "5-Year Survival Rate >90%", "Breakthrough Progress")
+        st.metric("Liver Cancer Combined with FOLFOX4", "Median Survival 16.2 months", "Significant Improvement")
+        st.metric("Engineered Bacteria Production Efficiency", "300% Increase", "Technological Innovation")
@@ -0,0 +1,1043 @@
+"""Basic Laboratory Procedures page and its protocol panels."""
+import io
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from experiment_platform.colonies import IMAGE_SUFFIXES, cfu_per_ug, count_images, count_plate, overlay, synthetic_plate
+from experiment_platform.datasets import upload_digest
+from experiment_platform.gel import analyze_gel, analyze_gels, annotate, synthetic_gel
+from experiment_platform.rendering import load_pyplot
+from experiment_platform.state import is_kids_mode, rerun_panel, sidebar_status
+
+# Photo formats accepted for plates and gels
+IMAGE_TYPES = tuple(suffix.lstrip('.') for suffix in IMAGE_SUFFIXES)
+EXAMPLE_PLATE_COLONIES = 150
+GEL_LANE_LABELS = ('Marker', 'PCR product', 'negative control', 'positive control', 'Sample 1', 'Sample 2')
+# Lanes of the simulated gel after the ladder: (size bp, ng) of each fragment loaded
+EXAMPLE_GEL_LANES = ([(1500, 80)], [], [(1500, 100)], [(1500, 60), (2500, 40)], [(1500, 70)])
+
+
+@st.cache_resource(show_spinner="Counting colonies...", max_entries=32)
+def counted_plate(digest: str, _plate: bytes):
+    """Colony count of a plate photo and the photo with the colonies marked, once per photo."""
+    count = count_plate(_plate)
+    return count, overlay(_plate, count)
+
+
+@st.cache_resource(show_spinner="Counting colonies...")
+def example_plate():
+    """Count and marked photo of the synthetic plate shown before any photo is uploaded."""
+    plate = synthetic_plate(EXAMPLE_PLATE_COLONIES)
+    count = count_plate(plate)
+    return count, overlay(plate, count)
+
+
+@st.cache_resource(show_spinner="Counting colonies...", max_entries=8)
+def plate_counts(digests: tuple, _plates):
+    """Colonies and counting time of every uploaded plate, counted in the process pool."""
+    return count_images(_plates)
+
+
+@st.cache_resource(show_spinner="Analysing gel...", max_entries=32)
+def analyzed_gel(digest: str, ladder_lane: int, _gel: bytes):
+    """Lanes, bands and sizes of a gel photo and the photo with them marked, once per photo and ladder lane."""
+    analysis = analyze_gel(_gel, ladder_lane)
+    return analysis, annotate(_gel, analysis)
+
+
+@st.cache_resource(show_spinner="Analysing gel...")
+def example_gel():
+    """Analysis and marked photo of the simulated gel shown before any photo is uploaded."""
+    gel = synthetic_gel(EXAMPLE_GEL_LANES)
+    analysis = analyze_gel(gel)
+    return analysis, annotate(gel, analysis, GEL_LANE_LABELS)
+
+
+@st.cache_resource(show_spinner="Analysing gels...", max_entries=8)
+def gel_batch(digests: tuple, _gels):
+    """Bands and analysis time of every uploaded gel."""
+    return analyze_gels(_gels)
+
+
+def create_bacterial_growth_animation():
+    """Create bacterial growth animation"""
+    plt = load_pyplot()
+
+    fig, ax = plt.subplots(figsize=(8, 4))
+    x = np.linspace(0, 10, 100)
+
+    def animate(frame):
+        ax.clear()
+        y = 0.001 * np.exp(0.8 * x + frame * 0.1)
+        ax.plot(x, y, 'g-', linewidth=2)
+        ax.set_ylim(0, 1.5)
+        ax.set_xlabel('Time (hours)')
+        ax.set_ylabel('OD600')
+        ax.set_title('Bacterial Growth Curve (Real-time Simulation)')
+        ax.grid(True, alpha=0.3)
+
+        # Add current growth point
+        current_x = min(frame * 0.1, 10)
+        current_y = 0.001 * np.exp(0.8 * current_x)
+        ax.plot(current_x, current_y, 'ro', markersize=8)
+
+        return ax
+
+    return fig, animate
+
+
+def create_pcr_animation():
+    """Create PCR process molecular animation"""
+    plt = load_pyplot()
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    def animate(frame):
+        ax.clear()
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 8)
+        ax.set_title('PCR Amplification Process Molecular Simulation')
+        ax.axis('off')
+
+        # Draw DNA double strand
+        x_dna = np.linspace(1, 9, 100)
+        y_dna1 = 4 + 0.3 * np.sin(2 * np.pi * x_dna)
+        y_dna2 = 4 - 0.3 * np.sin(2 * np.pi * x_dna)
+        ax.plot(x_dna, y_dna1, 'b-', linewidth=2, label='DNA Template')
+        ax.plot(x_dna, y_dna2, 'b-', linewidth=2)
+
+        # Display different stages based on frame number
+        if frame < 10:
+            # Denaturation stage - DNA double strand separation
+            separation = frame * 0.1
+            ax.plot(x_dna, y_dna1 + separation, 'r-', linewidth=2, alpha=0.7)
+            ax.plot(x_dna, y_dna2 - separation, 'r-', linewidth=2, alpha=0.7)
+            ax.text(5, 6, 'Denaturation: 95°C', ha='center', fontsize=12, color='red')
+
+        elif frame < 20:
+            # Annealing stage - primer binding
+            ax.text(5, 6, 'Annealing: 55-65°C', ha='center', fontsize=12, color='orange')
+            # Draw primers
+            for i in range(3):
+                x_primer = 3 + i * 2
+                ax.plot([x_primer, x_primer + 0.5], [4.5, 4.5], 'g-', linewidth=3)
+
+        else:
+            # Extension stage - new strand synthesis
+            ax.text(5, 6, 'Extension: 72°C', ha='center', fontsize=12, color='green')
+            # Draw newly synthesized DNA strand
+            x_new = np.linspace(2, 8, 50)
+            y_new = 5 + 0.2 * np.sin(2 * np.pi * x_new)
+            ax.plot(x_new, y_new, 'm-', linewidth=2, label='Newly Synthesized Strand')
+
+        ax.legend()
+        return ax
+
+    return fig, animate
+
+
+def create_gel_electrophoresis_animation():
+    """Create gel electrophoresis animation"""
+    import matplotlib.patches as patches
+    plt = load_pyplot()
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+
+    def animate(frame):
+        ax.clear()
+
+        # Draw gel
+        gel = patches.Rectangle((1, 1), 8, 4, linewidth=2, edgecolor='black',
+                                facecolor='lightblue', alpha=0.5)
+        ax.add_patch(gel)
+
+        # Draw sample wells
+        wells_x = [2, 3, 4, 5, 6, 7]
+        for x in wells_x:
+            well = patches.Circle((x, 4.5), 0.2, facecolor='white', edgecolor='black')
+            ax.add_patch(well)
+
+        # Display DNA migration based on frame number
+        migration_distance = min(frame * 0.2, 3.5)
+
+        # Draw DNA bands
+        bands_data = [
+            (2, 0.8, 'Marker'), (3, 0.3, 'Sample1'), (4, 0.6, 'Sample2'),
+            (5, 0.9, 'Sample3'), (6, 0.2, 'Negative'), (7, 0.7, 'Positive')
+        ]
+
+        for x, intensity, label in bands_data:
+            band_height = intensity * 0.3
+            band = patches.Rectangle((x - 0.15, 4.5 - migration_distance - band_height / 2),
+                                     0.3, band_height, facecolor='red', alpha=intensity)
+            ax.add_patch(band)
+            ax.text(x, 4.5 - migration_distance - 0.4, label, ha='center', fontsize=8)
+
+        ax.set_xlim(0, 9)
+        ax.set_ylim(0, 6)
+        ax.set_title('Agarose Gel Electrophoresis Simulation')
+        ax.text(4.5, 0.5, f'Electrophoresis Progress: {min(frame * 10, 100):.0f}%', ha='center', fontsize=12)
+
+        return ax
+
+    return fig, animate
+
+
+def show_basic_experiments():
+    st.header("🔬 Basic Laboratory Procedures Simulation")
+    if is_kids_mode():
+        st.info(
+            "Let's get hands-on! These are the most common little steps in the lab, just like preparing ingredients before making a cake~")
+
+    # Experiment selection
+    experiment = st.selectbox(
+        "Select Experiment",
+        ["LB Medium Preparation", "Plasmid Extraction", "PCR Amplification", "Agarose Gel Electrophoresis",
+         "Gel Extraction", "Heat Shock Transformation", "Electrocompetent Cell Preparation"]
+    )
+
+    if experiment == "LB Medium Preparation":
+        simulate_lb_preparation()
+    elif experiment == "Plasmid Extraction":
+        simulate_plasmid_extraction()
+    elif experiment == "PCR Amplification":
+        simulate_pcr()
+    elif experiment == "Agarose Gel Electrophoresis":
+        simulate_gel_electrophoresis()
+    elif experiment == "Gel Extraction":
+        simulate_gel_recovery()
+    elif experiment == "Heat Shock Transformation":
+        simulate_heat_shock()
+    else:
+        simulate_electroporation()
+
+
+@st.fragment
+def simulate_lb_preparation():
+    st.subheader("🧪 LB Medium Preparation")
+
+    # Display experiment materials
+    materials = {
+        "Tryptone": "10g",
+        "Yeast Extract": "5g",
+        "NaCl": "10g",
+        "Agar": "3g/200ml",
+        "Deionized Water": "1000ml"
+    }
+
+    col1, col2, col3 = st.columns([1, 1, 1])
+
+    with col1:
+        st.write("### Materials")
+        for material, amount in materials.items():
+            st.checkbox(f"{material}: {amount}", value=True)
+
+        if st.button("Start Preparation", key="start_lb"):
+            st.session_state.simulator.experiment_data['current_step'] = 1
+            rerun_panel()
+
+    with col2:
+        st.write("### Procedure")
+        steps = [
+            "Accurately weigh each chemical",
+            "Measure 1000ml tap water and add to beaker",
+            "Add chemicals (except agar) and stir to dissolve",
+            "Adjust pH to 7.2-7.6",
+            "Distribute into Erlenmeyer flasks",
+            "Sterilize at 121°C for 30 minutes"
+        ]
+
+        current_step = st.session_state.simulator.experiment_data['current_step']
+        for i, step in enumerate(steps, 1):
+            if i <= current_step:
+                st.success(f"{step}")
+            else:
+                st.info(f"{i}. {step}")
+
+        if current_step > 0 and current_step < len(steps):
+            if st.button("Next Step", key="next_lb_step"):
+                st.session_state.simulator.experiment_data['current_step'] += 1
+                rerun_panel()
+
+    with col3:
+        st.write("### Real-time Monitoring")
+
+        # pH adjustment simulation
+        current_ph = st.session_state.simulator.experiment_data['ph_level']
+
+        fig = go.Figure(go.Indicator(
+            mode="gauge+number+delta",
+            value=current_ph,
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': "pH"},
+            delta={'reference': 7.4},
+            gauge={
+                'axis': {'range': [6.5, 8.5]},
+                'bar': {'color': "darkblue"},
+                'steps': [
+                    {'range': [6.5, 7.2], 'color': "lightgray"},
+                    {'range': [7.2, 7.6], 'color': "lightgreen"},
+                    {'range': [7.6, 8.5], 'color': "lightgray"}],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 7.4}}
+        ))
+        st.plotly_chart(fig, use_container_width=True)
+
+        if st.button("Adjust pH"):
+            status = sidebar_status()
+            with st.spinner("Adjusting pH..."):
+                progress_bar = st.progress(0)
+                for i in range(100):
+                    time.sleep(0.01)
+                    progress_bar.progress(i + 1)
+                # Simulate pH adjustment to ideal range
+                st.session_state.simulator.experiment_data['ph_level'] = 7.4
+                st.session_state.simulator.experiment_data['current_step'] += 1
+                st.success("pH adjusted to 7.4!")
+                rerun_panel(status)
+
+        # Temperature monitoring
+        current_temp = st.session_state.simulator.experiment_data['temperature']
+        if st.session_state.simulator.experiment_data['current_step'] >= 6:
+            st.metric("Sterilization Temperature", "121°C", "High Temperature Sterilization")
+        else:
+            st.metric("Current Temperature", f"{current_temp}°C")
+
+
+@st.fragment
+def simulate_plasmid_extraction():
+    st.subheader("🧬 Plasmid Extraction Experiment")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.write("### Protocol")
+
+        steps = [
+            "Collect bacterial cells (OD600 ≥ 2.0)",
+            "Add Solution I for resuspension",
+            "Add Solution II for lysis",
+            "Add Solution III for neutralization",
+            "Centrifuge and collect supernatant",
+            "Column adsorption purification",
+            "Elute plasmid DNA"
+        ]
+
+        completed_steps = st.session_state.simulator.experiment_data.get('plasmid_steps', 0)
+
+        for i, step in enumerate(steps, 1):
+            if i <= completed_steps:
+                st.success(f"✓ {step}")
+            else:
+                st.info(f"{i}. {step}")
+
+        if completed_steps < len(steps):
+            if st.button("Next Extraction Step"):
+                st.session_state.simulator.experiment_data['plasmid_steps'] = completed_steps + 1
+
+                # Simulate extraction process
+                with st.spinner(f"Executing Step {completed_steps + 1}..."):
+                    progress_bar = st.progress(0)
+                    for i in range(100):
+                        time.sleep(0.02)
+                        progress_bar.progress(i + 1)
+
+                if completed_steps + 1 == len(steps):
+                    # Complete extraction, generate random results
+                    st.session_state.simulator.experiment_data['plasmid_yield'] = np.random.normal(150, 20)
+                    st.success("🎉 Plasmid Extraction Complete!")
+
+                rerun_panel()
+
+    with col2:
+        st.write("### Plasmid Quality Detection")
+
+        if st.session_state.simulator.experiment_data.get('plasmid_steps', 0) >= len(steps):
+            # 鏄剧ず璐ㄧ矑娴撳害缁撴灉
+            concentration = st.session_state.simulator.experiment_data['plasmid_yield']
+            purity_260_280 = np.random.normal(1.8, 0.05)
+
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.metric("Plasmid concentration", f"{concentration:.1f} ng/μl")
+            with col_b:
+                st.metric("A260/A280", f"{purity_260_280:.2f}")
+
+            # 璐ㄧ矑鐢垫吵妯℃嫙
+            st.write("#### Plasmid Electrophoresis Analysis")
+            fig = go.Figure()
+
+            # 鏍囧噯鍒嗗瓙閲�
+            sizes = [10000, 8000, 6000, 5000, 4000, 3000, 2000, 1000, 500]
+            intensities = [0.1, 0.2, 0.15, 0.3, 0.25, 0.4, 0.35, 0.5, 0.2]
+
+            fig.add_trace(go.Scatter(
+                x=sizes, y=intensities,
+                mode='lines',
+                name='DNA Marker',
+                line=dict(color='blue', width=3)
+            ))
+
+            # 鎻愬彇鐨勮川绮� - 妯℃嫙瓒呰灪鏃嬨€佺嚎鎬с€佸紑鐜舰寮�
+            plasmid_forms = [
+                (4500, 0.8, 'supercoiled'),
+                (4500, 0.6, 'linear'),
+                (4500, 0.4, 'open-ring')
+            ]
+
+            for size, intensity, name in plasmid_forms:
+                fig.add_trace(go.Scatter(
+                    x=[size], y=[intensity],
+                    mode='markers+text',
+                    name=name,
+                    marker=dict(size=15, color='red'),
+                    text=name,
+                    textposition='top center'
+                ))
+
+            fig.update_layout(
+                title="Plasmid Electrophoresis Analysis",
+                xaxis_title="Molecular Weight (bp)",
+                yaxis_title="Fluorescence Intensity",
+                xaxis_type="log",
+                showlegend=True
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        else:
+            st.info("Please complete the plasmid extraction steps to view the results.")
+
+
+@st.fragment
+def simulate_pcr():
+    st.subheader("🔁 PCR Amplification Experiment")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.write("### PCR reaction system")
+
+        components = {
+            "10×PCR Buffer": "2 μl",
+            "dNTPs": "2 μl",
+            "Primers": "1 μl each",
+            "DNA template": "1 μl",
+            "DNA polymerase": "0.5 μl",
+            "ddH₂O": "12.5 μl",
+            "Total volume": "20 μl"
+        }
+
+        for component, volume in components.items():
+            st.text_input(component, volume, disabled=True)
+
+        # PCR绋嬪簭璁剧疆
+        st.write("### PCR Program")
+        pcr_program = [
+            ("Pre-denaturation", "95℃", "5 min"),
+            ("Denaturation", "95℃", "45 s"),
+            ("Annealing", "55-65℃", "45 s"),
+            ("Extension", "72℃", "1 min/kb"),
+            ("Final Extension", "72℃", "10 min")
+        ]
+
+        for step, temp, time1 in pcr_program:
+            st.text(f"{step}: {temp} - {time1}")
+
+        cycles = st.slider("Number of cycles", 20, 50, 30)
+        st.session_state.simulator.experiment_data['pcr_cycles'] = cycles
+
+    with col2:
+        st.write("### Real-time amplification curve")
+
+        if st.button("Initiate PCR amplification"):
+            with st.spinner("PCR amplification in progress..."):
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+
+                # 妯℃嫙瀹炴椂鎵╁鏁版嵁
+                cycles_data = []
+                fluorescence_data = []
+
+                placeholder = st.empty()
+                # 寮€濮嬫ā鎷烶CR鎵╁
+                for cycle in range(cycles + 1):
+                    status_text.text(f"The {cycle}th iteration is currently in progress...")
+                    progress_bar.progress(cycle / cycles)
+
+                    # 鐢熸垚鎵╁鏇茬嚎鏁版嵁
+                    if cycle <= 15:
+                        # 鍩虹嚎鏈�
+                        fluorescence = 1 + 0.1 * cycle + np.random.normal(0, 0.05)
+                    elif cycle <= 25:
+                        # 鎸囨暟鏈�
+                        fluorescence = 1 + 2 ** ((cycle - 15) / 3) + np.random.normal(0, 0.1)
+                    else:
+                        # 骞冲彴鏈�
+                        fluorescence = 50 + (cycle - 25) * 0.5 + np.random.normal(0, 0.2)
+
+                    cycles_data.append(cycle)
+                    fluorescence_data.append(fluorescence)
+
+                    # 瀹炴椂鏇存柊鍥捐〃
+                    fig = go.Figure()
+                    fig.add_trace(go.Scatter(
+                        x=cycles_data, y=fluorescence_data,
+                        mode='lines+markers',
+                        name='Fluorescent Signal',
+                        line=dict(color='green', width=3)
+                    ))
+
+                    fig.update_layout(
+                        title="Real-time PCR amplification curve",
+                        xaxis_title="Cycle count",
+                        yaxis_title="Fluorescence Intensity (RFU)",
+                        height=300
+                    )
+
+                    placeholder.plotly_chart(fig, use_container_width=True)
+                    time.sleep(0.5)
+
+                st.session_state.simulator.experiment_data['pcr_product'] = fluorescence_data[-1]
+
+            st.success("PCR amplification complete!")
+
+            # 鏄剧ず鎵╁缁撴灉
+            col_a, col_b = st.columns(2)
+            with col_a:
+                efficiency = np.random.normal(95, 2)
+                st.metric("Amplification efficiency", f"{efficiency:.1f}%")
+            with col_b:
+                concentration = np.random.normal(50, 5)
+                st.metric("Product concentration", f"{concentration:.1f} ng/μl")
+
+            # PCR鍒嗗瓙杩囩▼鍔ㄧ敾
+            st.write("#### PCR Molecular Process Simulation")
+            plt = load_pyplot()
+            fig, animate_func = create_pcr_animation()
+
+            # 鍒涘缓鍔ㄧ敾棰勮
+            frames = 30
+            for i in range(frames):
+                animate_func(i)
+                time.sleep(0.1)
+
+            # The figure's own savefig: pyplot's current figure is shared by every session's script thread
+            buf = io.BytesIO()
+            fig.savefig(buf, format='png', dpi=100)
+            plt.close(fig)
+            buf.seek(0)
+            st.image(buf, caption="Schematic Diagram of the PCR Molecular Process")
+
+
+def simulate_gel_electrophoresis():
+    import plotly.express as px
+
+    st.subheader("🌊 Agarose Gel Electrophoresis")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        electrophoresis_run_panel()
+
+    with col2:
+        st.write("### Analysis of Electrophoresis Results")
+
+        # 鏈€缁堢數娉崇粨鏋�
+        st.write("#### Final Electrophoresis Pattern")
+        uploads = st.file_uploader("Gel photos", type=list(IMAGE_TYPES), accept_multiple_files=True, key="gel_photos")
+        analysis = None
+        if uploads:
+            shown = uploads[0]
+            if len(uploads) > 1:
+                names = [upload.name for upload in uploads]
+                shown = uploads[names.index(st.selectbox("Gel", names, key="gel_photo"))]
+            ladder_lane = st.number_input("Ladder lane", min_value=1, value=1, step=1, key="gel_ladder_lane") - 1
+            try:
+                analysis, marked = analyzed_gel(upload_digest(shown), ladder_lane, shown.getvalue())
+            except OSError:
+                st.error(f"{shown.name} could not be read as an image")
+            except ValueError as exc:
+                st.error(f"{shown.name}: {exc}")
+            else:
+                labels = [f"Lane {lane + 1}" for lane in range(len(analysis.lanes))]
+        else:
+            analysis, marked = example_gel()
+            labels = list(GEL_LANE_LABELS)
+        if analysis is not None:
+            st.image(marked, caption=f"{len(analysis.lanes)} lanes, {len(analysis.bands)} bands sized against the "
+                                     f"1 kb ladder, analysed in {analysis.seconds * 1000:.0f} ms")
+
+            # 鏉″甫鍒嗘瀽
+            st.write("#### Band Intensity Analysis")
+            main = analysis.main_bands()
+            strongest = main['volume'].max() if len(main) and main['volume'].max() > 0 else 1.0
+            fig_bar = px.bar(x=labels, y=main['volume'] / strongest,
+                             title='Band Intensity by Lane',
+                             labels={'x': 'Sample', 'y': 'Relative Intensity'},
+                             hover_data={'Main band (bp)': main['size_bp'].to_numpy()})
+            st.plotly_chart(fig_bar, use_container_width=True)
+            samples = analysis.bands[analysis.bands['lane'] != analysis.ladder_lane]
+            samples = samples.assign(Lane=[labels[lane] for lane in samples['lane']],
+                                     relative=samples['volume'] / strongest)
+            st.dataframe(samples[['Lane', 'size_bp', 'migration', 'volume', 'relative']], hide_index=True,
+                         column_config={'size_bp': st.column_config.NumberColumn("Size (bp)", format="%d"),
+                                        'migration': st.column_config.NumberColumn("Migration (px)"),
+                                        'volume': st.column_config.NumberColumn("Volume", format="%.0f"),
+                                        'relative': st.column_config.NumberColumn("Relative", format="%.2f")})
+        if uploads and len(uploads) > 1:
+            batch = gel_batch(tuple(upload_digest(upload) for upload in uploads),
+                              [(upload.name, upload.getvalue()) for upload in uploads])
+            summary = batch.groupby('gel', sort=False).agg(bands=('lane', 'count'), seconds=('seconds', 'first'),
+                                                           error=('error', 'first'))
+            st.dataframe(summary.assign(ms=summary['seconds'] * 1000)[['bands', 'ms', 'error']],
+                         column_config={'ms': st.column_config.NumberColumn(format="%.0f")})
+
+
+@st.fragment
+def electrophoresis_run_panel():
+    st.write("### Gel Preparation")
+
+    gel_conc = st.slider("Agarose concentration(%)", 0.5, 3.0, 1.0, 0.1)
+    voltage = st.slider("Electrophoresis voltage(V)", 50, 150, 110)
+    run_time = st.slider("Electrophoresis time(min)", 10, 60, 30)
+
+    if st.button("Start electrophoresis"):
+        with st.spinner("Electrophoresis in progress..."):
+            progress_bar = st.progress(0)
+
+            # 鍒涘缓鐢垫吵鍔ㄧ敾
+            plt = load_pyplot()
+            fig, animate_func = create_gel_electrophoresis_animation()
+            placeholder = st.empty()
+
+            for i in range(run_time + 1):
+                progress = i / run_time
+                progress_bar.progress(progress)
+
+                # 鏇存柊鍔ㄧ敾
+                animate_func(int(i * 30 / run_time))  # 缂╂斁甯ф暟
+                buf = io.BytesIO()
+                fig.savefig(buf, format='png', dpi=100)
+                buf.seek(0)
+                placeholder.image(buf, caption=f"Electrophoresis Progress: {progress * 100:.0f}%")
+
+                time.sleep(0.1)
+            plt.close(fig)
+
+            st.success("Electrophoresis complete!")
+
+
+@st.fragment
+def simulate_gel_recovery():
+    st.subheader("🔍 DNA Gel Recovery Experiment")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("### Experimental Procedure")
+
+        steps = [
+            "Excise target DNA band",
+            "Weigh gel fragment",
+            "Add binding solution",
+            "Incubate at 50-60°C for dissolution",
+            "Transfer to recovery column",
+            "Centrifuge to adsorb DNA",
+            "Wash to remove impurities",
+            "Elute purified DNA"
+        ]
+
+        current_step = st.session_state.simulator.experiment_data.get('gel_recovery_step', 0)
+
+        for i, step in enumerate(steps, 1):
+            if i <= current_step:
+                st.success(f"✓ {step}")
+            else:
+                st.info(f"{i}. {step}")
+
+        if st.button("Next Step") and current_step < len(steps):
+            with st.spinner(f"Executing step {current_step + 1}..."):
+                time.sleep(2)
+                st.session_state.simulator.experiment_data['gel_recovery_step'] = current_step + 1
+            rerun_panel()
+
+    with col2:
+        st.write("### Gel Recovery Efficiency Monitoring")
+
+        current_step = st.session_state.simulator.experiment_data.get('gel_recovery_step', 0)
+
+        # DNA recovery efficiency simulation
+        if current_step >= len(steps):
+            st.success("🎉 Gel recovery complete!")
+
+            # Display recovery results
+            recovery_efficiency = np.random.normal(75, 5)
+            dna_concentration = np.random.normal(45, 3)
+
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.metric("Recovery Efficiency", f"{recovery_efficiency:.1f}%")
+            with col_b:
+                st.metric("DNA Concentration", f"{dna_concentration:.1f} ng/μl")
+
+            # Purity detection
+            purity_260_280 = np.random.normal(1.8, 0.05)
+            st.metric("A260/A280 Ratio", f"{purity_260_280:.2f}")
+
+            # Recovered product quality verification
+            st.write("#### Recovered Product Validation")
+            fig = go.Figure()
+
+            # Original PCR product vs recovered product
+            samples = ['Original PCR Product', 'Gel-recovered Product']
+            concentrations = [80, dna_concentration]
+            purities = [1.75, purity_260_280]
+
+            fig.add_trace(go.Bar(name='Concentration (ng/μl)', x=samples, y=concentrations,
+                                 marker_color='lightblue'))
+            fig.add_trace(go.Scatter(name='A260/A280 Ratio', x=samples, y=purities,
+                                     yaxis='y2', marker=dict(size=10, color='red')))
+
+            fig.update_layout(
+                title='Comparison Before and After Gel Recovery',
+                yaxis=dict(title='Concentration (ng/μl)'),
+                yaxis2=dict(title='A260/A280 Ratio', overlaying='y', side='right'),
+                showlegend=True
+            )
+
+            st.plotly_chart(fig, use_container_width=True)
+
+        else:
+            # Gel dissolution process visualization
+            st.write("#### Gel Dissolution Status")
+            dissolution_progress = min(current_step / len(steps), 1.0)
+
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number+delta",
+                value=dissolution_progress * 100,
+                number={'font': {'size': 48, 'color': '#1E90FF', 'family': 'Arial Black'}},
+                delta={'reference': 100, 'increasing': {'color': '#00C851'}, 'decreasing': {'color': '#ff4444'}},
+                domain={'x': [0, 1], 'y': [0, 1]},
+                title={'text': "Dissolution Progress"},
+                gauge={
+                    'axis': {'range': [0, 100], 'tickwidth': 2, 'tickcolor': '#1E90FF',
+                             'tickfont': {'color': '#37474f'}},
+                    'bar': {'color': 'rgba(30,144,255,0.8)', 'thickness': 0.25},
+                    'bgcolor': 'rgba(240,248,255,0.5)',
+                    'borderwidth': 3,
+                    'bordercolor': '#1E90FF',
+                    'steps': [
+                        {'range': [0, 30], 'color': '#ffebee'},
+                        {'range': [30, 70], 'color': '#fff9c4'},
+                        {'range': [70, 100], 'color': '#e8f5e9'}],
+                    'threshold': {'line': {'color': '#0d47a1', 'width': 6}, 'thickness': 0.8,
+                                  'value': dissolution_progress * 100},
+
+                }
+            ))
+            fig.update_layout(
+                paper_bgcolor='rgba(255,255,255,0)',
+                font={'color': '#0d47a1', 'family': 'Microsoft YaHei'},
+                margin=dict(l=30, r=30, t=60, b=20),
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def simulate_heat_shock():
+    st.subheader("🔥 Heat Shock Transformation Experiment")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("### Experimental Protocol")
+
+        steps = [
+            "Prepare competent cells",
+            "Ice bath for 30 minutes",
+            "Add plasmid DNA",
+            "Ice bath for 30 minutes",
+            "Heat shock at 42°C for 90 seconds",
+            "Rapid ice bath for 2-3 minutes",
+            "Add LB medium for recovery",
+            "Plate on selective media"
+        ]
+
+        current_step = st.session_state.simulator.experiment_data.get('heat_shock_step', 0)
+
+        for i, step in enumerate(steps, 1):
+            if i <= current_step:
+                st.success(f"✓ {step}")
+            else:
+                st.info(f"{i}. {step}")
+
+        if current_step < len(steps):
+            if st.button("Execute Next Step"):
+                status = sidebar_status()
+                # 鐗规畩澶勭悊鐑縺姝ラ
+                if current_step == 4:  # 鐑縺鍓�
+                    st.session_state.simulator.experiment_data['temperature'] = 0
+                elif current_step == 5:  # 鐑縺
+                    st.session_state.simulator.experiment_data['temperature'] = 42
+                elif current_step == 6:  # 鍐版荡
+                    st.session_state.simulator.experiment_data['temperature'] = 0
+
+                with st.spinner(f"Executing step {current_step + 1}..."):
+                    time.sleep(2)
+                    st.session_state.simulator.experiment_data['heat_shock_step'] = current_step + 1
+                rerun_panel(status)
+
+    with col2:
+        st.write("### Real-time Monitoring")
+
+        current_step = st.session_state.simulator.experiment_data.get('heat_shock_step', 0)
+        current_temp = st.session_state.simulator.experiment_data.get('temperature', 0)
+
+        # 娓╁害鏄剧ず
+        fig = go.Figure(go.Indicator(
+            mode="gauge+number",
+            value=current_temp,
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': "Temperature (°C)"},
+            gauge={
+                'axis': {'range': [0, 50]},
+                'bar': {'color': "red" if current_temp > 40 else "blue"},
+                'steps': [
+                    {'range': [0, 4], 'color': "lightblue"},
+                    {'range': [4, 37], 'color': "lightgreen"},
+                    {'range': [37, 50], 'color': "lightcoral"}],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 42}
+            }
+        ))
+        st.plotly_chart(fig, use_container_width=True)
+
+        # 杞寲鏁堢巼璁＄畻
+        if current_step >= len(steps):
+            st.success("✅ Heat shock transformation complete!")
+
+            # Colonies counted on the photographed plate, or on the example plate before any is uploaded
+            uploads = st.file_uploader("Plate photos", type=list(IMAGE_TYPES), accept_multiple_files=True,
+                                       key="heat_shock_plates")
+            col_dna, col_plated = st.columns(2)
+            with col_dna:
+                dna_ug = st.number_input("Plasmid DNA (µg)", min_value=0.001, value=0.1, step=0.05, format="%.3f",
+                                         key="heat_shock_dna")
+            with col_plated:
+                plated = st.number_input("Recovery plated (%)", min_value=1.0, max_value=100.0, value=100.0,
+                                         step=5.0, key="heat_shock_plated")
+            count = None
+            if uploads:
+                shown = uploads[0]
+                if len(uploads) > 1:
+                    names = [upload.name for upload in uploads]
+                    shown = uploads[names.index(st.selectbox("Plate", names, key="heat_shock_plate"))]
+                try:
+                    count, marked = counted_plate(upload_digest(shown), shown.getvalue())
+                except OSError:
+                    st.error(f"{shown.name} could not be read as an image")
+            else:
+                count, marked = example_plate()
+            if count is not None:
+                colonies = count.colonies
+                efficiency = cfu_per_ug(colonies, dna_ug, plated / 100)
+
+                st.image(marked, caption=f"{colonies} colonies ({count.split} split from touching "
+                                         f"neighbours), counted in {count.seconds * 1000:.0f} ms")
+                col_a, col_b = st.columns(2)
+                with col_a:
+                    st.metric("Transformant Count: ", f"{colonies}")
+                with col_b:
+                    st.metric("Transformation Efficiency: ", f"{efficiency:,.0f} CFU/μg")
+            if uploads and len(uploads) > 1:
+                counts = plate_counts(tuple(upload_digest(upload) for upload in uploads),
+                                      [(upload.name, upload.getvalue()) for upload in uploads])
+                counts = counts.assign(**{'CFU/µg': cfu_per_ug(counts['colonies'], dna_ug, plated / 100),
+                                          'ms': counts['seconds'] * 1000})
+                st.dataframe(counts[['file', 'colonies', 'split', 'CFU/µg', 'ms', 'error']], hide_index=True,
+                             column_config={'CFU/µg': st.column_config.NumberColumn(format="%.0f"),
+                                            'ms': st.column_config.NumberColumn(format="%.0f")})
+
+            # 闃虫€у厠闅嗛獙璇�
+            positive_rate = np.random.normal(85, 5)
+            st.metric("Positive Clone Rate", f"{positive_rate:.1f}%")
+
+            if count is not None:
+                # 鑿岃惤鐢熼暱妯℃嫙
+                st.write("#### Transformant Growth Status")
+                time_points = np.linspace(0, 16, 100)
+                growth_curve = colonies * (1 - np.exp(-0.3 * time_points))
+
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=time_points, y=growth_curve,
+                    mode='lines',
+                    name='Colony growth',
+                    line=dict(color='green', width=3)
+                ))
+                fig.update_layout(
+                    title='Transformant Overnight Growth Curve',
+                    xaxis_title='Time (hours)',
+                    yaxis_title='Colony Count'
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+
+def simulate_electroporation():
+    st.subheader("⚡ Electrocompetent Cell Preparation and Transformation")
+
+    tab1, tab2 = st.tabs(["Electrocompetent Cell Preparation", "Electroporation Transformation"])
+
+    with tab1:
+        electrocompetent_preparation_panel()
+
+    with tab2:
+        electroporation_transformation_panel()
+
+
+@st.fragment
+def electrocompetent_preparation_panel():
+    st.write("### Electrocompetent Cell Preparation")
+
+    preparation_steps = [
+        "Inoculate single colony on LB medium",
+        "Incubate at 37°C for overnight culture",
+        "Transfer to fresh medium",
+        "Grow to OD600=0.5",
+        "Cool on ice for 15 minutes",
+        "Centrifuge to collect cells",
+        "Pre-cool 10% glycerol wash",
+        "Store at -80°C"
+    ]
+
+    prep_step = st.session_state.simulator.experiment_data.get('prep_step', 0)
+
+    for i, step in enumerate(preparation_steps, 1):
+        if i <= prep_step:
+            st.success(f"✓ {step}")
+        else:
+            st.info(f"{i}. {step}")
+
+    if prep_step < len(preparation_steps):
+        if st.button("Execute Preparation Step"):
+            status = sidebar_status()
+            with st.spinner(f"Executing step {prep_step + 1}..."):
+                time.sleep(2)
+                st.session_state.simulator.experiment_data['prep_step'] = prep_step + 1
+
+                # 鏇存柊缁嗚弻OD鍊�
+                if prep_step + 1 == 4:  # 鍩瑰吇鑷砄D600=0.5
+                    st.session_state.simulator.experiment_data['bacterial_od'] = 0.5
+
+            rerun_panel(status)
+
+    # 缁嗚弻鐢熼暱鏇茬嚎
+    if prep_step >= 2:
+        st.write("#### Bacterial Growth Monitoring")
+
+        # 鍒涘缓鐢熼暱鏇茬嚎鍔ㄧ敾
+        plt = load_pyplot()
+        fig, animate_func = create_bacterial_growth_animation()
+
+        # 鏄剧ず褰撳墠鐢熼暱鐘舵€�
+        animate_func(min(prep_step * 5, 30))  # 鏍规嵁姝ラ鏄剧ず鐩稿簲鐢熼暱闃舵
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=100)
+        plt.close(fig)
+        buf.seek(0)
+        st.image(buf, caption="Bacterial Growth Curve")
+
+        current_od = st.session_state.simulator.experiment_data.get('bacterial_od', 0)
+        st.metric("Current OD600", f"{current_od:.3f}")
+
+
+@st.fragment
+def electroporation_transformation_panel():
+    import plotly.express as px
+    import pandas as pd
+
+    st.write("### Electroporation Transformation")
+
+    electro_steps = [
+        "Melt electrocompetent cells",
+        "Add DNA sample",
+        "Ice bath for 10 minutes",
+        "Transfer to electroporation cuvette",
+        "Set electroporation parameters",
+        "Perform electroporation",
+        "Quickly add recovery medium",
+        "Incubate at 37°C for 1-2 hours",
+        "Plate on selective media"
+    ]
+
+    electro_step = st.session_state.simulator.experiment_data.get('electro_step', 0)
+
+    for i, step in enumerate(electro_steps, 1):
+        if i <= electro_step:
+            st.success(f"✓ {step}")
+        else:
+            st.info(f"{i}. {step}")
+
+    # 鐢靛嚮鍙傛暟璁剧疆
+    if electro_step >= 4 and electro_step <= 6:
+        st.write("#### Electroporation Parameters")
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            voltage = st.slider("Voltage (kV)", 1.0, 3.0, 2.5, 0.1)
+        with col_b:
+            capacitance = st.slider("Capacitance (μF)", 10, 50, 25)
+        with col_c:
+            resistance = st.slider("Resistance (Ω)", 100, 400, 200)
+
+    if electro_step < len(electro_steps):
+        if st.button("Execute Next Transformation Step"):
+            # 鐗规畩澶勭悊鐢靛嚮姝ラ
+            if electro_step == 5:  # 鐢靛嚮
+                with st.spinner("Performing electroporation..."):
+                    progress_bar = st.progress(0)
+                    for i in range(100):
+                        time.sleep(0.01)
+                        progress_bar.progress(i + 1)
+                    st.success("⚡ Electroporation completed!")
+
+            st.session_state.simulator.experiment_data['electro_step'] = electro_step + 1
+            rerun_panel()
+
+    # 杞寲缁撴灉灞曠ず
+    if electro_step >= len(electro_steps):
+        st.success("🎉 Electroporation experiment completed!")
+
+        # 妯℃嫙鐢靛嚮杞寲鏁堢巼
+        colonies_electro = np.random.poisson(5000)  # 鐢靛嚮杞寲鏁堢巼鏇撮珮
+        efficiency_electro = colonies_electro / 0.01  # 鍋囪浣跨敤0.01渭g DNA
+
+        col_x, col_y = st.columns(2)
+        with col_x:
+            st.metric("Electroporation Transformant Count", f"{colonies_electro:,}")
+        with col_y:
+            st.metric("Electroporation Efficiency", f"{efficiency_electro:,.0f} CFU/μg")
+
+        # 涓庣儹婵€杞寲瀵规瘮
+        st.write("#### Transformation Method Comparison")
+        methods = ['Heat Shock Transformation', 'Electroporation Transformation']
+        heat_shock_colonies = np.random.poisson(150)
+        heat_shock_efficiency = heat_shock_colonies / 0.1
+
+        comparison_data = {
+            'Methods': methods * 2,
+            'Types': ['Number of Conversion Subunits'] * 2 + ['Conversion Efficiency'] * 2,
+            'Value': [heat_shock_colonies, colonies_electro,
+                      heat_shock_efficiency, efficiency_electro]
+        }
+
+        df = pd.DataFrame(comparison_data)
+        fig = px.bar(df, x='Methods', y='Value', color='Types', barmode='group',
+                     title='Efficiency Comparison of Different Conversion Methods')
+        st.plotly_chart(fig, use_container_width=True)
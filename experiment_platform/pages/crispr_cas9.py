@@ -0,0 +1,157 @@
+"""CRISPR-Cas9 Gene Integration page."""
+import time
+
+import numpy as np
+import streamlit as st
+
+from experiment_platform.rendering import load_pyplot
+from experiment_platform.state import is_kids_mode, rerun_panel
+
+
+def show_crispr_cas9():
+    import matplotlib.patches as patches
+    plt = load_pyplot()
+
+    st.header("⚡ CRISPR-Cas9 Gene Integration System")
+    if is_kids_mode():
+        st.info(
+            "CRISPR is like a super-precise pair of scissors that helps us 'cut and paste' on DNA! It's like editing a recipe to make something even more delicious!")
+
+    st.write("### sgRNA Design and Validation")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        sgrna_design_panel()
+
+    with col2:
+        st.write("**CRISPR-Cas9 Working Principle**")
+
+        # 鍒涘缓CRISPR宸ヤ綔鍘熺悊鍔ㄧ敾
+        fig, ax = plt.subplots(figsize=(8, 6))
+
+        # 缁樺埗DNA
+        x_dna = np.linspace(1, 7, 100)
+        y_dna = 5 + 0.2 * np.sin(2 * np.pi * x_dna)
+        ax.plot(x_dna, y_dna, 'b-', linewidth=3, label='Target DNA')
+
+        # 缁樺埗Cas9铔嬬櫧
+        cas9_x, cas9_y = 4, 6
+        cas9 = patches.Circle((cas9_x, cas9_y), 0.3, facecolor='orange', alpha=0.8)
+        ax.add_patch(cas9)
+        ax.text(cas9_x, cas9_y, 'Cas9', ha='center', va='center', fontsize=10)
+
+        # 缁樺埗sgRNA
+        ax.plot([cas9_x, 4.5], [cas9_y, 5.2], 'g-', linewidth=2)
+        ax.text(4.7, 5.0, 'sgRNA', fontsize=10, color='green')
+
+        # 缁樺埗鍒囧壊浣嶇偣
+        ax.plot([4.5, 4.5], [4.8, 5.2], 'r--', linewidth=2, label='Cleavage Site')
+
+        ax.set_xlim(0, 8)
+        ax.set_ylim(4, 7)
+        ax.set_title('CRISPR-Cas9 Gene Editing Principle')
+        ax.legend()
+        ax.axis('off')
+
+        st.pyplot(fig)
+
+    # 铻嶅悎PCR妯℃嫙
+    fusion_pcr_panel()
+
+
+@st.fragment
+def sgrna_design_panel():
+    st.write("**sgRNA Sequence Design**")
+    target_sequence = st.text_input("Target Sequence (20bp)", "cgtagagtgggaacacgtcg")
+    pam_sequence = st.text_input("PAM Sequence", "CGG", disabled=True)
+
+    if st.button("Validate sgRNA Design"):
+        if len(target_sequence) == 20:
+            # 璁＄畻sgRNA鐗规€�
+            gc_content = (target_sequence.count('G') + target_sequence.count('C')) / 20 * 100
+            off_target_score = np.random.normal(0.85, 0.05)
+
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.metric("GC Content", f"{gc_content:.1f}%")
+            with col_b:
+                st.metric("Off-target Prediction Score", f"{off_target_score:.2f}")
+
+            if gc_content >= 40 and gc_content <= 60:
+                st.success("✅ sgRNA Design Excellent")
+            else:
+                st.warning("⚠️ GC Content not in ideal range (40-60%)")
+        else:
+            st.error("❌ sgRNA Length must be 20bp")
+
+
+@st.fragment
+def fusion_pcr_panel():
+    import plotly.express as px
+    import pandas as pd
+
+    st.write("### Donor Fragment Construction - Fusion PCR")
+
+    pcr_steps = [
+        "First Round PCR: Amplify Upstream Homology Arm",
+        "Second Round PCR: Amplify Downstream Homology Arm",
+        "Third Round PCR: Amplify Selection Marker",
+        "Overlap Extension PCR: Fragment Fusion",
+        "Gel Extraction and Purification of Donor Fragment"
+    ]
+
+    current_pcr_step = st.session_state.simulator.experiment_data.get('fusion_pcr_step', 0)
+
+    for i, step in enumerate(pcr_steps, 1):
+        if i <= current_pcr_step:
+            st.success(f"✓ {step}")
+        else:
+            st.info(f"{i}. {step}")
+
+    if current_pcr_step < len(pcr_steps):
+        if st.button("Execute Next PCR"):
+            with st.spinner(f"Executing {pcr_steps[current_pcr_step]}..."):
+                time.sleep(2)
+                st.session_state.simulator.experiment_data['fusion_pcr_step'] = current_pcr_step + 1
+            rerun_panel()
+
+    # 鐢靛嚮杞寲妯℃嫙
+    if current_pcr_step >= len(pcr_steps):
+        st.write("### Electroporation Transformation and Screening")
+
+        if st.button("Execute Electroporation Transformation"):
+            with st.spinner("Electroporation transformation in progress..."):
+                steps = [
+                    "Prepare Electrocompetent Cells",
+                    "Mix Donor Fragment with sgRNA Plasmid",
+                    "Ice bath for 10 minutes",
+                    "Electroporation Transformation (2.5kV, 5ms)",
+                    "Recovery Culture for 1 Hour",
+                    "Spread Double Antibiotic Plate",
+                    "Incubate at 37°C for Overnight Culture"
+                ]
+
+                progress_bar = st.progress(0)
+                for i, step in enumerate(steps):
+                    st.write(f"⚡ {step}")
+                    progress_bar.progress((i + 1) / len(steps))
+                    time.sleep(1)
+
+                st.success("🎉 Electroporation transformation completed! Starting to screen positive clones...")
+
+        # 绛涢€夌粨鏋�
+        st.write("#### Positive Clone Screening Results")
+
+        screening_data = {
+            'Screening Round': ['First Round', 'Second Round', 'Third Round'],
+            'Total Clone Count': [156, 89, 45],
+            'Positive Clone Count': [23, 15, 12],
+            'Positive Rate %': [14.7, 16.9, 26.7]
+        }
+
+        df = pd.DataFrame(screening_data)
+
+        fig = px.line(df, x='Screening Round', y='Positive Rate %',
+                      title='Positive Clone Screening Efficiency', markers=True)
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,361 @@
+"""Engineered Bacteria Construction page."""
+from pathlib import Path
+
+import streamlit as st
+
+from experiment_platform.assembly import AssemblyError, Fragment, assemble, assemble_example, pet21a
+from experiment_platform.datasets import upload_digest
+from experiment_platform.digest import catalog, digest, plan_digests
+from experiment_platform.gel import analyze_gel, annotate, synthetic_gel
+from experiment_platform.pcr import MAX_MISMATCHES, MAX_PRODUCT, gel_lanes, integration_example
+from experiment_platform.plasmid import (EXAMPLE_CONSTRUCTS, FEATURE_SUFFIXES, INSERT_SPACER, SEQUENCE_SUFFIXES,
+                                         example_plasmids, read_records, render_svg)
+from experiment_platform.primers import design_primers, homology_tails
+from experiment_platform.rendering import load_pyplot
+from experiment_platform.state import is_kids_mode
+
+SEQUENCE_TYPES = tuple(suffix.lstrip('.') for suffix in SEQUENCE_SUFFIXES)
+PLASMID_TYPES = SEQUENCE_TYPES + tuple(suffix.lstrip('.') for suffix in FEATURE_SUFFIXES)
+
+
+@st.cache_resource(show_spinner="Drawing plasmid maps...", max_entries=32)
+def plasmid_maps(digest: str, features_digest: str, filename: str, _file, _features=None):
+    """Map (SVG) and feature table of every record of a sequence file, once per file and feature table."""
+    return [(plasmid.name, render_svg(plasmid), plasmid.feature_table())
+            for plasmid in read_records(_file, _features, sequence=False, filename=filename)]
+
+
+@st.cache_resource(show_spinner="Drawing plasmid maps...")
+def example_maps():
+    """Maps of the page's own constructs, shown with or without uploads."""
+    return [(plasmid.name, render_svg(plasmid), plasmid.feature_table()) for plasmid in example_plasmids()]
+
+
+@st.cache_resource(show_spinner="Assembling fragments...")
+def example_assembly(construct: str):
+    """Simulated Gibson assembly of one of the page's constructs from its stand-in fragments."""
+    return assemble_example(construct)
+
+
+@st.cache_resource(show_spinner="Assembling fragments...", max_entries=16)
+def uploaded_assembly(digest: str, filename: str, _file):
+    """Assembly of the records of an uploaded file: the linearized backbone first, then the inserts."""
+    fragments = [Fragment(record.name, record.sequence, record.features)
+                 for record in read_records(_file, filename=filename)]
+    if len(fragments) < 2:
+        raise AssemblyError("the file needs a backbone and at least one insert")
+    return assemble(fragments[0], fragments[1:], Path(filename).stem)
+
+
+@st.cache_resource(show_spinner="Planning diagnostic digests...")
+def digest_plan(construct: str):
+    """Diagnostic digests of a page construct, ranked against the empty pET-21a(+)."""
+    return plan_digests(example_assembly(construct).plasmid, pet21a())
+
+
+@st.cache_resource(show_spinner="Running the digest...", max_entries=64)
+def virtual_digest(construct: str, enzymes: tuple):
+    """Annotated virtual gel (ladder, construct, empty vector) and fragment table of one digest."""
+    digests = [digest(example_assembly(construct).plasmid, enzymes), digest(pet21a(), enzymes)]
+    gel = synthetic_gel([d.lane() for d in digests])
+    image = annotate(gel, analyze_gel(gel), ['Ladder', 'Construct', 'pET-21a(+)'])
+    return image, digests[0].fragments
+
+
+@st.cache_resource(show_spinner="Designing primers...")
+def amplification_primers(construct: str):
+    """Ranked primer pairs, with the Gibson homology tails, for every gene of a page construct, and their gel."""
+    plasmid = example_assembly(construct).plasmid
+    designs = {}
+    for gene, _ in EXAMPLE_CONSTRUCTS[construct]:
+        feature = next(f for f in plasmid.features if f.name == gene)
+        # Each gene is amplified with its RBS and spacer, just upstream of the ORF on its own strand
+        start, end = ((feature.start, feature.end + INSERT_SPACER) if feature.strand < 0
+                      else (feature.start - INSERT_SPACER, feature.end))
+        template, forward_tail, reverse_tail = homology_tails(plasmid.sequence, start, end, feature.strand)
+        designs[gene] = design_primers(template, tails=(forward_tail, reverse_tail))
+    lanes = [[(int(pairs.loc[0, 'product']), 100.0)] if len(pairs) else [] for pairs in designs.values()]
+    gel = synthetic_gel(lanes)
+    image = annotate(gel, analyze_gel(gel), ['Ladder'] + list(designs))
+    return designs, image
+
+
+@st.cache_resource(show_spinner="Indexing the genome...")
+def integration_templates():
+    """The stand-in genome and its integrant, indexed once, and the colony PCR primers flanking the cassette."""
+    return integration_example()
+
+
+@st.cache_resource(show_spinner="Running the PCR...", max_entries=64)
+def colony_pcr(forward: str, reverse: str, max_product: int, max_mismatches: int):
+    """Annotated virtual gel of the colony PCR of wild-type and transgenic colonies, and its predicted products."""
+    index, _ = integration_templates()
+    amplicons = index.amplicons({'F': forward, 'R': reverse}, max_product, max_mismatches)
+    wild_type, integrant = gel_lanes(amplicons, [t.name for t in index.templates])
+    # A negative control without template (next to the ladder: empty lanes count between lanes with bands),
+    # the wild type and three transgenic colonies
+    gel = synthetic_gel([[], wild_type, integrant, integrant, integrant])
+    image = annotate(gel, analyze_gel(gel), ['Ladder', 'No DNA', 'Wild-type', 'Clone 1', 'Clone 2', 'Clone 3'])
+    return image, amplicons
+
+
+def show_engineering_bacteria():
+    import plotly.express as px
+    import pandas as pd
+    plt = load_pyplot()
+
+    st.header("🧫 Engineering Bacteria Construction Experiment")
+    if is_kids_mode():
+        st.info(
+            "Let's build super bacteria together! We'll put the best genes together like building blocks to make tiny factories that create amazing things! ✓")
+
+    tab1, tab2, tab3 = st.tabs(
+        ["Downstream Plasmid Construction", "Upstream Plasmid Construction", "Gene Integration Validation"])
+
+    with tab1:
+        st.subheader("21a-raldh-IIdR-blh Plasmid Construction")
+
+        # 瀹為獙姒傝堪
+        st.markdown("""
+        **Experimental Objective**: Construct a recombinant plasmid containing the raldh, IIdR, and blh genes
+        - **raldh**: Retinal aldehyde dehydrogenase gene
+        - **IIdR**: Transcription regulatory factor   
+        - **blh**: β-carotene hydroxylase gene
+        """)
+
+        # 鍩哄洜鐗囨鎵╁
+        st.write("### Gene Fragment Amplification Validation")
+        amplification_panel('21a-raldh-IIdR-blh')
+
+        # 鍚屾簮閲嶇粍妯℃嫙
+        st.write("### Homologous Recombination Construction")
+
+        homologous_recombination_panel()
+
+        # 璐ㄧ矑鍥捐氨
+        st.write("### Recombinant Plasmid Map")
+        plasmid_map_panel()
+
+    with tab2:
+        st.subheader("21a-crtEBIY Plasmid Construction")
+
+        st.markdown("""
+        **Experimental Objectives**: Construct a recombinant plasmid containing the crTE, crTB, crTI, and crY gene clusters.
+        - **crtE**: Bovine Calcium-Manganese Pyrophosphate Synthase
+        - **crtB**: Octahydrolycopene synthase
+        - **crtI**: Octahydrolycopene dehydrogenase
+        - **crtY**: Lycopene Cyclase
+        """)
+
+        st.write("### crtEBIY Gene Cluster Amplification")
+
+        # 鍩哄洜绨囩粨鏋勫彲瑙嗗寲
+        fig, ax = plt.subplots(figsize=(12, 3))
+
+        genes = [
+            (0, 2, 'crtE', '#FF6B6B'),
+            (2.2, 4, 'crtB', '#4ECDC4'),
+            (4.2, 6, 'crtI', '#45B7D1'),
+            (6.2, 8, 'crtY', '#96CEB4')
+        ]
+
+        for start, end, name, color in genes:
+            ax.barh(0, end - start, left=start, height=0.6, color=color, alpha=0.8)
+            ax.text((start + end) / 2, 0, name, ha='center', va='center',
+                    fontsize=12, weight='bold')
+
+        ax.set_xlim(0, 8)
+        ax.set_ylim(-1, 1)
+        ax.set_xlabel('Gene Position (kb)')
+        ax.set_title('crtEBIY Gene Cluster Structure')
+        ax.axis('off')
+
+        st.pyplot(fig)
+
+        # 鏋勫缓杩囩▼妯℃嫙
+        crtebiy_construction_panel()
+
+    with tab3:
+        st.subheader("Gene Integration Validation")
+
+        st.write("### Colony PCR Validation")
+        colony_pcr_panel()
+
+        st.write("### Diagnostic Restriction Digest")
+        digest_panel()
+
+        # 鏁村悎鏁堢巼缁熻
+        st.write("### Integration Efficiency Statistics")
+
+        integration_data = {
+            'Experiment Batch': ['Batch 1', 'Batch 2', 'Batch 3', 'Batch 4'],
+            'Positive Clones': [8, 12, 15, 11],
+            'Total Clones': [24, 30, 32, 28],
+            'Integration Efficiency %': [33.3, 40.0, 46.9, 39.3]
+        }
+
+        df = pd.DataFrame(integration_data)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = px.bar(df, x='Experiment Batch', y='Integration Efficiency %',
+                         title='Gene Integration Efficiency Statistics',
+                         color='Integration Efficiency %', color_continuous_scale='Viridis')
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            fig = px.scatter(df, x='Total Clones', y='Positive Clones',
+                             size='Integration Efficiency %', color='Experiment Batch',
+                             title='Clone Screening Distribution')
+            st.plotly_chart(fig, use_container_width=True)
+
+
+def show_assembly(assembly, steps):
+    """Protocol steps and the simulated assembly: size, fragment order, junctions and warnings."""
+    st.markdown('\n'.join(f"{number}. {step}" for number, step in enumerate(steps, 1)))
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Expected size", f"{assembly.plasmid.length:,} bp")
+    col2.metric("Junctions", len(assembly.junctions))
+    col3.metric("Simulated in", f"{assembly.seconds * 1000:.1f} ms")
+    st.write("**Fragment order**: " + " → ".join(
+        f"{name} ({'+' if strand > 0 else '−'})" for name, strand in assembly.order))
+    st.dataframe(assembly.junction_table(), hide_index=True)
+    for warning in assembly.warnings:
+        st.warning(warning)
+    if not assembly.warnings:
+        st.success(f"🎉 Recombinant Plasmid {assembly.plasmid.name} Construction Successful!")
+
+
+def assembly_of(construct: str, uploaded):
+    """Assembly of the uploaded fragments if any, else of the construct's own, or None if they do not join."""
+    try:
+        if uploaded is not None:
+            return uploaded_assembly(upload_digest(uploaded), uploaded.name, uploaded)
+        return example_assembly(construct)
+    except AssemblyError as error:
+        st.error(f"Assembly failed: {error}")
+    except ValueError as error:
+        st.error(f"{uploaded.name}: {error}")
+    return None
+
+
+def amplification_panel(construct: str):
+    designs, gel = amplification_primers(construct)
+    for column, (gene, pairs) in zip(st.columns(len(designs)), designs.items()):
+        with column:
+            st.write(f"**{gene} gene amplification**")
+            if pairs.empty:
+                st.warning(f"No primer pair for {gene} meets the design limits.")
+                continue
+            best = pairs.loc[0]
+            st.metric("PCR product", f"{best['product']:,} bp")
+            st.caption(f"Tm {best['forward_tm']:.1f} / {best['reverse_tm']:.1f} °C, cross-dimer "
+                       f"{best['cross_dimer']:.1f} kcal/mol; homology tails in lower case")
+            st.code(f"F 5'-{best['forward']}-3'\nR 5'-{best['reverse']}-3'", language=None)
+    st.image(gel, caption=f"Virtual gel of the best pairs' PCR products for {construct}")
+    with st.expander("Ranked primer pairs"):
+        for gene, pairs in designs.items():
+            st.write(f"**{gene}**")
+            st.dataframe(pairs, hide_index=True)
+
+
+@st.fragment
+def homologous_recombination_panel():
+    uploaded = st.file_uploader("Fragments to assemble (FASTA or GenBank: the linearized backbone first, then the "
+                                "inserts); the page's own fragments are used without one",
+                                type=SEQUENCE_TYPES, key='hr_fragments')
+    if st.button("Execute Homologous Recombination Construction"):
+        assembly = assembly_of('21a-raldh-IIdR-blh', uploaded)
+        if assembly is not None:
+            show_assembly(assembly, [
+                "Linearize pET-21a Vector",
+                "Mix Three Gene Fragments",
+                "Add C115 Recombinase",
+                "Incubate at 50°C for 30 minutes",
+                "Transform Competent Cells",
+                "Screen Positive Clones"
+            ])
+
+
+@st.fragment
+def crtebiy_construction_panel():
+    uploaded = st.file_uploader("Fragments to assemble (FASTA or GenBank: the linearized backbone first, then the "
+                                "inserts); the page's own fragments are used without one",
+                                type=SEQUENCE_TYPES, key='crtebiy_fragments')
+    if st.button("Construct 21a-crtEBIY Plasmid"):
+        assembly = assembly_of('21a-crtEBIY', uploaded)
+        if assembly is not None:
+            show_assembly(assembly, [
+                "PCR Amplify crtEBIY Fragment",
+                "Gel Extraction and Purification",
+                "Linearize pET-21a Vector",
+                "Homologous Recombination Ligation",
+                "Transformation and Screening",
+                "Positive Clone Validation"
+            ])
+
+
+@st.fragment
+def plasmid_map_panel():
+    uploads = st.file_uploader("GenBank or FASTA files (FASTA features from a GFF3 or CSV/TSV table: name, start, end)",
+                               type=PLASMID_TYPES, accept_multiple_files=True, key='plasmid_files')
+    feature_files = [upload for upload in uploads if upload.name.lower().endswith(FEATURE_SUFFIXES)]
+    features = feature_files[0] if feature_files else None
+    if len(feature_files) > 1:
+        st.caption(f"Features of FASTA records are read from {features.name} only.")
+    maps = list(example_maps())
+    for upload in uploads:
+        if upload in feature_files:
+            continue
+        try:
+            maps.extend(plasmid_maps(upload_digest(upload), upload_digest(features) if features else '',
+                                     upload.name, upload, features))
+        except ValueError as error:
+            st.error(f"{upload.name}: {error}")
+    choice = st.selectbox("Plasmid", range(len(maps)), format_func=lambda index: maps[index][0],
+                          key='plasmid_map')
+    name, svg, table = maps[choice]
+    st.image(svg, caption=f"{name} recombinant plasmid map")
+    with st.expander(f"Features of {name}"):
+        st.dataframe(table, hide_index=True)
+
+
+@st.fragment
+def colony_pcr_panel():
+    _, locus = integration_templates()
+    left, right = st.columns(2)
+    forward = left.text_input("Forward primer (5'-3')", locus['Locus-F'], key='colony_pcr_forward')
+    reverse = right.text_input("Reverse primer (5'-3')", locus['Locus-R'], key='colony_pcr_reverse')
+    max_mismatches = left.slider("Mismatches allowed outside the 3' end", 0, 6, MAX_MISMATCHES,
+                                 key='colony_pcr_mismatches')
+    max_product = right.number_input("Largest product (bp)", 500, 20000, MAX_PRODUCT, step=500,
+                                     key='colony_pcr_max_product')
+    try:
+        image, amplicons = colony_pcr(forward.strip().upper(), reverse.strip().upper(), int(max_product),
+                                      max_mismatches)
+    except ValueError as error:
+        st.error(str(error))
+        return
+    st.image(image, caption="Virtual gel of the colony PCR (products predicted on the stand-in BL21(DE3) genome, "
+                            "with and without the integrated cassette)")
+    with st.expander(f"Predicted products ({len(amplicons)})"):
+        st.dataframe(amplicons, hide_index=True)
+
+
+@st.fragment
+def digest_panel():
+    construct = st.selectbox("Construct", list(EXAMPLE_CONSTRUCTS), key='digest_construct')
+    plan = digest_plan(construct)
+    st.write(f"**Digests that check {construct}** (bands resolved on a 1 kb ladder and told apart from the "
+             "empty vector)")
+    st.dataframe(plan, hide_index=True)
+    default = plan.loc[0, 'enzymes'].split(' + ') if len(plan) else []
+    enzymes = st.multiselect(f"Enzymes ({len(catalog())} in the catalog)", list(catalog()), default=default,
+                             max_selections=3, key=f"digest_enzymes_{construct}")
+    if not enzymes:
+        return
+    image, fragments = virtual_digest(construct, tuple(sorted(enzymes)))
+    st.image(image, caption=f"Virtual gel: {construct} and pET-21a(+) cut with {' + '.join(sorted(enzymes))}")
+    with st.expander(f"Fragments of {construct}"):
+        st.dataframe(fragments, hide_index=True)
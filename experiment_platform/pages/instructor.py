@@ -0,0 +1,58 @@
+"""Instructor Dashboard page: progress of every session of the class, refreshed as updates arrive."""
+import streamlit as st
+
+from experiment_platform.progress import STUCK_S, progress_registry
+
+REFRESH_S = 5.0
+
+
+def show_instructor_dashboard():
+    st.header("📋 Instructor Dashboard")
+    st.caption(f"Every student session of this server, refreshed every {REFRESH_S:g} s; a session is stuck "
+               f"after {STUCK_S / 60:g} minutes on one step.")
+    dashboard_panel()
+
+
+@st.fragment(run_every=REFRESH_S)
+def dashboard_panel():
+    import plotly.express as px
+
+    summary = progress_registry().summary()
+    columns = st.columns(4)
+    columns[0].metric("Sessions", summary.sessions)
+    columns[1].metric("Active (5 min)", summary.active)
+    columns[2].metric("Stuck", int(summary.stuck['sessions'].sum()))
+    columns[3].metric("Updates received", f"{summary.updates:,}")
+    if not summary.sessions:
+        st.info("No student sessions yet: progress appears here as students work through the protocols.")
+        return
+
+    st.write("### Protocol Progress")
+    steps = summary.steps.assign(step=summary.steps['step'].map(lambda step: 'not started' if step == 0
+                                                                else f"step {step}"))
+    fig = px.bar(steps, x='sessions', y='protocol', color='step', orientation='h',
+                 title='Sessions at each step of every protocol')
+    fig.update_layout(yaxis_title=None, legend_traceorder='normal')
+    st.plotly_chart(fig, use_container_width=True)
+
+    left, right = st.columns(2)
+    with left:
+        st.write("### Stuck Steps")
+        if summary.stuck.empty:
+            st.success("No session has been stuck on a step.")
+        else:
+            st.dataframe(summary.stuck.sort_values('sessions', ascending=False), hide_index=True)
+    with right:
+        st.write("### Pages Open")
+        st.bar_chart(summary.pages.rename('sessions'), horizontal=True)
+        st.caption(' · '.join(f"{mode}: {count}" for mode, count in summary.modes.items()))
+
+    st.write("### Result Distributions")
+    measured = {label: counts for label, counts in summary.distributions.items() if counts.sum()}
+    if not measured:
+        st.caption("No measurements yet.")
+    columns = st.columns(3)
+    for index, (label, counts) in enumerate(measured.items()):
+        with columns[index % len(columns)]:
+            fig = px.bar(x=counts.index, y=counts.to_numpy(), labels={'x': label, 'y': 'sessions'}, title=label)
+            st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,63 @@
+"""Server Memory page: process RSS over time, the size of every session's state, open figures and caches."""
+import json
+
+import streamlit as st
+
+from experiment_platform.memory import SAMPLE_S, SESSIONS_PER_SAMPLE, memory_sampler
+
+REFRESH_S = 10.0
+
+
+def show_memory_profile():
+    st.header("🧠 Server Memory")
+    st.caption(f"Sampled every {SAMPLE_S:g} s, {SESSIONS_PER_SAMPLE} session states at a time; the same numbers "
+               f"are served as OpenMetrics at /_stcore/metrics (families experiment_*).")
+    memory_panel()
+
+
+@st.fragment(run_every=REFRESH_S)
+def memory_panel():
+    summary = memory_sampler().summary()
+    if summary.error:
+        st.warning(f"The last sample failed: {summary.error}")
+    if summary.history.empty:
+        st.info("No samples yet: the first arrives within a few seconds.")
+        return
+    latest = summary.history.iloc[-1]
+    first = summary.history.iloc[0]
+    columns = st.columns(5)
+    columns[0].metric("Process RSS (MB)", f"{latest['RSS (MB)']:,.0f}",
+                      f"{latest['RSS (MB)'] - first['RSS (MB)']:+,.0f} since {first['time']:%H:%M}")
+    columns[1].metric("Open figures", int(latest['open figures']))
+    columns[2].metric("Sessions", int(latest['sessions']))
+    columns[3].metric("Session state (MB)", f"{latest['session state (MB)']:,.1f}")
+    columns[4].metric("Sample cost (ms)", f"{summary.sample_ms:,.1f}")
+
+    st.write("### Over Time")
+    st.line_chart(summary.history.set_index('time')[['RSS (MB)', 'session state (MB)', 'caches (MB)']])
+    st.line_chart(summary.history.set_index('time')[['open figures', 'sessions']])
+
+    left, right = st.columns(2)
+    with left:
+        st.write("### Session State by Page")
+        st.dataframe(summary.pages, hide_index=True)
+    with right:
+        st.write("### Largest Session State Keys")
+        st.dataframe(summary.keys.head(15), hide_index=True)
+    st.write("### Sessions")
+    st.dataframe(summary.sessions, hide_index=True)
+
+    st.write("### Caches")
+    st.dataframe(summary.caches, hide_index=True)
+    st.write("### Open Figures")
+    if summary.figures.empty:
+        st.success("pyplot holds no figures.")
+    else:
+        st.caption("Figures still open after their page ran: the page should close them once saved.")
+        st.dataframe(summary.figures.rename('figures'))
+
+    st.download_button("Download samples (JSON)", json.dumps({
+        'history': summary.history.assign(time=summary.history['time'].astype(str)).to_dict('records'),
+        'pages': summary.pages.to_dict('records'), 'keys': summary.keys.to_dict('records'),
+        'caches': summary.caches.to_dict('records'), 'figures': summary.figures.to_dict()}, indent=1),
+        file_name="memory_samples.json", mime='application/json', on_click='ignore')
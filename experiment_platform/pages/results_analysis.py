@@ -0,0 +1,564 @@
+"""Results Analysis page."""
+
+import time
+from typing import Dict
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from experiment_platform.datasets import FILE_TYPES, SCHEMAS, load_uploaded_dataset, load_uploaded_matrix
+from experiment_platform.dose_response import (BOOTSTRAP_RESAMPLES, curve_labels, example_viability_table,
+                                                fit_curves)
+from experiment_platform.fermentation import MEDIA, Conditions, estimate, example_time_course, simulate
+from experiment_platform.hplc import example_chromatogram, find_peaks, production_kinetics
+from experiment_platform.pathway import (ATRA_MG_PER_UMOL, CONFIDENCE, DURATION_H, ENZYME_NAMES, SPECIES,
+                                         control_coefficients, simulate_pathway, sobol_indices)
+from experiment_platform.qpcr import MAX_REPLICATE_DEVIATION, PATHWAY_GENES, example_ct_table, relative_expression
+from experiment_platform.rendering import load_pyplot
+from experiment_platform.state import is_kids_mode
+from experiment_platform.transcriptome import cluster_matrix, example_expression_matrix, matrix_digest
+
+# Sample names picked as the default qPCR calibrator
+CALIBRATOR_NAMES = ('wild-type', 'wild type', 'wt', 'control')
+
+# Display names of the animal-study columns in the efficacy charts
+ANIMAL_COLUMNS = {
+    'group': 'Treatment Group',
+    'tumor_volume': 'Tumor Volume (mm³)',
+    'survival_days': 'Survival (days)',
+    'body_weight_change': 'Body Weight Change (%)',
+}
+
+# Drill-down levels offered below the transcriptome heatmap
+MAX_DRILL_DEPTH = 6
+
+# What-if map of the titre at the end of the run: inducer time (h) × temperature (°C)
+SWEEP_INDUCER_TIMES = np.arange(0, 49, 3.0)
+SWEEP_TEMPERATURES = np.arange(18, 43, 2.0)
+
+# Expression levels offered for each pathway enzyme, relative to the current strain
+ENZYME_LEVELS = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+# Dose-response curves drawn at first and at most; the fit table lists all of them
+DEFAULT_PLOTTED_CURVES = 4
+MAX_PLOTTED_CURVES = 10
+
+
+@st.cache_data(show_spinner="Quantifying ATRA...", max_entries=16)
+def atra_kinetics(digest: str, _traces):
+    """ATRA titre per culture time and the calibration curve, computed once per uploaded trace file."""
+    return production_kinetics(_traces)
+
+
+@st.cache_resource(show_spinner="Fitting the fermentation model...", max_entries=16)
+def fermentation_fit(digest: str, conditions: Conditions, _course):
+    """Kinetic parameters fitted to a time course, computed once per course and run conditions."""
+    return estimate(_course['time'], _course.get('od600'), _course.get('atra'), conditions)
+
+
+@st.cache_resource(show_spinner="Running pathway sensitivity analysis...")
+def pathway_sensitivity():
+    """Sobol indices of the ATRA titre over enzyme levels; the same for every session, so computed once."""
+    return sobol_indices(fold_range=max(ENZYME_LEVELS))
+
+
+@st.cache_resource(show_spinner="Fitting dose-response curves...", max_entries=8)
+def dose_response_fits(digest: str, by: tuple, _table):
+    """4PL fits of every curve of a viability table, computed once per table and shared by all sessions."""
+    return fit_curves(_table, by)
+
+
+@st.cache_resource(show_spinner="Clustering genes...", max_entries=8)
+def clustered_transcriptome(digest: str, units: str, _matrix):
+    """Normalized, clustered expression matrix, computed once per matrix and shared by all sessions."""
+    return cluster_matrix(_matrix, units)
+
+
+@st.fragment
+def fermentation_explorer(fit, measured: Conditions, course):
+    """Fitted run next to a what-if run; only this panel reruns when a condition is changed."""
+    st.write("**What-if Explorer**")
+    col_a, col_b, col_c = st.columns(3)
+    inducer_time = col_a.slider("Inducer added (h)", 0.0, 48.0, float(measured.inducer_time), 1.0,
+                                key="fermentation_inducer")
+    temperature = col_b.slider("Temperature (°C)", 18.0, 42.0, float(measured.temperature), 1.0,
+                               key="fermentation_temperature")
+    medium = col_c.selectbox("Medium", list(MEDIA), index=list(MEDIA).index(measured.medium),
+                             key="fermentation_medium")
+
+    start = time.perf_counter()
+    fitted = simulate(fit.params, measured.inducer_time, measured.temperature, measured.medium)
+    # Row 0 is the best fit, the rest the fit's final population, for the uncertainty band
+    what_if = simulate(np.vstack([fit.params, fit.population]), inducer_time, temperature, medium)
+    low, high = np.percentile(what_if.atra[1:], [5, 95], axis=0)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=np.concatenate([what_if.time, what_if.time[::-1]]),
+                             y=np.concatenate([high, low[::-1]]), fill='toself', fillcolor='rgba(214,39,40,0.15)',
+                             line=dict(width=0), hoverinfo='skip', name='What-if ATRA (90% band)'))
+    fig.add_trace(go.Scatter(x=fitted.time, y=fitted.atra[0], name='Fitted ATRA',
+                             line=dict(color='#d62728', dash='dash')))
+    fig.add_trace(go.Scatter(x=what_if.time, y=what_if.atra[0], name='What-if ATRA', line=dict(color='#d62728')))
+    fig.add_trace(go.Scatter(x=fitted.time, y=fitted.od600[0], name='Fitted OD600', yaxis='y2',
+                             line=dict(color='#1f77b4', dash='dash')))
+    fig.add_trace(go.Scatter(x=what_if.time, y=what_if.od600[0], name='What-if OD600', yaxis='y2',
+                             line=dict(color='#1f77b4')))
+    if 'atra' in course.columns:
+        error = dict(type='data', array=course['atra_sd']) if 'atra_sd' in course.columns else None
+        fig.add_trace(go.Scatter(x=course['time'], y=course['atra'], mode='markers', name='Measured ATRA',
+                                 error_y=error, marker=dict(color='#d62728', size=8)))
+    if 'od600' in course.columns:
+        fig.add_trace(go.Scatter(x=course['time'], y=course['od600'], mode='markers', name='Measured OD600',
+                                 yaxis='y2', marker=dict(color='#1f77b4', size=8, symbol='square')))
+    fig.update_layout(
+        title='ATRA Fermentation Production Kinetics',
+        xaxis_title='Culture Time (hours)',
+        yaxis=dict(title='ATRA Production (mg/L)'),
+        yaxis2=dict(title='Cell Density (OD600)', overlaying='y', side='right'),
+        legend=dict(orientation='h', y=-0.25),
+    )
+    st.plotly_chart(fig, use_container_width=True, key="fermentation_kinetics")
+
+    final, baseline = what_if.atra[0, -1], fitted.atra[0, -1]
+    st.metric(f"ATRA at {what_if.time[-1]:.0f} h", f"{final:.2f} mg/L", f"{final - baseline:+.2f} mg/L vs fitted run")
+    rmse = ", ".join(f"{name} RMSE {value:.3g}" for name, value in (('OD600', fit.rmse_od600),
+                                                                     ('ATRA', fit.rmse_atra)) if value == value)
+    st.caption(f"Fit: {rmse} ({fit.simulations:,} simulations in {fit.seconds:.1f} s). "
+               f"What-if: {len(what_if.atra)} runs simulated in {elapsed_ms:.1f} ms.")
+
+    if st.toggle("Map inducer time × temperature", key="fermentation_sweep"):
+        inducer_grid, temperature_grid = np.meshgrid(SWEEP_INDUCER_TIMES, SWEEP_TEMPERATURES)
+        sweep = simulate(np.repeat(fit.params[None], inducer_grid.size, axis=0), inducer_grid.ravel(),
+                         temperature_grid.ravel(), medium)
+        fig = go.Figure(go.Heatmap(x=SWEEP_INDUCER_TIMES, y=SWEEP_TEMPERATURES,
+                                   z=sweep.atra[:, -1].reshape(inducer_grid.shape).round(2),
+                                   colorscale='Viridis', colorbar=dict(title='mg/L')))
+        fig.add_trace(go.Scatter(x=[inducer_time], y=[temperature], mode='markers', name='What-if',
+                                 marker=dict(color='white', size=12, symbol='x')))
+        fig.update_layout(title=f'ATRA at {sweep.time[-1]:.0f} h in {medium}', xaxis_title='Inducer added (h)',
+                          yaxis_title='Temperature (°C)')
+        st.plotly_chart(fig, use_container_width=True, key="fermentation_sweep_map")
+
+
+@st.fragment
+def pathway_panel():
+    """Intermediates of the ATRA pathway at chosen enzyme levels, and which enzyme limits the titre."""
+    columns = st.columns(len(ENZYME_NAMES))
+    levels = np.array([col.select_slider(name, ENZYME_LEVELS, value=1.0, format_func=lambda level: f"{level:g}×",
+                                         key=f"pathway_level_{name}")
+                       for col, name in zip(columns, ENZYME_NAMES)])
+    times = np.linspace(0, DURATION_H, 49)
+    start = time.perf_counter()
+    course = simulate_pathway(levels, times)[0]
+    coefficients = control_coefficients(levels)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    atra = SPECIES.index('ATRA')
+    fig = go.Figure()
+    for index, species in enumerate(SPECIES):
+        fig.add_trace(go.Scatter(x=times, y=course[:, index], name=species,
+                                 line=dict(width=3 if index == atra else 1.5)))
+    fig.update_layout(title='Pathway Intermediates', xaxis_title='Time (hours)', yaxis_title='Concentration (µM)')
+    st.plotly_chart(fig, use_container_width=True, key="pathway_course")
+    st.caption(f"ATRA after {DURATION_H:.0f} h: {course[-1, atra] * ATRA_MG_PER_UMOL:.2f} mg/L "
+               f"({1 + 2 * len(ENZYME_NAMES)} ODE runs in {elapsed_ms:.0f} ms)")
+
+    sensitivity = pathway_sensitivity()
+    fig = go.Figure([
+        go.Bar(x=list(ENZYME_NAMES), y=coefficients.round(3), name='Control coefficient at these levels'),
+        go.Bar(x=list(ENZYME_NAMES), y=sensitivity.first_order.round(3), name='Sobol first-order index',
+               error_y=_interval_bars(sensitivity.first_order, sensitivity.first_order_interval)),
+        go.Bar(x=list(ENZYME_NAMES), y=sensitivity.total.round(3), name='Sobol total index',
+               error_y=_interval_bars(sensitivity.total, sensitivity.total_interval)),
+    ])
+    fig.update_layout(title='Which Enzyme Limits ATRA Production?', barmode='group', yaxis_title='Sensitivity')
+    st.plotly_chart(fig, use_container_width=True, key="pathway_sensitivity")
+    st.caption(f"Overexpress {ENZYME_NAMES[int(coefficients.argmax())]} first at these levels; across "
+               f"{min(ENZYME_LEVELS):g}–{max(ENZYME_LEVELS):g}× expression, "
+               f"{ENZYME_NAMES[int(sensitivity.total.argmax())]} explains most of the titre's variance "
+               f"({sensitivity.simulations:,} simulations; error bars are {CONFIDENCE:.0%} bootstrap intervals).")
+
+
+def _interval_bars(values: np.ndarray, interval: np.ndarray) -> dict:
+    """Plotly error bars spanning a (low, high) interval around each value."""
+    return dict(type='data', symmetric=False, array=(interval[1] - values).round(3),
+                arrayminus=(values - interval[0]).round(3))
+
+
+def lab_data_uploads() -> Dict:
+    """Uploaded lab datasets by kind; the tabs fall back to the example data for kinds not uploaded."""
+    datasets = {}
+    with st.expander("📂 Load Lab Data"):
+        st.caption("Upload your own results (CSV, Excel or Parquet) to replace the example data in the tabs below.")
+        columns = st.columns(len(SCHEMAS) + 1)
+        for col, (kind, schema) in zip(columns, SCHEMAS.items()):
+            with col:
+                uploaded = st.file_uploader(schema.label, type=list(FILE_TYPES), key=f"dataset_{kind}")
+                if uploaded is None:
+                    continue
+                try:
+                    datasets[kind] = load_uploaded_dataset(uploaded, kind)
+                except ValueError as exc:
+                    st.error(f"{uploaded.name}: {exc}")
+                else:
+                    st.caption(f"{len(datasets[kind]):,} rows")
+        with columns[-1]:
+            uploaded = st.file_uploader("Expression matrix (genes × samples)", type=list(FILE_TYPES),
+                                        key="dataset_transcriptome")
+            if uploaded is not None:
+                try:
+                    datasets['transcriptome'] = load_uploaded_matrix(uploaded)
+                except ValueError as exc:
+                    st.error(f"{uploaded.name}: {exc}")
+                else:
+                    st.caption("{:,} genes × {} samples".format(*datasets['transcriptome'].shape))
+    return datasets
+
+
+def show_results_analysis():
+    import plotly.express as px
+    import pandas as pd
+    plt = load_pyplot()
+
+    st.header("📊 Comprehensive Experimental Results Analysis")
+    if is_kids_mode():
+        st.info(
+            "Time to see our results! Let's check if our experiments worked using pictures and numbers that tell us the story of our amazing bacteria!")
+
+    datasets = lab_data_uploads()
+
+    tab1, tab2, tab3, tab4 = st.tabs(["Gene Expression Validation", "Protein Function Analysis", "Metabolite Detection",
+                                      "Therapeutic Effect Evaluation"])
+
+    with tab1:
+        st.subheader("Gene Expression Validation")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("#### Real-time Quantitative PCR")
+
+            ct_table = datasets.get('qpcr')
+            if ct_table is None:
+                ct_table = example_ct_table()
+            measured = ct_table[pd.to_numeric(ct_table['ct'], errors='coerce').notna()]
+            samples = sorted(measured['sample'].dropna().astype(str).unique())
+            other_genes = sorted(set(measured['gene'].dropna().astype(str)) - set(PATHWAY_GENES))
+            wild_type = next((i for i, name in enumerate(samples) if name.lower() in CALIBRATOR_NAMES), 0)
+            calibrator = st.selectbox("Calibrator sample", samples, index=wild_type, key="qpcr_calibrator")
+            reference_genes = st.multiselect("Reference genes", other_genes, default=other_genes,
+                                             key="qpcr_reference_genes")
+            try:
+                expression = relative_expression(ct_table, reference_genes, calibrator)
+            except ValueError as exc:
+                st.error(str(exc))
+            else:
+                rejected = int(expression['rejected'].sum())
+                discordant = int(expression['discordant'].sum())
+                missing = expression[expression['fold_change'].isna() & ~expression['gene'].isin(reference_genes)]
+                expression = expression[(expression['sample'] != calibrator)
+                                        & expression['gene'].isin(PATHWAY_GENES)]
+                fig = px.bar(expression, x='gene', y='fold_change', color='sample', barmode='group',
+                             error_y=expression['upper'] - expression['fold_change'],
+                             error_y_minus=expression['fold_change'] - expression['lower'],
+                             category_orders={'gene': list(PATHWAY_GENES)},
+                             title='Engineering Bacteria Gene Expression Levels',
+                             labels={'gene': 'Gene', 'fold_change': f'Fold Change vs {calibrator} (2^-ΔΔCt)',
+                                     'sample': 'Sample'})
+                st.plotly_chart(fig, use_container_width=True)
+                if rejected:
+                    st.caption(f"{rejected} outlier wells (> {MAX_REPLICATE_DEVIATION} cycles from their "
+                               f"replicates' median) were left out")
+                if discordant:
+                    st.warning(f"{discordant} wells are more than {MAX_REPLICATE_DEVIATION} cycles from their "
+                               f"replicates' median with too few replicates to tell which is off; they were kept")
+                if not missing.empty:
+                    st.warning("No fold change without reference or calibrator Ct on the same plate: "
+                               + ", ".join(f"{row.gene} ({row.sample})" for row in missing.itertuples()))
+
+        with col2:
+            st.write("#### Transcriptome Analysis")
+
+            matrix = datasets.get('transcriptome')
+            units = 'counts'
+            if matrix is None:
+                matrix = example_expression_matrix()
+            else:
+                units = st.radio("Values", ['counts', 'tpm'], horizontal=True, key="transcriptome_units",
+                                 format_func={'counts': "Read counts", 'tpm': "TPM / FPKM"}.get)
+            clustered = clustered_transcriptome(matrix_digest(matrix), units, matrix)
+
+            # Each level offers the multi-gene rows of the level above; the key carries the path, so a
+            # deeper choice never outlives the cluster it was made in
+            path = ()
+            for _ in range(MAX_DRILL_DEPTH):
+                view = clustered.view(path)
+                rows = [i for i, size in enumerate(view.sizes) if size > 1]
+                if not rows:
+                    break
+                choice = st.selectbox("Drill into cluster" if not path else "Drill further", [None] + rows,
+                                      format_func=lambda i, labels=view.labels: "—" if i is None else labels[i],
+                                      key="transcriptome_drill_" + ".".join(map(str, path)))
+                if choice is None:
+                    break
+                path += (choice,)
+            view = clustered.view(path)
+
+            fig = go.Figure(go.Heatmap(z=view.values.round(2), x=clustered.samples, y=view.labels, colorscale='RdBu_r',
+                                       zmid=0, colorbar={'title': {'text': 'z-score'}},
+                                       hovertemplate='%{y}<br>%{x}<br>z = %{z:.2f}<extra></extra>'))
+            fig.update_layout(title='Metabolic Pathway Gene Expression Heatmap', height=500,
+                              yaxis={'autorange': 'reversed'})
+            st.plotly_chart(fig, use_container_width=True, key="transcriptome_heatmap")
+            st.caption(f"{len(clustered.genes):,} genes × {len(clustered.samples)} samples; each of the "
+                       f"{len(view.labels)} rows is the mean log2 expression z-score of its genes"
+                       + (f" ({clustered.left_out:,} genes without variation left out)" if clustered.left_out else ""))
+
+    with tab2:
+        st.subheader("Protein Function Analysis")
+
+        st.write("#### SDS-PAGE Protein Electrophoresis")
+
+        # 妯℃嫙铔嬬櫧鐢垫吵缁撴灉
+        fig, ax = plt.subplots(figsize=(10, 6))
+
+        # 铔嬬櫧Marker
+        marker_sizes = [180, 130, 100, 70, 55, 40, 35, 25]
+        marker_ints = [0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+
+        for size, intensity in zip(marker_sizes, marker_ints):
+            ax.barh(0, 10, left=size - 5, height=0.2, color='black', alpha=intensity)
+            ax.text(size, -0.1, f'{size}kDa', ha='center', fontsize=8)
+
+        # 鏍峰搧鏉″甫
+        samples = [
+            ('Wild-type’', []),
+            ('Engineered bacteria - whole protein', [55, 45, 35]),
+            ('Engineered bacteria - purified', [55]),
+            ('Positive control', [55])
+        ]
+
+        for i, (label, bands) in enumerate(samples):
+            y_pos = i + 1
+            ax.text(-20, y_pos, label, ha='right', va='center', fontsize=10)
+
+            for band in bands:
+                ax.barh(y_pos, 10, left=band - 5, height=0.3, color='red', alpha=0.8)
+
+        ax.set_xlim(0, 200)
+        ax.set_ylim(-0.5, len(samples) + 0.5)
+        ax.set_xlabel('Molecular Weight (kDa)')
+        ax.set_title('SDS-PAGE Protein Electrophoresis Analysis')
+        ax.invert_yaxis()
+
+        st.pyplot(fig)
+
+        # 閰舵椿鎬у垎鏋�
+        st.write("#### Enzyme Activity Assay")
+
+        enzyme_data = {
+            'Enzyme': ['RALDH', 'IIdR', 'BLH', 'CRTE', 'CRTB', 'CRTI', 'CRTY'],
+            'Specific Activity (U/mg)': [45, 32, 28, 65, 58, 42, 39],
+            'Conversion Rate (%)': [88, 75, 82, 92, 89, 85, 78]
+        }
+
+        df = pd.DataFrame(enzyme_data)
+
+        fig = px.scatter(df, x='Specific Activity (U/mg)', y='Conversion Rate (%)', size='Specific Activity (U/mg)',
+                         color='Enzyme', title='Relationship Between Key Enzyme Activity and Conversion Rate')
+        st.plotly_chart(fig, use_container_width=True)
+
+        st.write("#### Pathway Flux Model")
+        pathway_panel()
+
+    with tab3:
+        st.subheader("Metabolite Detection")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("#### ATRA Production Analysis")
+
+            # 妯℃嫙HPLC妫€娴嬬粨鏋�
+            if 'hplc' in datasets:
+                trace = datasets['hplc']
+                if 'injection' in trace.columns and len(trace):
+                    trace = trace[trace['injection'] == trace['injection'].iloc[0]]
+                time_points, atra_signal = trace['time'].to_numpy(), trace['signal'].to_numpy()
+                peaks = find_peaks(time_points, atra_signal)
+            else:
+                time_points, atra_signal = example_chromatogram()
+                # The example peak is far wider than a real one; keep it out of the baseline
+                peaks = find_peaks(time_points, atra_signal, baseline_window=20)
+
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=time_points, y=atra_signal,
+                mode='lines',
+                name='ATRA Peak',
+                line=dict(color='blue', width=3)
+            ))
+            fig.add_trace(go.Scatter(
+                x=peaks['retention_time'], y=np.interp(peaks['retention_time'], time_points, atra_signal),
+                mode='markers',
+                name='Detected Peaks',
+                marker=dict(color='red', size=9, symbol='triangle-down'),
+                customdata=peaks['area'],
+                hovertemplate='RT %{x:.2f} min<br>Area %{customdata:.3g}<extra></extra>'
+            ))
+
+            fig.update_layout(
+                title='HPLC Detection - ATRA Standard',
+                xaxis_title='Retention Time (min)',
+                yaxis_title='Signal Intensity'
+            )
+            st.plotly_chart(fig, use_container_width=True, key="hplc_trace")
+
+            measured, course, digest = None, None, 'example'
+            if 'fermentation' in datasets:
+                course, digest = datasets['fermentation'], datasets['fermentation'].attrs.get('sha256')
+            elif 'hplc' in datasets:
+                try:
+                    measured, curve = atra_kinetics(datasets['hplc'].attrs.get('sha256'), datasets['hplc'])
+                except ValueError as exc:
+                    st.caption(f"Showing example kinetics: {exc}")
+                else:
+                    course = measured.rename(columns={'culture_time': 'time', 'atra_mg_l': 'atra'})
+                    digest = datasets['hplc'].attrs.get('sha256')
+            if course is None:
+                course = example_time_course()
+
+            with st.expander("Conditions of the measured run"):
+                col_a, col_b, col_c = st.columns(3)
+                conditions = Conditions(
+                    col_a.number_input("Inducer added (h)", 0.0, 72.0, 12.0, 1.0, key="fermentation_run_inducer"),
+                    col_b.number_input("Temperature (°C)", 16.0, 42.0, 30.0, 1.0, key="fermentation_run_temperature"),
+                    col_c.selectbox("Medium", list(MEDIA), key="fermentation_run_medium"),
+                )
+            try:
+                fit = fermentation_fit(digest, conditions, course)
+            except ValueError as exc:
+                st.caption(f"Cannot fit the fermentation model: {exc}")
+            else:
+                fermentation_explorer(fit, conditions, course)
+            if measured is not None:
+                st.caption(f"Calibration: area = {curve.slope:.4g} × mg/L + {curve.intercept:.3g} "
+                           f"(R² = {curve.r_squared:.4f})")
+
+        with col2:
+            st.write("#### Metabolomics Analysis")
+
+            # 妯℃嫙浠ｈ阿鐗╁彉鍖�
+            metabolites = ['glucose’', 'lactic acid', 'acetic acid', 'ethanol', 'ATP', 'NADH']
+            wild_type = np.random.exponential(1, len(metabolites))
+            engineered = wild_type * np.random.uniform(0.5, 2, len(metabolites))
+
+            fig = go.Figure()
+            fig.add_trace(go.Scatterpolar(
+                r=wild_type,
+                theta=metabolites,
+                fill='toself',
+                name='Wild-type'
+            ))
+            fig.add_trace(go.Scatterpolar(
+                r=engineered,
+                theta=metabolites,
+                fill='toself',
+                name='Engineered strain'
+            ))
+
+            fig.update_layout(
+                title='Metabolomics Comparative Analysis',
+                polar=dict(radialaxis=dict(visible=True)),
+                showlegend=True
+            )
+
+            st.plotly_chart(fig, use_container_width=True)
+
+    with tab4:
+        st.subheader("Therapeutic Effect Evaluation")
+
+        st.write("#### In Vitro Antitumor Activity")
+
+        plate = datasets.get('plate_reader')
+        if plate is None:
+            plate = example_viability_table()
+        digest = plate.attrs.get('sha256', 'example')
+        curve_columns = [name for name in ('treatment', 'cell_line') if name in plate.columns]
+        if 'replicate' in plate.columns and st.checkbox("Fit each replicate series separately",
+                                                        key="dose_response_by_replicate"):
+            curve_columns.append('replicate')
+        fits = dose_response_fits(digest, tuple(curve_columns), plate)
+        labels = curve_labels(fits.curves, curve_columns)
+        shown = st.multiselect("Curves", range(len(labels)), default=range(min(len(labels), DEFAULT_PLOTTED_CURVES)),
+                               format_func=labels.__getitem__, max_selections=MAX_PLOTTED_CURVES,
+                               key=f"dose_response_curves_{digest[:12]}_{len(curve_columns)}")
+
+        wells = plate.groupby(curve_columns + ['concentration'], observed=True)['viability'].agg(['mean', 'std'])
+        tested = plate['concentration'][plate['concentration'] > 0]
+        grid = np.logspace(np.log10(tested.min()) - 0.5, np.log10(tested.max()) + 0.5, 80) if len(tested) else []
+        grid = np.array([float(f"{x:.3g}") for x in grid])  # short numbers in the figure JSON
+        palette = px.colors.qualitative.Plotly
+        fig = go.Figure()
+        for n, curve in enumerate(shown):
+            color, label = palette[n % len(palette)], labels[curve]
+            lower, upper = fits.band(curve, grid)
+            fig.add_trace(go.Scatter(x=np.r_[grid, grid[::-1]], y=np.r_[upper, lower[::-1]].round(2), fill='toself',
+                                     fillcolor=color, opacity=0.2, line_width=0, hoverinfo='skip',
+                                     legendgroup=label, showlegend=False))
+            fig.add_trace(go.Scatter(x=grid, y=fits.predict(curve, grid).round(2), mode='lines', line_color=color,
+                                     name=label, legendgroup=label))
+            measured = wells.loc[tuple(fits.curves.loc[curve, curve_columns])].reset_index()
+            measured = measured[measured['concentration'] > 0]
+            fig.add_trace(go.Scatter(x=measured['concentration'], y=measured['mean'], mode='markers',
+                                     marker_color=color, error_y={'array': measured['std']}, name=label,
+                                     legendgroup=label, showlegend=False))
+
+        fig.update_layout(
+            title='ATRA Cytotoxicity to Hepatocellular Carcinoma Cells',
+            xaxis_title='Concentration (μM)',
+            yaxis_title='Cell Survival Rate (%)',
+            xaxis_type='log'
+        )
+
+        st.plotly_chart(fig, use_container_width=True, key="dose_response_curves_chart")
+        table = fits.curves.rename(columns={
+            'cell_line': 'cell line', 'ic50': 'IC50 (μM)', 'ic50_lower': 'IC50 lower', 'ic50_upper': 'IC50 upper',
+            'hill': 'Hill slope', 'hill_lower': 'Hill lower', 'hill_upper': 'Hill upper', 'r_squared': 'R²',
+            'ic50_determined': 'IC50 determined'})
+        table.loc[~table['IC50 determined'], ['IC50 (μM)', 'IC50 lower', 'IC50 upper']] = np.nan
+        st.dataframe(table.drop(columns=['bottom', 'top']), hide_index=True, use_container_width=True)
+        st.caption(f"Four-parameter logistic fits of {len(fits.curves):,} curves with 95% confidence intervals "
+                   f"from {BOOTSTRAP_RESAMPLES} bootstrap resamples of the wells ({fits.seconds:.2f} s). "
+                   "Shaded bands are the bootstrap range of each fitted curve.")
+
+        # 鍔ㄧ墿瀹為獙鏁堟灉
+        st.write("#### Animal Model Efficacy")
+
+        animal_data = {
+            'Treatment Group': ['Control Group', 'FOLFOX4', 'ATRA Standard', 'Engineered Bacteria ATRA'],
+            'Tumor Volume (mm³)': [1250, 680, 420, 350],
+            'Survival (days)': [45, 68, 82, 95],
+            'Body Weight Change (%)': [-15, -25, -8, -5]
+        }
+
+        df_animal = pd.DataFrame(animal_data)
+        if 'animal' in datasets:
+            animal = datasets['animal']
+            measures = [name for name in ANIMAL_COLUMNS if name in animal.columns and name != 'group']
+            df_animal = (animal.groupby('group', observed=True)[measures].median()
+                         .reset_index().rename(columns=ANIMAL_COLUMNS))
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = px.bar(df_animal, x='Treatment Group', y='Tumor Volume (mm³)',
+                         title='Treatment 4 Weeks Post-Tumor Volume', color='Tumor Volume (mm³)')
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            fig = px.bar(df_animal, x='Treatment Group', y='Survival (days)',
+                         title='Median Survival Time Comparison', color='Survival (days)')
+            st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,24 @@
+"""Worker processes shared by the numerical pipelines of all sessions."""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def process_pool() -> ProcessPoolExecutor:
+    """Worker processes shared by all sessions, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the Streamlit server is multi-threaded
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                        mp_context=multiprocessing.get_context('spawn'))
+    return _pool
+
+
+def worth_parallel(jobs: int) -> bool:
+    """Whether splitting work into this many jobs can gain anything on this machine."""
+    return jobs > 1 and (os.cpu_count() or 1) > 1
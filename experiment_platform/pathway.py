@@ -0,0 +1,226 @@
+"""Flux model of the engineered ATRA pathway with global sensitivity analysis.
+
+    FPP --crtE--> GGPP --crtB--> phytoene --crtI--> lycopene --crtY--> β-carotene
+        --blh--> 2 retinal --raldh--> ATRA
+
+FPP is supplied by the host's MEP pathway at a constant rate and also drained
+by its native uses; retinal is lost to native reductases and ATRA slowly
+degrades.  Every enzymatic step follows Michaelis-Menten kinetics, with a
+Vmax proportional to the enzyme's specific activity (the Enzyme Activity
+Assay values) times its expression level, given relative to the current
+strain.
+
+``simulate_pathway`` integrates the ODEs of many enzyme-level combinations
+at once: an adaptive Dormand-Prince 5(4) solver whose state, step size and
+error control are arrays over the combinations, so each combination takes
+its own steps but all of them advance in the same NumPy operations.  Large
+batches are cut into chunks that run in the process pool.
+
+``sobol_indices`` estimates first-order and total Sobol indices of the ATRA
+titre over log-uniform enzyme levels (Saltelli sampling; first-order indices
+by Saltelli's 2010 estimator on centered titres, total indices by Jansen's),
+with bootstrap confidence intervals: the genes whose level explains most of
+the titre's variance are the ones worth overexpressing.  ``control_coefficients`` gives the local
+answer at one strain, d ln(titre) / d ln(enzyme level).
+"""
+import dataclasses
+from typing import Tuple
+
+import numpy as np
+
+from experiment_platform.parallel import process_pool, worth_parallel
+
+
+@dataclasses.dataclass(frozen=True)
+class Enzyme:
+    name: str
+    specific_activity: float  # U/mg, i.e. µmol/min per mg of enzyme
+    km: float  # µM
+    substrate: str
+    product: str
+    consumed: int = 1  # substrate molecules per reaction
+    produced: int = 1  # product molecules per reaction
+
+
+SPECIES = ('FPP', 'GGPP', 'phytoene', 'lycopene', 'β-carotene', 'retinal', 'ATRA')
+ENZYMES = (
+    Enzyme('CRTE', 65, 4.0, 'FPP', 'GGPP'),
+    Enzyme('CRTB', 58, 3.0, 'GGPP', 'phytoene', consumed=2),  # two GGPP condense into one phytoene
+    Enzyme('CRTI', 42, 2.0, 'phytoene', 'lycopene'),
+    Enzyme('CRTY', 39, 2.0, 'lycopene', 'β-carotene'),
+    Enzyme('BLH', 28, 1.5, 'β-carotene', 'retinal', produced=2),  # central cleavage gives two retinal
+    Enzyme('RALDH', 45, 1.0, 'retinal', 'ATRA'),
+)
+ENZYME_NAMES = tuple(enzyme.name for enzyme in ENZYMES)
+
+# Enzyme in the current strain, mg/L of culture; with U/mg this gives Vmax in µM/min
+ENZYME_MG_L = 0.0008
+FPP_SUPPLY = 1.5  # µM/h from the MEP pathway
+NATIVE_FPP_DRAIN = 0.4  # 1/h, FPP spent on the host's own isoprenoids
+RETINAL_REDUCTION = 0.15  # 1/h, retinal to retinol by native reductases
+ATRA_DEGRADATION = 0.01  # 1/h
+ATRA_MG_PER_UMOL = 0.30044  # molar mass 300.44 g/mol
+
+DURATION_H = 48.0
+RTOL, ATOL = 1e-5, 1e-8
+MAX_STEPS = 10_000
+
+# Combinations per job, and the batch size from which the process pool is used
+CHUNK_COMBINATIONS = 4_096
+PARALLEL_MIN_COMBINATIONS = 16_384
+
+_VMAX = np.array([enzyme.specific_activity for enzyme in ENZYMES]) * ENZYME_MG_L * 60  # µM/h at level 1
+_KM = np.array([enzyme.km for enzyme in ENZYMES])
+_SUBSTRATE = np.array([SPECIES.index(enzyme.substrate) for enzyme in ENZYMES])
+# Stoichiometric matrix, enzymes × species: what one unit of each reaction consumes and makes
+_STOICHIOMETRY = np.zeros((len(ENZYMES), len(SPECIES)))
+for _row, _enzyme in enumerate(ENZYMES):
+    _STOICHIOMETRY[_row, SPECIES.index(_enzyme.substrate)] -= _enzyme.consumed
+    _STOICHIOMETRY[_row, SPECIES.index(_enzyme.product)] += _enzyme.produced
+_FIRST_ORDER = np.zeros(len(SPECIES))
+_FIRST_ORDER[[SPECIES.index('FPP'), SPECIES.index('retinal'), SPECIES.index('ATRA')]] = (
+    NATIVE_FPP_DRAIN, RETINAL_REDUCTION, ATRA_DEGRADATION)
+_SUPPLY = np.zeros(len(SPECIES))
+_SUPPLY[SPECIES.index('FPP')] = FPP_SUPPLY
+
+# Dormand-Prince 5(4) tableau
+_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+_ERROR = _B - np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+
+def _derivatives(y: np.ndarray, vmax: np.ndarray) -> np.ndarray:
+    substrate = np.clip(y[:, _SUBSTRATE], 0, None)
+    rates = vmax * substrate / (_KM + substrate)
+    return _SUPPLY + rates @ _STOICHIOMETRY - _FIRST_ORDER * y
+
+
+def _integrate(levels: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """Concentrations (µM) of every species at the given times (from 0), combinations × times × species."""
+    vmax = _VMAX * levels
+    n = len(levels)
+    y = np.zeros((n, len(SPECIES)))
+    t = np.zeros(n)
+    h = np.full(n, 0.01)
+    out = np.empty((n, len(times), len(SPECIES)))
+    stages = np.empty((len(_C), n, len(SPECIES)))
+    for column, target in enumerate(times):
+        for _ in range(MAX_STEPS):
+            rows = np.flatnonzero(t < target)
+            if not len(rows):
+                break
+            yi, vi = y[rows], vmax[rows]
+            hi = np.minimum(h[rows], target - t[rows])[:, None]
+            k = stages[:, :len(rows)]
+            k[0] = _derivatives(yi, vi)
+            for stage in range(1, len(_C)):
+                k[stage] = _derivatives(yi + hi * np.tensordot(_A[stage], k[:stage], axes=1), vi)
+            step = yi + hi * np.tensordot(_B, k, axes=1)
+            scale = ATOL + RTOL * np.maximum(np.abs(yi), np.abs(step))
+            error = np.sqrt(np.mean((hi * np.tensordot(_ERROR, k, axes=1) / scale) ** 2, axis=1))
+            accepted = error <= 1
+            y[rows[accepted]] = step[accepted]
+            # The last step onto the target is shortened; land on it exactly
+            t[rows[accepted]] = np.where(hi[accepted, 0] == target - t[rows[accepted]], target,
+                                         t[rows[accepted]] + hi[accepted, 0])
+            h[rows] = hi[:, 0] * np.clip(0.9 * np.maximum(error, 1e-10) ** -0.2, 0.2, 5.0)
+        else:
+            raise RuntimeError(f"Pathway ODE did not reach {target} h in {MAX_STEPS} steps")
+        out[:, column] = y
+    return out
+
+
+def _integrate_chunk(job: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    return _integrate(*job)
+
+
+def simulate_pathway(levels, times=(DURATION_H,), parallel: bool = None) -> np.ndarray:
+    """Concentrations (µM) of ``SPECIES`` at the given times, for each row of enzyme levels.
+
+    ``levels`` is combinations × enzymes (columns as in ``ENZYMES``), relative to the current strain.
+    """
+    levels = np.atleast_2d(np.asarray(levels, dtype=np.float64))
+    times = np.asarray(times, dtype=np.float64)
+    jobs = [(levels[i:i + CHUNK_COMBINATIONS], times) for i in range(0, len(levels), CHUNK_COMBINATIONS)]
+    if parallel is None:
+        parallel = worth_parallel(len(jobs)) and len(levels) >= PARALLEL_MIN_COMBINATIONS
+    results = list(process_pool().map(_integrate_chunk, jobs)) if parallel else [_integrate(*job) for job in jobs]
+    return np.concatenate(results) if results else np.empty((0, len(times), len(SPECIES)))
+
+
+def atra_titre(levels, duration: float = DURATION_H, parallel: bool = None) -> np.ndarray:
+    """ATRA (mg/L) after ``duration`` hours for each row of enzyme levels."""
+    return simulate_pathway(levels, (duration,), parallel)[:, 0, SPECIES.index('ATRA')] * ATRA_MG_PER_UMOL
+
+
+def control_coefficients(levels=None, duration: float = DURATION_H, step: float = 0.05) -> np.ndarray:
+    """d ln(titre) / d ln(level) of each enzyme, by central differences around one strain."""
+    levels = np.ones(len(ENZYMES)) if levels is None else np.asarray(levels, dtype=np.float64)
+    factors = np.exp(np.concatenate([np.eye(len(ENZYMES)) * step, -np.eye(len(ENZYMES)) * step]))
+    titres = atra_titre(levels * factors, duration, parallel=False)
+    up, down = titres[:len(ENZYMES)], titres[len(ENZYMES):]
+    return (np.log(up) - np.log(down)) / (2 * step)
+
+
+BOOTSTRAP_RESAMPLES = 500
+CONFIDENCE = 0.95
+
+
+@dataclasses.dataclass
+class Sensitivity:
+    first_order: np.ndarray  # Sobol S1 per enzyme
+    total: np.ndarray  # Sobol ST per enzyme
+    levels: np.ndarray  # sampled combinations (the A and B matrices), combinations × enzymes
+    titres: np.ndarray  # ATRA mg/L of those combinations
+    first_order_interval: np.ndarray  # CONFIDENCE bootstrap interval of S1, 2 × enzymes (low, high)
+    total_interval: np.ndarray  # same for ST
+
+    @property
+    def simulations(self) -> int:
+        return len(self.titres) // 2 * (len(ENZYMES) + 2)
+
+
+def _sobol_estimates(y_a: np.ndarray, y_b: np.ndarray, y_ab: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """S1 and ST of every input from the titres of A, B and the AB matrices (inputs × samples)."""
+    both = np.concatenate([y_a, y_b])
+    variance = np.var(both)
+    if variance == 0:
+        return np.zeros(len(y_ab)), np.zeros(len(y_ab))
+    # Centering leaves the estimate's expectation alone but removes noise proportional to the mean titre
+    first_order = np.mean((y_b - both.mean()) * (y_ab - y_a), axis=1) / variance
+    total = 0.5 * np.mean((y_a - y_ab) ** 2, axis=1) / variance
+    return first_order, total
+
+
+def sobol_indices(samples: int = 2048, fold_range: float = 4.0, duration: float = DURATION_H, seed: int = 0,
+                  parallel: bool = None) -> Sensitivity:
+    """Sobol indices of the ATRA titre with every enzyme level log-uniform in [1/fold_range, fold_range].
+
+    Runs ``samples × (enzymes + 2)`` simulations, in one batch; the intervals come from
+    ``BOOTSTRAP_RESAMPLES`` resamplings of those runs.
+    """
+    rng = np.random.default_rng(seed)
+    d = len(ENZYMES)
+    a, b = rng.uniform(-1, 1, (2, samples, d)) * np.log(fold_range)
+    # Row block i of ab is A with column i taken from B
+    ab = np.repeat(a[None], d, axis=0)
+    ab[np.arange(d), :, np.arange(d)] = b.T
+    titres = atra_titre(np.exp(np.concatenate([a, b, ab.reshape(-1, d)])), duration, parallel)
+    y_a, y_b, y_ab = titres[:samples], titres[samples:2 * samples], titres[2 * samples:].reshape(d, samples)
+    first_order, total = _sobol_estimates(y_a, y_b, y_ab)
+    resampled = [_sobol_estimates(y_a[rows], y_b[rows], y_ab[:, rows])
+                 for rows in rng.integers(0, samples, (BOOTSTRAP_RESAMPLES, samples))]
+    tails = [50 * (1 - CONFIDENCE), 50 * (1 + CONFIDENCE)]
+    first_order_interval, total_interval = (np.percentile([estimates[i] for estimates in resampled], tails, axis=0)
+                                            for i in (0, 1))
+    return Sensitivity(first_order, total, np.exp(np.concatenate([a, b])), titres[:2 * samples],
+                       first_order_interval, total_interval)
@@ -0,0 +1,213 @@
+"""In-silico PCR: primer binding sites in indexed genomes and plasmids, predicted amplicons and gel lanes.
+
+``TemplateIndex`` indexes a set of templates (a genome, an integrant, a
+plasmid) once:
+
+* codes: the templates' 2-bit codes are laid end to end, apart by a run of
+  unknown bases, with each circular template extended past its origin so
+  that primers across the origin are found;
+* index: every k-mer is bucketed by its code (a counting sort), so the
+  positions of any k-mer are one slice of the sorted positions;
+* binding: a primer binds where its 3' end matches exactly, the last
+  ``SEED`` bases, which is looked up in the index for the primer (top
+  strand) and its reverse complement (bottom strand); the rest of the
+  primer is compared at every hit at once and may have up to
+  ``MAX_MISMATCHES`` mismatches, as the polymerase extends a primer whose
+  3' end is paired;
+* amplicons: every top-strand site paired with every bottom-strand site
+  downstream of it on the same template, within ``MAX_PRODUCT`` bases
+  (round the origin of a circular template), from one sort and a
+  vectorized range search, for any number of primers and pairs.
+
+Building the index of a 5 Mb genome takes under a second; after that a
+primer pair is evaluated in milliseconds.  The genome of the Gene
+Integration Validation tab is a stand-in (seeded random bases of
+E. coli BL21(DE3)'s length) and ``integration_example`` indexes it with
+its integrant, for colony PCR primers designed on the flanks of the site.
+"""
+import dataclasses
+import zlib
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from experiment_platform.assembly import random_bases
+from experiment_platform.primers import design_primers
+
+SEED = 10  # 3'-terminal bases that must match exactly; also the index's k-mer length
+MAX_MISMATCHES = 3
+MAX_PRIMER = 60
+MAX_PRODUCT = 10_000  # bp
+PRODUCT_NG = 150.0  # a perfectly matched product's yield in a gel lane
+MISMATCH_YIELD = 0.4  # share of the yield kept per mismatch
+GENOME_BP = 4_557_508  # E. coli BL21(DE3)
+INTEGRATION_SITE = 1_216_400  # stand-in genome coordinate of the cassette
+LOCUS_BP = 2223  # wild-type product of the colony PCR primers flanking the site
+CASSETTE_BP = 1329  # selection marker and gene left between the homology arms
+
+SITE_COLUMNS = ['primer', 'template', 'start', 'end', 'strand', 'mismatches']
+AMPLICON_COLUMNS = ['template', 'forward', 'reverse', 'start', 'end', 'size', 'mismatches']
+
+_CODES = np.full(256, -1, dtype=np.int8)
+for _code, _base in enumerate('ACGT'):
+    _CODES[ord(_base)] = _CODES[ord(_base.lower())] = _code
+_BASES = np.frombuffer(b'ACGT', dtype=np.uint8)
+
+
+@dataclasses.dataclass
+class Template:
+    name: str
+    sequence: str
+    circular: bool = False
+
+
+def encode(sequence: str) -> np.ndarray:
+    return _CODES[np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)]
+
+
+class TemplateIndex:
+    def __init__(self, templates: Sequence[Template], seed: int = SEED):
+        self.templates = list(templates)
+        self.seed = seed
+        parts, offsets, position = [], [], 0
+        gap = np.full(MAX_PRIMER, -1, dtype=np.int8)
+        for template in self.templates:
+            codes = encode(template.sequence)
+            if template.circular:
+                codes = np.concatenate([codes, codes[:MAX_PRIMER - 1]])
+            parts += [codes, gap]
+            offsets.append(position)
+            position += len(codes) + len(gap)
+        self.codes = np.concatenate(parts) if parts else gap
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.lengths = np.array([len(t.sequence) for t in self.templates], dtype=np.int64)
+        keys = self._kmers(self.codes)
+        valid = np.flatnonzero(keys >= 0)
+        # Counting sort: the positions of k-mer code c are positions[starts[c]:starts[c + 1]]
+        self.positions = valid[np.argsort(keys[valid])]
+        self.starts = np.concatenate([[0], np.cumsum(np.bincount(keys[valid], minlength=4 ** seed))])
+
+    def _kmers(self, codes: np.ndarray) -> np.ndarray:
+        """Code of the k-mer starting at every position, -1 where it runs into an unknown base or the end."""
+        count = len(codes) - self.seed + 1
+        keys = np.zeros(max(count, 0), dtype=np.int32)
+        unknown = np.zeros(len(keys), dtype=bool)
+        for offset in range(self.seed):
+            window = codes[offset:offset + count]
+            keys <<= 2
+            keys |= np.maximum(window, 0)
+            unknown |= window < 0
+        keys[unknown] = -1
+        return np.concatenate([keys, np.full(len(codes) - len(keys), -1, dtype=np.int32)])
+
+    def _hits(self, seed: np.ndarray) -> np.ndarray:
+        if (seed < 0).any():
+            return np.zeros(0, dtype=np.int64)
+        code = int((seed.astype(np.int64) * 4 ** np.arange(self.seed - 1, -1, -1)).sum())
+        return self.positions[self.starts[code]:self.starts[code + 1]]
+
+    def binding_sites(self, primer: str, name: str = '', max_mismatches: int = MAX_MISMATCHES) -> pd.DataFrame:
+        """Sites (``SITE_COLUMNS``) where ``primer`` binds with its 3' end matched, on either strand.
+
+        ``start`` and ``end`` bound the bases the primer pairs with on the top strand; a site across the origin
+        of a circular template ends past its length.
+        """
+        codes = encode(primer)
+        length = len(codes)
+        if not self.seed <= length <= MAX_PRIMER:
+            raise ValueError(f"primers must be {self.seed} to {MAX_PRIMER} bases, not {length}")
+        rest = np.arange(length - self.seed)
+        found = []
+        # Top strand: the primer itself ends with the seed
+        start = self._hits(codes[-self.seed:]) + self.seed - length
+        start = start[start >= 0]
+        mismatches = (self.codes[start[:, None] + rest] != codes[None, :length - self.seed]).sum(axis=1)
+        found.append((start, mismatches, 1))
+        # Bottom strand: the reverse complement starts with the seed
+        flipped = np.where(codes >= 0, 3 - codes, -1)[::-1].astype(np.int8)
+        start = self._hits(flipped[:self.seed])
+        start = start[start + length <= len(self.codes)]
+        mismatches = (self.codes[start[:, None] + self.seed + rest] != flipped[None, self.seed:]).sum(axis=1)
+        found.append((start, mismatches, -1))
+        rows = []
+        for start, mismatches, strand in found:
+            keep = mismatches <= max_mismatches
+            start, mismatches = start[keep], mismatches[keep]
+            template = np.searchsorted(self.offsets, start, 'right') - 1
+            local = start - self.offsets[template]
+            # Not into the gap after a template, nor a second time past a circular template's origin
+            keep = (local < self.lengths[template]) & (self.codes[start + length - 1] >= 0)
+            rows.append(pd.DataFrame({'primer': name or primer, 'template': template[keep], 'start': local[keep],
+                                      'end': local[keep] + length, 'strand': strand,
+                                      'mismatches': mismatches[keep]}))
+        sites = pd.concat(rows, ignore_index=True)
+        sites['template'] = [self.templates[t].name for t in sites['template']]
+        return sites[SITE_COLUMNS]
+
+    def amplicons(self, primers: Dict[str, str], max_product: int = MAX_PRODUCT,
+                  max_mismatches: int = MAX_MISMATCHES) -> pd.DataFrame:
+        """Every product (``AMPLICON_COLUMNS``) of a PCR with all of ``primers`` (name: sequence) together.
+
+        Any primer can prime on either strand, so a product may come from one primer at both ends.
+        """
+        sites = pd.concat([self.binding_sites(sequence, name, max_mismatches) for name, sequence in primers.items()],
+                          ignore_index=True)
+        products = []
+        for template in self.templates:
+            here = sites[sites['template'] == template.name]
+            top, bottom = here[here['strand'] > 0], here[here['strand'] < 0].sort_values('end')
+            ends = bottom['end'].to_numpy()
+            index = np.arange(len(bottom))
+            if template.circular:
+                ends = np.concatenate([ends, ends + len(template.sequence)])
+                index = np.concatenate([index, index])
+            starts = top['start'].to_numpy()
+            # A product runs from a top-strand primer's 5' end to a bottom-strand primer's, past its 3' end
+            first = np.searchsorted(ends, starts + 1, 'left')
+            last = np.searchsorted(ends, starts + max_product, 'right')
+            count = np.maximum(last - first, 0)
+            forward = np.repeat(np.arange(len(top)), count)
+            partner = np.repeat(first, count) + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+            reverse = index[partner]
+            end = ends[partner]
+            start = starts[forward]
+            # The reverse primer's 3' end must lie past the forward primer's
+            keep = end - (bottom['end'].to_numpy()[reverse] - bottom['start'].to_numpy()[reverse]) > start
+            forward, reverse, start, end = forward[keep], reverse[keep], start[keep], end[keep]
+            products.append(pd.DataFrame({
+                'template': template.name, 'forward': top['primer'].to_numpy()[forward],
+                'reverse': bottom['primer'].to_numpy()[reverse], 'start': start, 'end': end, 'size': end - start,
+                'mismatches': top['mismatches'].to_numpy()[forward] + bottom['mismatches'].to_numpy()[reverse]}))
+        table = pd.concat(products, ignore_index=True) if products else pd.DataFrame(columns=AMPLICON_COLUMNS)
+        return table[AMPLICON_COLUMNS].sort_values(['template', 'size'], ascending=[True, False], ignore_index=True)
+
+
+def gel_lanes(amplicons: pd.DataFrame, templates: Sequence[str]) -> List[List[Tuple[int, float]]]:
+    """(size, ng) bands of each template's products for ``gel.synthetic_gel``, weaker with more mismatches."""
+    return [[(int(size), PRODUCT_NG * MISMATCH_YIELD ** int(mismatches))
+             for size, mismatches in amplicons.loc[amplicons['template'] == name, ['size', 'mismatches']].to_numpy()]
+            for name in templates]
+
+
+def stand_in_genome(name: str = 'E. coli BL21(DE3)', length: int = GENOME_BP) -> str:
+    """Random bases seeded by ``name``: the same stand-in genome in every process."""
+    rng = np.random.default_rng(zlib.crc32(name.encode()))
+    return _BASES[rng.integers(0, 4, length)].tobytes().decode('ascii')
+
+
+def integrate(genome: str, cassette: str, at: int, replaced: int = 0) -> str:
+    """The genome with ``cassette`` in place of the ``replaced`` bases from ``at``."""
+    return genome[:at] + cassette + genome[at + replaced:]
+
+
+
+def integration_example() -> Tuple[TemplateIndex, Dict[str, str]]:
+    """The stand-in genome and its integrant indexed together, and colony PCR primers flanking the cassette."""
+    genome = stand_in_genome()
+    start = INTEGRATION_SITE - LOCUS_BP // 2
+    # Primers at the ends of the wild-type locus amplify it whole
+    pair = design_primers(genome[start:start + LOCUS_BP], pairs=1).loc[0]
+    integrant = integrate(genome, random_bases(CASSETTE_BP, 'integration cassette'), INTEGRATION_SITE)
+    index = TemplateIndex([Template('Wild-type', genome, True), Template('Integrant', integrant, True)])
+    return index, {'Locus-F': pair['forward'], 'Locus-R': pair['reverse']}
@@ -0,0 +1,573 @@
+"""Plasmid maps from GenBank files, or FASTA files with a feature table.
+
+Files are read line by line: ``read_records`` yields one ``Plasmid`` per
+record of a multi-record file as soon as the record's ``//`` (or the next
+FASTA header) is reached, and with ``sequence=False`` the ORIGIN section is
+skipped without being kept, so a map of a large construct costs only its
+feature table.  Features for FASTA records come from a GFF3 file or a table
+with name, start and end columns (``read_features``).
+
+``layout_map`` places the features on the circle:
+
+* arcs: features are taken by start position and each goes on the
+  innermost track where it overlaps no arc already there, so arcs never
+  overlap and overlapping features stack outwards;
+* labels: each feature's label wants to sit level with the middle of its
+  arc, on the right or the left of the map; on each side the labels are
+  spread to a minimum spacing with the least total movement (isotonic
+  regression by pooling adjacent violators), and if a side holds more
+  labels than fit, the longest features keep theirs.
+
+``render_svg`` draws the layout as an SVG document: a vector map that is
+rendered once and scales to any width.
+"""
+import dataclasses
+import html
+import io
+import math
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+SEQUENCE_SUFFIXES = ('.gb', '.gbk', '.genbank', '.fasta', '.fa', '.fna', '.fas')
+FEATURE_SUFFIXES = ('.gff', '.gff3', '.tsv', '.csv')
+
+# Feature kinds left off the map: the whole record, and genes drawn again by their CDS
+SKIPPED_KINDS = ('source',)
+# Qualifiers naming a feature, in order of preference
+NAME_QUALIFIERS = ('label', 'gene', 'product', 'locus_tag', 'note')
+KIND_COLORS = {
+    'CDS': '#4C78A8',
+    'gene': '#72B7B2',
+    'promoter': '#54A24B',
+    'terminator': '#B279A2',
+    'rep_origin': '#F58518',
+    'primer_bind': '#9D755D',
+    'protein_bind': '#FF9DA6',
+    'RBS': '#EECA3B',
+}
+OTHER_COLOR = '#BAB0AC'
+
+# Map geometry, in SVG units
+BACKBONE_RADIUS = 150.0
+TRACK_WIDTH = 12.0
+TRACK_GAP = 3.0
+MAX_TRACK_SPAN = 90.0  # radial room for all tracks; more tracks get thinner
+LABEL_OFFSET = 22.0  # labels' circle beyond the outermost track
+FONT_SIZE = 11.0
+LABEL_SPACING = 1.3  # line heights between label baselines
+CHAR_WIDTH = 0.6  # of the font size, for sizing the canvas to the labels
+ARROW_LENGTH = 8.0
+MIN_ARC_GAP_BP = 0  # bases between arcs sharing a track
+MAX_TICKS = 12
+
+
+@dataclasses.dataclass
+class Feature:
+    name: str
+    kind: str
+    start: int  # 0-based first base
+    end: int  # 0-based last base + 1; below start for a feature across the origin
+    strand: int  # 1, -1 or 0
+
+
+@dataclasses.dataclass
+class Plasmid:
+    name: str
+    length: int
+    circular: bool
+    features: List[Feature]
+    sequence: str = ''  # empty when read without the sequence
+    description: str = ''
+
+    def feature_table(self) -> pd.DataFrame:
+        """One row per feature, positions 1-based inclusive as in the GenBank file."""
+        return pd.DataFrame({
+            'feature': [f.name for f in self.features],
+            'type': [f.kind for f in self.features],
+            'start': [f.start + 1 for f in self.features],
+            'end': [f.end for f in self.features],
+            'strand': ['+' if f.strand > 0 else '-' if f.strand < 0 else '' for f in self.features],
+            'length_bp': [span(f, self.length) for f in self.features],
+        })
+
+
+@dataclasses.dataclass
+class MapLayout:
+    tracks: np.ndarray  # track of every feature, 0 innermost
+    radii: np.ndarray  # (tracks, 2) inner and outer radius of every track
+    labelled: np.ndarray  # indices of the features with a label
+    label_xy: np.ndarray  # (labelled, 2) label anchor points
+    anchor_xy: np.ndarray  # (labelled, 2) points on the arcs the leader lines start from
+    right: np.ndarray  # (labelled,) whether the label is on the right of the map
+    size: Tuple[float, float]  # canvas width and height
+    center: Tuple[float, float]
+
+
+def span(feature: Feature, length: int) -> int:
+    """Bases covered by a feature, across the origin if it wraps."""
+    return (feature.end - feature.start) % length or (length if feature.end != feature.start else 0)
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+def _lines(source) -> Iterator[str]:
+    """Text lines of a path, bytes, or binary or text file object, read lazily."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    if isinstance(source, str) or hasattr(source, '__fspath__'):
+        with open(source, encoding='utf-8', errors='replace') as handle:
+            yield from handle
+        return
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    if isinstance(source, io.TextIOBase):
+        yield from source
+    else:
+        # Detached afterwards, so closing the wrapper does not close the caller's file
+        text = io.TextIOWrapper(source, encoding='utf-8', errors='replace')
+        try:
+            yield from text
+        finally:
+            text.detach()
+
+
+_SEQUENCE_JUNK = str.maketrans('', '', '0123456789 \t\r\n')
+_LOCATION_PARTS = re.compile(r'(\d+)(?:(?:\.\.|\^)(\d+))?')
+
+
+def parse_location(location: str, length: int, circular: bool = True) -> Tuple[int, int, int]:
+    """0-based start, end and strand of a GenBank location such as ``complement(join(5000..5386,1..200))``.
+
+    The parts of a join are spanned as one feature; on a circular record the feature takes the shorter way
+    round, across the origin if the widest gap between its parts is not the one over the origin.
+    """
+    strand = -1 if 'complement(' in location else 1
+    parts = sorted((int(first) - 1, int(last or first)) for first, last in
+                   _LOCATION_PARTS.findall(location.replace('<', '').replace('>', '')))
+    if not parts:
+        raise ValueError(f"no positions in location {location!r}")
+    starts = np.array([part[0] for part in parts])
+    ends = np.maximum.accumulate([part[1] for part in parts])
+    if circular and length and len(parts) > 1:
+        gaps = starts[1:] - ends[:-1]
+        widest = int(np.argmax(gaps))
+        if gaps[widest] > length - ends[-1] + starts[0]:
+            return int(starts[widest + 1]), int(ends[widest]), strand
+    return int(starts[0]), int(ends[-1]), strand
+
+
+def _feature_name(kind: str, qualifiers: Dict[str, str]) -> str:
+    for key in NAME_QUALIFIERS:
+        if qualifiers.get(key):
+            return qualifiers[key]
+    return kind
+
+
+def _record(header: dict, raw: List[list], chunks: List[str], counted: int) -> Plasmid:
+    sequence = ''.join(chunks).upper()
+    length = header['length'] or len(sequence) or counted
+    features = []
+    for kind, location, qualifiers, _ in raw:
+        if kind in SKIPPED_KINDS:
+            continue
+        try:
+            start, end, strand = parse_location(location, length, header['circular'])
+        except ValueError:
+            continue
+        features.append(Feature(_feature_name(kind, qualifiers), kind, start, end, strand))
+    # Genes already drawn by a CDS on the same bases
+    coding = {(f.start, f.end, f.strand) for f in features if f.kind == 'CDS'}
+    features = [f for f in features if not (f.kind == 'gene' and (f.start, f.end, f.strand) in coding)]
+    return Plasmid(header['name'], length, header['circular'], features, sequence, header['description'])
+
+
+def parse_genbank(lines: Iterable[str], sequence: bool = True) -> Iterator[Plasmid]:
+    """Records of a GenBank file, one at a time."""
+    lines = iter(lines)
+    header = None
+    for line in lines:
+        if line.startswith('LOCUS'):
+            fields = line.split()
+            length = next((int(value) for value, unit in zip(fields, fields[1:])
+                           if unit in ('bp', 'aa') and value.isdigit()), 0)
+            header = {'name': fields[1] if len(fields) > 1 else 'record', 'length': length,
+                      'circular': 'circular' in fields, 'description': ''}
+            raw, chunks, counted, section = [], [], 0, None
+        elif header is None:
+            continue
+        elif line.startswith('//'):
+            yield _record(header, raw, chunks, counted)
+            header = None
+        elif not line[:1].isspace():
+            section = line.split(None, 1)[0] if line.strip() else section
+            if section == 'DEFINITION':
+                header['description'] = line[10:].strip().rstrip('.')
+            elif section == 'ORIGIN' and not sequence and header['length']:
+                # The length is known from LOCUS: pass over the sequence without keeping it
+                for line in lines:
+                    if line.startswith('//'):
+                        break
+                yield _record(header, raw, [], 0)
+                header = None
+        elif section == 'ORIGIN':
+            bases = line.translate(_SEQUENCE_JUNK)
+            if sequence:
+                chunks.append(bases)
+            else:
+                counted += len(bases)
+        elif section == 'FEATURES':
+            key, text = line[5:21].strip(), line[21:].strip()
+            if key:
+                # Kind, location, qualifiers, and the qualifier a continued line belongs to
+                raw.append([key, text, {}, None])
+            elif not raw:
+                continue
+            elif text.startswith('/'):
+                qualifier, _, value = text[1:].partition('=')
+                raw[-1][3] = qualifier
+                raw[-1][2][qualifier] = value.strip('"')
+            elif raw[-1][3] is None:
+                raw[-1][1] += text  # a location continued on the next line
+            else:
+                qualifiers, qualifier = raw[-1][2], raw[-1][3]
+                qualifiers[qualifier] = f"{qualifiers[qualifier]} {text.strip(chr(34))}".strip()
+    if header is not None:
+        # A last record without its closing //
+        yield _record(header, raw, chunks, counted)
+
+
+def parse_fasta(lines: Iterable[str], features: Optional[Dict[str, List[Feature]]] = None,
+                sequence: bool = True) -> Iterator[Plasmid]:
+    """Records of a FASTA file, one at a time, with features from ``read_features`` by record id.
+
+    FASTA has no topology: records are taken as circular unless their header says ``linear``.  Features of a
+    table without record ids go on the first record.
+    """
+    features = features or {}
+    header, chunks, counted, first = None, [], 0, True
+
+    def record():
+        name, _, description = header.partition(' ')
+        own = features.get(name, features.get('', []) if first else [])
+        plasmid = _record({'name': name, 'length': 0, 'circular': 'linear' not in description.lower(),
+                           'description': description.strip()}, [], chunks, counted)
+        plasmid.features = [dataclasses.replace(feature) for feature in own]
+        return plasmid
+
+    for line in lines:
+        if line.startswith('>'):
+            if header is not None:
+                yield record()
+                first = False
+            header, chunks, counted = line[1:].strip() or 'record', [], 0
+        elif header is not None and not line.startswith(';'):
+            bases = line.translate(_SEQUENCE_JUNK)
+            if sequence:
+                chunks.append(bases)
+            else:
+                counted += len(bases)
+    if header is not None:
+        yield record()
+
+
+def read_features(source) -> Dict[str, List[Feature]]:
+    """Features by record id from a GFF3 file, or a CSV/TSV table with name, start and end columns.
+
+    Positions are 1-based and inclusive as in the files; a table may add strand, type and record columns.
+    """
+    features: Dict[str, List[Feature]] = {}
+    lines = _lines(source)
+    header = None
+    for line in lines:
+        if not line.strip() or line.startswith('#'):
+            continue
+        fields = line.rstrip('\r\n').split('\t')
+        if len(fields) == 9 and fields[3].isdigit() and fields[4].isdigit():
+            attributes = dict(item.partition('=')[::2] for item in fields[8].split(';') if '=' in item)
+            name = next((attributes[key] for key in ('Name', 'gene', 'label', 'ID') if attributes.get(key)),
+                        fields[2])
+            strand = {'+': 1, '-': -1}.get(fields[6], 0)
+            features.setdefault(fields[0], []).append(
+                Feature(name, fields[2], int(fields[3]) - 1, int(fields[4]), strand))
+            continue
+        if len(fields) == 1:
+            fields = line.rstrip('\r\n').split(',')
+        if header is None:
+            header = [field.strip().lower() for field in fields]
+            missing = {'name', 'start', 'end'} - set(header)
+            if missing:
+                raise ValueError(f"feature table has no {', '.join(sorted(missing))} column")
+            continue
+        row = dict(zip(header, (field.strip() for field in fields)))
+        strand = {'+': 1, '1': 1, '-': -1, '-1': -1}.get(row.get('strand', '+'), 0)
+        features.setdefault(row.get('record', ''), []).append(
+            Feature(row['name'], row.get('type') or 'misc_feature', int(row['start']) - 1, int(row['end']), strand))
+    return features
+
+
+def read_records(source, features=None, sequence: bool = True, filename: str = '') -> Iterator[Plasmid]:
+    """Records of a GenBank or FASTA file (told apart by the first line), one at a time.
+
+    ``features`` is a feature file for FASTA records; GenBank records carry their own.
+    """
+    lines = _lines(source)
+    for line in lines:
+        if line.strip():
+            break
+    else:
+        return
+    rest = _chain(line, lines)
+    if line.startswith('>'):
+        yield from parse_fasta(rest, read_features(features) if features is not None else None, sequence)
+    elif line.startswith('LOCUS'):
+        yield from parse_genbank(rest, sequence)
+    else:
+        raise ValueError(f"{filename or 'file'} is neither GenBank (LOCUS ...) nor FASTA (>...)")
+
+
+def _chain(first: str, rest: Iterator[str]) -> Iterator[str]:
+    yield first
+    yield from rest
+
+
+# ---------------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------------
+
+def assign_tracks(starts: np.ndarray, spans: np.ndarray, length: int) -> np.ndarray:
+    """Innermost track for each feature on which it overlaps no feature placed before it.
+
+    Features across the origin are placed first, one to a track as they all cover the origin; the rest are
+    placed by start, so a track is free for a feature if its last arc ends before the feature starts and its
+    arc across the origin, if any, starts after the feature ends.
+    """
+    tracks = np.zeros(len(starts), dtype=np.int64)
+    ends = starts + spans
+    wrapping = ends > length
+    # Per track: end of the last arc placed, and start of the arc across the origin
+    last_end = (ends[wrapping] - length).astype(np.float64)
+    wrap_start = starts[wrapping].astype(np.float64)
+    tracks[wrapping] = np.arange(wrapping.sum())
+    for index in np.flatnonzero(~wrapping)[np.lexsort((-spans[~wrapping], starts[~wrapping]))]:
+        free = np.flatnonzero((last_end <= starts[index] - MIN_ARC_GAP_BP)
+                              & (ends[index] + MIN_ARC_GAP_BP <= wrap_start))
+        if len(free):
+            track = free[0]
+        else:
+            track = len(last_end)
+            last_end = np.append(last_end, 0.0)
+            wrap_start = np.append(wrap_start, np.inf)
+        last_end[track] = ends[index]
+        tracks[index] = track
+    return tracks
+
+
+def _spread(wanted: np.ndarray, spacing: float) -> np.ndarray:
+    """Positions at least ``spacing`` apart, in the order of ``wanted`` (sorted), moved least in total.
+
+    With ``z_i = y_i - i * spacing`` the constraint is that ``z`` does not decrease, so the answer is the
+    isotonic regression of ``wanted_i - i * spacing``, found by pooling adjacent violators.
+    """
+    shifted = wanted - spacing * np.arange(len(wanted))
+    means, counts = [], []
+    for value in shifted:
+        means.append(float(value))
+        counts.append(1)
+        while len(means) > 1 and means[-2] > means[-1]:
+            count = counts[-2] + counts[-1]
+            means[-2] = (means[-2] * counts[-2] + means[-1] * counts[-1]) / count
+            counts[-2] = count
+            means.pop()
+            counts.pop()
+    return np.repeat(means, counts) + spacing * np.arange(len(wanted))
+
+
+def layout_map(plasmid: Plasmid) -> MapLayout:
+    """Tracks of the features' arcs and non-overlapping positions of their labels."""
+    length = max(plasmid.length, 1)
+    features = plasmid.features
+    starts = np.array([f.start for f in features], dtype=np.int64)
+    spans = np.array([max(span(f, length), 1) for f in features], dtype=np.int64)
+    tracks = assign_tracks(starts, spans, length) if features else np.zeros(0, dtype=np.int64)
+    n_tracks = int(tracks.max()) + 1 if len(tracks) else 0
+    width = min(TRACK_WIDTH, MAX_TRACK_SPAN / max(n_tracks, 1) - TRACK_GAP)
+    inner = BACKBONE_RADIUS + TRACK_GAP + np.arange(n_tracks) * (width + TRACK_GAP)
+    radii = np.column_stack([inner, inner + width])
+    outer = radii[-1, 1] if n_tracks else BACKBONE_RADIUS
+
+    # Labels level with the middle of their arcs, angles clockwise from the top
+    middle = 2 * np.pi * ((starts + spans / 2) % length) / length
+    label_radius = outer + LABEL_OFFSET
+    line = FONT_SIZE * LABEL_SPACING
+    reach = label_radius + 2 * line
+    capacity = int(2 * reach / line) + 1
+    labelled, label_y, right = [], [], []
+    for side in (True, False):
+        members = np.flatnonzero((np.sin(middle) >= 0) == side)
+        if len(members) > capacity:
+            members = members[np.argsort(-spans[members], kind='stable')[:capacity]]
+        wanted = -label_radius * np.cos(middle[members])
+        order = np.argsort(wanted, kind='stable')
+        members, wanted = members[order], wanted[order]
+        placed = _spread(wanted, line)
+        if len(placed):
+            # Moved back onto the canvas as a block; no more labels than fit are kept
+            placed += max(-reach - placed[0], 0) - max(placed[-1] - reach, 0)
+        labelled.append(members)
+        label_y.append(placed)
+        right.append(np.full(len(members), side))
+    labelled = np.concatenate(labelled).astype(np.int64)
+    label_y = np.concatenate(label_y)
+    right = np.concatenate(right).astype(bool)
+    label_x = np.sqrt(np.clip(label_radius ** 2 - label_y ** 2, 0, None))
+    label_x = np.maximum(label_x, LABEL_OFFSET) * np.where(right, 1, -1)
+    anchor_radius = radii[tracks[labelled], 1] if n_tracks else np.zeros(0)
+    anchor = np.column_stack([anchor_radius * np.sin(middle[labelled]), -anchor_radius * np.cos(middle[labelled])])
+
+    longest = max((len(features[i].name) for i in labelled), default=0)
+    half_width = label_radius + longest * FONT_SIZE * CHAR_WIDTH + 12
+    half_height = reach + line
+    center = (half_width, half_height)
+    offset = np.array(center)
+    return MapLayout(tracks, radii, labelled, np.column_stack([label_x, label_y]) + offset, anchor + offset,
+                     right, (2 * half_width, 2 * half_height), center)
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def _xy(cx: float, cy: float, radius: float, angle: float) -> Tuple[float, float]:
+    return cx + radius * math.sin(angle), cy - radius * math.cos(angle)
+
+
+def _point(cx: float, cy: float, radius: float, angle: float) -> str:
+    return '{:.1f},{:.1f}'.format(*_xy(cx, cy, radius, angle))
+
+
+def _arc_path(cx: float, cy: float, inner: float, outer: float, first: float, last: float, strand: int) -> str:
+    """Annular sector from angle ``first`` to ``last`` (clockwise), pointed at its 3' end."""
+    middle = (inner + outer) / 2
+    arrow = min(ARROW_LENGTH / middle, (last - first) / 2) if strand else 0.0
+    tail, head = (first, last - arrow) if strand >= 0 else (first + arrow, last)
+    large = int(head - tail > math.pi)
+    path = [f"M{_point(cx, cy, outer, tail)}",
+            f"A{outer:.1f},{outer:.1f} 0 {large} 1 {_point(cx, cy, outer, head)}"]
+    if strand > 0:
+        path.append(f"L{_point(cx, cy, middle, last)}")
+    elif strand < 0:
+        path.append(f"L{_point(cx, cy, outer, last)}L{_point(cx, cy, inner, last)}")
+    path.append(f"L{_point(cx, cy, inner, head)}")
+    path.append(f"A{inner:.1f},{inner:.1f} 0 {large} 0 {_point(cx, cy, inner, tail)}")
+    if strand < 0:
+        path.append(f"L{_point(cx, cy, middle, first)}")
+    return ''.join(path) + 'Z'
+
+
+def _tick_step(length: int) -> int:
+    raw = length / MAX_TICKS
+    magnitude = 10 ** int(math.floor(math.log10(max(raw, 1))))
+    return next(step * magnitude for step in (1, 2, 5, 10) if step * magnitude >= raw)
+
+
+def render_svg(plasmid: Plasmid, layout: Optional[MapLayout] = None) -> str:
+    """SVG document of the plasmid's map."""
+    layout = layout or layout_map(plasmid)
+    width, height = layout.size
+    cx, cy = layout.center
+    length = max(plasmid.length, 1)
+    # A linear record is drawn on a dashed backbone
+    dashes = '' if plasmid.circular else ' stroke-dasharray="6 4"'
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width:.0f} {height:.0f}" '
+             f'width="{width:.0f}" height="{height:.0f}" font-family="Helvetica, Arial, sans-serif" '
+             f'font-size="{FONT_SIZE:.0f}">',
+             f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{BACKBONE_RADIUS:.1f}" fill="none" stroke="#333" '
+             f'stroke-width="2"{dashes}/>']
+
+    step = _tick_step(length)
+    for position in range(0, length, step):
+        angle = 2 * math.pi * position / length
+        label = f"{position / 1000:g} kb" if step >= 100 else f"{position}"
+        (x1, y1), (x2, y2) = _xy(cx, cy, BACKBONE_RADIUS, angle), _xy(cx, cy, BACKBONE_RADIUS - 6, angle)
+        parts.append(f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" stroke="#333"/>')
+        x, y = _xy(cx, cy, BACKBONE_RADIUS - 18, angle)
+        parts.append(f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="middle" dominant-baseline="middle" '
+                     f'font-size="{FONT_SIZE - 2:.0f}" fill="#666">{label}</text>')
+
+    for feature, track in zip(plasmid.features, layout.tracks):
+        inner, outer = layout.radii[track]
+        first = 2 * math.pi * feature.start / length
+        last = first + 2 * math.pi * max(span(feature, length), 1) / length
+        color = KIND_COLORS.get(feature.kind, OTHER_COLOR)
+        parts.append(f'<path d="{_arc_path(cx, cy, inner, outer, first, last, feature.strand)}" fill="{color}" '
+                     f'stroke="#fff" stroke-width="0.5"><title>{html.escape(feature.name)} ({feature.kind}, '
+                     f'{feature.start + 1}..{feature.end})</title></path>')
+
+    for index, (x, y), (ax, ay), right in zip(layout.labelled, layout.label_xy, layout.anchor_xy, layout.right):
+        feature = plasmid.features[index]
+        end = x - 4 if right else x + 4
+        parts.append(f'<polyline points="{ax:.1f},{ay:.1f} {end:.1f},{y:.1f} {x:.1f},{y:.1f}" fill="none" '
+                     f'stroke="#999" stroke-width="0.75"/>')
+        parts.append(f'<text x="{x + (2 if right else -2):.1f}" y="{y:.1f}" dominant-baseline="middle" '
+                     f'text-anchor="{"start" if right else "end"}" '
+                     f'fill="{KIND_COLORS.get(feature.kind, "#555")}">{html.escape(feature.name)}</text>')
+
+    parts.append(f'<text x="{cx:.1f}" y="{cy - 8:.1f}" text-anchor="middle" font-size="{FONT_SIZE + 4:.0f}" '
+                 f'font-weight="bold">{html.escape(plasmid.name)}</text>')
+    parts.append(f'<text x="{cx:.1f}" y="{cy + 12:.1f}" text-anchor="middle" fill="#555">'
+                 f'{plasmid.length:,} bp</text>')
+    parts.append('</svg>')
+    return '\n'.join(parts)
+
+
+# ---------------------------------------------------------------------------
+# The constructs of the Engineering Bacteria page
+# ---------------------------------------------------------------------------
+
+PET21A_LENGTH = 5443
+# pET-21a(+) features, 1-based inclusive; the vector is read counterclockwise from the T7 promoter
+PET21A_FEATURES = (
+    ('T7 terminator', 'terminator', 26, 72, -1),
+    ('6xHis', 'CDS', 140, 157, -1),
+    ('MCS', 'misc_feature', 158, 203, -1),
+    ('T7 promoter', 'promoter', 311, 329, -1),
+    ('lac operator', 'protein_bind', 330, 354, -1),
+    ('lacI', 'CDS', 1172, 2251, -1),
+    ('ori', 'rep_origin', 2877, 3465, -1),
+    ('AmpR', 'CDS', 3626, 4486, -1),
+    ('f1 ori', 'rep_origin', 4618, 5073, 1),
+)
+PET21A_INSERT_AT = 203  # after the MCS's last base
+INSERT_SPACER = 24  # RBS and spacer between genes of an operon, bp
+
+EXAMPLE_CONSTRUCTS = {
+    '21a-raldh-IIdR-blh': (('raldh', 1497), ('IIdR', 795), ('blh', 1206)),
+    '21a-crtEBIY': (('crtE', 909), ('crtB', 930), ('crtI', 1479), ('crtY', 1149)),
+}
+
+
+def construct(name: str, genes: Sequence[Tuple[str, int]]) -> Plasmid:
+    """pET-21a(+) with genes (name, bp) inserted at the MCS as one operon under the T7 promoter."""
+    inserted = sum(bp + INSERT_SPACER for _, bp in genes)
+    features = []
+    for label, kind, start, end, strand in PET21A_FEATURES:
+        shift = inserted if start > PET21A_INSERT_AT else 0
+        features.append(Feature(label, kind, start - 1 + shift, end + shift, strand))
+    # Read counterclockwise from the promoter: the first gene is nearest to it
+    position = PET21A_INSERT_AT + inserted
+    for label, bp in genes:
+        position -= INSERT_SPACER
+        features.append(Feature(label, 'CDS', position - bp, position, -1))
+        position -= bp
+    features.sort(key=lambda feature: feature.start)
+    return Plasmid(name, PET21A_LENGTH + inserted, True, features,
+                   description=f"pET-21a(+) carrying {', '.join(label for label, _ in genes)}")
+
+
+def example_plasmids() -> List[Plasmid]:
+    return [construct(name, genes) for name, genes in EXAMPLE_CONSTRUCTS.items()]
@@ -0,0 +1,310 @@
+"""PCR primer design: candidates over a template, nearest-neighbor Tm, secondary structure and ranked pairs.
+
+``design_primers`` scores every candidate at once:
+
+* candidates: every forward primer ending before the target and every
+  reverse primer starting after it (or, anchored, every length of the
+  primers starting exactly at the target's ends), ``MIN_LENGTH`` to
+  ``MAX_LENGTH`` bases;
+* Tm: SantaLucia's unified nearest-neighbor parameters with a salt
+  correction for sodium and magnesium.  The stacks' enthalpy and entropy,
+  and the G and C count, are summed along the template once, so a
+  candidate's Tm is a difference of two cumulative sums whatever its
+  length, and a primer and its reverse complement share it;
+* GC clamp: G or C bases among the last five at the 3' end;
+* hairpins and dimers, on the shortlisted primers with their tails: every
+  pair of complementary bases between two primers (or within one, with a
+  loop of at least ``MIN_LOOP`` bases) is found at once, and the most
+  stable run of stacked pairs along each antiparallel alignment is
+  summed from the nearest-neighbor free energies, with a loop or
+  initiation penalty.  Mismatches and bulges end a run;
+* pairs: the best forward and reverse primers are paired, with the
+  product size (the less amplified beyond the target the better), the Tm
+  difference and the cross-dimer of every pair.
+
+Homology tails for recombination cloning go on the primers' 5' ends
+(``homology_tails`` reads them from the finished construct) and count in
+the structure scores and the product size, not in the Tm.
+"""
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from experiment_platform.assembly import DESIGN_OVERLAP, reverse_complement
+
+MIN_LENGTH = 18
+MAX_LENGTH = 30
+OPTIMAL_LENGTH = 21
+TM_RANGE = (52.0, 68.0)  # degC; candidates outside are dropped
+OPTIMAL_TM = 60.0
+MAX_TM_DIFFERENCE = 5.0  # between the two primers of a pair
+GC_RANGE = (30.0, 70.0)  # percent; candidates outside are dropped
+OPTIMAL_GC = (40.0, 60.0)
+CLAMP = (1, 3)  # G or C among the last CLAMP_WINDOW bases
+CLAMP_WINDOW = 5
+MIN_LOOP = 3  # bases in a hairpin loop
+HAIRPIN_LIMIT = -2.0  # kcal/mol; more stable hairpins are penalized
+DIMER_LIMIT = -6.0  # kcal/mol, for self- and cross-dimers
+HAIRPIN_LOOP = 3.5  # kcal/mol, free energy of closing a small hairpin loop
+DUPLEX_INITIATION = 1.96  # kcal/mol
+PRODUCT_RANGE = (100, 5000)  # bp, with tails
+FLANK_PENALTY = 0.002  # per bp amplified beyond the target
+SHORTLIST = 300  # primers per side scored for structure
+PAIR_SHORTLIST = 60  # primers per side paired
+
+SODIUM_MM = 50.0
+MAGNESIUM_MM = 1.5
+DNTP_MM = 0.2
+PRIMER_NM = 250.0
+GAS_CONSTANT = 1.987  # cal/(K mol)
+
+# SantaLucia (1998) unified parameters: stack (5'->3' top strand): (dH kcal/mol, dS cal/(K mol))
+NEAREST_NEIGHBOR = {
+    'AA': (-7.9, -22.2), 'AT': (-7.2, -20.4), 'TA': (-7.2, -21.3), 'CA': (-8.5, -22.7), 'GT': (-8.4, -22.4),
+    'CT': (-7.8, -21.0), 'GA': (-8.2, -22.2), 'CG': (-10.6, -27.2), 'GC': (-9.8, -24.4), 'GG': (-8.0, -19.9),
+}
+INITIATION = {'GC': (0.1, -2.8), 'AT': (2.3, 4.1)}  # per terminal base pair
+
+PAIR_COLUMNS = ['forward', 'reverse', 'forward_start', 'reverse_start', 'product', 'forward_tm', 'reverse_tm',
+                'forward_gc', 'reverse_gc', 'hairpin', 'self_dimer', 'cross_dimer', 'penalty']
+
+_CODES = np.full(256, -1, dtype=np.int64)
+for _code, _base in enumerate('ACGT'):
+    _CODES[ord(_base)] = _CODES[ord(_base.lower())] = _code
+
+
+def _stack_table() -> Tuple[np.ndarray, np.ndarray]:
+    enthalpy, entropy = np.zeros((4, 4)), np.zeros((4, 4))
+    for stack, (dh, ds) in NEAREST_NEIGHBOR.items():
+        for pair in (stack, reverse_complement(stack)):
+            enthalpy['ACGT'.index(pair[0]), 'ACGT'.index(pair[1])] = dh
+            entropy['ACGT'.index(pair[0]), 'ACGT'.index(pair[1])] = ds
+    return enthalpy, entropy
+
+
+_ENTHALPY, _ENTROPY = _stack_table()
+_FREE_ENERGY = _ENTHALPY - 310.15 * _ENTROPY / 1000  # kcal/mol at 37 degC
+_STRONG = np.array([False, True, True, False])  # C and G
+
+
+def encode(sequence: str) -> np.ndarray:
+    """2-bit code of every base (A, C, G, T = 0..3), -1 for any other letter."""
+    return _CODES[np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)]
+
+
+def _salt_entropy(stacks: np.ndarray) -> np.ndarray:
+    """Entropy correction for monovalent and divalent cations (von Ahsen's sodium equivalent)."""
+    sodium = (SODIUM_MM + 120 * np.sqrt(max(MAGNESIUM_MM - DNTP_MM, 0.0))) / 1000
+    return 0.368 * stacks * np.log(sodium)
+
+
+def _tm(enthalpy: np.ndarray, entropy: np.ndarray, stacks: np.ndarray) -> np.ndarray:
+    entropy = entropy + _salt_entropy(stacks)
+    return 1000 * enthalpy / (entropy + GAS_CONSTANT * np.log(PRIMER_NM * 1e-9 / 4)) - 273.15
+
+
+def melting_temperature(sequences: Sequence[str]) -> np.ndarray:
+    """Nearest-neighbor Tm (degC) of each sequence against its perfect complement."""
+    length = max((len(s) for s in sequences), default=0)
+    codes = np.full((len(sequences), length + 1), -1, dtype=np.int64)
+    for row, sequence in enumerate(sequences):
+        codes[row, :len(sequence)] = encode(sequence)
+    valid = (codes[:, :-1] >= 0) & (codes[:, 1:] >= 0)
+    first, second = np.maximum(codes[:, :-1], 0), np.maximum(codes[:, 1:], 0)
+    enthalpy = np.where(valid, _ENTHALPY[first, second], 0).sum(axis=1)
+    entropy = np.where(valid, _ENTROPY[first, second], 0).sum(axis=1)
+    lengths = np.array([len(s) for s in sequences])
+    ends = np.stack([codes[:, 0], codes[np.arange(len(sequences)), np.maximum(lengths - 1, 0)]], axis=1)
+    strong = _STRONG[np.maximum(ends, 0)]
+    enthalpy = enthalpy + np.where(strong, INITIATION['GC'][0], INITIATION['AT'][0]).sum(axis=1)
+    entropy = entropy + np.where(strong, INITIATION['GC'][1], INITIATION['AT'][1]).sum(axis=1)
+    return _tm(enthalpy, entropy, np.maximum(lengths - 1, 0))
+
+
+def stem_energy(first: np.ndarray, second: np.ndarray, hairpin: bool = False) -> np.ndarray:
+    """Free energy (kcal/mol, 0 for none) of the most stable stem between rows of two primer-code arrays.
+
+    Both arrays are 5'->3' codes padded with -1; ``first`` is paired antiparallel with ``second``.  With
+    ``hairpin`` the two are the same molecule, so only pairs enclosing a loop of ``MIN_LOOP`` bases count.
+    """
+    rows, length_a = first.shape
+    length_b = second.shape[1]
+    if length_a < 2 or length_b < 2:
+        return np.zeros(rows)
+    # Second reversed, so that stacked pairs (a, b), (a + 1, b - 1) lie on a diagonal (a, c), (a + 1, c + 1)
+    flipped = second[:, ::-1]
+    paired = (first[:, :, None] + flipped[:, None, :] == 3) & (first[:, :, None] >= 0)
+    stacked = paired[:, :-1, :-1] & paired[:, 1:, 1:]
+    if hairpin:
+        a = np.arange(length_a - 1)[:, None]
+        b = length_b - 1 - np.arange(length_b - 1)[None, :]
+        stacked &= (b - 1) - (a + 1) - 1 >= MIN_LOOP
+    stability = -_FREE_ENERGY[np.maximum(first[:, :-1], 0), np.maximum(first[:, 1:], 0)]
+    run = np.zeros((rows, length_b - 1))
+    best = np.zeros(rows)
+    for a in range(length_a - 1):
+        extended = np.concatenate([np.zeros((rows, 1)), run[:, :-1]], axis=1) + stability[:, a, None]
+        run = np.where(stacked[:, a], extended, 0.0)
+        best = np.maximum(best, run.max(axis=1))
+    penalty = HAIRPIN_LOOP if hairpin else DUPLEX_INITIATION
+    return np.where(best > 0, np.minimum(penalty - best, 0.0), 0.0)
+
+
+def homology_tails(sequence: str, start: int, end: int, strand: int = 1,
+                   overlap: int = DESIGN_OVERLAP) -> Tuple[str, str, str]:
+    """Template and 5' tails of the primers that amplify ``sequence[start:end]`` to go back in place.
+
+    ``sequence`` is the finished circular construct and the region is read on ``strand``; the forward tail is
+    the ``overlap`` bases before the region and the reverse tail the reverse complement of those after it.
+    """
+    length = len(sequence)
+    doubled = sequence + sequence
+    region = doubled[start:end] if end > start else doubled[start:end + length]
+    before = doubled[(start - overlap) % length:][:overlap]
+    after = doubled[end % length:][:overlap]
+    if strand > 0:
+        return region, before, reverse_complement(after)
+    return reverse_complement(region), reverse_complement(after), before
+
+
+def _candidates(codes: np.ndarray, start: np.ndarray, length: np.ndarray, sums: Dict[str, np.ndarray],
+                forward: bool) -> pd.DataFrame:
+    """Start, length, Tm, GC and clamp of the primers on ``codes[start:start + length]``."""
+    end = start + length
+    keep = (start >= 0) & (end <= len(codes))
+    start, length, end = start[keep], length[keep], end[keep]
+    keep = sums['unknown'][end] == sums['unknown'][start]
+    start, length, end = start[keep], length[keep], end[keep]
+    enthalpy = sums['enthalpy'][end - 1] - sums['enthalpy'][start]
+    entropy = sums['entropy'][end - 1] - sums['entropy'][start]
+    strong = _STRONG[codes[start]].astype(int) + _STRONG[codes[end - 1]]
+    enthalpy = enthalpy + strong * INITIATION['GC'][0] + (2 - strong) * INITIATION['AT'][0]
+    entropy = entropy + strong * INITIATION['GC'][1] + (2 - strong) * INITIATION['AT'][1]
+    gc = sums['gc'][end] - sums['gc'][start]
+    # The 3' end: the region's end for a forward primer, its start for a reverse one
+    clamp_from = end - CLAMP_WINDOW if forward else start
+    clamp = sums['gc'][clamp_from + CLAMP_WINDOW] - sums['gc'][clamp_from]
+    return pd.DataFrame({'start': start, 'length': length, 'tm': _tm(enthalpy, entropy, length - 1),
+                         'gc': 100 * gc / length, 'clamp': clamp})
+
+
+def _penalty(table: pd.DataFrame) -> np.ndarray:
+    gc_off = np.maximum(OPTIMAL_GC[0] - table['gc'], 0) + np.maximum(table['gc'] - OPTIMAL_GC[1], 0)
+    clamp_off = (table['clamp'] < CLAMP[0]) | (table['clamp'] > CLAMP[1])
+    return (np.abs(table['tm'] - OPTIMAL_TM) + 0.5 * np.abs(table['length'] - OPTIMAL_LENGTH)
+            + 0.2 * gc_off + 3.0 * clamp_off).to_numpy()
+
+
+def _structure_penalty(hairpin: np.ndarray, dimer: np.ndarray) -> np.ndarray:
+    return 2.0 * np.maximum(HAIRPIN_LIMIT - hairpin, 0) + 2.0 * np.maximum(DIMER_LIMIT - dimer, 0)
+
+
+def _primer_codes(codes: np.ndarray, table: pd.DataFrame, tail: str, forward: bool) -> np.ndarray:
+    """5'->3' codes of the shortlisted primers with their tail, padded with -1."""
+    steps = np.arange(MAX_LENGTH)
+    start, length = table['start'].to_numpy()[:, None], table['length'].to_numpy()[:, None]
+    inside = steps < length
+    if forward:
+        annealing = codes[np.where(inside, start + steps, 0)]
+    else:
+        annealing = 3 - codes[np.where(inside, start + length - 1 - steps, 0)]
+    annealing = np.where(inside, annealing, -1)
+    return np.concatenate([np.broadcast_to(encode(tail), (len(table), len(tail))), annealing], axis=1)
+
+
+def _sequences(template: str, table: pd.DataFrame, tail: str, forward: bool) -> list:
+    """Primer sequences, the tail in lower case."""
+    regions = [template[s:s + n] for s, n in zip(table['start'], table['length'])]
+    return [tail.lower() + (region if forward else reverse_complement(region)) for region in regions]
+
+
+def _shortlist(codes: np.ndarray, table: pd.DataFrame, tail: str, forward: bool) -> Tuple[pd.DataFrame, np.ndarray]:
+    table = table[table['tm'].between(*TM_RANGE) & table['gc'].between(*GC_RANGE)]
+    penalty = _penalty(table)
+    if len(table) > SHORTLIST:
+        keep = np.argpartition(penalty, SHORTLIST)[:SHORTLIST]
+        table, penalty = table.iloc[keep], penalty[keep]
+    primers = _primer_codes(codes, table, tail, forward)
+    table = table.assign(hairpin=stem_energy(primers, primers, hairpin=True),
+                         self_dimer=stem_energy(primers, primers))
+    table['penalty'] = penalty + _structure_penalty(table['hairpin'].to_numpy(), table['self_dimer'].to_numpy())
+    order = np.argsort(table['penalty'].to_numpy(), kind='stable')[:PAIR_SHORTLIST]
+    return table.iloc[order].reset_index(drop=True), primers[order]
+
+
+def design_primers(template: str, target: Optional[Tuple[int, int]] = None, tails: Tuple[str, str] = ('', ''),
+                   anchored: bool = False, product: Tuple[int, int] = PRODUCT_RANGE,
+                   pairs: int = 10) -> pd.DataFrame:
+    """Best primer pairs (``PAIR_COLUMNS``) that amplify ``template[target[0]:target[1]]``, lowest penalty first.
+
+    ``target`` defaults to the whole template, which anchors the primers at its ends; otherwise the primers lie
+    in the flanks, and ``anchored`` makes them start exactly at the target's ends.  ``tails`` go on the 5'
+    ends of the forward and reverse primers.  Starts are 0-based template positions of the annealing parts
+    (the reverse primer's is its 3' end's); the product includes the tails.
+    """
+    template = template.upper()
+    length = len(template)
+    start, end = target if target is not None else (0, length)
+    anchored = anchored or target is None
+    if not 0 <= start < end <= length:
+        raise ValueError(f"target {start}..{end} is outside the {length} bp template")
+    codes = encode(template)
+    known = np.maximum(codes, 0)
+    stacks = np.concatenate([[0.0], np.cumsum(np.where((codes[:-1] >= 0) & (codes[1:] >= 0),
+                                                       _ENTHALPY[known[:-1], known[1:]], 0))])
+    sums = {
+        'enthalpy': stacks,
+        'entropy': np.concatenate([[0.0], np.cumsum(np.where((codes[:-1] >= 0) & (codes[1:] >= 0),
+                                                             _ENTROPY[known[:-1], known[1:]], 0))]),
+        'gc': np.concatenate([[0], np.cumsum(_STRONG[known] & (codes >= 0))]),
+        'unknown': np.concatenate([[0], np.cumsum(codes < 0)]),
+    }
+    lengths = np.arange(MIN_LENGTH, MAX_LENGTH + 1)
+    tail_bp = len(tails[0]) + len(tails[1])
+    if anchored:
+        forward = _candidates(codes, np.full(len(lengths), start), lengths, sums, True)
+        # The reverse primer's region ends at the target's end, whatever its length
+        reverse = _candidates(codes, end - lengths, lengths, sums, False)
+    else:
+        reach = product[1] - tail_bp - (end - start)
+        starts, sizes = (grid.ravel() for grid in np.meshgrid(
+            np.arange(max(start - reach, 0), start - MIN_LENGTH + 1), lengths, indexing='ij'))
+        keep = starts + sizes <= start
+        forward = _candidates(codes, starts[keep], sizes[keep], sums, True)
+        starts, sizes = (grid.ravel() for grid in np.meshgrid(
+            np.arange(end, min(end + reach, length - MIN_LENGTH) + 1), lengths, indexing='ij'))
+        reverse = _candidates(codes, starts, sizes, sums, False)
+    forward, forward_codes = _shortlist(codes, forward, tails[0], True)
+    reverse, reverse_codes = _shortlist(codes, reverse, tails[1], False)
+    if forward.empty or reverse.empty:
+        return pd.DataFrame(columns=PAIR_COLUMNS)
+    f, r = (grid.ravel() for grid in np.meshgrid(np.arange(len(forward)), np.arange(len(reverse)), indexing='ij'))
+    size = (reverse['start'].to_numpy()[r] + reverse['length'].to_numpy()[r] - forward['start'].to_numpy()[f]
+            + tail_bp)
+    keep = (size >= product[0]) & (size <= product[1])
+    f, r, size = f[keep], r[keep], size[keep]
+    cross = stem_energy(forward_codes[f], reverse_codes[r])
+    tm_difference = np.abs(forward['tm'].to_numpy()[f] - reverse['tm'].to_numpy()[r])
+    penalty = (forward['penalty'].to_numpy()[f] + reverse['penalty'].to_numpy()[r] + tm_difference
+               + 3.0 * np.maximum(tm_difference - MAX_TM_DIFFERENCE, 0)
+               + 2.0 * np.maximum(DIMER_LIMIT - cross, 0) + FLANK_PENALTY * (size - tail_bp - (end - start)))
+    best = np.argsort(penalty, kind='stable')[:pairs]
+    f, r = f[best], r[best]
+    chosen_forward, chosen_reverse = forward.iloc[f], reverse.iloc[r]
+    return pd.DataFrame({
+        'forward': _sequences(template, chosen_forward, tails[0], True),
+        'reverse': _sequences(template, chosen_reverse, tails[1], False),
+        'forward_start': chosen_forward['start'].to_numpy(),
+        'reverse_start': chosen_reverse['start'].to_numpy(),
+        'product': size[best],
+        'forward_tm': chosen_forward['tm'].round(1).to_numpy(),
+        'reverse_tm': chosen_reverse['tm'].round(1).to_numpy(),
+        'forward_gc': chosen_forward['gc'].round(1).to_numpy(),
+        'reverse_gc': chosen_reverse['gc'].round(1).to_numpy(),
+        'hairpin': np.minimum(chosen_forward['hairpin'].to_numpy(), chosen_reverse['hairpin'].to_numpy()).round(2),
+        'self_dimer': np.minimum(chosen_forward['self_dimer'].to_numpy(),
+                                 chosen_reverse['self_dimer'].to_numpy()).round(2),
+        'cross_dimer': cross[best].round(2),
+        'penalty': penalty[best].round(2),
+    }, columns=PAIR_COLUMNS)
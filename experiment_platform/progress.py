@@ -0,0 +1,274 @@
+"""Class progress for the instructor: compact updates published by every session, aggregated as they arrive.
+
+Each session publishes what changed in its simulator since it last published
+(protocol steps, measurements, page and mode) on a ``ProgressBus``, an
+in-process stand-in for a pub/sub server.  The process-wide
+``ProgressRegistry`` (started by the first dashboard that opens) queues the
+updates and folds them, a batch at a time, into running aggregates:
+
+* counters of the sessions at each step of every protocol, on each page and
+  in each mode, an update moving a session from one count to another;
+* histograms of the measurements, an update moving one value between bins;
+* per protocol, a queue of the steps sessions reached, in time order, read
+  from the front as steps become stuck: a session still on the step then
+  joins that step's stuck list (oldest first), and leaves it when it
+  advances;
+* the sessions in the order they last published, so idle ones expire from
+  the front.
+
+A dashboard refresh costs the updates since the last one and the size of
+the summary, not a scan of every session.  Sessions send their whole state
+again whenever a new registry subscribes, so it starts complete, and after a
+registry expires idle sessions, so one that comes back is counted in full.
+"""
+import collections
+import dataclasses
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from experiment_platform.session_log import MEASUREMENTS, PROTOCOL_STEPS
+
+if TYPE_CHECKING:
+    # Only the summary builds frames; the pages publishing progress do not need pandas
+    import pandas as pd
+
+# Environment variable that adds the instructor dashboard to the sidebar
+INSTRUCTOR_ENV = 'EXPERIMENT_INSTRUCTOR'
+STUCK_S = 300.0  # on a step this long without advancing
+ACTIVE_S = 300.0
+SESSION_TTL_S = 3600.0  # sessions silent this long have left
+FOLD_EVERY = 256  # updates queued before a publisher folds them in itself
+
+# Steps of each protocol, as its page lists them
+PROTOCOL_LENGTHS = {
+    'current_step': 6,
+    'plasmid_steps': 7,
+    'gel_recovery_step': 8,
+    'heat_shock_step': 8,
+    'prep_step': 8,
+    'electro_step': 9,
+    'fusion_pcr_step': 5,
+}
+# (low, high, bins) of each measurement's histogram; values outside fall in the end bins
+HISTOGRAMS = {
+    'temperature': (0.0, 50.0, 10),
+    'ph_level': (5.0, 9.0, 16),
+    'bacterial_od': (0.0, 1.0, 10),
+    'pcr_cycles': (0.0, 40.0, 8),
+    'pcr_product': (0.0, 100.0, 10),
+    'plasmid_yield': (0.0, 250.0, 10),
+    'dna_concentration': (0.0, 500.0, 10),
+}
+# Values of a fresh simulator, published as None: steps not started, measurements not taken
+DEFAULTS = {'current_step': 0, 'plasmid_steps': 0, 'gel_recovery_step': 0, 'heat_shock_step': 0, 'prep_step': 0,
+            'electro_step': 0, 'fusion_pcr_step': 0, 'temperature': 25, 'ph_level': 7.0, 'bacterial_od': 0.0,
+            'pcr_cycles': 0, 'pcr_product': 0.0, 'plasmid_yield': 0.0, 'dna_concentration': 0}
+
+
+@dataclasses.dataclass(frozen=True)
+class ProgressUpdate:
+    session: str
+    time: float
+    changes: Tuple[Tuple[str, object], ...]  # (key, new value or None)
+
+
+class ProgressBus:
+    """In-process stand-in for a pub/sub server: every update published is handed to every subscriber."""
+
+    def __init__(self):
+        self.epoch = 0  # bumped by each subscription and resend: publishers then send their whole state again
+        self._subscribers: List[Callable[[ProgressUpdate], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[ProgressUpdate], None]):
+        with self._lock:
+            self._subscribers.append(callback)
+            self.epoch += 1
+
+    def resend(self):
+        """Ask every publisher to send its whole state with its next update."""
+        with self._lock:
+            self.epoch += 1
+
+    def publish(self, update: ProgressUpdate):
+        for callback in self._subscribers:
+            callback(update)
+
+
+@dataclasses.dataclass
+class ProgressSummary:
+    sessions: int
+    active: int
+    steps: 'pd.DataFrame'  # protocol, step, sessions
+    stuck: 'pd.DataFrame'  # protocol, step, sessions, longest (min)
+    pages: 'pd.Series'  # sessions by page
+    modes: 'pd.Series'
+    distributions: Dict[str, 'pd.Series']  # sessions by bin, by measurement label
+    updates: int  # folded in since the registry started
+
+
+class ProgressRegistry:
+    """Running aggregates of the progress of every session, from the updates of a ``ProgressBus``."""
+
+    def __init__(self, bus: ProgressBus, stuck_s: float = STUCK_S, ttl_s: float = SESSION_TTL_S):
+        self.bus = bus
+        self.stuck_s = stuck_s
+        self.ttl_s = ttl_s
+        self.updates = 0
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._sessions: 'collections.OrderedDict[str, Dict[str, object]]' = collections.OrderedDict()
+        self._seen: Dict[str, float] = {}
+        self._counts = {key: collections.Counter() for key in list(PROTOCOL_LENGTHS) + ['page', 'mode']}
+        self._bins = {key: np.zeros(bins, dtype=np.int64) for key, (_, _, bins) in HISTOGRAMS.items()}
+        # Per protocol: session -> (step, since) partway through, (since, session, step) in time order, and the
+        # sessions stuck on each step, oldest first
+        self._working = {key: {} for key in PROTOCOL_LENGTHS}
+        self._reached = {key: collections.deque() for key in PROTOCOL_LENGTHS}
+        self._stuck = {key: collections.defaultdict(collections.OrderedDict) for key in PROTOCOL_LENGTHS}
+        bus.subscribe(self.receive)
+
+    def receive(self, update: ProgressUpdate):
+        self._pending.append(update)
+        if len(self._pending) >= FOLD_EVERY:
+            self.refresh(update.time)
+
+    def refresh(self, now: Optional[float] = None) -> int:
+        """Fold in the updates queued since the last refresh, expire idle sessions and mark the stuck ones; the
+        number of updates folded in."""
+        now = time.time() if now is None else now
+        with self._lock:
+            folded = expired = 0
+            while self._pending:
+                self._apply(self._pending.popleft())
+                folded += 1
+            while self._sessions:
+                session = next(iter(self._sessions))
+                if self._seen[session] > now - self.ttl_s:
+                    break
+                for key, value in self._sessions.pop(session).items():
+                    self._move(session, key, value, None, now)
+                del self._seen[session]
+                expired += 1
+            if expired:
+                # A session coming back would otherwise send only what changed, to a registry that forgot the rest
+                self.bus.resend()
+            for key, reached in self._reached.items():
+                while reached and reached[0][0] <= now - self.stuck_s:
+                    since, session, step = reached.popleft()
+                    # Skipped if the session has moved on since
+                    if self._working[key].get(session) == (step, since):
+                        self._stuck[key][step][session] = since
+            self.updates += folded
+            return folded
+
+    def _apply(self, update: ProgressUpdate):
+        values = self._sessions.pop(update.session, {})
+        self._sessions[update.session] = values
+        self._seen[update.session] = update.time
+        for key, value in update.changes:
+            self._move(update.session, key, values.get(key), value, update.time)
+            if value is None:
+                values.pop(key, None)
+            else:
+                values[key] = value
+
+    def _bin(self, key: str, value) -> int:
+        low, high, bins = HISTOGRAMS[key]
+        return int(min(max((float(value) - low) / (high - low) * bins, 0), bins - 1))
+
+    def _move(self, session: str, key: str, old, new, when: float):
+        if old == new:
+            return
+        if key in self._counts:
+            counts = self._counts[key]
+            if old is not None:
+                counts[old] -= 1
+                if not counts[old]:
+                    del counts[old]
+            if new is not None:
+                counts[new] += 1
+        if key in self._working:
+            working = self._working[key]
+            if session in working:
+                self._stuck[key][working.pop(session)[0]].pop(session, None)
+            if new is not None and new < PROTOCOL_LENGTHS[key]:
+                working[session] = (new, when)
+                self._reached[key].append((when, session, new))
+        elif key in self._bins:
+            if old is not None:
+                self._bins[key][self._bin(key, old)] -= 1
+            if new is not None:
+                self._bins[key][self._bin(key, new)] += 1
+
+    def summary(self, now: Optional[float] = None) -> ProgressSummary:
+        import pandas as pd
+
+        now = time.time() if now is None else now
+        self.refresh(now)
+        with self._lock:
+            sessions = len(self._sessions)
+            rows, stuck = [], []
+            for key, protocol in PROTOCOL_STEPS.items():
+                counts = self._counts[key]
+                rows.append((protocol, 0, sessions - sum(counts.values())))
+                rows += [(protocol, step, counts.get(step, 0)) for step in range(1, PROTOCOL_LENGTHS[key] + 1)]
+                stuck += [(protocol, step, len(sessions_), round((now - next(iter(sessions_.values()))) / 60, 1))
+                          for step, sessions_ in sorted(self._stuck[key].items()) if sessions_]
+            active = 0
+            for session in reversed(self._sessions):
+                if self._seen[session] <= now - ACTIVE_S:
+                    break
+                active += 1
+            distributions = {}
+            for key, (low, high, bins) in HISTOGRAMS.items():
+                edges = np.linspace(low, high, bins + 1)
+                labels = [f"{a:g}–{b:g}" for a, b in zip(edges[:-1], edges[1:])]
+                distributions[MEASUREMENTS[key][0]] = pd.Series(self._bins[key].copy(), index=labels)
+            return ProgressSummary(
+                sessions, active, pd.DataFrame(rows, columns=['protocol', 'step', 'sessions']),
+                pd.DataFrame(stuck, columns=['protocol', 'step', 'sessions', 'longest (min)']),
+                pd.Series(dict(self._counts['page'].most_common()), dtype=np.int64),
+                pd.Series(dict(self._counts['mode'].most_common()), dtype=np.int64), distributions, self.updates)
+
+
+progress_bus = ProgressBus()
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def progress_registry() -> ProgressRegistry:
+    """The registry of all sessions of this process, subscribed on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ProgressRegistry(progress_bus)
+    return _registry
+
+
+def publish_progress(page: Optional[str] = None, state=None):
+    """Publish what changed in this session's progress (and page, if given) since it last published.
+
+    ``state`` is a mapping like a session's state, by default the current session's.
+    """
+    state = st.session_state if state is None else state
+    # Read once: a resend asked for while this publishes is answered by the next update
+    epoch = progress_bus.epoch
+    if 'simulator' not in state or not epoch:
+        return
+    published, last = state.get('_progress_published', (None, {}))
+    data = state['simulator'].experiment_data
+    current = {key: None if data.get(key, default) == default else data[key] for key, default in DEFAULTS.items()}
+    current['mode'] = state.get('app_mode', "Professional")
+    current['page'] = page if page is not None else last.get('page')
+    sent = last if published == epoch else {}
+    changes = tuple((key, value) for key, value in current.items() if key not in sent or sent[key] != value)
+    if changes:
+        session = state.setdefault('_progress_session', uuid.uuid4().hex)
+        progress_bus.publish(ProgressUpdate(session, time.time(), changes))
+        state['_progress_published'] = (epoch, current)
@@ -0,0 +1,140 @@
+"""Relative expression (ΔΔCt) from qPCR Ct tables.
+
+``relative_expression`` takes one row per well (the ``qpcr`` dataset of
+``experiment_platform.datasets``: sample, gene, ct and optionally plate and
+efficiency) and works on whole columns with groupby, so tens of thousands of
+wells take a few tens of milliseconds:
+
+1. Technical replicates (same plate, sample and gene) are pooled; a well
+   further than ``max_deviation`` cycles from its replicates' median is
+   rejected, if there are at least ``MIN_REJECT_REPLICATES`` wells and some
+   of them are near the median.  Otherwise there is no telling which well is
+   off (two discordant duplicates, say): the wells are kept and counted as
+   discordant.
+2. Each gene's mean Ct is compared with the calibrator sample on the same
+   plate.  With an amplification efficiency E per gene (2.0 = 100%) the
+   log2 relative quantity is ``log2(E) * (Ct_calibrator - Ct_sample)``
+   (Pfaffl); without one, E = 2 and this is the classic ΔΔCt.
+3. Targets are normalised to the geometric mean of the reference genes.
+4. Plates are combined by averaging log2 fold changes.  The standard error
+   is the spread between plates when there are several, else the replicate
+   variances propagated through steps 2-3.
+"""
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+PATHWAY_GENES = ('raldh', 'IIdR', 'blh', 'crtE', 'crtB', 'crtI', 'crtY')
+
+MAX_REPLICATE_DEVIATION = 0.5  # cycles
+# Replicates needed to reject one as an outlier
+MIN_REJECT_REPLICATES = 3
+
+
+def _log2_efficiency(wells: pd.DataFrame, genes: pd.Index, efficiencies: Dict[str, float] = None) -> pd.Series:
+    """log2 of the amplification factor per gene: explicit values, else the table's efficiency column, else 2."""
+    log2_e = pd.Series(1.0, index=genes)
+    if efficiencies is None and 'efficiency' in wells.columns:
+        efficiencies = wells.groupby('gene', observed=True)['efficiency'].mean().dropna().to_dict()
+    for gene, efficiency in (efficiencies or {}).items():
+        if gene in log2_e.index:
+            # Accept percentages (95 -> 1.95) as well as amplification factors
+            factor = efficiency / 100 + 1 if efficiency > 2.5 else efficiency
+            log2_e[gene] = np.log2(factor)
+    return log2_e
+
+
+def relative_expression(wells: pd.DataFrame, reference_genes: Iterable[str], calibrator: str,
+                        efficiencies: Dict[str, float] = None,
+                        max_deviation: float = MAX_REPLICATE_DEVIATION) -> pd.DataFrame:
+    """Fold change of every target gene in every sample against the calibrator sample.
+
+    Returns one row per (sample, gene) with log2_fold_change, se, fold_change,
+    lower/upper (fold change at ± one standard error), plates, wells used,
+    wells rejected as outliers and wells kept though discordant.  Every
+    (sample, gene) with a Ct value has a row, with a NaN fold change for the
+    reference genes and for targets that cannot be computed (no reference or
+    calibrator Ct on their plates).
+    """
+    reference_genes = list(reference_genes)
+    if not reference_genes:
+        raise ValueError("At least one reference gene is needed")
+    keys = ['plate', 'sample', 'gene']
+    df = pd.DataFrame({
+        'plate': wells['plate'] if 'plate' in wells.columns else '1',
+        'sample': wells['sample'].astype(str),
+        'gene': wells['gene'].astype(str),
+        'ct': wells['ct'].astype(np.float64),
+    }).dropna(subset=['ct'])
+
+    # 1. Replicates: reject wells far from their group's median where the others outvote them, then pool
+    groups = df.groupby(keys, observed=True, sort=False)['ct']
+    near = (df['ct'] - groups.transform('median')).abs() <= max_deviation
+    consensus = near.groupby([df[key] for key in keys], observed=True, sort=False).transform('any')
+    can_reject = (groups.transform('size') >= MIN_REJECT_REPLICATES) & consensus
+    kept = near | ~can_reject
+    flags = pd.DataFrame({'rejected': ~kept, 'discordant': ~near & kept}).groupby(
+        [df['sample'], df['gene']], observed=True).sum()
+    reps = df[kept].groupby(keys, observed=True)['ct'].agg(['mean', 'var', 'count'])
+    reps['var'] = reps['var'].fillna(0.0) / reps['count']  # variance of the mean
+
+    # 2. Against the calibrator on the same plate, in log2 units
+    if calibrator not in reps.index.get_level_values('sample'):
+        raise ValueError(f"Calibrator sample {calibrator!r} has no Ct values")
+    calibration = reps.xs(calibrator, level='sample')
+    cal = calibration.reindex(pd.MultiIndex.from_arrays([reps.index.get_level_values('plate'),
+                                                         reps.index.get_level_values('gene')]))
+    genes = reps.index.get_level_values('gene')
+    log2_e = _log2_efficiency(wells, pd.Index(genes.unique()), efficiencies).reindex(genes).to_numpy()
+    rq = pd.DataFrame({
+        'log2': log2_e * (cal['mean'].to_numpy() - reps['mean'].to_numpy()),
+        'var': log2_e ** 2 * (cal['var'].to_numpy() + reps['var'].to_numpy()),
+    }, index=reps.index).dropna()
+
+    # 3. Normalise to the geometric mean of the reference genes of each (plate, sample)
+    is_reference = rq.index.get_level_values('gene').isin(reference_genes)
+    ref = rq[is_reference].groupby(level=['plate', 'sample']).agg(
+        log2=('log2', 'mean'), var=('var', 'sum'), n=('var', 'size'))
+    if ref.empty:
+        raise ValueError(f"No Ct values for the reference genes {', '.join(reference_genes)}")
+    ref['var'] /= ref['n'] ** 2
+    targets = rq[~is_reference]
+    ref_at = ref.reindex(targets.index.droplevel('gene'))
+    per_plate = pd.DataFrame({
+        'log2': targets['log2'].to_numpy() - ref_at['log2'].to_numpy(),
+        'var': targets['var'].to_numpy() + ref_at['var'].to_numpy(),
+    }, index=targets.index).dropna()
+
+    # 4. Combine plates
+    by_gene = per_plate.groupby(level=['sample', 'gene'])
+    out = by_gene['log2'].agg(log2_fold_change='mean', spread='std', plates='size')
+    out['propagated'] = np.sqrt(by_gene['var'].mean() / out['plates'])
+    out['se'] = np.where(out['plates'] > 1, out['spread'] / np.sqrt(out['plates']), out['propagated'])
+    out['fold_change'] = np.exp2(out['log2_fold_change'])
+    out['lower'] = np.exp2(out['log2_fold_change'] - out['se'])
+    out['upper'] = np.exp2(out['log2_fold_change'] + out['se'])
+    out = out.join(flags, how='outer')
+    out['plates'] = out['plates'].fillna(0).astype(int)
+    out['wells'] = reps['count'].groupby(level=['sample', 'gene']).sum().reindex(out.index, fill_value=0).astype(int)
+    out[['rejected', 'discordant']] = out[['rejected', 'discordant']].astype(int)
+    return out.reset_index()[['sample', 'gene', 'fold_change', 'lower', 'upper', 'log2_fold_change', 'se',
+                              'plates', 'wells', 'rejected', 'discordant']]
+
+
+def example_ct_table(plates: int = 3, replicates: int = 3, seed: int = 7) -> pd.DataFrame:
+    """A synthetic Ct export (wild-type vs engineered strain) for the page's example chart."""
+    rng = np.random.default_rng(seed)
+    genes = list(PATHWAY_GENES) + ['16S rRNA', 'gapA']
+    # Cycles earlier than wild type for each pathway gene in the engineered strain
+    induction = dict(zip(PATHWAY_GENES, (4.2, 2.1, 3.6, 5.0, 4.4, 3.1, 2.7)))
+    rows = []
+    for plate in range(1, plates + 1):
+        plate_shift = rng.normal(0, 0.3)
+        for sample in ('Wild-type', 'Engineered Strain'):
+            for gene in genes:
+                base = 16.0 if gene == '16S rRNA' else 22.0 if gene == 'gapA' else 28.0
+                shift = induction.get(gene, 0.0) if sample != 'Wild-type' else 0.0
+                for ct in base - shift + plate_shift + rng.normal(0, 0.15, replicates):
+                    rows.append((f"Plate {plate}", sample, gene, ct))
+    return pd.DataFrame(rows, columns=['plate', 'sample', 'gene', 'ct'])
@@ -0,0 +1,417 @@
+"""Display helpers shared by the pages."""
+import io
+from typing import Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from experiment_platform.decimation import decimate_indices
+from experiment_platform.session_log import record_figure, record_metric
+from experiment_platform.state import is_kids_mode
+from experiment_platform.translation import translate_display
+
+# Record the original Streamlit function references for fallback use
+_BASE_ST_TITLE = st.title
+_BASE_ST_HEADER = st.header
+_BASE_ST_SUBHEADER = st.subheader
+_BASE_ST_MARKDOWN = st.markdown
+_BASE_ST_WRITE = st.write
+_BASE_ST_TEXT = st.text
+_BASE_ST_METRIC = st.metric
+_BASE_ST_SELECTBOX = st.selectbox
+_BASE_ST_SLIDER = st.slider
+_BASE_ST_BUTTON = st.button
+_BASE_ST_TABS = st.tabs
+_BASE_ST_PLOTLY_CHART = st.plotly_chart
+_BASE_ST_PYPLOT = st.pyplot
+_BASE_ST_IMAGE = st.image
+try:
+    _BASE_SB_SELECTBOX = st.sidebar.selectbox
+    _BASE_SB_SLIDER = st.sidebar.slider
+    _BASE_SB_BUTTON = st.sidebar.button
+    _BASE_SB_MARKDOWN = st.sidebar.markdown
+    _BASE_SB_METRIC = st.sidebar.metric if hasattr(st.sidebar, 'metric') else None
+except Exception:
+    _BASE_SB_SELECTBOX = None
+    _BASE_SB_SLIDER = None
+    _BASE_SB_BUTTON = None
+    _BASE_SB_MARKDOWN = None
+    _BASE_SB_METRIC = None
+
+
+# Line traces longer than this are decimated before they are sent
+TRACE_POINT_BUDGET = 2000
+# Scatter traces with at least this many points (before decimation) are drawn with WebGL
+WEBGL_MIN_POINTS = 5000
+# Per-point trace properties cut down along with x and y
+_PER_POINT_PROPS = ('customdata', 'text', 'hovertext', 'ids')
+# What st.pyplot passes to savefig
+_SAVEFIG_OPTIONS = {'bbox_inches': 'tight', 'dpi': 200, 'format': 'png'}
+_PNG_SIGNATURE = b'\x89PNG'
+
+
+def _zoom_key(key: str) -> str:
+    return f"_{key}_zoom"
+
+
+def _reset_zoom(key: str):
+    st.session_state[_zoom_key(key)] = None
+
+
+def _box_selection(key: str) -> Optional[Tuple]:
+    """x range of the box last drawn on the chart with this key, if any."""
+    try:
+        boxes = st.session_state[key]['selection']['box']
+        x0, x1 = boxes[-1]['x'][:2]
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+    return (min(x0, x1), max(x0, x1))
+
+
+def decimate_figure(fig, budget: int = TRACE_POINT_BUDGET, x_range: Tuple = None):
+    """Copy of fig with long line traces decimated (and drawn with WebGL), plus (points sent, total points).
+
+    Returns fig itself when nothing needed changing.  With x_range, long traces are first cut to
+    that range, so zooming in shows the full-resolution points there.
+    """
+    import plotly.graph_objects as go
+
+    traces = []
+    changed = False
+    shipped = total = 0
+    for trace in fig.data:
+        n = len(trace.y) if getattr(trace, 'y', None) is not None else 0
+        total += n
+        mode = getattr(trace, 'mode', None)
+        is_line = trace.type in ('scatter', 'scattergl') and (mode is None or 'lines' in mode)
+        if n <= budget or not is_line or trace.x is None:
+            shipped += n
+            traces.append(trace)
+            continue
+        x, y = np.asarray(trace.x), np.asarray(trace.y)
+        if x.dtype.kind not in 'iufM' or np.isnan(x).any() or np.any(x[1:] < x[:-1]):
+            # Not a line over sorted x; only the WebGL switch applies
+            keep = np.arange(n)
+        else:
+            window = np.arange(n)
+            if x_range is not None:
+                lo, hi = np.searchsorted(x, x_range[0]), np.searchsorted(x, x_range[1], side='right')
+                window = window[max(lo - 1, 0):min(hi + 1, n)]
+            keep = window[decimate_indices(x[window], y[window], budget)]
+        props = trace.to_plotly_json()
+        props.pop('type', None)
+        props['x'], props['y'] = x[keep], y[keep]
+        for name in _PER_POINT_PROPS:
+            values = props.get(name)
+            if values is not None and not isinstance(values, str) and len(values) == n:
+                props[name] = np.asarray(values)[keep]
+        try:
+            traces.append(go.Scattergl(**props) if n >= WEBGL_MIN_POINTS else go.Scatter(**props))
+        except ValueError:
+            # A property Scattergl does not support (e.g. spline lines)
+            traces.append(go.Scatter(**props))
+        shipped += len(keep)
+        changed = True
+    if not changed:
+        return fig, (shipped, total)
+    return go.Figure(data=traces, layout=fig.layout), (shipped, total)
+
+
+def plotly_chart(fig, *args, **kwargs):
+    """st.plotly_chart that sends long line traces decimated and records the bytes sent per chart.
+
+    Charts given a ``key`` can be zoomed at full resolution: drag a box over the decimated chart and
+    the traces are decimated again within its x range.
+    """
+    if not (hasattr(fig, 'data') and hasattr(fig, 'layout')):
+        return _BASE_ST_PLOTLY_CHART(fig, *args, **kwargs)
+    import plotly.io
+
+    key = kwargs.get('key')
+    x_range = None
+    if key is not None:
+        selection = _box_selection(key)
+        if selection is not None and selection != st.session_state.get(f"_{key}_applied"):
+            st.session_state[f"_{key}_applied"] = selection
+            st.session_state[_zoom_key(key)] = selection
+        x_range = st.session_state.get(_zoom_key(key))
+    sent, (shipped, total) = decimate_figure(fig, x_range=x_range)
+    decimated = sent is not fig
+    if decimated and key is not None:
+        kwargs.setdefault('on_select', 'rerun')
+        kwargs.setdefault('selection_mode', 'box')
+        sent.update_layout(dragmode='select')
+        if x_range is not None:
+            sent.update_xaxes(range=list(x_range))
+
+    # One serialization serves both the size recorded and the report copy
+    result = _BASE_ST_PLOTLY_CHART(sent, *args, **kwargs)
+    spec = plotly.io.to_json(sent, validate=False)
+    size = len(spec)
+    label = key or sent.layout.title.text or "(untitled)"
+    st.session_state.setdefault('_chart_stats', {})[label] = {
+        'bytes': size, 'points': shipped, 'points_total': total, 'decimated': decimated}
+    record_figure(sent.layout.title.text or label, 'plotly', spec.encode('utf-8'))
+
+    if decimated:
+        note = f"Showing {shipped:,} of {total:,} points ({size / 1024:,.0f} kB sent)."
+        if key is not None:
+            note += " Drag a box over the chart to zoom in at full resolution."
+        if x_range is not None:
+            col1, col2 = st.columns([4, 1])
+            col1.caption(note)
+            col2.button("Reset zoom", key=f"_{key}_reset_zoom", on_click=_reset_zoom, args=(key,))
+        else:
+            st.caption(note)
+    return result
+
+
+def figure_label(fig) -> str:
+    if fig._suptitle is not None and fig._suptitle.get_text():
+        return fig._suptitle.get_text()
+    titles = [ax.get_title() for ax in fig.axes if ax.get_title()]
+    return titles[0] if titles else "Figure"
+
+
+def pyplot(fig, clear_figure: bool = False, *, width='stretch', use_container_width=None, alt=None, **kwargs):
+    """st.pyplot that keeps the PNG it sends for the session report; the figure is still saved only once.
+
+    The figure is then released from pyplot (it can still be drawn on), which would otherwise keep every
+    figure a page run made until the process ends.
+    """
+    from matplotlib import pyplot as plt
+
+    image = io.BytesIO()
+    fig.savefig(image, **{**_SAVEFIG_OPTIONS, **kwargs})
+    plt.close(fig)
+    record_figure(figure_label(fig), 'png', image.getvalue())
+    if use_container_width is not None:
+        width = 'stretch' if use_container_width else 'content'
+    # st.image takes alt text only from Streamlit 1.65
+    result = _BASE_ST_IMAGE(image, width=width, output_format='PNG', **({} if alt is None else {'alt': alt}))
+    if clear_figure:
+        fig.clf()
+    return result
+
+
+def image(image, caption=None, *args, **kwargs):
+    """st.image that keeps PNG images drawn by the pages (not image files) for the session report."""
+    data = image.getvalue() if isinstance(image, io.BytesIO) else image
+    if isinstance(data, bytes) and data.startswith(_PNG_SIGNATURE):
+        record_figure(caption or "Image", 'png', data)
+    return _BASE_ST_IMAGE(image, caption, *args, **kwargs)
+
+
+def metric(label, value, delta=None, *args, **kwargs):
+    """st.metric that keeps the value shown for the session report."""
+    record_metric(label, value, delta)
+    return _BASE_ST_METRIC(label, value, delta, *args, **kwargs)
+
+
+def install_display_layer():
+    """Route st.plotly_chart, st.pyplot, st.image and st.metric through the wrappers here (idempotent)."""
+    st.plotly_chart = plotly_chart
+    st.pyplot = pyplot
+    st.image = image
+    st.metric = metric
+
+
+def patch_streamlit_for_kids():
+    patched = hasattr(st, '_kids_patched') and getattr(st, '_kids_patched', False)
+
+    if not is_kids_mode():
+        if not patched:
+            return
+        # Unpatch main functions
+        st.title = st._orig_title
+        st.header = st._orig_header
+        st.subheader = st._orig_subheader
+        st.markdown = st._orig_markdown
+        st.write = st._orig_write
+        st.text = st._orig_text
+        st.metric = st._orig_metric
+        st.selectbox = st._orig_selectbox
+        st.slider = st._orig_slider
+        st.button = st._orig_button
+        st.tabs = st._orig_tabs
+        st.plotly_chart = st._orig_plotly_chart
+        # Unpatch sidebar functions if they were patched
+        if hasattr(st, '_orig_sb_selectbox'):
+            st.sidebar.selectbox = st._orig_sb_selectbox
+        if hasattr(st, '_orig_sb_slider'):
+            st.sidebar.slider = st._orig_sb_slider
+        if hasattr(st, '_orig_sb_button'):
+            st.sidebar.button = st._orig_sb_button
+        if hasattr(st, '_orig_sb_markdown'):
+            st.sidebar.markdown = st._orig_sb_markdown
+        if hasattr(st, '_orig_sb_metric'):
+            if st._orig_sb_metric is not None:
+                st.sidebar.metric = st._orig_sb_metric
+        st._kids_patched = False
+        return
+
+    if patched:
+        return
+
+    # Save original functions
+    st._orig_title = getattr(st, '_orig_title', _BASE_ST_TITLE)
+    st._orig_header = getattr(st, '_orig_header', _BASE_ST_HEADER)
+    st._orig_subheader = getattr(st, '_orig_subheader', _BASE_ST_SUBHEADER)
+    st._orig_markdown = getattr(st, '_orig_markdown', _BASE_ST_MARKDOWN)
+    st._orig_write = getattr(st, '_orig_write', _BASE_ST_WRITE)
+    st._orig_text = getattr(st, '_orig_text', _BASE_ST_TEXT)
+    st._orig_metric = getattr(st, '_orig_metric', metric)
+    st._orig_selectbox = getattr(st, '_orig_selectbox', _BASE_ST_SELECTBOX)
+    st._orig_slider = getattr(st, '_orig_slider', _BASE_ST_SLIDER)
+    st._orig_button = getattr(st, '_orig_button', _BASE_ST_BUTTON)
+    st._orig_tabs = getattr(st, '_orig_tabs', _BASE_ST_TABS)
+    st._orig_plotly_chart = getattr(st, '_orig_plotly_chart', plotly_chart)
+
+    # Wrappers
+    def w_title(label, *args, **kwargs):
+        orig = getattr(st, '_orig_title', _BASE_ST_TITLE)
+        if not is_kids_mode():
+            return orig(translate_display(label), *args, **kwargs)
+        return orig(translate_display(label), *args, **kwargs)
+
+    def w_header(label, *args, **kwargs):
+        orig = getattr(st, '_orig_header', _BASE_ST_HEADER)
+        return orig(translate_display(label), *args, **kwargs)
+
+    def w_subheader(label, *args, **kwargs):
+        orig = getattr(st, '_orig_subheader', _BASE_ST_SUBHEADER)
+        return orig(translate_display(label), *args, **kwargs)
+
+    def w_markdown(body, *args, **kwargs):
+        orig = getattr(st, '_orig_markdown', _BASE_ST_MARKDOWN)
+        try:
+            if isinstance(body, str) and "<style" in body:
+                # CSS and styles are not translated, use base function directly to avoid wrapping
+                return orig(body, *args, **kwargs)
+        except Exception:
+            pass
+        return orig(translate_display(body), *args, **kwargs)
+
+    def w_write(*args, **kwargs):
+        orig = getattr(st, '_orig_write', _BASE_ST_WRITE)
+        new_args = [translate_display(a) if isinstance(a, str) else a for a in args]
+        return orig(*new_args, **kwargs)
+
+    def w_text(body, *args, **kwargs):
+        orig = getattr(st, '_orig_text', _BASE_ST_TEXT)
+        return orig(translate_display(body), *args, **kwargs)
+
+    def w_metric(label, value, *args, **kwargs):
+        orig = getattr(st, '_orig_metric', metric)
+        return orig(translate_display(label), value, *args, **kwargs)
+
+    def w_selectbox(label, options, *args, **kwargs):
+        orig = getattr(st, '_orig_selectbox', _BASE_ST_SELECTBOX)
+        new_label = translate_display(label)
+        # Only translate display, don't modify option values, ensure return value is still original string
+        fmt = kwargs.get('format_func')
+        if fmt is None:
+            kwargs['format_func'] = lambda x: translate_display(x) if isinstance(x, str) else x
+        else:
+            kwargs['format_func'] = (lambda f: (lambda x: translate_display(f(x)) if isinstance(f(x), str) else f(x)))(
+                fmt)
+        return orig(new_label, options, *args, **kwargs)
+
+    def w_slider(label, *args, **kwargs):
+        orig = getattr(st, '_orig_slider', _BASE_ST_SLIDER)
+        return orig(translate_display(label), *args, **kwargs)
+
+    def w_button(label, *args, **kwargs):
+        orig = getattr(st, '_orig_button', _BASE_ST_BUTTON)
+        return orig(translate_display(label), *args, **kwargs)
+
+    def w_tabs(tabs_list, *args, **kwargs):
+        orig = getattr(st, '_orig_tabs', _BASE_ST_TABS)
+        new_list = [translate_display(t) if isinstance(t, str) else t for t in tabs_list]
+        return orig(new_list, *args, **kwargs)
+
+    def w_plotly_chart(fig, *args, **kwargs):
+        orig = getattr(st, '_orig_plotly_chart', plotly_chart)
+        try:
+            if hasattr(fig, 'layout'):
+                if getattr(fig.layout, 'title', None) and getattr(fig.layout.title, 'text', None):
+                    fig.layout.title.text = translate_display(fig.layout.title.text)
+                if getattr(fig.layout, 'xaxis', None) and getattr(fig.layout.xaxis, 'title', None):
+                    if getattr(fig.layout.xaxis.title, 'text', None):
+                        fig.layout.xaxis.title.text = translate_display(fig.layout.xaxis.title.text)
+                if getattr(fig.layout, 'yaxis', None) and getattr(fig.layout.yaxis, 'title', None):
+                    if getattr(fig.layout.yaxis.title, 'text', None):
+                        fig.layout.yaxis.title.text = translate_display(fig.layout.yaxis.title.text)
+        except Exception:
+            pass
+        return orig(fig, *args, **kwargs)
+
+    # Apply to st
+    st.title = w_title
+    st.header = w_header
+    st.subheader = w_subheader
+    st.markdown = w_markdown
+    st.write = w_write
+    st.text = w_text
+    st.metric = w_metric
+    st.selectbox = w_selectbox
+    st.slider = w_slider
+    st.button = w_button
+    st.tabs = w_tabs
+    st.plotly_chart = w_plotly_chart
+
+    # Sidebar common controls (use closure to save original functions, avoid adding custom attributes to sidebar)
+    try:
+        st._orig_sb_selectbox = _BASE_SB_SELECTBOX or st.sidebar.selectbox
+        st._orig_sb_slider = _BASE_SB_SLIDER or st.sidebar.slider
+        st._orig_sb_button = _BASE_SB_BUTTON or st.sidebar.button
+        st._orig_sb_markdown = _BASE_SB_MARKDOWN or st.sidebar.markdown
+        st._orig_sb_metric = _BASE_SB_METRIC if _BASE_SB_METRIC else (
+            st.sidebar.metric if hasattr(st.sidebar, 'metric') else None)
+
+        def sb_selectbox(label, options, *args, **kwargs):
+            new_label = translate_display(label)
+            fmt = kwargs.get('format_func')
+            if fmt is None:
+                kwargs['format_func'] = lambda x: translate_display(x) if isinstance(x, str) else x
+            else:
+                kwargs['format_func'] = (
+                    lambda f: (lambda x: translate_display(f(x)) if isinstance(f(x), str) else f(x)))(fmt)
+            return st._orig_sb_selectbox(new_label, options, *args, **kwargs)
+
+        def sb_slider(label, *args, **kwargs):
+            return st._orig_sb_slider(translate_display(label), *args, **kwargs)
+
+        def sb_button(label, *args, **kwargs):
+            return st._orig_sb_button(translate_display(label), *args, **kwargs)
+
+        def sb_metric(label, value, *args, **kwargs):
+            if st._orig_sb_metric:
+                return st._orig_sb_metric(translate_display(label), value, *args, **kwargs)
+            # In rare cases where sidebar doesn't have metric, fall back to main area
+            base_metric = getattr(st, '_orig_metric', _BASE_ST_METRIC)
+            return base_metric(translate_display(label), value, *args, **kwargs)
+
+        def sb_markdown(body, *args, **kwargs):
+            if isinstance(body, str) and "<style" in body:
+                return st._orig_sb_markdown(body, *args, **kwargs)
+            return st._orig_sb_markdown(translate_display(body), *args, **kwargs)
+
+        st.sidebar.selectbox = sb_selectbox
+        st.sidebar.slider = sb_slider
+        st.sidebar.button = sb_button
+        if st._orig_sb_metric:
+            st.sidebar.metric = sb_metric
+        st.sidebar.markdown = sb_markdown
+    except Exception:
+        pass
+
+    st._kids_patched = True
+
+
+def load_pyplot():
+    """Import matplotlib on first use (it is slow to import) and set the app's font options."""
+    import matplotlib.pyplot as plt
+    plt.rcParams['font.sans-serif'] = ['Arial']  # For proper label display
+    plt.rcParams['axes.unicode_minus'] = False  # For proper minus sign display
+    return plt
@@ -0,0 +1,370 @@
+"""Session reports: what a student or researcher did and saw, as one self-contained HTML or PDF file.
+
+A report is rendered from a ``SessionSnapshot``: the protocol steps completed,
+the simulator's measurements, the metrics shown and the figures drawn, each
+figure as the bytes that were sent to the browser (Plotly figure JSON or
+PNG), so nothing is redrawn from page code.  The HTML report embeds
+plotly.js once and the figures as they were shown; the PDF report places
+PNG figures as they are and redraws Plotly figures with Matplotlib.
+
+This module does not use Streamlit, so reports render in worker processes:
+the app submits ``render`` to the process pool, and a whole class's saved
+snapshots can be rendered offline::
+
+    python -m experiment_platform.report snapshots/ --out reports/ --format html pdf
+"""
+import argparse
+import base64
+import dataclasses
+import gzip
+import html
+import io
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+SNAPSHOT_SUFFIX = '.json.gz'
+MIME_TYPES = {'html': 'text/html', 'pdf': 'application/pdf'}
+
+# Streamlit's Plotly theme sends placeholder colours "#000001"... that its frontend swaps for the page theme's;
+# a report swaps them for the light theme's
+_CATEGORY = ('#0068c9', '#83c9ff', '#ff2b2b', '#ffabab', '#29b09d', '#7defa1', '#ff8700', '#ffd16a', '#6d3fc0',
+             '#d5dae5')
+_SEQUENTIAL = ('#e4f5ff', '#c7ebff', '#a6dcff', '#83c9ff', '#60b4ff', '#3d9df3', '#1c83e1', '#0068c9', '#0054a3',
+               '#004280')
+_DIVERGING = ('#7d353b', '#bd4043', '#ff4b4b', '#ff8c8c', '#ffc7c7', '#a6dcff', '#60b4ff', '#1c83e1', '#0054a3',
+              '#004280')
+THEME_COLORS = {f'#{i + 1:06d}': color for i, color in enumerate(_CATEGORY + _SEQUENTIAL + _DIVERGING)}
+THEME_COLORS.update({'#000032': '#29b09d', '#000033': '#ff2b2b', '#000034': '#0068c9', '#000036': '#a3a8b8',
+                     '#000037': '#31333f', '#000038': '#ffffff', '#000039': 'rgba(49, 51, 63, 0.1)',
+                     '#000040': '#f0f2f6'})
+_THEME_COLOR = re.compile(r'"(#0000[0-4][0-9])"')
+
+# Text lines per PDF summary page
+PDF_LINES_PER_PAGE = 48
+PDF_PAGE_INCHES = (8.27, 11.69)  # A4
+
+
+@dataclasses.dataclass
+class ReportFigure:
+    page: str
+    label: str
+    kind: str  # 'plotly' (figure JSON) or 'png'
+    data: bytes
+
+
+@dataclasses.dataclass
+class SessionSnapshot:
+    name: str
+    mode: str
+    created: str  # ISO 8601
+    steps: List[Tuple[str, int]]  # protocol, steps completed
+    measurements: List[Tuple[str, str]]
+    metrics: List[Tuple[str, str, str, str]]  # page, label, value, delta
+    figures: List[ReportFigure]
+    missing_figures: int = 0  # shown, but evicted from the figure store before the snapshot
+
+    def to_bytes(self) -> bytes:
+        """Gzipped JSON, the format of saved snapshots."""
+        record = dataclasses.asdict(self)
+        for figure in record['figures']:
+            figure['data'] = base64.b64encode(figure['data']).decode('ascii')
+        return gzip.compress(json.dumps(record).encode('utf-8'))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SessionSnapshot':
+        record = json.loads(gzip.decompress(data))
+        figures = [ReportFigure(**{**figure, 'data': base64.b64decode(figure['data'])})
+                   for figure in record.pop('figures')]
+        return cls(figures=figures, **{key: value if not isinstance(value, list) else [tuple(v) for v in value]
+                                       for key, value in record.items()})
+
+
+def _by_page(items, page_of) -> Dict[str, list]:
+    pages = {}
+    for item in items:
+        pages.setdefault(page_of(item), []).append(item)
+    return pages
+
+
+_HTML_STYLE = """
+body { font-family: Arial, sans-serif; margin: 2em auto; max-width: 1100px; color: #222; }
+h1 { border-bottom: 2px solid #1f77b4; padding-bottom: .3em; }
+table { border-collapse: collapse; margin-bottom: 1.5em; }
+th, td { border: 1px solid #ccc; padding: .3em .8em; text-align: left; }
+th { background: #f0f4f8; }
+figure { margin: 1em 0 2em; }
+figure img { max-width: 100%; }
+figcaption { color: #555; font-size: .9em; }
+.plot { width: 100%; height: 460px; }
+"""
+
+
+def _html_table(headers: Sequence[str], rows) -> str:
+    head = ''.join(f"<th>{html.escape(h)}</th>" for h in headers)
+    body = ''.join('<tr>' + ''.join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + '</tr>' for row in rows)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def render_html(snapshot: SessionSnapshot) -> bytes:
+    """A self-contained HTML report; Plotly figures stay interactive."""
+    parts = [f"<h1>{html.escape(snapshot.name)}</h1>",
+             f"<p>{html.escape(snapshot.mode)} mode · generated {html.escape(snapshot.created)}</p>"]
+    if snapshot.steps:
+        parts += ["<h2>Completed Steps</h2>", _html_table(('Protocol', 'Steps completed'), snapshot.steps)]
+    if snapshot.measurements:
+        parts += ["<h2>Measurements</h2>", _html_table(('Quantity', 'Value'), snapshot.measurements)]
+    for page, metrics in _by_page(snapshot.metrics, lambda m: m[0]).items():
+        parts += [f"<h2>{html.escape(page)}: Results</h2>",
+                  _html_table(('Metric', 'Value', 'Change'), [m[1:] for m in metrics])]
+    has_plotly = False
+    for page, figures in _by_page(snapshot.figures, lambda f: f.page).items():
+        parts.append(f"<h2>{html.escape(page)}: Figures</h2>")
+        for figure in figures:
+            caption = f"<figcaption>{html.escape(figure.label)}</figcaption>"
+            if figure.kind == 'png':
+                encoded = base64.b64encode(figure.data).decode('ascii')
+                parts.append(f'<figure><img src="data:image/png;base64,{encoded}" alt="{html.escape(figure.label)}">'
+                             f'{caption}</figure>')
+            else:
+                has_plotly = True
+                # The figure JSON sits in a data block; "</" is escaped so it cannot end the script element
+                spec = plotly_spec(figure.data).replace('</', '<\\/')
+                parts.append(f'<figure><div class="plot"></div><script type="application/json">{spec}</script>'
+                             f'{caption}</figure>')
+    if snapshot.missing_figures:
+        parts.append(f"<p><em>{snapshot.missing_figures} figure(s) shown in the session are no longer cached "
+                     "and are not included.</em></p>")
+    scripts = ''
+    if has_plotly:
+        from plotly.offline import get_plotlyjs
+        scripts = (f"<script>{get_plotlyjs()}</script><script>"
+                   "document.querySelectorAll('figure .plot').forEach(function (div) {"
+                   "var spec = JSON.parse(div.nextElementSibling.textContent);"
+                   "Plotly.newPlot(div, spec.data, spec.layout || {}, {responsive: true});});</script>")
+    document = (f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{html.escape(snapshot.name)}</title>"
+                f"<style>{_HTML_STYLE}</style></head><body>{''.join(parts)}{scripts}</body></html>")
+    return document.encode('utf-8')
+
+
+def _array(values):
+    """Plotly JSON values as an array, decoding the typed-array form ({"dtype", "bdata"}) of plotly.py."""
+    import numpy as np
+    if values is None:
+        return None
+    if isinstance(values, dict) and 'bdata' in values:
+        array = np.frombuffer(base64.b64decode(values['bdata']), dtype=values.get('dtype', 'f8'))
+        shape = values.get('shape')
+        if shape:
+            array = array.reshape([int(n) for n in str(shape).split(',')])
+        return array
+    return np.asarray(values)
+
+
+def plotly_spec(data: bytes) -> str:
+    """Figure JSON as sent, with Streamlit's theme placeholder colours made real."""
+    return _THEME_COLOR.sub(lambda match: f'"{THEME_COLORS.get(match.group(1), match.group(1))}"',
+                            data.decode('utf-8'))
+
+
+def _color(value):
+    """A Plotly colour Matplotlib understands: CSS names and hex as they are, rgb()/rgba() converted."""
+    if not isinstance(value, str):
+        return None
+    match = re.fullmatch(r'rgba?\(([^)]*)\)', value.replace(' ', ''))
+    if match:
+        parts = [float(part) for part in match.group(1).split(',')]
+        return tuple(part / 255 for part in parts[:3]) + tuple(parts[3:4])
+    return value
+
+
+def _text(value) -> str:
+    if isinstance(value, dict):
+        value = value.get('text')
+    return value or ''
+
+
+def _draw_plotly(ax, spec: dict):
+    """Redraw a Plotly figure on Matplotlib axes: lines, markers, bars, heatmaps, histograms and boxes."""
+    import numpy as np
+    layout = spec.get('layout', {})
+    right = None
+    categories = {}
+    bars = [trace for trace in spec.get('data', []) if trace.get('type') == 'bar']
+    boxes = [trace for trace in spec.get('data', []) if trace.get('type') == 'box']
+    skipped = []
+    for trace in spec.get('data', []):
+        kind = trace.get('type', 'scatter')
+        target = ax
+        if trace.get('yaxis') == 'y2':
+            right = right or ax.twinx()
+            target = right
+        name = trace.get('name')
+        x, y = _array(trace.get('x')), _array(trace.get('y'))
+        if x is not None and x.dtype.kind in 'OU':
+            # Category axis: positions by first appearance across traces
+            x = np.array([categories.setdefault(str(value), len(categories)) for value in x])
+        line = trace.get('line') or {}
+        marker = trace.get('marker') or {}
+        color = _color(line.get('color')) or _color(marker.get('color'))
+        if kind in ('scatter', 'scattergl') and y is not None:
+            x = np.arange(len(y)) if x is None else x
+            if trace.get('fill') == 'toself':
+                target.fill(x, y, color=_color(trace.get('fillcolor')) or color or 'tab:gray', alpha=0.2, label=name,
+                            linewidth=0)
+                continue
+            mode = trace.get('mode') or 'lines'
+            dashed = line.get('dash') in ('dash', 'dot', 'dashdot', 'longdash')
+            target.plot(x, y, linestyle=('--' if dashed else '-') if 'lines' in mode else 'none',
+                        marker='o' if 'markers' in mode else None, markersize=4, color=color, label=name)
+        elif kind == 'bar' and y is not None:
+            x = np.arange(len(y)) if x is None else x
+            width = 0.8 / max(len(bars), 1)
+            grouped = layout.get('barmode', 'group') == 'group' and len(bars) > 1
+            offset = (bars.index(trace) - (len(bars) - 1) / 2) * width if grouped else 0
+            if isinstance(marker.get('color'), list):
+                color = [_color(c) for c in marker['color']]
+            if trace.get('orientation') == 'h':
+                target.barh(y, x, color=color, label=name)
+            else:
+                target.bar(x.astype(float) + offset, y, width=width if grouped else 0.8, color=color, label=name)
+        elif kind == 'heatmap':
+            z = _array(trace.get('z'))
+            image = target.imshow(z, aspect='auto', origin='lower', cmap='RdBu_r' if trace.get('zmid') == 0 else None)
+            ax.figure.colorbar(image, ax=target)
+            for axis, values in (('x', _array(trace.get('x'))), ('y', _array(trace.get('y')))):
+                if values is not None and len(values) <= 40:
+                    getattr(target, f'set_{axis}ticks')(range(len(values)))
+                    getattr(target, f'set_{axis}ticklabels')([str(v) for v in values], fontsize=6,
+                                                             rotation=90 if axis == 'x' else 0)
+        elif kind == 'histogram' and x is not None:
+            target.hist(x, bins=trace.get('nbinsx') or 'auto', color=color, alpha=0.7, label=name)
+        elif kind == 'box':
+            values = y if y is not None else x
+            if values is not None:
+                target.boxplot([values], positions=[boxes.index(trace)], tick_labels=[name or ''])
+        else:
+            skipped.append(kind)
+    if categories:
+        ax.set_xticks(list(categories.values()))
+        ax.set_xticklabels(list(categories), rotation=30, ha='right', fontsize=7)
+    ax.set_title(_text(layout.get('title')), fontsize=10)
+    ax.set_xlabel(_text((layout.get('xaxis') or {}).get('title')))
+    ax.set_ylabel(_text((layout.get('yaxis') or {}).get('title')))
+    if right is not None:
+        right.set_ylabel(_text((layout.get('yaxis2') or {}).get('title')))
+    handles = [h for a in (ax, right) if a is not None for h in a.get_legend_handles_labels()[0]]
+    if 1 < len(handles) <= 12:
+        labels = [label for a in (ax, right) if a is not None for label in a.get_legend_handles_labels()[1]]
+        ax.legend(handles, labels, fontsize=7)
+    if skipped:
+        ax.text(0.5, 0.5, f"{', '.join(sorted(set(skipped)))} traces: see the HTML report", ha='center',
+                transform=ax.transAxes, color='gray')
+
+
+def _summary_lines(snapshot: SessionSnapshot) -> List[str]:
+    lines = [f"{snapshot.mode} mode · generated {snapshot.created}", ""]
+    if snapshot.steps:
+        lines += ["Completed steps"] + [f"  {protocol}: {steps}" for protocol, steps in snapshot.steps] + [""]
+    if snapshot.measurements:
+        lines += ["Measurements"] + [f"  {quantity}: {value}" for quantity, value in snapshot.measurements] + [""]
+    for page, metrics in _by_page(snapshot.metrics, lambda m: m[0]).items():
+        lines.append(f"{page}: results")
+        lines += [f"  {label}: {value}" + (f" ({delta})" if delta else "") for _, label, value, delta in metrics]
+        lines.append("")
+    if snapshot.missing_figures:
+        lines.append(f"{snapshot.missing_figures} figure(s) shown in the session are no longer cached.")
+    return lines
+
+
+def render_pdf(snapshot: SessionSnapshot) -> bytes:
+    """A PDF report: a summary, then one figure per page."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.image
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    out = io.BytesIO()
+    with PdfPages(out) as pdf:
+        lines = _summary_lines(snapshot)
+        for start in range(0, max(len(lines), 1), PDF_LINES_PER_PAGE):
+            fig = plt.figure(figsize=PDF_PAGE_INCHES)
+            if start == 0:
+                fig.text(0.08, 0.95, snapshot.name, fontsize=16, weight='bold')
+            fig.text(0.08, 0.92, '\n'.join(lines[start:start + PDF_LINES_PER_PAGE]), va='top', fontsize=9,
+                     family='monospace')
+            pdf.savefig(fig)
+            plt.close(fig)
+        for figure in snapshot.figures:
+            fig = plt.figure(figsize=PDF_PAGE_INCHES)
+            fig.suptitle(f"{figure.page}: {figure.label}", fontsize=10)
+            ax = fig.add_axes([0.1, 0.45, 0.8, 0.45])
+            if figure.kind == 'png':
+                ax.imshow(matplotlib.image.imread(io.BytesIO(figure.data), format='png'))
+                ax.axis('off')
+            else:
+                _draw_plotly(ax, json.loads(plotly_spec(figure.data)))
+            pdf.savefig(fig)
+            plt.close(fig)
+    return out.getvalue()
+
+
+RENDERERS = {'html': render_html, 'pdf': render_pdf}
+
+
+def render(snapshot: SessionSnapshot, fmt: str) -> bytes:
+    """The report of a snapshot in the given format (``'html'`` or ``'pdf'``)."""
+    return RENDERERS[fmt](snapshot)
+
+
+def render_timed(snapshot: SessionSnapshot, fmt: str) -> Tuple[bytes, float]:
+    """``render``, with the seconds it took."""
+    start = time.perf_counter()
+    return render(snapshot, fmt), time.perf_counter() - start
+
+
+def file_stem(snapshot: SessionSnapshot) -> str:
+    safe = ''.join(c if c.isalnum() or c in '-_' else '_' for c in snapshot.name).strip('_') or 'session'
+    return f"{safe}_{snapshot.created[:19].replace(':', '-')}"
+
+
+def _render_file(job: Tuple[Path, Path, str]) -> Tuple[Path, float]:
+    source, out_dir, fmt = job
+    start = time.perf_counter()
+    snapshot = SessionSnapshot.from_bytes(source.read_bytes())
+    target = out_dir / f"{file_stem(snapshot)}.{fmt}"
+    target.write_bytes(render(snapshot, fmt))
+    return target, time.perf_counter() - start
+
+
+def render_directory(snapshots: Path, out_dir: Path, formats: Sequence[str] = ('html',),
+                     parallel: bool = None) -> List[Tuple[Path, float]]:
+    """Render every saved snapshot in a directory; returns each report's path and render seconds."""
+    from experiment_platform.parallel import process_pool, worth_parallel
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [(path, out_dir, fmt) for path in sorted(snapshots.glob(f'*{SNAPSHOT_SUFFIX}')) for fmt in formats]
+    if parallel is None:
+        parallel = worth_parallel(len(jobs))
+    return list(process_pool().map(_render_file, jobs)) if parallel else [_render_file(job) for job in jobs]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render saved session snapshots into reports.")
+    parser.add_argument('snapshots', type=Path, help=f"directory of *{SNAPSHOT_SUFFIX} session snapshots")
+    parser.add_argument('--out', type=Path, default=Path('reports'))
+    parser.add_argument('--format', nargs='+', choices=sorted(RENDERERS), default=['html'])
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    reports = render_directory(args.snapshots, args.out, args.format)
+    for path, seconds in reports:
+        print(f"{path}  {seconds:.2f} s")
+    print(f"{len(reports)} report(s) in {time.perf_counter() - start:.1f} s")
+    return 0 if reports else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""What each session did and saw, kept for its report (see ``report``).
+
+The display wrappers in ``rendering`` record every figure and metric a page
+shows.  Figure bytes are the ones already produced to send the figure (the
+Plotly JSON or the PNG), kept once per content in a process-wide
+``FigureStore``: sessions only hold digests, and the many sessions that see
+the same example chart share one copy.  Bytes are charged to the session that
+first stored them, and a session past ``SESSION_FIGURE_BYTES`` loses its own
+least recently used figures first, so one session cannot evict the others'.
+``report_panel`` snapshots the
+session and renders the report in the process pool, so the page stays
+responsive while it renders.
+"""
+import collections
+import datetime
+import hashlib
+import os
+import threading
+from typing import Optional
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from experiment_platform.parallel import process_pool
+from experiment_platform.report import (MIME_TYPES, RENDERERS, SNAPSHOT_SUFFIX, ReportFigure, SessionSnapshot,
+                                        file_stem, render_timed)
+
+FIGURE_STORE_BYTES = 256 * 2 ** 20
+SESSION_FIGURE_BYTES = 32 * 2 ** 20  # share of the figure store one session's figures may take
+# Directory where "Save for Instructor" writes session snapshots for batch rendering
+SNAPSHOT_DIR_ENV = 'EXPERIMENT_REPORT_DIR'
+REPORT_POLL_S = 0.5
+# Session state a snapshot is made from
+SNAPSHOT_KEYS = ('simulator', 'app_mode', '_report_metrics', '_report_figures')
+
+# Step counters of the simulator's protocols, in the order the report lists them
+PROTOCOL_STEPS = {
+    'current_step': 'LB Medium Preparation',
+    'plasmid_steps': 'Plasmid Extraction',
+    'gel_recovery_step': 'Gel Extraction',
+    'heat_shock_step': 'Heat Shock Transformation',
+    'prep_step': 'Electrocompetent Cell Preparation',
+    'electro_step': 'Electroporation Transformation',
+    'fusion_pcr_step': 'Fusion PCR',
+}
+MEASUREMENTS = {
+    'temperature': ('Temperature', '{:g} °C'),
+    'ph_level': ('pH', '{:.1f}'),
+    'bacterial_od': ('Bacterial OD600', '{:.3f}'),
+    'pcr_cycles': ('PCR cycles', '{:g}'),
+    'pcr_product': ('PCR product (fluorescence)', '{:.1f}'),
+    'plasmid_yield': ('Plasmid yield (ng/µL)', '{:.1f}'),
+    'dna_concentration': ('DNA concentration (ng/µL)', '{:.1f}'),
+}
+
+
+class FigureStore:
+    """Figure bytes by SHA-256, least recently used evicted beyond ``capacity`` bytes; shared by all sessions.
+
+    Each entry is charged to the owner that stored it first; an owner past ``owner_capacity`` bytes has its own
+    least recently used entries evicted instead of everyone's.
+    """
+
+    def __init__(self, capacity: int, owner_capacity: Optional[int] = None):
+        self.capacity = capacity
+        self.owner_capacity = capacity if owner_capacity is None else owner_capacity
+        self.size = 0
+        self.hits = self.misses = 0  # puts of bytes already kept, and of new ones
+        self._items = collections.OrderedDict()  # digest -> (bytes, owner)
+        self._owned = collections.defaultdict(collections.OrderedDict)  # owner -> its digests, oldest use first
+        self._owned_size = collections.Counter()
+        self._lock = threading.Lock()
+
+    def put(self, data: bytes, owner: Optional[str] = None) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._items:
+                self._items.move_to_end(digest)
+                self._owned[self._items[digest][1]].move_to_end(digest)
+                self.hits += 1
+                return digest
+            self.misses += 1
+            self._items[digest] = (data, owner)
+            self._owned[owner][digest] = None
+            self._owned_size[owner] += len(data)
+            self.size += len(data)
+            owned = self._owned[owner]
+            while self._owned_size[owner] > self.owner_capacity and len(owned) > 1:
+                self._evict(next(iter(owned)))
+            while self.size > self.capacity and len(self._items) > 1:
+                self._evict(next(iter(self._items)))
+        return digest
+
+    def _evict(self, digest: str):
+        data, owner = self._items.pop(digest)
+        del self._owned[owner][digest]
+        self._owned_size[owner] -= len(data)
+        self.size -= len(data)
+        if not self._owned[owner]:  # nothing is kept for sessions that have gone
+            del self._owned[owner], self._owned_size[owner]
+
+    def get(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._items.get(digest)
+        return None if item is None else item[0]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+figure_store = FigureStore(FIGURE_STORE_BYTES, SESSION_FIGURE_BYTES)
+
+
+def begin_page(name: str):
+    """Attribute the figures and metrics shown from now on to this page."""
+    st.session_state['_report_page'] = name
+
+
+def record_figure(label: str, kind: str, data: bytes):
+    """Keep a figure shown in this session; a later figure with the same page and label replaces it."""
+    page = st.session_state.get('_report_page', '')
+    ctx = get_script_run_ctx()
+    digest = figure_store.put(data, ctx.session_id if ctx is not None else None)
+    st.session_state.setdefault('_report_figures', {})[(page, label)] = (kind, digest)
+
+
+def record_metric(label, value, delta=None):
+    page = st.session_state.get('_report_page', '')
+    st.session_state.setdefault('_report_metrics', {})[(page, str(label))] = (
+        str(value), '' if delta is None else str(delta))
+
+
+def session_snapshot(name: str, state=None) -> SessionSnapshot:
+    """Steps, measurements, metrics and figures of a session (by default the current one).
+
+    ``state`` is a mapping with the ``SNAPSHOT_KEYS`` of a session's state.
+    """
+    state = st.session_state if state is None else state
+    data = state['simulator'].experiment_data
+    steps = [(protocol, int(data[key])) for key, protocol in PROTOCOL_STEPS.items() if data.get(key)]
+    measurements = [(label, fmt.format(data[key])) for key, (label, fmt) in MEASUREMENTS.items()
+                    if data.get(key) is not None]
+    metrics = [(page, label, value, delta)
+               for (page, label), (value, delta) in state.get('_report_metrics', {}).items()]
+    figures, missing = [], 0
+    for (page, label), (kind, digest) in state.get('_report_figures', {}).items():
+        figure = figure_store.get(digest)
+        if figure is None:
+            missing += 1
+        else:
+            figures.append(ReportFigure(page, label, kind, figure))
+    return SessionSnapshot(name, state.get('app_mode', "Professional"),
+                           datetime.datetime.now().isoformat(timespec='seconds'), steps, measurements, metrics,
+                           figures, missing)
+
+
+@st.fragment(run_every=REPORT_POLL_S)
+def _report_watch(future):
+    """Waits for a report being rendered, then reruns the app once to offer it (which ends the polling)."""
+    if future.done():
+        st.rerun()
+
+
+@st.fragment
+def report_panel():
+    """Sidebar controls that render the session report in the background and offer it for download."""
+    st.markdown("### Session Report")
+    name = st.text_input("Name on report", key="report_name") or "Session Report"
+    fmt = st.radio("Format", list(RENDERERS), format_func=str.upper, horizontal=True, key="report_format")
+    job = st.session_state.get('_report_job')
+    pending = job is not None and not job[0].done()
+    if st.button("Generate Report", key="report_generate", disabled=pending):
+        snapshot = session_snapshot(name)
+        job = (process_pool().submit(render_timed, snapshot, fmt), fmt, file_stem(snapshot))
+        st.session_state['_report_job'] = job
+        pending = True
+
+    if job is not None:
+        future, job_format, stem = job
+        if pending:
+            st.caption(f"Rendering the {job_format.upper()} report in the background...")
+            _report_watch(future)
+        elif future.exception() is not None:
+            st.error(f"Report failed: {future.exception()}")
+        else:
+            report, seconds = future.result()
+            st.download_button(f"Download {job_format.upper()} Report", report, file_name=f"{stem}.{job_format}",
+                               mime=MIME_TYPES[job_format], key="report_download", on_click='ignore')
+            st.caption(f"{len(report) / 1024:,.0f} kB, rendered in {seconds:.1f} s")
+
+    directory = os.environ.get(SNAPSHOT_DIR_ENV)
+    if directory and st.button("Save for Instructor", key="report_save"):
+        snapshot = session_snapshot(name)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, file_stem(snapshot) + SNAPSHOT_SUFFIX)
+        with open(path, 'wb') as f:
+            f.write(snapshot.to_bytes())
+        st.caption(f"Saved {os.path.basename(path)}")
+    elif not directory:
+        # Built only when clicked, from a copy of the state it needs
+        state = {key: st.session_state.get(key) for key in SNAPSHOT_KEYS}
+        state['_report_metrics'] = dict(state['_report_metrics'] or {})
+        state['_report_figures'] = dict(state['_report_figures'] or {})
+        st.download_button("Download Session Snapshot", lambda: session_snapshot(name, state).to_bytes(),
+                           file_name=f"session{SNAPSHOT_SUFFIX}", mime='application/gzip', key="report_snapshot",
+                           on_click='ignore')
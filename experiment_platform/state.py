@@ -0,0 +1,80 @@
+"""Session state shared by every page."""
+from typing import Tuple
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+
+class MolecularBiologySimulator:
+    def __init__(self):
+        self.experiment_data = {
+            'current_step': 0,
+            'materials_used': [],
+            'time_elapsed': 0,
+            'temperature': 25,
+            'ph_level': 7.0,
+            'bacterial_growth': 0,
+            'dna_concentration': 0,
+            'pcr_cycles': 0,
+            'gel_recovery_step': 0,
+            'heat_shock_step': 0,
+            'prep_step': 0,
+            'electro_step': 0,
+            'bacterial_od': 0.0,
+            'plasmid_yield': 0.0,
+            'pcr_product': 0.0
+        }
+
+    def reset_experiment(self):
+        self.experiment_data = {
+            'current_step': 0,
+            'materials_used': [],
+            'time_elapsed': 0,
+            'temperature': 25,
+            'ph_level': 7.0,
+            'bacterial_growth': 0,
+            'dna_concentration': 0,
+            'pcr_cycles': 0,
+            'gel_recovery_step': 0,
+            'heat_shock_step': 0,
+            'prep_step': 0,
+            'electro_step': 0,
+            'bacterial_od': 0.0,
+            'plasmid_yield': 0.0,
+            'pcr_product': 0.0
+        }
+
+
+def init_session_state():
+    if 'simulator' not in st.session_state:
+        st.session_state.simulator = MolecularBiologySimulator()
+
+
+def is_kids_mode() -> bool:
+    return st.session_state.get('app_mode', "Professional") == "Kids"
+
+
+def is_pro_mode() -> bool:
+    return st.session_state.get('app_mode') == "Professional"
+
+
+# Experiment data shown in the sidebar "Current Experiment Status" block
+SIDEBAR_STATUS_KEYS = ('temperature', 'ph_level', 'bacterial_od')
+
+
+def sidebar_status() -> Tuple:
+    data = st.session_state.simulator.experiment_data
+    return tuple(data.get(k) for k in SIDEBAR_STATUS_KEYS)
+
+
+def rerun_panel(status_before: Tuple = None):
+    """Rerun only the enclosing fragment, or the whole app if the sidebar status changed."""
+    from experiment_platform.progress import publish_progress
+    publish_progress()
+    if status_before is not None and sidebar_status() != status_before:
+        st.rerun()
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        # The fragment is running as part of a full app run
+        st.rerun()
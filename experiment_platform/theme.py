@@ -0,0 +1,20 @@
+"""Theme stylesheet and mode switch, served once as a static component."""
+import hashlib
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+THEME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "components", "theme")
+_theme_component = components.declare_component("app_theme", path=THEME_DIR)
+
+
+@st.cache_resource
+def theme_css_hash() -> str:
+    with open(os.path.join(THEME_DIR, "theme.css"), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def apply_theme(mode: str):
+    """Link the theme stylesheet into the page (once) and set body[data-app-mode] to mode."""
+    _theme_component(mode=mode, css_hash=theme_css_hash(), key="app_theme", default=None)
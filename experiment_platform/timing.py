@@ -0,0 +1,262 @@
+"""Opt-in timers on the hot paths: page entry points, translation and every chart and image sent.
+
+With ``TIMING_ENV`` set, the app calls ``install_timing`` before its display
+layer, which wraps
+
+* the ``show_*`` and ``simulate_*`` functions of each page as it is loaded,
+  and every ``st.fragment`` defined from then on, so a panel's own reruns
+  count as well;
+* ``translate_display``;
+* the chart and image calls (``st.plotly_chart``, ``st.pyplot``, ``st.image``
+  and Streamlit's native charts) and, within them, Matplotlib's
+  ``Figure.savefig`` and ``plotly.io.to_json`` (which Streamlit also calls).
+
+A timer adds each call's time, including the timed calls it makes, to a
+histogram of fixed buckets shared by every session.  The histograms are
+served with Streamlit's metrics, in the OpenMetrics text format at
+``/_stcore/metrics?families=experiment_function_seconds``, and with
+``TIMING_FILE_ENV`` set to a path they are written there, in the same
+format, every ``FLUSH_S`` and at exit.
+"""
+import atexit
+import bisect
+import functools
+import os
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Environment variable that turns the timers on
+TIMING_ENV = 'EXPERIMENT_TIMING'
+# File the histograms are written to, if set
+TIMING_FILE_ENV = 'EXPERIMENT_TIMING_FILE'
+FLUSH_S = 15.0
+FAMILY = 'experiment_function_seconds'
+HELP = "Time of the calls to a hot-path function, including the timed calls within it."
+# Upper bounds of the histogram buckets, 10 µs to 50 s; a last bucket takes longer calls
+BOUNDS = tuple(m * 10.0 ** e for e in range(-5, 2) for m in (1, 2.5, 5))
+# Page functions timed as the page module is loaded
+PAGE_PREFIXES = ('show_', 'simulate_')
+NATIVE_CHARTS = ('line_chart', 'bar_chart', 'area_chart', 'scatter_chart', 'altair_chart', 'vega_lite_chart')
+
+
+class Histogram:
+    """Calls by duration bucket, and their total time; safe to observe from any thread."""
+
+    __slots__ = ('counts', 'total', '_lock')
+
+    def __init__(self):
+        self.counts = [0] * (len(BOUNDS) + 1)
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        index = bisect.bisect_left(BOUNDS, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += seconds
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self.counts), self.total
+
+
+def quantile(counts: List[int], q: float) -> float:
+    """The q-quantile of a histogram's calls, interpolated within its bucket (the top bound past the last)."""
+    calls = sum(counts)
+    if not calls:
+        return 0.0
+    rank = q * calls
+    seen = 0
+    for index, count in enumerate(counts):
+        if count and seen + count >= rank:
+            if index == len(BOUNDS):
+                return BOUNDS[-1]
+            low = BOUNDS[index - 1] if index else 0.0
+            return low + (BOUNDS[index] - low) * (rank - seen) / count
+        seen += count
+    return BOUNDS[-1]
+
+
+_histograms: Dict[str, Histogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def histogram(name: str) -> Histogram:
+    with _histograms_lock:
+        return _histograms.setdefault(name, Histogram())
+
+
+def timed(name: str, func: Callable) -> Callable:
+    """func, adding the time of every call to the histogram ``name``."""
+    observe = histogram(name).observe
+    clock = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            observe(clock() - start)
+
+    wrapper.timed = True
+    return wrapper
+
+
+def _function_name(func: Callable) -> str:
+    """``page.function`` of a function defined in ``experiment_platform.pages.page``."""
+    return f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+
+def _timed_fragment(fragment: Callable) -> Callable:
+    """st.fragment that times the function inside the fragment, so its fragment-only reruns are timed too."""
+    @functools.wraps(fragment)
+    def timed_fragment(func=None, **kwargs):
+        if func is None:
+            return lambda f: fragment(timed(_function_name(f), f), **kwargs)
+        return fragment(timed(_function_name(func), func), **kwargs)
+    return timed_fragment
+
+
+_installed = False
+_install_lock = threading.Lock()
+_pages_timed = set()
+
+
+def instrument_page(module):
+    """Time the page's ``show_*`` and ``simulate_*`` functions, if the timers are installed (once per page)."""
+    if not _installed or module.__name__ in _pages_timed:
+        return
+    _pages_timed.add(module.__name__)
+    for name, value in list(vars(module).items()):
+        defined_here = getattr(value, '__module__', None) == module.__name__
+        # Fragments are already timed inside (see _timed_fragment)
+        if name.startswith(PAGE_PREFIXES) and callable(value) and defined_here and not getattr(value, 'timed', False):
+            setattr(module, name, timed(_function_name(value), value))
+
+
+class HistogramStat(NamedTuple):
+    """One function's histogram as a Streamlit stat (OpenMetrics histogram, cumulative buckets)."""
+
+    function: str
+    counts: Tuple[int, ...]
+    total: float
+
+    @property
+    def family_name(self) -> str:
+        return FAMILY
+
+    @property
+    def type(self) -> str:
+        return 'histogram'
+
+    @property
+    def unit(self) -> str:
+        return 'seconds'
+
+    @property
+    def help(self) -> str:
+        return HELP
+
+    def buckets(self) -> List[Tuple[str, int]]:
+        cumulative, upper = 0, []
+        for bound, count in zip([f"{bound:g}" for bound in BOUNDS] + ['+Inf'], self.counts):
+            cumulative += count
+            upper.append((bound, cumulative))
+        return upper
+
+    def to_metric_str(self) -> str:
+        label = f'function="{self.function}"'
+        lines = [f'{FAMILY}_bucket{{{label},le="{bound}"}} {count}' for bound, count in self.buckets()]
+        lines.append(f'{FAMILY}_count{{{label}}} {sum(self.counts)}')
+        lines.append(f'{FAMILY}_sum{{{label}}} {self.total:.6f}')
+        return '\n'.join(lines)
+
+    def marshall_metric_proto(self, metric):
+        label = metric.labels.add()
+        label.name = 'function'
+        label.value = self.function
+        value = metric.metric_points.add().histogram_value
+        value.double_value = self.total
+        value.count = sum(self.counts)
+        for bound, count in self.buckets():
+            bucket = value.buckets.add()
+            bucket.upper_bound = float('inf') if bound == '+Inf' else float(bound)
+            bucket.count = count
+
+
+def timing_stats() -> List[HistogramStat]:
+    """Every function's histogram, the most time first."""
+    with _histograms_lock:
+        histograms = dict(_histograms)
+    stats = []
+    for name, histogram_ in histograms.items():
+        counts, total = histogram_.snapshot()
+        stats.append(HistogramStat(name, tuple(counts), total))
+    return sorted(stats, key=lambda stat: -stat.total)
+
+
+class TimingMetrics:
+    """The histograms as Streamlit stats, served at ``/_stcore/metrics``."""
+
+    stats_families = (FAMILY,)
+
+    def get_stats(self, family_names=None):
+        return {FAMILY: timing_stats()}
+
+
+def metrics_text() -> str:
+    """The histograms in the OpenMetrics text format, as the metrics endpoint serves them."""
+    stats = timing_stats()
+    lines = [f"# TYPE {FAMILY} histogram", f"# UNIT {FAMILY} seconds", f"# HELP {FAMILY} {HELP}"]
+    lines += [stat.to_metric_str() for stat in stats]
+    return '\n'.join(lines + ['# EOF\n'])
+
+
+def write_metrics(path: str):
+    """Replace the file at path with the histograms, so a reader never sees half of them."""
+    partial = f"{path}.partial"
+    with open(partial, 'w') as f:
+        f.write(metrics_text())
+    os.replace(partial, path)
+
+
+def _flush_every(path: str, interval: float):
+    while True:
+        time.sleep(interval)
+        write_metrics(path)
+
+
+def install_timing(path: Optional[str] = None):
+    """Wrap the hot paths with timers and serve the histograms (idempotent); written to path, if given or set."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        _installed = True
+    import matplotlib.figure
+    import plotly.io
+    import streamlit as st
+    from streamlit.runtime import Runtime
+
+    from experiment_platform import rendering, translation
+
+    translation.translate_display = rendering.translate_display = timed('translation.translate_display',
+                                                                        translation.translate_display)
+    # install_display_layer puts these on st, and the Kids patches wrap them
+    rendering.plotly_chart = timed('emit.plotly_chart', rendering.plotly_chart)
+    rendering.pyplot = timed('emit.pyplot', rendering.pyplot)
+    rendering.image = timed('emit.image', rendering.image)
+    for name in NATIVE_CHARTS:
+        setattr(st, name, timed(f'emit.{name}', getattr(st, name)))
+    matplotlib.figure.Figure.savefig = timed('matplotlib.savefig', matplotlib.figure.Figure.savefig)
+    plotly.io.to_json = timed('plotly.to_json', plotly.io.to_json)
+    st.fragment = _timed_fragment(st.fragment)
+
+    if Runtime.exists():
+        Runtime.instance().stats_mgr.register_provider(TimingMetrics())
+    path = path or os.environ.get(TIMING_FILE_ENV)
+    if path:
+        threading.Thread(target=_flush_every, args=(path, FLUSH_S), daemon=True, name='timing-flush').start()
+        atexit.register(write_metrics, path)
@@ -0,0 +1,203 @@
+"""Normalization and clustering of genes × samples expression matrices.
+
+A matrix of tens of thousands of genes can neither be clustered gene by gene
+(the pairwise distances alone would take gigabytes) nor sent to the browser
+as one heatmap, so both are done at screen size:
+
+* normalization: counts to CPM, or TPM when gene lengths are given, then
+  log2(x + 1) and a z-score of each gene across samples;
+* samples: average-linkage (UPGMA) clustering on correlation distance;
+* genes: k-means into at most ``SCREEN_ROWS`` clusters whose centroids are
+  ordered by UPGMA, so each heatmap row is the mean profile of a cluster of
+  co-expressed genes.  Drilling into a row clusters its genes the same way,
+  down to single genes.
+
+``cluster_matrix`` does the whole-matrix work once, and
+``ClusteredMatrix.view`` returns the rows for a drill-down path, computing
+each view once under a lock, as sessions share the matrix.
+"""
+import dataclasses
+import hashlib
+import threading
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from experiment_platform.qpcr import PATHWAY_GENES
+
+SCREEN_ROWS = 100
+KMEANS_ITERATIONS = 20
+
+
+def matrix_digest(matrix: pd.DataFrame) -> str:
+    """SHA-256 of a matrix, or of the file it was parsed from."""
+    if 'sha256' in matrix.attrs:
+        return matrix.attrs['sha256']
+    digest = hashlib.sha256(np.ascontiguousarray(matrix.to_numpy(dtype=np.float32)).tobytes())
+    digest.update('\0'.join(map(str, matrix.index)).encode())
+    digest.update('\0'.join(map(str, matrix.columns)).encode())
+    return digest.hexdigest()
+
+
+def normalize(values: np.ndarray, units: str = 'counts', lengths: np.ndarray = None) -> np.ndarray:
+    """log2(x + 1) of CPM/TPM from counts (``units='counts'``) or of already normalized values (``'tpm'``)."""
+    values = np.clip(np.nan_to_num(np.asarray(values, dtype=np.float64)), 0, None)
+    if units == 'counts':
+        if lengths is not None:
+            values = values / np.clip(np.asarray(lengths, dtype=np.float64), 1, None)[:, None]
+        totals = values.sum(axis=0)
+        values = values / np.where(totals > 0, totals, 1) * 1e6
+    elif units != 'tpm':
+        raise ValueError(f"Unknown expression units: {units}")
+    return np.log2(values + 1)
+
+
+def _euclidean(points: np.ndarray) -> np.ndarray:
+    squared = (points ** 2).sum(axis=1)
+    return np.sqrt(np.clip(squared[:, None] + squared[None, :] - 2 * points @ points.T, 0, None))
+
+
+def upgma_order(distances: np.ndarray, sizes: np.ndarray = None) -> np.ndarray:
+    """Leaf order of average-linkage (UPGMA) clustering of a square distance matrix.
+
+    ``sizes`` weights each item as a cluster of that many members, so clusters can be joined as if
+    their members had been clustered one by one.
+    """
+    n = len(distances)
+    if n < 3:
+        return np.arange(n)
+    d = np.array(distances, dtype=np.float64)
+    np.fill_diagonal(d, np.inf)
+    sizes = np.ones(n) if sizes is None else np.asarray(sizes, dtype=np.float64).copy()
+    leaves = [[i] for i in range(n)]
+    i = 0
+    for _ in range(n - 1):
+        i, j = divmod(int(np.argmin(d)), n)
+        merged = (sizes[i] * d[i] + sizes[j] * d[j]) / (sizes[i] + sizes[j])
+        d[i, :] = d[:, i] = merged
+        d[j, :] = d[:, j] = np.inf
+        d[i, i] = np.inf
+        sizes[i] += sizes[j]
+        leaves[i] += leaves[j]
+    return np.array(leaves[i])
+
+
+def kmeans(points: np.ndarray, k: int, seed: int = 0,
+           iterations: int = KMEANS_ITERATIONS) -> Tuple[np.ndarray, np.ndarray]:
+    """Cluster labels and centroids of k-means (k-means++ start, Lloyd iterations)."""
+    rng = np.random.default_rng(seed)
+    n = len(points)
+    # float32 halves the time of the distance products, the bulk of the work
+    points = points.astype(np.float32)
+    squared = (points ** 2).sum(axis=1)
+    centroids = np.empty((k, points.shape[1]), dtype=np.float32)
+    centroids[0] = points[rng.integers(n)]
+    nearest = np.clip(squared - 2 * points @ centroids[0] + centroids[0] @ centroids[0], 0, None)
+    for c in range(1, k):
+        total = nearest.sum(dtype=np.float64)
+        pick = rng.choice(n, p=nearest / total) if total > 0 else rng.integers(n)
+        centroids[c] = points[pick]
+        distance = squared - 2 * points @ centroids[c] + centroids[c] @ centroids[c]
+        nearest = np.minimum(nearest, np.clip(distance, 0, None))
+
+    labels = None
+    for _ in range(iterations):
+        new_labels = ((centroids ** 2).sum(axis=1) - 2 * points @ centroids.T).argmin(axis=1)
+        if labels is not None and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=k)
+        filled = counts > 0
+        for dim in range(points.shape[1]):
+            centroids[filled, dim] = np.bincount(labels, points[:, dim], minlength=k)[filled] / counts[filled]
+    return labels, centroids
+
+
+@dataclasses.dataclass
+class HeatmapView:
+    """Rows of the heatmap: one per gene cluster (or per gene, once clusters are small enough)."""
+    values: np.ndarray  # rows × samples, mean z-score of the row's genes
+    labels: List[str]
+    members: List[np.ndarray]  # indices into ClusteredMatrix.genes
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return np.array([len(m) for m in self.members])
+
+
+@dataclasses.dataclass
+class ClusteredMatrix:
+    """A normalized matrix with samples in clustered order; shared by sessions, so read-only."""
+    genes: np.ndarray
+    samples: List[str]
+    z: np.ndarray  # genes × samples, float32
+    left_out: int  # genes not expressed or not varying across samples
+    rows: int = SCREEN_ROWS
+    _views: Dict[Tuple[int, ...], HeatmapView] = dataclasses.field(default_factory=dict, repr=False)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def view(self, path: Tuple[int, ...] = ()) -> HeatmapView:
+        """Heatmap rows after drilling into row path[0] of the top view, then row path[1] of that one..."""
+        path = tuple(path)
+        with self._lock:
+            for depth in range(len(path) + 1):
+                step = path[:depth]
+                if step in self._views:
+                    continue
+                if step:
+                    parent = self._views[step[:-1]]
+                    members, prefix = parent.members[step[-1]], parent.labels[step[-1]].split(' ')[0] + '.'
+                else:
+                    members, prefix = np.arange(len(self.genes)), 'C'
+                self._views[step] = self._aggregate(members, prefix)
+            return self._views[path]
+
+    def _aggregate(self, members: np.ndarray, prefix: str) -> HeatmapView:
+        data = self.z[members]
+        if len(members) <= self.rows:
+            order = upgma_order(_euclidean(data))
+            return HeatmapView(data[order], [str(self.genes[m]) for m in members[order]],
+                               [members[i:i + 1] for i in order])
+        labels, centroids = kmeans(data, self.rows, seed=len(members))
+        counts = np.bincount(labels, minlength=self.rows)
+        used = np.flatnonzero(counts)
+        order = used[upgma_order(_euclidean(centroids[used]), counts[used])]
+        by_label = np.argsort(labels, kind='stable')
+        groups = np.split(members[by_label], np.cumsum(counts)[:-1])
+        names = [f"{prefix}{rank + 1} ({counts[c]:,} genes)" for rank, c in enumerate(order)]
+        values = np.stack([data[labels == c].mean(axis=0) for c in order])
+        return HeatmapView(values, names, [groups[c] for c in order])
+
+
+def cluster_matrix(matrix: pd.DataFrame, units: str = 'counts', rows: int = SCREEN_ROWS) -> ClusteredMatrix:
+    """Normalize a genes × samples matrix, order its samples and prepare the gene clusters."""
+    log = normalize(matrix.to_numpy(), units, matrix.attrs.get('length'))
+    spread = log.std(axis=1)
+    varying = spread > 0
+    z = ((log[varying] - log[varying].mean(axis=1, keepdims=True)) / spread[varying, None]).astype(np.float32)
+    samples = np.asarray(matrix.columns, dtype=object)
+    if log.shape[1] > 2 and varying.sum() > 1:
+        order = upgma_order(1 - np.nan_to_num(np.corrcoef(log[varying].T)))
+        z, samples = z[:, order], samples[order]
+    return ClusteredMatrix(np.asarray(matrix.index)[varying], [str(s) for s in samples], z,
+                           int((~varying).sum()), rows)
+
+
+def example_expression_matrix(genes: int = 2000, replicates: int = 3, seed: int = 11) -> pd.DataFrame:
+    """Synthetic RNA-seq counts of wild type and three engineered strains, for the page's example heatmap."""
+    rng = np.random.default_rng(seed)
+    strains = ['Wild-type', 'Engineered Strain 1', 'Engineered Strain 2', 'Engineered Strain 3']
+    names = list(PATHWAY_GENES) + [f"gene{i:05d}" for i in range(genes - len(PATHWAY_GENES))]
+    mean = rng.lognormal(5, 1.5, genes)
+    # Co-regulated modules with a log2 fold change per strain; the pathway genes rise with engineering
+    module = rng.integers(0, 12, genes)
+    module[:len(PATHWAY_GENES)] = 12
+    effects = np.vstack([rng.normal(0, 1.2, (12, len(strains))), [0, 3, 4, 5]])
+    effects[:, 0] = 0
+    log2_fold = effects[module] * (rng.random(genes) < 0.4)[:, None]
+    log2_fold[:len(PATHWAY_GENES)] = effects[12]
+    lam = mean[:, None] * 2 ** np.repeat(log2_fold, replicates, axis=1)
+    counts = rng.poisson(lam * rng.gamma(10, 0.1, lam.shape))
+    columns = [f"{strain} rep{r + 1}" for strain in strains for r in range(replicates)]
+    return pd.DataFrame(counts.astype(np.float32), index=pd.Index(names, name='gene'), columns=columns)
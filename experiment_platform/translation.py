@@ -0,0 +1,46 @@
+"""Display-text translation for the Professional and Kids versions.
+
+The catalogs are large, so each one is imported the first time its version
+translates a string rather than when the app starts.
+"""
+import importlib
+from typing import Dict
+
+from experiment_platform.state import is_kids_mode, is_pro_mode
+
+_CATALOGS: Dict[str, Dict[str, str]] = {}
+
+
+def load_catalog(name: str) -> Dict[str, str]:
+    if name not in _CATALOGS:
+        _CATALOGS[name] = importlib.import_module(f"experiment_platform.catalogs.{name}").CATALOG
+    return _CATALOGS[name]
+
+
+def _apply_catalog(text: str, name: str) -> str:
+    out = text
+    for k, v in load_catalog(name).items():
+        out = out.replace(k, v)
+    return out
+
+
+def translate_for_professional(text: str) -> str:
+    if not isinstance(text, str):
+        return text
+    return _apply_catalog(text, "professional")
+
+
+def translate_for_kids_en(text: str) -> str:
+    if not isinstance(text, str):
+        return text
+    return _apply_catalog(text, "kids")
+
+
+def translate_display(text: str) -> str:
+    if not isinstance(text, str):
+        return text
+    if is_kids_mode():
+        return translate_for_kids_en(text)
+    if is_pro_mode():
+        return translate_for_professional(text)
+    return text